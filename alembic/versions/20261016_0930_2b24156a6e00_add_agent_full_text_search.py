@@ -0,0 +1,77 @@
+"""Add full-text search vector and trigram indexes to agents.
+
+Revision ID: 2b24156a6e00
+Revises: cefe07c5f938
+Create Date: 2026-10-16 09:30:12.418903
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2b24156a6e00"
+down_revision: str | None = "cefe07c5f938"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add a generated tsvector column with GIN index and pg_trgm indexes."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # Full-text search is PostgreSQL-only; SQLite keeps ILIKE-style matching
+        return
+
+    # array_to_string() is only STABLE, so generated columns need an IMMUTABLE wrapper
+    op.execute("""
+        CREATE OR REPLACE FUNCTION immutable_array_to_string(TEXT[], TEXT)
+        RETURNS TEXT AS $$
+            SELECT array_to_string($1, $2)
+        $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+    """)
+
+    # Weighted search document: names (A), keywords/capabilities (B), description (C)
+    op.execute("""
+        ALTER TABLE agents ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(agent_type, '')), 'A') ||
+            setweight(to_tsvector('english', immutable_array_to_string(coalesce(keywords, '{}'), ' ')), 'B') ||
+            setweight(to_tsvector('english', immutable_array_to_string(coalesce(capabilities, '{}'), ' ')), 'B') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'C')
+        ) STORED
+    """)
+    op.execute("CREATE INDEX idx_agents_search_vector ON agents USING GIN (search_vector)")
+
+    # Trigram indexes serve substring (ILIKE '%q%') matches on names and types
+    trgm_available = bind.exec_driver_sql(
+        "SELECT EXISTS(SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+    ).scalar()
+    if trgm_available:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX idx_agents_name_trgm ON agents USING GIN (name gin_trgm_ops)")
+        op.execute("CREATE INDEX idx_agents_agent_type_trgm ON agents USING GIN (agent_type gin_trgm_ops)")
+    else:
+        print("Warning: pg_trgm extension not available; skipping trigram indexes")
+
+    op.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (3, 'Added full-text search vector and trigram indexes on agents')
+        ON CONFLICT (version) DO NOTHING;
+    """)
+
+
+def downgrade() -> None:
+    """Drop full-text search column and indexes."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS idx_agents_agent_type_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_agents_name_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_agents_search_vector")
+    op.execute("ALTER TABLE agents DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP FUNCTION IF EXISTS immutable_array_to_string(TEXT[], TEXT)")
+    op.execute("DELETE FROM schema_version WHERE version = 3")
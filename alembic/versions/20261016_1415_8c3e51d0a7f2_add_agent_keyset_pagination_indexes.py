@@ -0,0 +1,47 @@
+"""Add composite indexes for keyset pagination of agents.
+
+Revision ID: 8c3e51d0a7f2
+Revises: 2b24156a6e00
+Create Date: 2026-10-16 14:15:47.902155
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3e51d0a7f2"
+down_revision: str | None = "2b24156a6e00"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add (name, id) and (category, name, id) indexes for cursor pagination."""
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    # Serve ORDER BY name, id with WHERE (name, id) > (cursor) as an index range scan,
+    # with and without an equality filter on category
+    op.create_index("idx_agents_name_id", "agents", ["name", "id"], unique=False)
+    op.create_index("idx_agents_category_name_id", "agents", ["category", "name", "id"], unique=False)
+
+    if is_postgresql:
+        op.execute("""
+            INSERT INTO schema_version (version, description)
+            VALUES (4, 'Added composite indexes for keyset pagination on agents')
+            ON CONFLICT (version) DO NOTHING;
+        """)
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    op.drop_index("idx_agents_category_name_id", table_name="agents")
+    op.drop_index("idx_agents_name_id", table_name="agents")
+
+    if is_postgresql:
+        op.execute("DELETE FROM schema_version WHERE version = 4")
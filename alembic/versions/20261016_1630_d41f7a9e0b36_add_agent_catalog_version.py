@@ -0,0 +1,68 @@
+"""Add agent catalog version stamp bumped on every write to agents.
+
+Revision ID: d41f7a9e0b36
+Revises: 8c3e51d0a7f2
+Create Date: 2026-10-16 16:30:05.117342
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41f7a9e0b36"
+down_revision: str | None = "8c3e51d0a7f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add a single-row catalog version table and a statement trigger on agents."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # Conditional GET support is PostgreSQL-only
+        return
+
+    op.execute("""
+        CREATE TABLE agent_catalog_version (
+            id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+            version BIGINT NOT NULL DEFAULT 1,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """)
+    op.execute("INSERT INTO agent_catalog_version (id) VALUES (TRUE)")
+
+    # Statement-level so bulk loads bump the version once, not once per row
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_agent_catalog_version()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE agent_catalog_version SET version = version + 1, updated_at = NOW();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_agents_catalog_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON agents
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_agent_catalog_version()
+    """)
+
+    op.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (5, 'Added agent catalog version stamp for conditional GET')
+        ON CONFLICT (version) DO NOTHING;
+    """)
+
+
+def downgrade() -> None:
+    """Drop the catalog version trigger, function and table."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS trg_agents_catalog_version ON agents")
+    op.execute("DROP FUNCTION IF EXISTS bump_agent_catalog_version()")
+    op.execute("DROP TABLE IF EXISTS agent_catalog_version")
+    op.execute("DELETE FROM schema_version WHERE version = 5")
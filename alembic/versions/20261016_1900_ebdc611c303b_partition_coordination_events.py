@@ -0,0 +1,393 @@
+"""Partition coordination_events by month and add hourly rollups.
+
+Revision ID: ebdc611c303b
+Revises: d41f7a9e0b36
+Create Date: 2026-10-16 19:00:41.528310
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ebdc611c303b"
+down_revision: str | None = "d41f7a9e0b36"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Number of log2 buckets in a duration histogram (bucket 1 is < 1 ms,
+# bucket k covers [2^(k-2), 2^(k-1)) ms, the last bucket is open-ended)
+HISTOGRAM_BUCKETS = 32
+
+EVENT_COLUMNS = """
+    event_id VARCHAR(36) NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    workflow_id VARCHAR(255) NOT NULL,
+    task_id VARCHAR(255),
+    timestamp TIMESTAMP NOT NULL,
+    agent_id VARCHAR(255),
+    agent_type VARCHAR(100),
+    source_agent JSONB,
+    target_agent JSONB,
+    status VARCHAR(50),
+    duration_ms FLOAT,
+    error JSONB,
+    metadata JSONB,
+    context JSONB,
+    performance JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+"""
+
+# Aggregates a set of events into rollup rows; {source} is a table or transition table
+ROLLUP_SELECT = """
+    SELECT
+        date_trunc('hour', timestamp),
+        event_type,
+        COALESCE(agent_type, ''),
+        COUNT(*),
+        COUNT(duration_ms),
+        COALESCE(SUM(duration_ms), 0),
+        MIN(duration_ms),
+        MAX(duration_ms),
+        coordination_duration_hist(duration_ms)
+    FROM {source}
+    GROUP BY 1, 2, 3
+"""
+
+ROLLUP_COLUMNS = (
+    "bucket, event_type, agent_type, event_count, duration_count, "
+    "duration_sum, duration_min, duration_max, duration_histogram"
+)
+
+
+def upgrade() -> None:
+    """Rebuild coordination_events as a monthly range-partitioned table with rollups."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # Native partitioning and rollup triggers are PostgreSQL-only
+        return
+
+    # The table may have been created by this project's initial migration or
+    # by CoordinationTracker.initialize(); stage its rows in the tracker layout
+    inspector = sa.inspect(bind)
+    legacy_columns = (
+        {column["name"] for column in inspector.get_columns("coordination_events")}
+        if inspector.has_table("coordination_events")
+        else set()
+    )
+    if "event_id" in legacy_columns:
+        op.execute("CREATE TEMP TABLE coordination_events_staging AS SELECT * FROM coordination_events")
+    elif legacy_columns:
+        op.execute("""
+            CREATE TEMP TABLE coordination_events_staging AS
+            SELECT
+                id::text AS event_id,
+                event_type,
+                workflow_id,
+                NULL::varchar AS task_id,
+                (created_at AT TIME ZONE 'UTC') AS timestamp,
+                NULL::varchar AS agent_id,
+                NULL::varchar AS agent_type,
+                NULL::jsonb AS source_agent,
+                NULL::jsonb AS target_agent,
+                NULL::varchar AS status,
+                NULL::float AS duration_ms,
+                NULL::jsonb AS error,
+                event_data AS metadata,
+                NULL::jsonb AS context,
+                NULL::jsonb AS performance,
+                (created_at AT TIME ZONE 'UTC') AS created_at
+            FROM coordination_events
+        """)
+    op.execute("DROP TABLE IF EXISTS coordination_events CASCADE")
+
+    # The partition key must be part of the primary key
+    op.execute(f"""
+        CREATE TABLE coordination_events ({EVENT_COLUMNS},
+            PRIMARY KEY (event_id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+    """)
+    # Catches rows outside the pre-created months; see create_coordination_event_partition()
+    op.execute("CREATE TABLE coordination_events_default PARTITION OF coordination_events DEFAULT")
+
+    # (workflow_id, timestamp) serves both workflow lookups and ordered timelines
+    op.execute("CREATE INDEX idx_coordination_events_workflow_ts ON coordination_events (workflow_id, timestamp)")
+    op.execute("CREATE INDEX idx_task_id ON coordination_events (task_id)")
+    op.execute("CREATE INDEX idx_agent_id ON coordination_events (agent_id)")
+    op.execute("CREATE INDEX idx_timestamp ON coordination_events (timestamp)")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_coordination_event_partition(month_start DATE)
+        RETURNS TEXT AS $$
+        DECLARE
+            range_start TIMESTAMP := date_trunc('month', month_start)::timestamp;
+            range_end TIMESTAMP := range_start + INTERVAL '1 month';
+            part_name TEXT := 'coordination_events_p' || to_char(range_start, 'YYYYMM');
+        BEGIN
+            IF to_regclass(part_name) IS NOT NULL THEN
+                RETURN NULL;
+            END IF;
+
+            -- Rows that landed in the default partition must move before attaching
+            EXECUTE format('CREATE TABLE %I (LIKE coordination_events INCLUDING DEFAULTS)', part_name);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM coordination_events_default '
+                'WHERE timestamp >= %L AND timestamp < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                range_start, range_end, part_name
+            );
+            EXECUTE format(
+                'ALTER TABLE coordination_events ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                part_name, range_start, range_end
+            );
+            RETURN part_name;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Retention job: run periodically (cron, pg_cron, or
+    # CoordinationTracker.maintain_partitions()). Dropping a partition leaves
+    # its rollups in place.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION maintain_coordination_event_partitions(
+            retain_months INT DEFAULT NULL,
+            months_ahead INT DEFAULT 2
+        )
+        RETURNS TABLE (action TEXT, partition_name TEXT) AS $$
+        DECLARE
+            current_month DATE := date_trunc('month', NOW() AT TIME ZONE 'UTC')::date;
+            cutoff DATE;
+            created TEXT;
+            part RECORD;
+        BEGIN
+            FOR offset_months IN 0..months_ahead LOOP
+                created := create_coordination_event_partition(
+                    (current_month + make_interval(months => offset_months))::date
+                );
+                IF created IS NOT NULL THEN
+                    action := 'created';
+                    partition_name := created;
+                    RETURN NEXT;
+                END IF;
+            END LOOP;
+
+            IF retain_months IS NULL THEN
+                RETURN;
+            END IF;
+
+            -- Keep the current month plus retain_months previous months
+            cutoff := (current_month - make_interval(months => retain_months))::date;
+            FOR part IN
+                SELECT child.relname
+                FROM pg_inherits inh
+                JOIN pg_class child ON child.oid = inh.inhrelid
+                WHERE inh.inhparent = 'coordination_events'::regclass
+                  AND child.relname ~ '^coordination_events_p[0-9]{6}$'
+                ORDER BY child.relname
+            LOOP
+                IF to_date(right(part.relname, 6), 'YYYYMM') < cutoff THEN
+                    EXECUTE format('DROP TABLE %I', part.relname);
+                    action := 'dropped';
+                    partition_name := part.relname;
+                    RETURN NEXT;
+                END IF;
+            END LOOP;
+
+            DELETE FROM coordination_events_default WHERE timestamp < cutoff;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Mergeable duration sketch: fixed log2 histogram stored as BIGINT[]
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION coordination_duration_bucket(duration_ms DOUBLE PRECISION)
+        RETURNS INT AS $$
+            SELECT CASE
+                WHEN duration_ms IS NULL THEN NULL
+                WHEN duration_ms < 1 THEN 1
+                ELSE LEAST(floor(log(2.0, duration_ms::numeric))::int + 2, {HISTOGRAM_BUCKETS})
+            END
+        $$ LANGUAGE sql IMMUTABLE;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION coordination_duration_hist_add(histogram BIGINT[], duration_ms DOUBLE PRECISION)
+        RETURNS BIGINT[] AS $$
+        DECLARE
+            bucket INT := coordination_duration_bucket(duration_ms);
+        BEGIN
+            IF bucket IS NOT NULL THEN
+                histogram[bucket] := histogram[bucket] + 1;
+            END IF;
+            RETURN histogram;
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION coordination_duration_hist_merge(a BIGINT[], b BIGINT[])
+        RETURNS BIGINT[] AS $$
+            SELECT array_agg(COALESCE(x, 0) + COALESCE(y, 0) ORDER BY n)
+            FROM unnest(a, b) WITH ORDINALITY AS t(x, y, n)
+        $$ LANGUAGE sql IMMUTABLE;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION coordination_duration_hist_negate(histogram BIGINT[])
+        RETURNS BIGINT[] AS $$
+            SELECT array_agg(-x ORDER BY n) FROM unnest(histogram) WITH ORDINALITY AS t(x, n)
+        $$ LANGUAGE sql IMMUTABLE;
+    """)
+    zeros = "{" + ",".join(["0"] * HISTOGRAM_BUCKETS) + "}"
+    op.execute(f"""
+        CREATE AGGREGATE coordination_duration_hist(DOUBLE PRECISION) (
+            SFUNC = coordination_duration_hist_add,
+            STYPE = BIGINT[],
+            INITCOND = '{zeros}'
+        )
+    """)
+    op.execute("""
+        CREATE AGGREGATE coordination_duration_hist_sum(BIGINT[]) (
+            SFUNC = coordination_duration_hist_merge,
+            STYPE = BIGINT[]
+        )
+    """)
+
+    op.execute("""
+        CREATE TABLE coordination_event_rollups (
+            bucket TIMESTAMP NOT NULL,
+            event_type VARCHAR(50) NOT NULL,
+            agent_type VARCHAR(100) NOT NULL DEFAULT '',
+            event_count BIGINT NOT NULL,
+            duration_count BIGINT NOT NULL DEFAULT 0,
+            duration_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+            duration_min DOUBLE PRECISION,
+            duration_max DOUBLE PRECISION,
+            duration_histogram BIGINT[] NOT NULL,
+            PRIMARY KEY (bucket, event_type, agent_type)
+        )
+    """)
+
+    # Statement-level with transition tables so a COPY batch is one upsert
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION coordination_events_rollup_insert()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO coordination_event_rollups AS r ({ROLLUP_COLUMNS})
+            {ROLLUP_SELECT.format(source="new_events")}
+            ON CONFLICT (bucket, event_type, agent_type) DO UPDATE SET
+                event_count = r.event_count + EXCLUDED.event_count,
+                duration_count = r.duration_count + EXCLUDED.duration_count,
+                duration_sum = r.duration_sum + EXCLUDED.duration_sum,
+                duration_min = LEAST(r.duration_min, EXCLUDED.duration_min),
+                duration_max = GREATEST(r.duration_max, EXCLUDED.duration_max),
+                duration_histogram = coordination_duration_hist_merge(
+                    r.duration_histogram, EXCLUDED.duration_histogram
+                );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    # Explicit deletes (not partition drops) are subtracted; min/max are left as-is
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION coordination_events_rollup_delete()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE coordination_event_rollups AS r SET
+                event_count = r.event_count - d.event_count,
+                duration_count = r.duration_count - d.duration_count,
+                duration_sum = r.duration_sum - d.duration_sum,
+                duration_histogram = coordination_duration_hist_merge(
+                    r.duration_histogram, coordination_duration_hist_negate(d.duration_histogram)
+                )
+            FROM ({ROLLUP_SELECT.format(source="old_events")}) AS d ({ROLLUP_COLUMNS})
+            WHERE r.bucket = d.bucket AND r.event_type = d.event_type AND r.agent_type = d.agent_type;
+
+            DELETE FROM coordination_event_rollups WHERE event_count <= 0;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Partitions for the months ahead and for existing data, then copy rows back
+    op.execute("SELECT maintain_coordination_event_partitions()")
+    if legacy_columns:
+        op.execute("""
+            SELECT create_coordination_event_partition(month::date)
+            FROM generate_series(
+                date_trunc('month', (SELECT MIN(timestamp) FROM coordination_events_staging)),
+                date_trunc('month', NOW() AT TIME ZONE 'UTC'),
+                INTERVAL '1 month'
+            ) AS month
+        """)
+        op.execute("""
+            INSERT INTO coordination_events (
+                event_id, event_type, workflow_id, task_id, timestamp, agent_id, agent_type,
+                source_agent, target_agent, status, duration_ms, error, metadata, context,
+                performance, created_at
+            )
+            SELECT
+                event_id, event_type, workflow_id, task_id, timestamp, agent_id, agent_type,
+                source_agent, target_agent, status, duration_ms, error, metadata, context,
+                performance, created_at
+            FROM coordination_events_staging
+        """)
+        rollup_select = ROLLUP_SELECT.format(source="coordination_events")
+        op.execute(f"INSERT INTO coordination_event_rollups ({ROLLUP_COLUMNS}) {rollup_select}")
+        op.execute("DROP TABLE coordination_events_staging")
+
+    op.execute("""
+        CREATE TRIGGER trg_coordination_events_rollup_insert
+        AFTER INSERT ON coordination_events
+        REFERENCING NEW TABLE AS new_events
+        FOR EACH STATEMENT EXECUTE FUNCTION coordination_events_rollup_insert()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_coordination_events_rollup_delete
+        AFTER DELETE ON coordination_events
+        REFERENCING OLD TABLE AS old_events
+        FOR EACH STATEMENT EXECUTE FUNCTION coordination_events_rollup_delete()
+    """)
+
+    op.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (6, 'Partitioned coordination_events by month and added hourly rollups')
+        ON CONFLICT (version) DO NOTHING;
+    """)
+
+
+def downgrade() -> None:
+    """Restore an unpartitioned coordination_events table and drop the rollups."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE TEMP TABLE coordination_events_staging AS SELECT * FROM coordination_events")
+    op.execute("DROP TABLE coordination_events CASCADE")
+    op.execute("DROP TABLE IF EXISTS coordination_event_rollups")
+
+    op.execute("DROP FUNCTION IF EXISTS coordination_events_rollup_delete()")
+    op.execute("DROP FUNCTION IF EXISTS coordination_events_rollup_insert()")
+    op.execute("DROP AGGREGATE IF EXISTS coordination_duration_hist_sum(BIGINT[])")
+    op.execute("DROP AGGREGATE IF EXISTS coordination_duration_hist(DOUBLE PRECISION)")
+    op.execute("DROP FUNCTION IF EXISTS coordination_duration_hist_negate(BIGINT[])")
+    op.execute("DROP FUNCTION IF EXISTS coordination_duration_hist_merge(BIGINT[], BIGINT[])")
+    op.execute("DROP FUNCTION IF EXISTS coordination_duration_hist_add(BIGINT[], DOUBLE PRECISION)")
+    op.execute("DROP FUNCTION IF EXISTS coordination_duration_bucket(DOUBLE PRECISION)")
+    op.execute("DROP FUNCTION IF EXISTS maintain_coordination_event_partitions(INT, INT)")
+    op.execute("DROP FUNCTION IF EXISTS create_coordination_event_partition(DATE)")
+
+    # Same layout CoordinationTracker.initialize() creates, with the index
+    # names the initial migration's downgrade expects
+    op.execute(f"""
+        CREATE TABLE coordination_events ({EVENT_COLUMNS},
+            PRIMARY KEY (event_id)
+        )
+    """)
+    op.execute("INSERT INTO coordination_events SELECT * FROM coordination_events_staging")
+    op.execute("CREATE INDEX ix_coordination_events_workflow_id ON coordination_events (workflow_id)")
+    op.execute("CREATE INDEX ix_coordination_events_event_type ON coordination_events (event_type)")
+    op.execute("CREATE INDEX idx_timestamp ON coordination_events (timestamp)")
+    op.execute("DROP TABLE coordination_events_staging")
+
+    op.execute("DELETE FROM schema_version WHERE version = 6")
@@ -0,0 +1,57 @@
+"""Move the agent embedding content hash out of metadata into its own column.
+
+Revision ID: 5f2c8e1a9d47
+Revises: ebdc611c303b
+Create Date: 2026-10-17 09:00:27.604118
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f2c8e1a9d47"
+down_revision: str | None = "ebdc611c303b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add agents.embedding_hash and move existing hashes out of metadata."""
+    op.add_column("agents", sa.Column("embedding_hash", sa.String(64), nullable=True))
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # Embeddings are only computed on PostgreSQL, so there is nothing to move
+        return
+
+    op.execute("""
+        UPDATE agents
+        SET
+            embedding_hash = metadata->>'embedding_hash',
+            metadata = metadata - 'embedding_hash'
+        WHERE metadata ? 'embedding_hash'
+    """)
+
+    op.execute("""
+        INSERT INTO schema_version (version, description)
+        VALUES (7, 'Moved agent embedding content hash into agents.embedding_hash')
+        ON CONFLICT (version) DO NOTHING;
+    """)
+
+
+def downgrade() -> None:
+    """Fold embedding hashes back into metadata and drop the column."""
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("""
+            UPDATE agents
+            SET metadata = COALESCE(metadata, '{}'::jsonb) || jsonb_build_object('embedding_hash', embedding_hash)
+            WHERE embedding_hash IS NOT NULL
+        """)
+        op.execute("DELETE FROM schema_version WHERE version = 7")
+
+    op.drop_column("agents", "embedding_hash")
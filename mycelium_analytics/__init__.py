@@ -5,6 +5,9 @@ in production use. Local-only storage with privacy guarantees.
 
 Features:
     - Thread-safe JSONL event storage
+    - Indexed, time-partitioned segments for windowed reads
+    - Mergeable quantile sketches, persisted per segment, for percentiles
+    - Compressed columnar archive of closed segments, with retention
     - Non-blocking event collection
     - Privacy-first (no PII, paths, or command content)
     - Automatic log rotation
@@ -24,6 +27,7 @@ Components:
     - EventStorage: Thread-safe JSONL storage backend
     - TelemetryCollector: Event collection with privacy guarantees
     - MetricsAnalyzer: Performance metrics analysis (Day 2)
+    - QuantileSketch: Mergeable relative-error percentile sketch
 
 Author: @python-pro
 Phase: 2 Performance Analytics
@@ -31,6 +35,7 @@ Date: 2025-10-18
 """
 
 from mycelium_analytics.metrics import MetricsAnalyzer
+from mycelium_analytics.sketch import QuantileSketch
 from mycelium_analytics.storage import EventStorage
 from mycelium_analytics.telemetry import TelemetryCollector
 
@@ -38,6 +43,7 @@ __all__ = [
     "EventStorage",
     "TelemetryCollector",
     "MetricsAnalyzer",
+    "QuantileSketch",
 ]
 
 __version__ = "0.1.0"
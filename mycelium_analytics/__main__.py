@@ -6,6 +6,8 @@ from collected telemetry data.
 Usage:
     uv run python -m mycelium_analytics report --days=7
     uv run python -m mycelium_analytics report --days=30 --format=json
+    uv run python -m mycelium_analytics migrate
+    uv run python -m mycelium_analytics compact --retention-days=90
 
 Author: @python-pro
 Phase: 2 Performance Analytics
@@ -30,11 +32,19 @@ Examples:
 
   # Generate 30-day report in JSON format
   uv run python -m mycelium_analytics report --days=30 --format=json
+
+  # One-time: repartition rotated files from older versions into indexed
+  # per-day segments
+  uv run python -m mycelium_analytics migrate
+
+  # Compress closed segments into columnar archives, then delete data
+  # older than 90 days or beyond 500MB
+  uv run python -m mycelium_analytics compact --retention-days=90 --max-mb=500
         """,
     )
     parser.add_argument(
         "command",
-        choices=["report"],
+        choices=["report", "migrate", "compact"],
         help="Command to run",
     )
     parser.add_argument(
@@ -49,12 +59,47 @@ Examples:
         default="text",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--retention-days",
+        type=float,
+        help="compact: delete segments whose newest event is older than this",
+    )
+    parser.add_argument(
+        "--max-mb",
+        type=float,
+        help="compact: delete the oldest segments until the store fits in this size",
+    )
 
     args = parser.parse_args()
 
     storage = EventStorage()
     analyzer = MetricsAnalyzer(storage)
 
+    if args.command == "migrate":
+        result = storage.migrate_segments()
+        if args.format == "json":
+            print(json.dumps(result, indent=2))
+        else:
+            print(
+                f"Migrated {result['events_migrated']:,} events from {result['files_migrated']} files "
+                f"into {result['segments_written']} segments"
+            )
+
+    if args.command == "compact":
+        result = storage.compact_segments()
+        if args.retention_days is not None or args.max_mb is not None:
+            max_bytes = int(args.max_mb * 2**20) if args.max_mb is not None else None
+            result.update(storage.apply_retention(max_age_days=args.retention_days, max_bytes=max_bytes))
+        if args.format == "json":
+            print(json.dumps(result, indent=2))
+        else:
+            print(
+                f"Compacted {result['events_compacted']:,} events from {result['segments_compacted']} segments "
+                f"({result['bytes_before'] / 2**20:.1f}MB -> {result['bytes_after'] / 2**20:.1f}MB)"
+            )
+            if "files_deleted" in result:
+                print(f"Retention: deleted {result['files_deleted']} files ({result['bytes_freed'] / 2**20:.1f}MB)")
+
     if args.command == "report":
         report = analyzer.get_summary_report(days=args.days)
 
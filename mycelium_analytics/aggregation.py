@@ -0,0 +1,790 @@
+"""Single-pass streaming aggregation over stored telemetry events.
+
+``StreamingAggregator`` reads the event store once, as a stream, and hands
+each event to every registered reducer interested in its event type. Each
+reducer keeps only running aggregates (counts, sums, quantile sketches), so
+memory stays bounded however many events are scanned, and any number of
+reports cost a single pass.
+
+The built-in reducers are also mergeable. Their state for each closed
+segment is persisted in a ``<segment>.summary`` sidecar the first time the
+segment is aggregated, and segments lying entirely inside a later window
+are merged from it instead of being reread. Only the segment straddling
+the window start and the active segment are streamed, so report cost no
+longer grows with history length.
+
+Compacted segments (see ``mycelium_analytics.archive``) are handed to
+reducers as column arrays via ``Reducer.add_columns``; the built-in
+reducers filter and aggregate them with NumPy instead of per event.
+
+Example:
+    >>> from datetime import datetime, timedelta, timezone
+    >>> aggregator = StreamingAggregator(EventStorage())
+    >>> aggregator.register("cache", CachePerformanceReducer())
+    >>> aggregator.register("tokens", TokenSavingsReducer())
+    >>> results = aggregator.run(start_date=datetime.now(timezone.utc) - timedelta(days=7))
+    >>> results["cache"]["hit_rate_percentage"]
+    92.5
+
+Author: @python-pro
+Phase: 2 Performance Analytics
+Date: 2026-10-16
+"""
+
+import contextlib
+import json
+import statistics
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from mycelium_analytics.archive import MISSING_INT, EventColumns, is_archive, read_archive
+from mycelium_analytics.segments import (
+    SegmentIndex,
+    decode_lines,
+    file_identity,
+    iter_segment,
+    iter_unindexed,
+    parse_timestamp,
+    same_file,
+    sidecar_path,
+    to_epoch,
+    write_sidecar,
+)
+from mycelium_analytics.sketch import QuantileSketch
+from mycelium_analytics.storage import EventStorage
+
+np: ModuleType | None
+try:
+    import numpy as np
+except ImportError:
+    # Archive columns are then stdlib arrays, consumed as events
+    np = None
+
+SUMMARY_SUFFIX = ".summary"
+SUMMARY_VERSION = 1
+
+_EPOCH_DATE = datetime(1970, 1, 1).date()
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+class Reducer:
+    """Incremental aggregation of a stream of events into one result.
+
+    Subclasses set ``event_types`` to the event types they consume (None
+    for all events), fold events in ``add`` and build their result in
+    ``result``. Reducers that also implement ``state`` and ``merge`` and
+    set ``summary_name`` can be listed in ``SUMMARY_REDUCERS`` to have
+    their per-segment state persisted and merged. Archived events arrive
+    through ``add_columns``, which reducers may override to aggregate
+    column arrays directly.
+    """
+
+    event_types: frozenset[str] | None = None
+    summary_name: str | None = None
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Fold one event into the running aggregate.
+
+        Args:
+            event: Event dictionary
+        """
+        raise NotImplementedError
+
+    def add_columns(self, columns: EventColumns) -> None:
+        """Fold a batch of archived events.
+
+        The default decodes the rows of the consumed event types back into
+        events for ``add``.
+
+        Args:
+            columns: Archived rows, already filtered to the time window
+        """
+        for event in columns.events(self.event_types):
+            self.add(event)
+
+    def result(self) -> Any:
+        """Get the aggregate of all events added so far."""
+        raise NotImplementedError
+
+    def state(self) -> dict[str, Any]:
+        """Get the running aggregate as a JSON-serializable dictionary."""
+        raise NotImplementedError
+
+    def merge(self, state: dict[str, Any]) -> None:
+        """Fold in the ``state`` of another reducer of the same type.
+
+        Args:
+            state: Output of ``state``
+        """
+        raise NotImplementedError
+
+
+def _percentiles(sketch: QuantileSketch, *percentiles: float) -> dict[str, float]:
+    """Rounded ``pNN_ms`` entries of a latency sketch."""
+    return {f"p{p}_ms": round(sketch.percentile(p), 2) for p in percentiles}
+
+
+def _rounded_mean(total: float, count: int) -> float:
+    """Mean rounded to 2 decimals (0.0 when there are no values)."""
+    return round(total / count, 2) if count else 0.0
+
+
+class DiscoveryStatsReducer(Reducer):
+    """Per-operation and overall latency statistics of agent discovery.
+
+    Produces the ``MetricsAnalyzer.get_discovery_stats`` report. Latencies
+    are kept in one ``QuantileSketch`` per operation (percentiles within
+    1%); the overall percentiles come from merging them.
+    """
+
+    event_types = frozenset({"agent_discovery"})
+    summary_name = "discovery_stats"
+
+    def __init__(self) -> None:
+        """Initialize reducer."""
+        self.total = 0
+        self.counts: dict[str, int] = {}
+        self.cache_hits: dict[str, int] = {}
+        self.latencies: dict[str, QuantileSketch] = {}
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Fold one agent_discovery event."""
+        operation = event.get("operation", "unknown")
+        self.total += 1
+        self.counts[operation] = self.counts.get(operation, 0) + 1
+        if event.get("cache_hit", False):
+            self.cache_hits[operation] = self.cache_hits.get(operation, 0) + 1
+
+        if "duration_ms" in event:
+            sketch = self.latencies.get(operation)
+            if sketch is None:
+                sketch = self.latencies[operation] = QuantileSketch()
+            sketch.add(event["duration_ms"])
+
+    def add_columns(self, columns: EventColumns) -> None:
+        """Fold archived agent_discovery rows, one operation at a time."""
+        if not columns.vectorized or np is None:
+            super().add_columns(columns)
+            return
+
+        columns = columns.matching(event_types=self.event_types)
+        self.total += columns.count
+        operations = columns.dictionaries["operation"]
+        for code in np.unique(columns.operation).tolist():
+            rows = columns.operation == code
+            operation = operations[code] if code else "unknown"
+            self.counts[operation] = self.counts.get(operation, 0) + int(rows.sum())
+            hits = int((columns.cache_hit[rows] == 1).sum())
+            if hits:
+                self.cache_hits[operation] = self.cache_hits.get(operation, 0) + hits
+
+            durations = columns.duration_ms[rows]
+            durations = durations[~np.isnan(durations)]
+            if durations.size:
+                sketch = self.latencies.get(operation)
+                if sketch is None:
+                    sketch = self.latencies[operation] = QuantileSketch()
+                sketch.add_many(durations)
+
+    def result(self) -> dict[str, Any]:
+        """Build the discovery statistics report."""
+        if not self.total:
+            return {"total_operations": 0, "by_operation": {}, "overall": {}}
+
+        overall = QuantileSketch()
+        by_operation = {}
+        for operation, count in self.counts.items():
+            latencies = self.latencies.get(operation, QuantileSketch())
+            overall.merge(latencies)
+            stats = {
+                "count": count,
+                **_percentiles(latencies, 50, 95, 99),
+                "avg_ms": _rounded_mean(latencies.total, latencies.count),
+            }
+            if operation == "get_agent":
+                stats["cache_hit_rate"] = round(self.cache_hits.get(operation, 0) / count * 100, 2)
+            by_operation[operation] = stats
+
+        return {
+            "total_operations": self.total,
+            "by_operation": by_operation,
+            "overall": {
+                **_percentiles(overall, 50, 95, 99),
+                "avg_ms": _rounded_mean(overall.total, overall.count),
+            },
+        }
+
+    def state(self) -> dict[str, Any]:
+        """Get counts and latency sketches."""
+        return {
+            "total": self.total,
+            "counts": self.counts,
+            "cache_hits": self.cache_hits,
+            "latencies": {operation: sketch.to_dict() for operation, sketch in self.latencies.items()},
+        }
+
+    def merge(self, state: dict[str, Any]) -> None:
+        """Fold in another reducer's counts and latency sketches."""
+        self.total += state["total"]
+        for operation, count in state["counts"].items():
+            self.counts[operation] = self.counts.get(operation, 0) + count
+        for operation, hits in state["cache_hits"].items():
+            self.cache_hits[operation] = self.cache_hits.get(operation, 0) + hits
+        for operation, data in state["latencies"].items():
+            sketch = QuantileSketch.from_dict(data)
+            if operation in self.latencies:
+                self.latencies[operation].merge(sketch)
+            else:
+                self.latencies[operation] = sketch
+
+
+class TokenSavingsReducer(Reducer):
+    """Token consumption of lazily loaded agents.
+
+    Produces the ``MetricsAnalyzer.get_token_savings`` report.
+    """
+
+    event_types = frozenset({"agent_load"})
+    summary_name = "token_savings"
+
+    # Pre-Phase 1 baseline: all 119 agents loaded at ~450 tokens each
+    BASELINE_AGENTS = 119
+    BASELINE_TOKENS_PER_AGENT = 450
+
+    def __init__(self) -> None:
+        """Initialize reducer."""
+        self.agents = 0
+        self.tokens = 0
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Fold one agent_load event."""
+        self.agents += 1
+        self.tokens += event.get("estimated_tokens", 0)
+
+    def add_columns(self, columns: EventColumns) -> None:
+        """Fold archived agent_load rows."""
+        if not columns.vectorized:
+            super().add_columns(columns)
+            return
+
+        columns = columns.matching(event_types=self.event_types)
+        self.agents += columns.count
+        tokens = columns.estimated_tokens
+        self.tokens += int(tokens[tokens != MISSING_INT].sum())
+
+    def result(self) -> dict[str, Any]:
+        """Build the token savings report."""
+        if not self.agents:
+            return {
+                "total_agents_loaded": 0,
+                "total_tokens_loaded": 0,
+                "avg_tokens_per_agent": 0.0,
+                "estimated_baseline_tokens": 0,
+                "estimated_savings_tokens": 0,
+                "savings_percentage": 0.0,
+            }
+
+        estimated_baseline = self.BASELINE_AGENTS * self.BASELINE_TOKENS_PER_AGENT
+        estimated_savings = estimated_baseline - self.tokens
+        return {
+            "total_agents_loaded": self.agents,
+            "total_tokens_loaded": self.tokens,
+            "avg_tokens_per_agent": round(self.tokens / self.agents, 2),
+            "estimated_baseline_tokens": estimated_baseline,
+            "estimated_savings_tokens": estimated_savings,
+            "savings_percentage": round(estimated_savings / estimated_baseline * 100, 2),
+        }
+
+    def state(self) -> dict[str, Any]:
+        """Get agent and token counts."""
+        return {"agents": self.agents, "tokens": self.tokens}
+
+    def merge(self, state: dict[str, Any]) -> None:
+        """Fold in another reducer's agent and token counts."""
+        self.agents += state["agents"]
+        self.tokens += state["tokens"]
+
+
+class CachePerformanceReducer(Reducer):
+    """Cache hits, misses and their latencies for get_agent lookups.
+
+    Produces the ``MetricsAnalyzer.get_cache_performance`` report.
+    """
+
+    event_types = frozenset({"agent_discovery"})
+    summary_name = "cache_performance"
+
+    def __init__(self) -> None:
+        """Initialize reducer."""
+        self.lookups = 0
+        self.hits = 0
+        # [sum, count] of latencies for hits and misses
+        self.hit_latency = [0.0, 0]
+        self.miss_latency = [0.0, 0]
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Fold one agent_discovery event (only get_agent counts)."""
+        if event.get("operation") != "get_agent":
+            return
+
+        self.lookups += 1
+        hit = event.get("cache_hit", False)
+        if hit:
+            self.hits += 1
+        if "duration_ms" in event:
+            latency = self.hit_latency if hit else self.miss_latency
+            latency[0] += event["duration_ms"]
+            latency[1] += 1
+
+    def add_columns(self, columns: EventColumns) -> None:
+        """Fold archived get_agent rows."""
+        if not columns.vectorized or np is None:
+            super().add_columns(columns)
+            return
+
+        columns = columns.matching(event_types=self.event_types)
+        rows = columns.operation == columns.code("operation", "get_agent")
+        hit = columns.cache_hit[rows] == 1
+        self.lookups += int(rows.sum())
+        self.hits += int(hit.sum())
+
+        durations = columns.duration_ms[rows].astype(np.float64)
+        has_duration = ~np.isnan(durations)
+        for latency, selected in ((self.hit_latency, hit & has_duration), (self.miss_latency, ~hit & has_duration)):
+            latency[0] += float(durations[selected].sum())
+            latency[1] += int(selected.sum())
+
+    def result(self) -> dict[str, Any]:
+        """Build the cache performance report."""
+        if not self.lookups:
+            return {
+                "total_lookups": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "hit_rate_percentage": 0.0,
+                "avg_hit_latency_ms": 0.0,
+                "avg_miss_latency_ms": 0.0,
+            }
+
+        return {
+            "total_lookups": self.lookups,
+            "cache_hits": self.hits,
+            "cache_misses": self.lookups - self.hits,
+            "hit_rate_percentage": round(self.hits / self.lookups * 100, 2),
+            "avg_hit_latency_ms": _rounded_mean(self.hit_latency[0], int(self.hit_latency[1])),
+            "avg_miss_latency_ms": _rounded_mean(self.miss_latency[0], int(self.miss_latency[1])),
+        }
+
+    def state(self) -> dict[str, Any]:
+        """Get lookup, hit and latency totals."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_latency": self.hit_latency,
+            "miss_latency": self.miss_latency,
+        }
+
+    def merge(self, state: dict[str, Any]) -> None:
+        """Fold in another reducer's totals."""
+        self.lookups += state["lookups"]
+        self.hits += state["hits"]
+        for mine, theirs in ((self.hit_latency, state["hit_latency"]), (self.miss_latency, state["miss_latency"])):
+            mine[0] += theirs[0]
+            mine[1] += theirs[1]
+
+
+class PerformanceTrendsReducer(Reducer):
+    """Daily discovery volume, latency and cache hit rate, with trend.
+
+    Produces the ``MetricsAnalyzer.get_performance_trends`` report. Memory
+    grows with the number of days, not events.
+    """
+
+    event_types = frozenset({"agent_discovery"})
+    summary_name = "trends"
+
+    def __init__(self) -> None:
+        """Initialize reducer."""
+        # date -> [operations, latency sum, latency count, get_agent lookups, cache hits]
+        self.days: dict[str, list[float]] = {}
+        # Date prefix of a timestamp -> its day's totals
+        self._prefixes: dict[str, list[float]] = {}
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Fold one agent_discovery event into its day."""
+        timestamp = event.get("timestamp")
+        if not isinstance(timestamp, str):
+            return
+
+        # Full parse only for the first timestamp of each calendar date
+        day = self._prefixes.get(timestamp[:10])
+        if day is None:
+            try:
+                date = datetime.fromisoformat(timestamp).date().isoformat()
+            except ValueError:
+                return
+            day = self.days.get(date)
+            if day is None:
+                day = self.days[date] = [0, 0.0, 0, 0, 0]
+            self._prefixes[timestamp[:10]] = day
+        day[0] += 1
+        if "duration_ms" in event:
+            day[1] += event["duration_ms"]
+            day[2] += 1
+        if event.get("operation") == "get_agent":
+            day[3] += 1
+            if event.get("cache_hit", False):
+                day[4] += 1
+
+    def add_columns(self, columns: EventColumns) -> None:
+        """Fold archived agent_discovery rows into their (UTC) days."""
+        if not columns.vectorized or np is None:
+            super().add_columns(columns)
+            return
+
+        columns = columns.matching(event_types=self.event_types)
+        timed = columns.timed.astype(bool)
+        day_numbers, rows = np.unique(columns.timestamp[timed] // _MICROSECONDS_PER_DAY, return_inverse=True)
+        if not day_numbers.size:
+            return
+
+        size = day_numbers.size
+        durations = columns.duration_ms[timed].astype(np.float64)
+        has_duration = ~np.isnan(durations)
+        lookups = columns.operation[timed] == columns.code("operation", "get_agent")
+        hits = lookups & (columns.cache_hit[timed] == 1)
+        totals = (
+            np.bincount(rows, minlength=size).tolist(),
+            np.bincount(rows[has_duration], weights=durations[has_duration], minlength=size).tolist(),
+            np.bincount(rows[has_duration], minlength=size).tolist(),
+            np.bincount(rows[lookups], minlength=size).tolist(),
+            np.bincount(rows[hits], minlength=size).tolist(),
+        )
+
+        for i, day_number in enumerate(day_numbers.tolist()):
+            date_key = (_EPOCH_DATE + timedelta(days=day_number)).isoformat()
+            day = self.days.get(date_key)
+            if day is None:
+                day = self.days[date_key] = [0, 0.0, 0, 0, 0]
+            for j, column in enumerate(totals):
+                day[j] += column[i]
+
+    def result(self) -> dict[str, Any]:
+        """Build the performance trends report."""
+        if not self.days:
+            return {"daily_stats": [], "trend": "stable"}
+
+        daily_stats: list[dict[str, Any]] = [
+            {
+                "date": date,
+                "operations": int(operations),
+                "avg_latency_ms": _rounded_mean(latency_sum, int(latency_count)),
+                "cache_hit_rate": round(hits / lookups * 100, 2) if lookups else 0.0,
+            }
+            for date, (operations, latency_sum, latency_count, lookups, hits) in sorted(self.days.items())
+        ]
+
+        # Determine trend (compare first half vs second half)
+        trend = "stable"
+        if len(daily_stats) >= 2:
+            midpoint = len(daily_stats) // 2
+            first_half_avg = statistics.mean(float(d["avg_latency_ms"]) for d in daily_stats[:midpoint])
+            second_half_avg = statistics.mean(float(d["avg_latency_ms"]) for d in daily_stats[midpoint:])
+
+            if second_half_avg < first_half_avg * 0.9:
+                trend = "improving"
+            elif second_half_avg > first_half_avg * 1.1:
+                trend = "degrading"
+
+        return {"daily_stats": daily_stats, "trend": trend}
+
+    def state(self) -> dict[str, Any]:
+        """Get the per-day totals."""
+        return {"days": self.days}
+
+    def merge(self, state: dict[str, Any]) -> None:
+        """Fold in another reducer's per-day totals."""
+        for date, totals in state["days"].items():
+            day = self.days.get(date)
+            if day is None:
+                self.days[date] = list(totals)
+            else:
+                for i, value in enumerate(totals):
+                    day[i] += value
+
+
+# Reducers whose per-segment state is persisted in summary sidecars
+SUMMARY_REDUCERS: tuple[type[Reducer], ...] = (
+    DiscoveryStatsReducer,
+    TokenSavingsReducer,
+    CachePerformanceReducer,
+    PerformanceTrendsReducer,
+)
+
+
+def summary_path(segment: Path) -> Path:
+    """Get the summary sidecar path of a segment."""
+    return sidecar_path(segment, SUMMARY_SUFFIX)
+
+
+def build_summary(segment: Path, index: SegmentIndex) -> dict[str, Any]:
+    """Run every ``SUMMARY_REDUCERS`` reducer over a whole closed segment.
+
+    Args:
+        segment: Closed segment file
+        index: Index of the segment
+
+    Returns:
+        Summary with the segment size, the number of events without a
+        valid timestamp, and each reducer's state by ``summary_name``
+    """
+    reducers = [reducer_type() for reducer_type in SUMMARY_REDUCERS]
+    if is_archive(segment):
+        untimed = 0
+        with contextlib.suppress(OSError):
+            columns = read_archive(segment).matching(event_types=_event_types(reducers))
+            untimed = columns.untimed
+            _feed_columns(reducers, columns)
+    else:
+        untimed, _ = _summarize(reducers, iter_segment(segment, index, event_types=_event_types(reducers)))
+    return {
+        "version": SUMMARY_VERSION,
+        "size": index.size,
+        "untimed": untimed,
+        "states": {reducer.summary_name: reducer.state() for reducer in reducers},
+    }
+
+
+def load_summary(segment: Path, index: SegmentIndex) -> dict[str, Any]:
+    """Load a closed segment's summary, (re)building and saving it if needed.
+
+    Args:
+        segment: Closed segment file
+        index: Current index of the segment
+
+    Returns:
+        Segment summary (see ``build_summary``)
+    """
+    sidecar = summary_path(segment)
+    with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+        data: dict[str, Any] = json.loads(sidecar.read_text(encoding="utf-8"))
+        if data.get("version") == SUMMARY_VERSION and data["size"] == index.size:
+            return data
+
+    data = build_summary(segment, index)
+    write_sidecar(sidecar, data)
+    return data
+
+
+def update_active_summary(path: Path) -> dict[str, Any] | None:
+    """Bring the active segment's summary up to date.
+
+    The active segment only grows until it is rotated away, so its summary
+    covers a prefix of the file and is extended with the complete lines
+    appended since, parsing nothing twice. A rotated or recreated file
+    starts a new summary (see ``segments.file_identity``).
+
+    Args:
+        path: Active segment file
+
+    Returns:
+        Summary as for ``build_summary``, plus ``min_ts`` of the covered
+        events, or None if the segment cannot be read
+    """
+    sidecar = summary_path(path)
+    reducers = [reducer_type() for reducer_type in SUMMARY_REDUCERS]
+    try:
+        with path.open("rb") as f:
+            inode, head = file_identity(f)
+
+            data: dict[str, Any] | None = None
+            with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+                data = json.loads(sidecar.read_text(encoding="utf-8"))
+                if data.get("version") != SUMMARY_VERSION or not same_file(data, inode, head):
+                    data = None
+
+            start = data["size"] if data is not None else 0
+            f.seek(start)
+            tail = f.read()
+    except OSError:
+        return None
+
+    # Only complete lines; a write may be in progress
+    end = tail.rfind(b"\n") + 1
+    if data is not None and not end:
+        return data
+
+    untimed, min_ts = 0, None
+    if data is not None:
+        for reducer in reducers:
+            reducer.merge(data["states"][reducer.summary_name])
+        untimed, min_ts = data["untimed"], data["min_ts"]
+
+    new_untimed, new_min_ts = _summarize(reducers, decode_lines(tail[:end], event_types=_event_types(reducers)))
+    if new_min_ts is not None and (min_ts is None or new_min_ts < min_ts):
+        min_ts = new_min_ts
+
+    size = start + end
+    data = {
+        "version": SUMMARY_VERSION,
+        "size": size,
+        "inode": inode,
+        "head": head[:size].hex(),
+        "untimed": untimed + new_untimed,
+        "min_ts": min_ts,
+        "states": {reducer.summary_name: reducer.state() for reducer in reducers},
+    }
+    write_sidecar(sidecar, data)
+    return data
+
+
+def _summarize(reducers: list[Reducer], events: Iterable[dict[str, Any]]) -> tuple[int, float | None]:
+    """Feed events to reducers, tracking untimed events and the earliest timestamp.
+
+    Returns:
+        (number of events without a valid timestamp, earliest timestamp)
+    """
+    untimed = 0
+    min_ts: float | None = None
+
+    def timed() -> Iterator[dict[str, Any]]:
+        nonlocal untimed, min_ts
+        for event in events:
+            ts = parse_timestamp(event.get("timestamp"))
+            if ts is None:
+                untimed += 1
+            elif min_ts is None or ts < min_ts:
+                min_ts = ts
+            yield event
+
+    _feed(reducers, timed())
+    return untimed, min_ts
+
+
+def _event_types(reducers: list[Reducer]) -> frozenset[str] | None:
+    """Union of the event types consumed by reducers (None for all)."""
+    if any(reducer.event_types is None for reducer in reducers):
+        return None
+    return frozenset().union(*(reducer.event_types or () for reducer in reducers))
+
+
+def _feed_segment(reducers: list[Reducer], path: Path, index: SegmentIndex, start_ts: float | None) -> None:
+    """Stream a closed segment or archive to reducers."""
+    event_types = _event_types(reducers)
+    if not is_archive(path):
+        _feed(reducers, iter_segment(path, index, start_ts, event_types))
+        return
+
+    try:
+        columns = read_archive(path)
+    except OSError:
+        return
+    _feed_columns(reducers, columns.matching(start_ts, event_types))
+
+
+def _feed_columns(reducers: list[Reducer], columns: EventColumns) -> None:
+    """Hand archived rows to reducers, decoding events once for those without ``add_columns``."""
+    generic = [reducer for reducer in reducers if type(reducer).add_columns is Reducer.add_columns]
+    if generic:
+        _feed(generic, columns.events(_event_types(generic)))
+    for reducer in reducers:
+        if reducer not in generic:
+            reducer.add_columns(columns)
+
+
+def _feed(reducers: list[Reducer], events: Iterable[dict[str, Any]]) -> None:
+    """Hand each event to the reducers consuming its event type."""
+    # Reducers per event type, resolved once per type seen
+    routes: dict[Any, list[Reducer]] = {}
+    for event in events:
+        event_type = event.get("event_type")
+        targets = routes.get(event_type)
+        if targets is None:
+            targets = routes[event_type] = [
+                reducer for reducer in reducers if reducer.event_types is None or event_type in reducer.event_types
+            ]
+        for reducer in targets:
+            reducer.add(event)
+
+
+class StreamingAggregator:
+    """Runs registered reducers over the event store in a single pass.
+
+    Only segments holding at least one event type some reducer consumes
+    are read (see ``EventStorage.list_segments``). Closed segments entirely
+    inside the window are merged from their summaries for reducers in
+    ``SUMMARY_REDUCERS`` and only streamed to the other reducers.
+
+    Args:
+        storage: EventStorage backend to stream events from
+    """
+
+    def __init__(self, storage: EventStorage):
+        """Initialize aggregator.
+
+        Args:
+            storage: EventStorage backend to stream events from
+        """
+        self.storage = storage
+        self._reducers: dict[str, Reducer] = {}
+
+    def register(self, name: str, reducer: Reducer) -> None:
+        """Register a reducer under the name its result is returned as.
+
+        Args:
+            name: Result name
+            reducer: Reducer instance
+        """
+        self._reducers[name] = reducer
+
+    def run(self, start_date: datetime | None = None) -> dict[str, Any]:
+        """Aggregate events once and collect every reducer's result.
+
+        Args:
+            start_date: Optional minimum event timestamp
+
+        Returns:
+            Mapping of reducer name to its result
+
+        Example:
+            >>> aggregator = StreamingAggregator(EventStorage())
+            >>> aggregator.register("tokens", TokenSavingsReducer())
+            >>> aggregator.run()["tokens"]["total_agents_loaded"]
+            12
+        """
+        reducers = list(self._reducers.values())
+        if reducers:
+            start_ts = to_epoch(start_date)
+            summarized = [reducer for reducer in reducers if type(reducer) in SUMMARY_REDUCERS]
+            unsummarized = [reducer for reducer in reducers if type(reducer) not in SUMMARY_REDUCERS]
+
+            for path, index in self.storage.list_segments(start_date, _event_types(reducers)):
+                streamed = reducers
+                inside = start_ts is None or (index.min_ts is not None and index.min_ts >= start_ts)
+                if summarized and inside:
+                    summary = load_summary(path, index)
+                    # Events without a timestamp would be excluded by a window
+                    if start_ts is None or not summary["untimed"]:
+                        for reducer in summarized:
+                            reducer.merge(summary["states"][reducer.summary_name])
+                        streamed = unsummarized
+                if streamed:
+                    _feed_segment(streamed, path, index, start_ts)
+
+            streamed = reducers
+            if summarized:
+                active = update_active_summary(self.storage.active_segment)
+                if active is not None and (
+                    start_ts is None
+                    or (not active["untimed"] and active["min_ts"] is not None and active["min_ts"] >= start_ts)
+                ):
+                    for reducer in summarized:
+                        reducer.merge(active["states"][reducer.summary_name])
+                    streamed = unsummarized
+            if streamed:
+                _feed(streamed, iter_unindexed(self.storage.active_segment, start_ts, _event_types(streamed)))
+
+        return {name: reducer.result() for name, reducer in self._reducers.items()}
@@ -0,0 +1,556 @@
+"""Compressed columnar archive of closed event segments.
+
+``EventStorage.compact_segments`` rewrites each closed ``events_*.jsonl``
+segment as an ``events_*.col`` archive holding one compressed column per
+field the analytics reports use:
+
+- ``event_type`` and ``operation``: dictionary codes
+- ``timestamp``: delta-encoded UTC microseconds, plus a "has timestamp" flag
+- ``duration_ms``: float32 (NaN when absent)
+- ``cache_hit``: int8 (-1 when absent) and ``estimated_tokens``: int64
+- every other field: one compact JSON object per event
+
+Columns are compressed separately with zstd (``zstandard`` package) or,
+failing that, gzip, so a report only decompresses the columns it needs.
+With NumPy installed, columns decode straight into arrays that reducers
+filter and aggregate without building per-event dictionaries (see
+``Reducer.add_columns`` in ``mycelium_analytics.aggregation``); without it,
+archives are decoded back into events.
+
+Archived events read back with the same fields, except that timestamps are
+normalized to UTC ISO 8601 and durations are rounded to float32 precision.
+
+Example:
+    >>> from pathlib import Path
+    >>> archive = write_archive(Path("~/.mycelium/analytics/events_20251018_migrated.jsonl"))
+    >>> columns = read_archive(archive)
+    >>> columns.count, columns.vectorized
+    (48213, True)
+
+Author: @python-pro
+Phase: 2 Performance Analytics
+Date: 2026-10-17
+"""
+
+import gzip
+import json
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Collection, Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+from mycelium_analytics.segments import SegmentIndex, parse_timestamp
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+ARCHIVE_SUFFIX = ".col"
+ARCHIVE_VERSION = 1
+MAGIC = b"MYCACOL\x01"
+
+# Value of an absent estimated_tokens
+MISSING_INT = -(2**63)
+
+# array typecodes of the stored columns and their little-endian NumPy dtypes
+_DTYPES = {"B": "<u1", "b": "<i1", "H": "<u2", "I": "<u4", "q": "<i8", "f": "<f4"}
+_HEADER = struct.Struct("<I")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_DICTIONARY_FIELDS = ("event_type", "operation")
+
+
+def is_archive(path: Path) -> bool:
+    """Whether a segment path is a columnar archive."""
+    return path.suffix == ARCHIVE_SUFFIX
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    """Compress one column."""
+    if codec == "zstd":
+        compressed: bytes = zstandard.ZstdCompressor(level=9).compress(data)
+        return compressed
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    raise ValueError(f"Unknown archive codec: {codec}")
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    """Decompress one column."""
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Archive is zstd-compressed; install the zstandard package to read it")
+        decompressed: bytes = zstandard.ZstdDecompressor().decompress(data)
+        return decompressed
+    if codec == "gzip":
+        return gzip.decompress(data)
+    raise ValueError(f"Unknown archive codec: {codec}")
+
+
+def _code_typecode(size: int) -> str:
+    """Smallest unsigned typecode holding ``size`` dictionary codes."""
+    if size <= 1 << 8:
+        return "B"
+    return "H" if size <= 1 << 16 else "I"
+
+
+def _to_bytes(values: "array[Any]") -> bytes:
+    """Little-endian bytes of an array."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data: bytes, typecode: str) -> Any:
+    """Decode a little-endian column into a NumPy or stdlib array."""
+    if NUMPY_AVAILABLE:
+        return np.frombuffer(data, dtype=_DTYPES[typecode])
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_archive(segment: Path, target: Path | None = None, codec: str | None = None) -> Path:
+    """Write the columnar archive of a closed JSONL segment.
+
+    Malformed lines are dropped, as when indexing. The archive is written
+    atomically; the segment itself is left in place.
+
+    Args:
+        segment: Closed JSONL segment
+        target: Archive path (default: the segment with ``.col`` suffix)
+        codec: "zstd" or "gzip" (default: zstd if available)
+
+    Returns:
+        Path of the written archive
+
+    Raises:
+        OSError: If the segment cannot be read or the archive written
+        ValueError: If the codec is unknown or unavailable
+    """
+    codec = codec or ("zstd" if ZSTD_AVAILABLE else "gzip")
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        raise ValueError("zstd compression requires the zstandard package")
+    target = target or segment.with_suffix(ARCHIVE_SUFFIX)
+
+    dictionaries: dict[str, dict[str | None, int]] = {name: {None: 0} for name in _DICTIONARY_FIELDS}
+    codes: dict[str, list[int]] = {name: [] for name in _DICTIONARY_FIELDS}
+    timed, timestamps = array("B"), array("q")
+    durations, cache_hits, tokens = array("f"), array("b"), array("q")
+    extras: list[str] = []
+    index = SegmentIndex()
+
+    with segment.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+
+            event_type = str(event.get("event_type", "unknown"))
+            index.event_types[event_type] = index.event_types.get(event_type, 0) + 1
+            index.count += 1
+
+            for name in _DICTIONARY_FIELDS:
+                value = event.get(name)
+                if isinstance(value, str):
+                    del event[name]
+                    lookup = dictionaries[name]
+                    codes[name].append(lookup.setdefault(value, len(lookup)))
+                else:
+                    codes[name].append(0)
+
+            ts = parse_timestamp(event.get("timestamp"))
+            timed.append(ts is not None)
+            if ts is not None:
+                del event["timestamp"]
+                timestamps.append(round(ts * 1e6))
+                if index.min_ts is None or ts < index.min_ts:
+                    index.min_ts = ts
+                if index.max_ts is None or ts > index.max_ts:
+                    index.max_ts = ts
+
+            duration = event.get("duration_ms")
+            if isinstance(duration, int | float) and not isinstance(duration, bool):
+                del event["duration_ms"]
+                durations.append(duration)
+            else:
+                durations.append(float("nan"))
+
+            hit = event.get("cache_hit")
+            if isinstance(hit, bool):
+                del event["cache_hit"]
+            cache_hits.append(int(hit) if isinstance(hit, bool) else -1)
+
+            estimate = event.get("estimated_tokens")
+            if isinstance(estimate, int) and not isinstance(estimate, bool) and MISSING_INT < estimate < 2**63:
+                del event["estimated_tokens"]
+                tokens.append(estimate)
+            else:
+                tokens.append(MISSING_INT)
+
+            extras.append(json.dumps(event, ensure_ascii=False, separators=(",", ":")))
+
+    # Timestamps as the first value followed by successive differences
+    deltas = array("q", (b - a for a, b in zip([0, *timestamps], timestamps, strict=False)))
+
+    raw_columns: dict[str, tuple[str | None, bytes]] = {
+        "timed": ("B", _to_bytes(timed)),
+        "timestamp": ("q", _to_bytes(deltas)),
+        "duration_ms": ("f", _to_bytes(durations)),
+        "cache_hit": ("b", _to_bytes(cache_hits)),
+        "estimated_tokens": ("q", _to_bytes(tokens)),
+        "extras": (None, "\n".join(extras).encode("utf-8")),
+    }
+    for name in _DICTIONARY_FIELDS:
+        code_typecode = _code_typecode(len(dictionaries[name]))
+        raw_columns[name] = (code_typecode, _to_bytes(array(code_typecode, codes[name])))
+
+    blobs = []
+    layout: dict[str, list[Any]] = {}
+    offset = 0
+    for name, (typecode, data) in raw_columns.items():
+        blob = _compress(data, codec)
+        layout[name] = [typecode, offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps(
+        {
+            "version": ARCHIVE_VERSION,
+            "codec": codec,
+            "count": index.count,
+            "min_ts": index.min_ts,
+            "max_ts": index.max_ts,
+            "event_types": index.event_types,
+            "dictionaries": {name: list(lookup) for name, lookup in dictionaries.items()},
+            "columns": layout,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    tmp = target.with_name(f"{target.name}.tmp{os.getpid()}")
+    try:
+        with tmp.open("wb") as f:
+            f.write(MAGIC + _HEADER.pack(len(header)) + header)
+            f.writelines(blobs)
+        tmp.replace(target)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    return target
+
+
+def _read_header(data: bytes) -> tuple[dict[str, Any], int]:
+    """Parse an archive header.
+
+    Returns:
+        (header, offset of the first column)
+
+    Raises:
+        ValueError: If the data is not a supported archive
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a columnar event archive")
+    start = len(MAGIC) + _HEADER.size
+    (length,) = _HEADER.unpack_from(data, len(MAGIC))
+    header = json.loads(data[start : start + length])
+    if header.get("version") != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported archive version: {header.get('version')}")
+    return header, start + length
+
+
+def load_archive_index(path: Path) -> SegmentIndex | None:
+    """Describe an archive from its header, as a segment index without blocks.
+
+    Args:
+        path: Archive file
+
+    Returns:
+        Index with the archive's file size, event count, time range and
+        event type counts, or None if the archive cannot be read
+    """
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            prefix = f.read(len(MAGIC) + _HEADER.size)
+            if len(prefix) < len(MAGIC) + _HEADER.size:
+                return None
+            (length,) = _HEADER.unpack_from(prefix, len(MAGIC))
+            header, _ = _read_header(prefix + f.read(length))
+        return SegmentIndex(
+            size=size,
+            count=header["count"],
+            min_ts=header["min_ts"],
+            max_ts=header["max_ts"],
+            event_types=header["event_types"],
+        )
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        return None
+
+
+class EventColumns:
+    """Decoded columns of an archive, or of a selection of its rows.
+
+    With NumPy (``vectorized``), columns are arrays that can be masked and
+    aggregated directly; otherwise they are stdlib arrays and ``events``
+    is the way to consume them. Dictionary-coded columns hold codes into
+    ``dictionaries[name]``, where code 0 means absent.
+
+    Attributes:
+        count: Number of rows
+        vectorized: Whether columns are NumPy arrays
+        timed: Whether each row has a timestamp
+        timestamp: UTC microseconds (meaningless where not timed)
+        event_type: Event type codes
+        operation: Operation codes
+        duration_ms: Durations (NaN when absent)
+        cache_hit: 1, 0, or -1 when absent
+        estimated_tokens: Token estimates (``MISSING_INT`` when absent)
+        dictionaries: Values of the dictionary codes per column
+    """
+
+    def __init__(
+        self,
+        columns: dict[str, Any],
+        dictionaries: dict[str, list[str | None]],
+        extras: "_Extras",
+        rows: Any = None,
+    ):
+        """Initialize from decoded columns.
+
+        Args:
+            columns: Arrays by column name
+            dictionaries: Values of the dictionary codes per column
+            extras: Lazily decoded remaining fields of the whole archive
+            rows: Archive row of each selected row (None: all rows)
+        """
+        self.timed = columns["timed"]
+        self.timestamp = columns["timestamp"]
+        self.event_type = columns["event_type"]
+        self.operation = columns["operation"]
+        self.duration_ms = columns["duration_ms"]
+        self.cache_hit = columns["cache_hit"]
+        self.estimated_tokens = columns["estimated_tokens"]
+        self.dictionaries = dictionaries
+        self.count = len(self.timed)
+        self.vectorized = NUMPY_AVAILABLE and isinstance(self.timed, np.ndarray)
+        self._extras = extras
+        self._rows = rows
+
+    def _columns(self) -> dict[str, Any]:
+        """Arrays by column name."""
+        return {
+            "timed": self.timed,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "operation": self.operation,
+            "duration_ms": self.duration_ms,
+            "cache_hit": self.cache_hit,
+            "estimated_tokens": self.estimated_tokens,
+        }
+
+    def codes(self, name: str, values: Collection[str]) -> list[int]:
+        """Get the codes of the given values of a dictionary-coded column."""
+        return [code for code, value in enumerate(self.dictionaries[name]) if value in values]
+
+    def code(self, name: str, value: str) -> int:
+        """Get the code of a value of a dictionary-coded column (-1 if unused)."""
+        codes = self.codes(name, (value,))
+        return codes[0] if codes else -1
+
+    def of_types(self, event_types: Collection[str]) -> Any:
+        """Boolean mask of rows with one of the given event types (vectorized only)."""
+        return np.isin(self.event_type, self.codes("event_type", event_types))
+
+    def take(self, selection: Any) -> "EventColumns":
+        """Select rows by boolean mask (vectorized) or list of positions."""
+        if self.vectorized:
+            columns = {name: values[selection] for name, values in self._columns().items()}
+            rows = np.arange(self.count)[selection] if self._rows is None else self._rows[selection]
+        else:
+            columns = {
+                name: array(values.typecode, (values[i] for i in selection)) for name, values in self._columns().items()
+            }
+            rows = [self._rows[i] for i in selection] if self._rows is not None else list(selection)
+        return EventColumns(columns, self.dictionaries, self._extras, rows)
+
+    def matching(self, start_ts: float | None = None, event_types: frozenset[str] | None = None) -> "EventColumns":
+        """Select rows at or after ``start_ts`` with one of ``event_types``.
+
+        Args:
+            start_ts: Minimum event timestamp (None for no bound)
+            event_types: Event types to include (None for all)
+
+        Returns:
+            Selected rows (self when nothing is filtered)
+        """
+        if start_ts is None and event_types is None:
+            return self
+        start_us = start_ts * 1e6 if start_ts is not None else None
+
+        if self.vectorized:
+            mask = np.ones(self.count, dtype=bool)
+            if start_us is not None:
+                mask &= self.timed.astype(bool) & (self.timestamp >= start_us)
+            if event_types is not None:
+                mask &= self.of_types(event_types)
+            return self.take(mask)
+
+        types = set(self.codes("event_type", event_types)) if event_types is not None else None
+        return self.take(
+            [
+                i
+                for i in range(self.count)
+                if (start_us is None or (self.timed[i] and self.timestamp[i] >= start_us))
+                and (types is None or self.event_type[i] in types)
+            ]
+        )
+
+    @property
+    def untimed(self) -> int:
+        """Number of rows without a timestamp."""
+        return self.count - int(self.timed.sum() if self.vectorized else sum(self.timed))
+
+    def events(self, event_types: frozenset[str] | None = None, newest_first: bool = False) -> Iterator[dict[str, Any]]:
+        """Decode rows back into event dictionaries.
+
+        Args:
+            event_types: Event types to include (None for all)
+            newest_first: Yield the last row first
+
+        Yields:
+            Event dictionaries
+        """
+        selected = self.matching(event_types=event_types) if event_types is not None else self
+        columns = {name: values.tolist() for name, values in selected._columns().items()}
+        rows = selected._rows if selected._rows is not None else range(selected.count)
+        rows = rows.tolist() if hasattr(rows, "tolist") else list(rows)
+        extras = self._extras.lines()
+        event_types_of = self.dictionaries["event_type"]
+        operations = self.dictionaries["operation"]
+
+        positions = range(selected.count - 1, -1, -1) if newest_first else range(selected.count)
+        for i in positions:
+            event: dict[str, Any] = {}
+            if columns["timed"][i]:
+                event["timestamp"] = (_EPOCH + timedelta(microseconds=columns["timestamp"][i])).isoformat()
+            if columns["event_type"][i]:
+                event["event_type"] = event_types_of[columns["event_type"][i]]
+            if columns["operation"][i]:
+                event["operation"] = operations[columns["operation"][i]]
+            duration = columns["duration_ms"][i]
+            if duration == duration:
+                # Shortest decimal that round-trips through float32
+                event["duration_ms"] = float(f"{duration:.7g}")
+            if columns["cache_hit"][i] >= 0:
+                event["cache_hit"] = bool(columns["cache_hit"][i])
+            if columns["estimated_tokens"][i] != MISSING_INT:
+                event["estimated_tokens"] = columns["estimated_tokens"][i]
+            extra = extras[rows[i]]
+            if extra != "{}":
+                event.update(json.loads(extra))
+            yield event
+
+
+class _Extras:
+    """Compressed per-event JSON of the fields without a column, decoded once."""
+
+    def __init__(self, blob: bytes, codec: str):
+        self._blob = blob
+        self._codec = codec
+        self._lines: list[str] | None = None
+
+    def lines(self) -> list[str]:
+        """JSON object of each archive row."""
+        if self._lines is None:
+            self._lines = _decompress(self._blob, self._codec).decode("utf-8").split("\n")
+        return self._lines
+
+
+def read_archive(path: Path) -> EventColumns:
+    """Decode an archive's columns.
+
+    The ``extras`` column is only decompressed if events are decoded.
+
+    Args:
+        path: Archive file
+
+    Returns:
+        Columns of every archived event
+
+    Raises:
+        OSError: If the archive cannot be read
+        ValueError: If it is not a supported archive or its codec is unavailable
+    """
+    data = path.read_bytes()
+    header, start = _read_header(data)
+    codec = header["codec"]
+
+    columns: dict[str, Any] = {}
+    for name, (typecode, offset, length) in header["columns"].items():
+        blob = data[start + offset : start + offset + length]
+        if name == "extras":
+            extras = _Extras(blob, codec)
+        else:
+            columns[name] = _from_bytes(_decompress(blob, codec), typecode)
+
+    # Undo the delta encoding and spread timestamps over the timed rows
+    timestamps: Any
+    if NUMPY_AVAILABLE:
+        timestamps = np.zeros(len(columns["timed"]), dtype=np.int64)
+        timestamps[columns["timed"].astype(bool)] = np.cumsum(columns["timestamp"])
+    else:
+        absolute = accumulate(columns["timestamp"])
+        timestamps = array("q", (next(absolute) if has_ts else 0 for has_ts in columns["timed"]))
+    columns["timestamp"] = timestamps
+
+    return EventColumns(columns, header["dictionaries"], extras)
+
+
+def iter_archive(
+    path: Path,
+    start_ts: float | None = None,
+    event_types: frozenset[str] | None = None,
+    newest_first: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the matching events of an archive.
+
+    Args:
+        path: Archive file
+        start_ts: Minimum event timestamp (None for no bound)
+        event_types: Event types to include (None for all)
+        newest_first: Iterate from the last archived event
+
+    Yields:
+        Event dictionaries
+
+    Raises:
+        ValueError: If the archive's codec is unavailable
+    """
+    try:
+        columns = read_archive(path)
+    except OSError:
+        return
+    yield from columns.matching(start_ts, event_types).events(newest_first=newest_first)
@@ -0,0 +1,464 @@
+"""Segment indexes for the JSONL event store.
+
+Every closed (rotated) ``events_*.jsonl`` segment gets a small JSON sidecar
+index, ``<segment>.idx``, recording its time range, per-event-type counts
+and the byte offsets of fixed-size blocks of events. Readers use it to skip
+whole segments, and blocks within a segment, that fall outside a time
+window, and to read the newest events first without parsing older ones.
+
+Indexes are built lazily the first time a segment is read and rebuilt
+whenever the segment's size no longer matches, so segments rotated by older
+versions or other processes are picked up transparently. Other sidecars
+(such as the ``.summary`` aggregates of ``mycelium_analytics.aggregation``)
+follow the same naming and write conventions.
+
+Example:
+    >>> from pathlib import Path
+    >>> index = load_index(Path("~/.mycelium/analytics/events_20251018_120000_000000.jsonl"))
+    >>> index.count, index.event_types
+    (48213, {'agent_discovery': 47001, 'agent_load': 1212})
+
+Author: @python-pro
+Phase: 2 Performance Analytics
+Date: 2026-10-16
+"""
+
+import contextlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+SIDECAR_SUFFIXES = (INDEX_SUFFIX, ".summary")
+
+# Events per index block (the unit of skipping within a segment)
+BLOCK_EVENTS = 1000
+
+# Read size when streaming a segment without an index
+_CHUNK_BYTES = 1 << 20
+
+# Leading bytes that, with the inode, identify a growing segment
+IDENTITY_BYTES = 64
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """Convert an event timestamp to UTC epoch seconds.
+
+    Naive timestamps are taken to be UTC.
+
+    Args:
+        value: ISO 8601 timestamp string
+
+    Returns:
+        Epoch seconds, or None if missing or unparseable
+
+    Example:
+        >>> parse_timestamp("2025-10-18T12:00:00Z")
+        1760788800.0
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def to_epoch(moment: datetime | None) -> float | None:
+    """Convert a datetime (naive means UTC) to epoch seconds."""
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _merge_range(low: float | None, high: float | None, ts: float) -> tuple[float, float]:
+    """Widen a (min, max) range to include ``ts``."""
+    return (ts if low is None or ts < low else low, ts if high is None or ts > high else high)
+
+
+@dataclass
+class SegmentBlock:
+    """Byte range of consecutive events within a segment.
+
+    Attributes:
+        offset: Byte offset of the block's first line
+        count: Number of valid events in the block
+        min_ts: Earliest event timestamp (epoch seconds)
+        max_ts: Latest event timestamp (epoch seconds)
+    """
+
+    offset: int
+    count: int = 0
+    min_ts: float | None = None
+    max_ts: float | None = None
+
+
+@dataclass
+class SegmentIndex:
+    """Summary of one segment file.
+
+    Attributes:
+        size: Segment size in bytes when indexed
+        count: Number of valid events
+        min_ts: Earliest event timestamp (epoch seconds)
+        max_ts: Latest event timestamp (epoch seconds)
+        event_types: Event count per ``event_type``
+        blocks: Event blocks in file order
+    """
+
+    size: int = 0
+    count: int = 0
+    min_ts: float | None = None
+    max_ts: float | None = None
+    event_types: dict[str, int] = field(default_factory=dict)
+    blocks: list[SegmentBlock] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, path: Path) -> "SegmentIndex":
+        """Index a segment by scanning it once.
+
+        Args:
+            path: Segment file
+
+        Returns:
+            Segment index (malformed lines are not counted)
+
+        Raises:
+            OSError: If the segment cannot be read
+        """
+        index = cls()
+        with path.open("rb") as f:
+            index.extend(f)
+        return index
+
+    def extend(self, lines: Iterable[bytes]) -> None:
+        """Index lines that follow the indexed part of the segment.
+
+        Args:
+            lines: Raw lines starting at byte offset ``size``
+        """
+        block = self.blocks[-1] if self.blocks else None
+        offset = self.size
+
+        for line in lines:
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+
+            if block is None or block.count >= BLOCK_EVENTS:
+                block = SegmentBlock(offset=line_offset)
+                self.blocks.append(block)
+            block.count += 1
+            self.count += 1
+
+            event_type = str(event.get("event_type", "unknown"))
+            self.event_types[event_type] = self.event_types.get(event_type, 0) + 1
+
+            ts = parse_timestamp(event.get("timestamp"))
+            if ts is not None:
+                block.min_ts, block.max_ts = _merge_range(block.min_ts, block.max_ts, ts)
+                self.min_ts, self.max_ts = _merge_range(self.min_ts, self.max_ts, ts)
+
+        self.size = offset
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SegmentIndex":
+        """Create index from its sidecar representation."""
+        return cls(
+            size=data["size"],
+            count=data["count"],
+            min_ts=data["min_ts"],
+            max_ts=data["max_ts"],
+            event_types=data["event_types"],
+            blocks=[SegmentBlock(*block) for block in data["blocks"]],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert index to its sidecar representation."""
+        data = asdict(self)
+        data["version"] = INDEX_VERSION
+        # Blocks as compact [offset, count, min_ts, max_ts] rows
+        data["blocks"] = [[b.offset, b.count, b.min_ts, b.max_ts] for b in self.blocks]
+        return data
+
+    def overlaps(self, start_ts: float | None, event_types: frozenset[str] | None = None) -> bool:
+        """Whether the segment may hold matching events.
+
+        Args:
+            start_ts: Minimum event timestamp (None for no bound)
+            event_types: Event types of interest (None for all)
+
+        Returns:
+            False only if no event can match
+        """
+        if start_ts is not None and (self.max_ts is None or self.max_ts < start_ts):
+            return False
+        return event_types is None or any(t in self.event_types for t in event_types)
+
+
+def index_path(segment: Path) -> Path:
+    """Get the sidecar index path of a segment."""
+    return sidecar_path(segment, INDEX_SUFFIX)
+
+
+def sidecar_path(segment: Path, suffix: str) -> Path:
+    """Get the path of a segment's sidecar with the given suffix."""
+    return segment.with_name(segment.name + suffix)
+
+
+def write_sidecar(path: Path, data: dict[str, Any]) -> None:
+    """Atomically write a JSON sidecar (best effort)."""
+    tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    try:
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def remove_sidecars(segment: Path) -> None:
+    """Delete every sidecar of a segment (best effort)."""
+    for suffix in SIDECAR_SUFFIXES:
+        with contextlib.suppress(OSError):
+            sidecar_path(segment, suffix).unlink()
+
+
+def load_index(segment: Path) -> SegmentIndex | None:
+    """Load a segment's index, (re)building and saving it if needed.
+
+    Args:
+        segment: Segment file
+
+    Returns:
+        Segment index, or None if the segment cannot be read
+    """
+    try:
+        size = segment.stat().st_size
+    except OSError:
+        return None
+
+    sidecar = index_path(segment)
+    with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+        data = json.loads(sidecar.read_text(encoding="utf-8"))
+        if data.get("version") == INDEX_VERSION and data["size"] == size:
+            return SegmentIndex.from_dict(data)
+
+    try:
+        index = SegmentIndex.build(segment)
+    except OSError:
+        return None
+    if index.size == size:
+        save_index(segment, index)
+    return index
+
+
+def load_active_index(segment: Path) -> SegmentIndex | None:
+    """Load the active segment's index, extending it with new complete lines.
+
+    The saved index records the identity of the file it describes (see
+    ``file_identity``), so a rotated or recreated active segment is indexed
+    afresh.
+
+    Args:
+        segment: Active segment file
+
+    Returns:
+        Index of the segment's complete lines, or None if it cannot be read
+    """
+    sidecar = index_path(segment)
+    try:
+        with segment.open("rb") as f:
+            inode, head = file_identity(f)
+            index = None
+            with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+                data = json.loads(sidecar.read_text(encoding="utf-8"))
+                if data.get("version") == INDEX_VERSION and same_file(data, inode, head):
+                    index = SegmentIndex.from_dict(data)
+            if index is None:
+                index = SegmentIndex()
+
+            f.seek(index.size)
+            tail = f.read()
+    except OSError:
+        return None
+
+    # Only complete lines; a write may be in progress
+    end = tail.rfind(b"\n") + 1
+    if end:
+        index.extend(tail[:end].splitlines(keepends=True))
+        write_sidecar(sidecar, {**index.to_dict(), "inode": inode, "head": head[: index.size].hex()})
+    return index
+
+
+def file_identity(f: BinaryIO) -> tuple[int, bytes]:
+    """Get the inode and leading bytes of an open file.
+
+    Sidecars of the growing active segment store both, so they are not
+    applied to a different file after rotation.
+
+    Args:
+        f: File opened in binary mode (its position is moved)
+
+    Returns:
+        (inode, up to ``IDENTITY_BYTES`` leading bytes)
+    """
+    f.seek(0)
+    return os.fstat(f.fileno()).st_ino, f.read(IDENTITY_BYTES)
+
+
+def same_file(data: dict[str, Any], inode: int, head: bytes) -> bool:
+    """Whether sidecar data saved with ``file_identity`` describes this file."""
+    return data.get("inode") == inode and head.hex().startswith(data["head"])
+
+
+def save_index(segment: Path, index: SegmentIndex) -> None:
+    """Atomically write a segment's sidecar index (best effort)."""
+    write_sidecar(index_path(segment), index.to_dict())
+
+
+def _matches(event: Any, start_ts: float | None, event_types: frozenset[str] | None) -> bool:
+    """Apply the time and event-type filters to a decoded line."""
+    if not isinstance(event, dict):
+        return False
+    if event_types is not None and event.get("event_type") not in event_types:
+        return False
+    if start_ts is not None:
+        ts = parse_timestamp(event.get("timestamp"))
+        if ts is None or ts < start_ts:
+            return False
+    return True
+
+
+def _split_lines(data: bytes) -> list[str]:
+    """Decode a chunk of JSONL once and split it into lines.
+
+    Splits on newlines only: unescaped U+2028 and similar characters are
+    valid inside JSON strings.
+    """
+    return data.decode("utf-8", errors="replace").split("\n")
+
+
+def _decode(lines: list[str], start_ts: float | None, event_types: frozenset[str] | None) -> Iterator[dict[str, Any]]:
+    """Decode JSONL lines, skipping blank, malformed and filtered ones."""
+    loads = json.loads
+    for line in lines:
+        if not line or line.isspace():
+            continue
+        try:
+            event = loads(line)
+        except ValueError:
+            continue
+        if _matches(event, start_ts, event_types):
+            yield event
+
+
+def decode_lines(
+    data: bytes,
+    start_ts: float | None = None,
+    event_types: frozenset[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Decode the matching events of a chunk of complete JSONL lines.
+
+    Args:
+        data: JSONL bytes
+        start_ts: Minimum event timestamp (None for no bound)
+        event_types: Event types to include (None for all)
+
+    Yields:
+        Event dictionaries
+    """
+    return _decode(_split_lines(data), start_ts, event_types)
+
+
+def iter_segment(
+    segment: Path,
+    index: SegmentIndex,
+    start_ts: float | None = None,
+    event_types: frozenset[str] | None = None,
+    newest_first: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the matching events of an indexed segment.
+
+    Blocks entirely older than ``start_ts`` are skipped without being read.
+
+    Args:
+        segment: Segment file
+        index: Index of the segment
+        start_ts: Minimum event timestamp (None for no bound)
+        event_types: Event types to include (None for all)
+        newest_first: Iterate from the end of the segment
+
+    Yields:
+        Event dictionaries
+    """
+    ends = [block.offset for block in index.blocks[1:]] + [index.size]
+    spans = [
+        (block.offset, end)
+        for block, end in zip(index.blocks, ends, strict=True)
+        if start_ts is None or (block.max_ts is not None and block.max_ts >= start_ts)
+    ]
+    if newest_first:
+        spans.reverse()
+
+    try:
+        with segment.open("rb") as f:
+            for start, end in spans:
+                f.seek(start)
+                lines = _split_lines(f.read(end - start))
+                if newest_first:
+                    lines.reverse()
+                yield from _decode(lines, start_ts, event_types)
+    except OSError:
+        return
+
+
+def iter_unindexed(
+    path: Path,
+    start_ts: float | None = None,
+    event_types: frozenset[str] | None = None,
+    newest_first: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over the matching events of a segment without an index.
+
+    Used for the active segment, which is still being appended to.
+
+    Args:
+        path: Segment file
+        start_ts: Minimum event timestamp (None for no bound)
+        event_types: Event types to include (None for all)
+        newest_first: Iterate from the end of the segment
+
+    Yields:
+        Event dictionaries
+    """
+    try:
+        with path.open("rb") as f:
+            if newest_first:
+                lines = _split_lines(f.read())
+                lines.reverse()
+                yield from _decode(lines, start_ts, event_types)
+            else:
+                # Bounded chunks of whole lines, oldest first
+                while chunk := f.read(_CHUNK_BYTES):
+                    chunk += f.readline()
+                    yield from _decode(_split_lines(chunk), start_ts, event_types)
+    except OSError:
+        return
@@ -0,0 +1,246 @@
+"""Mergeable quantile sketch for latency percentiles.
+
+``QuantileSketch`` is a DDSketch: values are counted in logarithmically
+sized buckets, so any quantile is returned with a bounded *relative* error
+(1% by default) using a few kilobytes however many values were added.
+Sketches with the same accuracy merge exactly, by adding bucket counts, so
+percentiles over a time window can be built from per-segment sketches
+without rereading raw events.
+
+Example:
+    >>> sketch = QuantileSketch()
+    >>> for duration in (12.0, 15.5, 9.8, 120.0):
+    ...     sketch.add(duration)
+    >>> round(sketch.quantile(0.5), 1)
+    12.1
+    >>> other = QuantileSketch.from_dict(sketch.to_dict())
+    >>> sketch.merge(other)
+    >>> sketch.count
+    8
+
+Author: @python-pro
+Phase: 2 Performance Analytics
+Date: 2026-10-17
+"""
+
+import math
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Values at or below this are counted in the zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """Relative-error quantile sketch with exact count, sum, min and max.
+
+    Bucket ``i`` counts values in ``(gamma**(i-1), gamma**i]`` with
+    ``gamma = (1 + relative_accuracy) / (1 - relative_accuracy)``.
+    Non-positive values fall into a dedicated zero bucket. If more than
+    ``max_bins`` buckets are in use, the lowest ones are collapsed, which
+    only affects accuracy of the smallest quantiles.
+
+    Args:
+        relative_accuracy: Maximum relative error of returned quantiles
+        max_bins: Maximum number of buckets kept
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles
+            max_bins: Maximum number of buckets kept
+
+        Raises:
+            ValueError: If relative_accuracy is not in (0, 1) or max_bins < 1
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_bins < 1:
+            raise ValueError("max_bins must be at least 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._multiplier = 1 / math.log(self.gamma)
+
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one value.
+
+        Args:
+            value: Value to add
+        """
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value > MIN_INDEXABLE_VALUE:
+            key = math.ceil(math.log(value) * self._multiplier)
+            self.bins[key] = self.bins.get(key, 0) + 1
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        else:
+            self.zero_count += 1
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add many values, binning NumPy arrays without a Python loop.
+
+        Args:
+            values: Values to add (a NumPy array, or any iterable)
+        """
+        if not NUMPY_AVAILABLE or not isinstance(values, np.ndarray):
+            for value in values:
+                self.add(value)
+            return
+        if not values.size:
+            return
+
+        values = values.astype(np.float64, copy=False)
+        self.count += int(values.size)
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        indexable = values[values > MIN_INDEXABLE_VALUE]
+        self.zero_count += int(values.size - indexable.size)
+        keys, counts = np.unique(np.ceil(np.log(indexable) * self._multiplier).astype(np.int64), return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist(), strict=True):
+            self.bins[key] = self.bins.get(key, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add another sketch's values to this one.
+
+        Args:
+            other: Sketch with the same relative accuracy
+
+        Raises:
+            ValueError: If the sketches have different accuracies
+        """
+        if not math.isclose(self.gamma, other.gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if not other.count:
+            return
+
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def quantile(self, q: float) -> float:
+        """Get an approximate quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Like ``MetricsAnalyzer._percentile``, interpolates linearly between
+        the values at the two closest ranks.
+
+        Returns:
+            Value within ``relative_accuracy`` of the exact quantile, clamped
+            to the observed min and max (0.0 if empty)
+
+        Raises:
+            ValueError: If q is outside [0, 1]
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        lower_rank = math.floor(rank)
+        lower = self._value_at(lower_rank)
+        if rank == lower_rank:
+            return lower
+        upper = self._value_at(lower_rank + 1)
+        return lower + (upper - lower) * (rank - lower_rank)
+
+    def percentile(self, percentile: float) -> float:
+        """Get an approximate percentile.
+
+        Args:
+            percentile: Percentile in [0, 100]
+
+        Returns:
+            Percentile value (see ``quantile``)
+        """
+        return self.quantile(percentile / 100)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert sketch to a JSON-serializable dictionary."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zero_count": self.zero_count,
+            "bins": {str(key): count for key, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Create sketch from its dictionary representation.
+
+        Args:
+            data: Output of ``to_dict``
+
+        Returns:
+            Restored sketch
+        """
+        sketch = cls(data["relative_accuracy"], data["max_bins"])
+        sketch.count = data["count"]
+        sketch.total = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        sketch.zero_count = data["zero_count"]
+        sketch.bins = {int(key): count for key, count in data["bins"].items()}
+        return sketch
+
+    def _value_at(self, rank: int) -> float:
+        """Estimate the value of the given (0-based) rank."""
+        value = 0.0
+        seen = self.zero_count
+        if seen <= rank:
+            for key in sorted(self.bins):
+                seen += self.bins[key]
+                if seen > rank:
+                    # Midpoint (in relative terms) of the bucket's range
+                    value = 2 * self.gamma**key / (self.gamma + 1)
+                    break
+        return min(max(value, self.min), self.max)
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together until ``max_bins`` remain."""
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        folded = sum(self.bins.pop(key) for key in keys[:excess])
+        target = keys[excess]
+        self.bins[target] += folded
@@ -6,11 +6,18 @@ format for efficient append operations and streaming analysis.
 
 Features:
     - Thread-safe append operations with locking
-    - Automatic log rotation at 10MB threshold
+    - Optional buffered writer: group commits from a background thread
+    - Automatic log rotation at 10MB threshold and at day (or hour) boundaries
+    - Indexed segments: time-windowed reads skip whole files and blocks
+    - Compaction of closed segments into compressed columnar archives,
+      with retention by age or total size
     - Privacy-first: no PII, only performance metrics
     - Efficient JSONL format for streaming
 
-Storage location: ~/.mycelium/analytics/events.jsonl
+Storage location: ~/.mycelium/analytics/events.jsonl (active segment) plus
+rotated ``events_<timestamp>.jsonl`` segments, each with an ``.idx`` sidecar
+index (see ``mycelium_analytics.segments``), or once compacted an
+``events_<timestamp>.col`` archive (see ``mycelium_analytics.archive``).
 
 Example:
     >>> from pathlib import Path
@@ -26,16 +33,36 @@ Phase: 2 Performance Analytics
 Date: 2025-10-18
 """
 
+import atexit
 import contextlib
 import json
+import shutil
 import threading
+from collections.abc import Collection, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from mycelium_analytics.archive import ARCHIVE_SUFFIX, is_archive, iter_archive, load_archive_index, write_archive
+from mycelium_analytics.segments import (
+    SIDECAR_SUFFIXES,
+    SegmentIndex,
+    iter_segment,
+    iter_unindexed,
+    load_active_index,
+    load_index,
+    parse_timestamp,
+    remove_sidecars,
+    save_index,
+    to_epoch,
+)
+
 # Module-level default for storage directory
 _DEFAULT_STORAGE_DIR = Path.home() / ".mycelium" / "analytics"
 
+# strftime formats identifying the period a segment belongs to
+_PERIOD_FORMATS = {"hour": "%Y%m%d%H", "day": "%Y%m%d"}
+
 
 class EventStorage:
     """Thread-safe JSONL storage for telemetry events.
@@ -49,9 +76,18 @@ class EventStorage:
         - Only performance metrics (durations, counts, booleans)
         - Timestamps are UTC with no timezone PII
 
+    With ``buffered=True``, ``append_event`` only serializes the event and
+    queues it; a background thread appends queued events in one write every
+    ``flush_every`` events or ``flush_interval_ms`` milliseconds, and on
+    interpreter exit. Reads from the same instance flush first. If more
+    than ``max_queue`` events are waiting, new ones are dropped and counted
+    (see ``get_writer_stats``), so a stalled disk never blocks callers.
+
     Attributes:
         storage_dir: Directory for JSONL files
         max_file_size: Maximum file size before rotation (10MB default)
+        segment_period: Rotate at "day" or "hour" boundaries (None: size only)
+        buffered: Whether appends are queued for the background writer
 
     Example:
         >>> storage = EventStorage()
@@ -66,11 +102,18 @@ class EventStorage:
     DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
     DEFAULT_FILENAME = "events.jsonl"
     ROTATED_FILENAME_PATTERN = "events_{timestamp}.jsonl"
+    MIGRATED_FILENAME_PATTERN = "events_{period}_migrated.jsonl"
+    MIGRATION_MARKER = ".segments-v1"
 
     def __init__(
         self,
         storage_dir: Path | None = None,
         max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        segment_period: str | None = "day",
+        buffered: bool = False,
+        flush_every: int = 256,
+        flush_interval_ms: float = 250.0,
+        max_queue: int = 10000,
     ):
         """Initialize storage backend.
 
@@ -78,6 +121,14 @@ class EventStorage:
             storage_dir: Directory for storing JSONL files
                 (default: ~/.mycelium/analytics)
             max_file_size: Maximum file size before rotation in bytes
+            segment_period: Also rotate when the UTC "day" or "hour"
+                changes, so closed segments cover bounded time ranges
+                (None: rotate on size only)
+            buffered: Queue appends for a background writer thread
+            flush_every: Queued events that trigger a write (buffered only)
+            flush_interval_ms: Maximum time an event stays queued (buffered only)
+            max_queue: Queued events beyond which appends are dropped
+                (buffered only)
 
         Example:
             >>> storage = EventStorage()
@@ -89,8 +140,32 @@ class EventStorage:
         else:
             self.storage_dir = _DEFAULT_STORAGE_DIR
 
+        if segment_period is not None and segment_period not in _PERIOD_FORMATS:
+            raise ValueError(f"segment_period must be one of {sorted(_PERIOD_FORMATS)} or None")
+        if flush_every < 1 or max_queue < 1:
+            raise ValueError("flush_every and max_queue must be at least 1")
+        if flush_interval_ms <= 0:
+            raise ValueError("flush_interval_ms must be positive")
+
         self.max_file_size = max_file_size
+        self.segment_period = segment_period
+        self.buffered = buffered
+        self.flush_every = flush_every
+        self.flush_interval_ms = flush_interval_ms
+        self.max_queue = max_queue
         self._lock = threading.Lock()
+        # Period and size of the active segment (resolved on first append);
+        # the size is refreshed by every write instead of stat() per event
+        self._active_period: str | None = None
+        self._active_size: int | None = None
+
+        # Buffered writer state
+        self._queue: list[str] = []
+        self._queue_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer: threading.Thread | None = None
+        self._closed = False
+        self._writer_stats = {"queued": 0, "written": 0, "dropped": 0, "flushes": 0, "errors": 0}
 
         # Ensure storage directory exists
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -102,13 +177,14 @@ class EventStorage:
         """Append event to JSONL file (thread-safe).
 
         Writes event as single-line JSON with newline. Automatically rotates
-        file if it exceeds max_file_size. Thread-safe with locking.
+        file if it exceeds max_file_size. Thread-safe with locking. When
+        buffered, the event is only queued for the background writer.
 
         Args:
             event: Event dictionary to append
 
         Raises:
-            OSError: If file write fails
+            OSError: If file write fails (unbuffered only)
             TypeError: If event is not JSON-serializable
 
         Example:
@@ -120,33 +196,135 @@ class EventStorage:
             ... }
             >>> storage.append_event(event)
         """
+        json_line = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+
+        if self.buffered:
+            with self._queue_lock:
+                if not self._closed:
+                    self._enqueue(json_line)
+                    return
+
         with self._lock:
-            # Check if rotation is needed BEFORE writing
-            self._rotate_if_needed()
+            self._write_lines([json_line])
+
+    def flush(self) -> None:
+        """Write all queued events now (no-op when unbuffered).
 
-            # Write event as single-line JSON
+        Raises:
+            OSError: If the write fails; the events are dropped and counted
+        """
+        with self._lock:
+            with self._queue_lock:
+                lines, self._queue = self._queue, []
+            if not lines:
+                return
             try:
-                json_line = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
-                with self._current_file.open("a", encoding="utf-8") as f:
-                    f.write(json_line + "\n")
-            except (OSError, TypeError):
-                # Re-raise for caller to handle
+                self._write_lines(lines)
+            except OSError:
+                with self._queue_lock:
+                    self._writer_stats["errors"] += 1
+                    self._writer_stats["dropped"] += len(lines)
                 raise
+            with self._queue_lock:
+                self._writer_stats["written"] += len(lines)
+                self._writer_stats["flushes"] += 1
+
+    def close(self) -> None:
+        """Stop the background writer after writing queued events.
+
+        Registered with ``atexit`` when the writer starts. Later appends are
+        written synchronously.
+        """
+        with self._queue_lock:
+            self._closed = True
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            atexit.unregister(self.close)
+            self._wakeup.set()
+            writer.join()
+        with contextlib.suppress(OSError):
+            self.flush()
+
+    def get_writer_stats(self) -> dict[str, int]:
+        """Get buffered writer statistics.
+
+        Returns:
+            Counts of queued, written and dropped events, flushes, failed
+            writes, and events currently pending
+        """
+        with self._queue_lock:
+            return {**self._writer_stats, "pending": len(self._queue)}
+
+    def _enqueue(self, json_line: str) -> None:
+        """Queue a serialized event for the writer (queue lock held)."""
+        if len(self._queue) >= self.max_queue:
+            self._writer_stats["dropped"] += 1
+            return
+        self._queue.append(json_line)
+        self._writer_stats["queued"] += 1
+        if self._writer is None:
+            self._start_writer()
+        if len(self._queue) >= self.flush_every:
+            self._wakeup.set()
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread (queue lock held)."""
+        self._writer = threading.Thread(target=self._run_writer, name="mycelium-analytics-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _run_writer(self) -> None:
+        """Background writer loop: group commit on batch size or interval.
+
+        Exits once a flush leaves nothing queued; the next append starts a
+        new writer, so idle instances hold no thread.
+        """
+        interval = self.flush_interval_ms / 1000
+        while True:
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            # Failures are counted in the writer stats
+            with contextlib.suppress(OSError):
+                self.flush()
+            with self._queue_lock:
+                if self._closed:
+                    return
+                if not self._queue:
+                    self._writer = None
+                    atexit.unregister(self.close)
+                    return
+
+    def _write_lines(self, lines: list[str]) -> None:
+        """Append serialized events to the active segment (lock held)."""
+        self._rotate_if_needed()
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        try:
+            with self._current_file.open("ab") as f:
+                f.write(data)
+                self._active_size = f.tell()
+        except OSError:
+            # Re-read the size next time
+            self._active_size = None
+            raise
 
     def read_events(
         self,
         start_date: datetime | None = None,
         limit: int = 1000,
+        event_types: Collection[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Read events from storage with optional filtering.
+        """Read the most recent events from storage with optional filtering.
 
-        Reads events from current and rotated files, filtering by timestamp
-        if start_date provided. Returns up to limit events in chronological
-        order.
+        Reads segments newest first and stops once ``limit`` matching events
+        are found, so the newest events are returned when more match.
+        Segments and blocks entirely older than ``start_date``, or without
+        any of ``event_types``, are skipped unread. Events are returned in
+        chronological (storage) order.
 
         Args:
-            start_date: Optional minimum timestamp (UTC)
+            start_date: Optional minimum timestamp (naive means UTC)
             limit: Maximum number of events to return
+            event_types: Optional event types to include
 
         Returns:
             List of event dictionaries
@@ -160,63 +338,134 @@ class EventStorage:
             True
         """
         events: list[dict[str, Any]] = []
+        if limit <= 0:
+            return events
 
-        # Get all JSONL files (current + rotated)
-        jsonl_files = sorted(
-            self.storage_dir.glob("events*.jsonl"),
-            key=lambda p: p.stat().st_mtime,
-        )
-
-        for file_path in jsonl_files:
+        for event in self.iter_events(start_date, event_types, newest_first=True):
+            events.append(event)
             if len(events) >= limit:
                 break
 
-            try:
-                with file_path.open(encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
+        events.reverse()
+        return events
 
-                        try:
-                            event = json.loads(line)
+    def iter_events(
+        self,
+        start_date: datetime | None = None,
+        event_types: Collection[str] | None = None,
+        newest_first: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream events from all segments without materializing them.
 
-                            # Filter by start_date if provided
-                            if start_date is not None:
-                                event_time = datetime.fromisoformat(event.get("timestamp", ""))
-                                if event_time < start_date:
-                                    continue
+        Args:
+            start_date: Optional minimum timestamp (naive means UTC)
+            event_types: Optional event types to include
+            newest_first: Iterate from the most recent event backwards
 
-                            events.append(event)
+        Yields:
+            Event dictionaries, oldest first unless ``newest_first``
 
-                            if len(events) >= limit:
-                                break
+        Example:
+            >>> storage = EventStorage()
+            >>> sum(1 for _ in storage.iter_events(event_types=["agent_load"]))
+            1212
+        """
+        start_ts = to_epoch(start_date)
+        types = frozenset(event_types) if event_types is not None else None
 
-                        except (json.JSONDecodeError, ValueError):
-                            # Skip malformed lines
-                            continue
+        segments = self.list_segments(start_date, event_types)
+        if newest_first:
+            segments.reverse()
+            yield from iter_unindexed(self._current_file, start_ts, types, newest_first=True)
 
-            except OSError:
-                # Skip unreadable files
+        for path, index in segments:
+            if is_archive(path):
+                yield from iter_archive(path, start_ts, types, newest_first=newest_first)
+            else:
+                yield from iter_segment(path, index, start_ts, types, newest_first=newest_first)
+
+        if not newest_first:
+            yield from iter_unindexed(self._current_file, start_ts, types)
+
+    @property
+    def active_segment(self) -> Path:
+        """Path of the segment currently appended to (not indexed)."""
+        return self._current_file
+
+    def list_segments(
+        self,
+        start_date: datetime | None = None,
+        event_types: Collection[str] | None = None,
+    ) -> list[tuple[Path, SegmentIndex]]:
+        """List closed segments that may hold matching events, oldest first.
+
+        Compacted segments are listed as their archive, with an index built
+        from the archive header (no blocks); see ``archive.is_archive``.
+
+        Args:
+            start_date: Optional minimum timestamp (naive means UTC)
+            event_types: Optional event types of interest
+
+        Returns:
+            (segment path, segment index) pairs
+        """
+        self.flush()
+        start_ts = to_epoch(start_date)
+        types = frozenset(event_types) if event_types is not None else None
+        return [(path, index) for path, index in self._closed_segments() if index.overlaps(start_ts, types)]
+
+    def _closed_segments(self) -> list[tuple[Path, SegmentIndex]]:
+        """List rotated segments with their indexes, oldest first.
+
+        Segments are ordered by their latest event, then by name; segments
+        without timestamped events sort first. An archive whose JSONL
+        segment still exists (compaction in progress) is not listed.
+        """
+        segments = []
+        for path in self.storage_dir.glob("events*.jsonl"):
+            if path.name == self.DEFAULT_FILENAME:
+                continue
+            index = load_index(path)
+            if index is not None:
+                segments.append((path, index))
+        for path in self.storage_dir.glob(f"events*{ARCHIVE_SUFFIX}"):
+            if path.with_suffix(".jsonl").exists():
                 continue
+            index = load_archive_index(path)
+            if index is not None:
+                segments.append((path, index))
 
-        return events
+        segments.sort(key=lambda item: (item[1].max_ts is not None, item[1].max_ts or 0.0, item[0].name))
+        return segments
 
     def _rotate_if_needed(self) -> None:
-        """Check file size and rotate if needed (internal).
+        """Check file size and period, and rotate if needed (internal).
 
         Renames current file with timestamp suffix and creates new file.
-        Called internally with lock held.
+        Called internally with lock held. The rotated segment is indexed
+        lazily by the first read, keeping this off the append path. The
+        file size is only stat()ed once; writes keep it up to date.
 
         Privacy note: Timestamp in filename is UTC, no timezone PII.
         """
-        if not self._current_file.exists():
+        period = self._period_of(datetime.now(timezone.utc))
+        if self._active_size is None:
+            try:
+                self._active_size = self._current_file.stat().st_size
+            except OSError:
+                self._active_size = 0
+        if not self._active_size:
+            self._active_period = period
             return
 
-        # Check file size
-        file_size = self._current_file.stat().st_size
-        if file_size < self.max_file_size:
+        if self._active_period is None:
+            self._active_period = self._first_event_period() or period
+
+        # Check file size and period
+        if self._active_size < self.max_file_size and self._active_period == period:
             return
+        self._active_period = period
+        self._active_size = 0
 
         # Rotate: rename current file with timestamp
         # Add microseconds to avoid collisions in high-frequency rotation
@@ -229,11 +478,31 @@ class EventStorage:
         with contextlib.suppress(OSError):
             self._current_file.rename(rotated_path)
 
+    def _period_of(self, moment: datetime) -> str | None:
+        """Get the rotation period key of a UTC datetime."""
+        if self.segment_period is None:
+            return None
+        return moment.strftime(_PERIOD_FORMATS[self.segment_period])
+
+    def _first_event_period(self) -> str | None:
+        """Get the period of the active segment from its first event."""
+        try:
+            with self._current_file.open("rb") as f:
+                first_line = f.readline()
+            ts = parse_timestamp(json.loads(first_line).get("timestamp"))
+        except (OSError, ValueError, AttributeError):
+            return None
+        if ts is None:
+            return None
+        return self._period_of(datetime.fromtimestamp(ts, tz=timezone.utc))
+
     def get_storage_stats(self) -> dict[str, Any]:
         """Get storage statistics including event count and latest timestamp.
 
         Returns information about storage usage, file count, sizes, total
-        events, and most recent event timestamp.
+        events, and most recent event timestamp. Closed segments are
+        summarized from their indexes; the active segment's saved index is
+        extended with the lines appended since the last call.
 
         Returns:
             Dict with storage statistics including:
@@ -241,6 +510,7 @@ class EventStorage:
                 - total_events: Total number of events across all files
                 - total_size_bytes: Total storage size in bytes
                 - latest_event_time: ISO timestamp of most recent event
+                - event_type_counts: Number of events per event type
                 - storage_dir: Path to storage directory
 
         Example:
@@ -253,42 +523,194 @@ class EventStorage:
             >>> 'latest_event_time' in stats
             True
         """
-        jsonl_files = list(self.storage_dir.glob("events*.jsonl"))
+        self.flush()
+        indexes = [index for _, index in self._closed_segments()]
+        active_index = load_active_index(self._current_file)
+        if active_index is not None:
+            indexes.append(active_index)
 
-        total_events = 0
-        total_size = 0
-        latest_event_time = None
+        event_type_counts: dict[str, int] = {}
+        for index in indexes:
+            for event_type, count in index.event_types.items():
+                event_type_counts[event_type] = event_type_counts.get(event_type, 0) + count
 
-        for file_path in jsonl_files:
-            try:
-                total_size += file_path.stat().st_size
+        latest_ts = max((index.max_ts for index in indexes if index.max_ts is not None), default=None)
+
+        return {
+            "file_count": len(indexes),
+            "total_events": sum(index.count for index in indexes),
+            "total_size_bytes": sum(index.size for index in indexes),
+            "latest_event_time": (
+                datetime.fromtimestamp(latest_ts, tz=timezone.utc).isoformat() if latest_ts is not None else None
+            ),
+            "event_type_counts": event_type_counts,
+            "storage_dir": str(self.storage_dir),
+        }
+
+    def migrate_segments(self) -> dict[str, int]:
+        """Repartition rotated segments from older versions by time (one-time).
+
+        Events of every rotated segment are regrouped into one segment per
+        ``segment_period`` (by event timestamp), sorted by timestamp within
+        each, and indexed; the original files are then removed. The active
+        segment is left alone. Runs once per storage directory: a marker
+        file makes later calls no-ops. Lines are copied verbatim, malformed
+        ones are dropped. Migrated events are not visible to readers until
+        their new segment is in place; an interrupted migration resumes
+        from its staged sources when called again.
+
+        Returns:
+            Dict with files_migrated, segments_written and events_migrated
 
-                # Count events and find latest timestamp
-                with file_path.open("r", encoding="utf-8") as f:
+        Example:
+            >>> storage = EventStorage()
+            >>> storage.migrate_segments()
+            {'files_migrated': 42, 'segments_written': 19, 'events_migrated': 1830211}
+        """
+        result = {"files_migrated": 0, "segments_written": 0, "events_migrated": 0}
+        marker = self.storage_dir / self.MIGRATION_MARKER
+
+        with self._lock:
+            if marker.exists():
+                return result
+
+            # Claim the sources first so an interrupted run can be repeated
+            staging = self.storage_dir / ".migrating"
+            sources_dir = staging / "sources"
+            output_dir = staging / "output"
+            sources_dir.mkdir(parents=True, exist_ok=True)
+            shutil.rmtree(output_dir, ignore_errors=True)
+            output_dir.mkdir()
+            for path in self.storage_dir.glob("events*.jsonl"):
+                if path.name != self.DEFAULT_FILENAME and not path.name.endswith("_migrated.jsonl"):
+                    path.replace(sources_dir / path.name)
+                    remove_sidecars(path)
+
+            # Regroup lines by period, one source file in memory at a time
+            for path in sorted(sources_dir.glob("events*.jsonl")):
+                buckets: dict[str, list[bytes]] = {}
+                with path.open("rb") as f:
                     for line in f:
-                        total_events += 1
                         try:
                             event = json.loads(line)
-                            timestamp = event.get("timestamp")
-                            if timestamp and (latest_event_time is None or timestamp > latest_event_time):
-                                latest_event_time = timestamp
-                        except json.JSONDecodeError:
+                        except ValueError:
+                            continue
+                        if not isinstance(event, dict):
                             continue
+                        ts = parse_timestamp(event.get("timestamp"))
+                        if ts is None:
+                            period = "undated"
+                        else:
+                            period = self._period_of(datetime.fromtimestamp(ts, tz=timezone.utc)) or "all"
+                        buckets.setdefault(period, []).append(line.rstrip(b"\r\n") + b"\n")
+                        result["events_migrated"] += 1
+
+                for period, lines in buckets.items():
+                    with (output_dir / self.MIGRATED_FILENAME_PATTERN.format(period=period)).open("ab") as out:
+                        out.writelines(lines)
+                result["files_migrated"] += 1
+
+            # Sort each new segment by time, index it, and move it in place
+            for segment in sorted(output_dir.iterdir()):
+                lines = segment.read_bytes().splitlines(keepends=True)
+                lines.sort(key=lambda line: parse_timestamp(json.loads(line).get("timestamp")) or 0.0)
+                segment.write_bytes(b"".join(lines))
+                target = self.storage_dir / segment.name
+                remove_sidecars(target)
+                save_index(target, SegmentIndex.build(segment))
+                segment.replace(target)
+                result["segments_written"] += 1
+
+            shutil.rmtree(staging, ignore_errors=True)
+            marker.write_text(datetime.now(timezone.utc).isoformat(), encoding="utf-8")
+
+        return result
+
+    def compact_segments(self, codec: str | None = None) -> dict[str, int]:
+        """Rewrite closed JSONL segments as compressed columnar archives.
+
+        Each archive is written next to its segment, then the segment and
+        its sidecars are removed; readers ignore an archive until then, so
+        an interrupted run is simply repeated. The active segment is left
+        alone. Archives are read by every query transparently.
+
+        Args:
+            codec: "zstd" or "gzip" (default: zstd if installed)
+
+        Returns:
+            Dict with segments_compacted, events_compacted, bytes_before
+            and bytes_after
+
+        Raises:
+            ValueError: If the codec is unknown or unavailable
+
+        Example:
+            >>> storage = EventStorage()
+            >>> storage.compact_segments()
+            {'segments_compacted': 19, 'events_compacted': 1830211, 'bytes_before': 270536704, 'bytes_after': 14417920}
+        """
+        result = {"segments_compacted": 0, "events_compacted": 0, "bytes_before": 0, "bytes_after": 0}
+        for path, index in self.list_segments():
+            if is_archive(path):
+                continue
+            try:
+                archive = write_archive(path, codec=codec)
+                archive_size = archive.stat().st_size
+                path.unlink()
             except OSError:
                 continue
+            remove_sidecars(path)
+            result["segments_compacted"] += 1
+            result["events_compacted"] += index.count
+            result["bytes_before"] += index.size
+            result["bytes_after"] += archive_size
+        return result
 
-        return {
-            "file_count": len(jsonl_files),
-            "total_events": total_events,
-            "total_size_bytes": total_size,
-            "latest_event_time": latest_event_time,
-            "storage_dir": str(self.storage_dir),
-        }
+    def apply_retention(self, max_age_days: float | None = None, max_bytes: int | None = None) -> dict[str, int]:
+        """Delete the oldest closed segments and archives beyond a retention policy.
+
+        Segments whose newest event is older than ``max_age_days`` are
+        deleted, then the oldest remaining ones until the store (including
+        the active segment, which is never deleted) fits in ``max_bytes``.
+
+        Args:
+            max_age_days: Maximum age of the newest event of a segment
+            max_bytes: Maximum total size of the store in bytes
+
+        Returns:
+            Dict with files_deleted and bytes_freed
+
+        Example:
+            >>> storage = EventStorage()
+            >>> storage.apply_retention(max_age_days=90, max_bytes=100 * 2**20)
+            {'files_deleted': 3, 'bytes_freed': 2097152}
+        """
+        result = {"files_deleted": 0, "bytes_freed": 0}
+        segments = self.list_segments()
+        cutoff = datetime.now(timezone.utc).timestamp() - max_age_days * 86400 if max_age_days is not None else None
+        total = sum(index.size for _, index in segments)
+        with contextlib.suppress(OSError):
+            total += self._current_file.stat().st_size
+
+        for path, index in segments:
+            expired = cutoff is not None and index.max_ts is not None and index.max_ts < cutoff
+            if not expired and (max_bytes is None or total <= max_bytes):
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            remove_sidecars(path)
+            total -= index.size
+            result["files_deleted"] += 1
+            result["bytes_freed"] += index.size
+        return result
 
     def clear_all_events(self) -> int:
         """Delete all event files (for testing/maintenance).
 
-        WARNING: This permanently deletes all telemetry data.
+        WARNING: This permanently deletes all telemetry data, including
+        events still queued by the buffered writer.
 
         Returns:
             Number of files deleted
@@ -300,7 +722,10 @@ class EventStorage:
             True
         """
         with self._lock:
-            jsonl_files = list(self.storage_dir.glob("events*.jsonl"))
+            with self._queue_lock:
+                self._queue.clear()
+            self._active_size = None
+            jsonl_files = [*self.storage_dir.glob("events*.jsonl"), *self.storage_dir.glob(f"events*{ARCHIVE_SUFFIX}")]
             deleted = 0
 
             for file_path in jsonl_files:
@@ -310,4 +735,9 @@ class EventStorage:
                 except OSError:
                     continue
 
+            for suffix in SIDECAR_SUFFIXES:
+                for sidecar in self.storage_dir.glob(f"events*{suffix}"):
+                    with contextlib.suppress(OSError):
+                        sidecar.unlink()
+
             return deleted
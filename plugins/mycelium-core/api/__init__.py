@@ -8,9 +8,19 @@ from .discovery import app, create_app
 from .models import (
     AgentDetailResponse,
     AgentSearchResponse,
+    BatchDiscoverRequest,
+    BatchDiscoverResponse,
+    CategoryListResponse,
     DiscoverRequest,
     DiscoverResponse,
     ErrorResponse,
+    WorkflowSummaryResponse,
+)
+from .ratelimit import (
+    InMemoryRateLimiter,
+    RateLimiterBackend,
+    RedisRateLimiter,
+    create_rate_limiter,
 )
 
 __all__ = [
@@ -18,9 +28,17 @@ __all__ = [
     "create_app",
     "DiscoverRequest",
     "DiscoverResponse",
+    "BatchDiscoverRequest",
+    "BatchDiscoverResponse",
     "AgentDetailResponse",
     "AgentSearchResponse",
+    "CategoryListResponse",
     "ErrorResponse",
+    "WorkflowSummaryResponse",
+    "RateLimiterBackend",
+    "InMemoryRateLimiter",
+    "RedisRateLimiter",
+    "create_rate_limiter",
 ]
 
 __version__ = "1.0.0"
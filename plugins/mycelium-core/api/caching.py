@@ -0,0 +1,131 @@
+"""Conditional GET and serialized-response caching for the Discovery API.
+
+Cacheable responses are tagged with the registry's catalog version, a
+stamp bumped on every write to the agents table. The version doubles as
+the ETag, so a client revalidating with ``If-None-Match`` gets a 304 without
+rebuilding the response (a single-resource 304 only looks the resource up
+when its body is not cached), and serialized bodies cached under an older
+version are simply treated as misses: no explicit invalidation is needed.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+def make_etag(version: int) -> str:
+    """Build the weak ETag for a catalog version.
+
+    Args:
+        version: Catalog version stamp
+
+    Returns:
+        ETag header value
+    """
+    return f'W/"catalog-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+
+    current = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == current:
+            return True
+    return False
+
+
+class ResponseCache:
+    """LRU cache of serialized JSON bodies keyed by resource and catalog version.
+
+    Args:
+        max_entries: Maximum cached bodies before LRU eviction
+
+    Example:
+        >>> cache = ResponseCache(max_entries=256)
+        >>> cache.put(("agent", "backend-developer"), 7, b'{"agent": {}}')
+        >>> cache.get(("agent", "backend-developer"), 7)
+        b'{"agent": {}}'
+        >>> cache.get(("agent", "backend-developer"), 8) is None
+        True
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached bodies before LRU eviction
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._max_entries = max_entries
+        # {key: (catalog_version, body)}
+        self._entries: OrderedDict[Hashable, tuple[int, bytes]] = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable, version: int) -> bytes | None:
+        """Get a cached body if it was built from the given catalog version.
+
+        Args:
+            key: Resource key
+            version: Current catalog version
+
+        Returns:
+            Serialized body, or None on miss or stale version
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry[1]
+
+    def contains(self, key: Hashable, version: int) -> bool:
+        """Check for a body built from the given catalog version without counting a hit or miss.
+
+        Args:
+            key: Resource key
+            version: Current catalog version
+
+        Returns:
+            True if a current body is cached
+        """
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] == version
+
+    def put(self, key: Hashable, version: int, body: bytes) -> None:
+        """Cache a serialized body with LRU eviction.
+
+        Args:
+            key: Resource key
+            version: Catalog version the body was built from
+            body: Serialized JSON body
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        self._entries[key] = (version, body)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, evictions, size
+        """
+        return {**self._stats, "size": len(self._entries)}
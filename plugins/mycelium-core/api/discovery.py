@@ -4,22 +4,34 @@ This module provides RESTful endpoints for agent discovery, search,
 and metadata retrieval.
 """
 
+import asyncio
 import json
+import math
 import os
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
-from fastapi import FastAPI, HTTPException, Path, Query
+import asyncpg
+from fastapi import FastAPI, Header, HTTPException, Path, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
 from registry import (
+    REGISTRY_NOTIFY_CHANNEL,
     AgentNotFoundError,
     AgentRegistry,
     AgentRegistryError,
+    EmbeddingEncoder,
+    RegistryCache,
+    create_encoder,
+    embed_agents,
 )
 
+from .caching import ResponseCache, etag_matches, make_etag
 from .middleware import (
     PerformanceMonitoringMiddleware,
     RateLimitMiddleware,
@@ -30,15 +42,34 @@ from .models import (
     AgentMatch,
     AgentMetadata,
     AgentSearchResponse,
+    BatchDiscoverRequest,
+    BatchDiscoverResponse,
+    CategoryInfo,
+    CategoryListResponse,
     DiscoverRequest,
     DiscoverResponse,
+    DiscoverResult,
     ErrorResponse,
     HealthResponse,
+    WorkflowSummaryResponse,
 )
+from .ratelimit import RateLimiterBackend, create_rate_limiter
+
+if TYPE_CHECKING:
+    from coordination import CoordinationTracker
 
 # Global registry instance
 _registry: AgentRegistry | None = None
 
+# Global query encoder (must match the encoder used to embed agents)
+_encoder: EmbeddingEncoder | None = None
+
+# Global coordination tracker (optional; enables the workflow endpoints)
+_tracker: "CoordinationTracker | None" = None
+
+# Seconds between SSE keep-alive comments on idle live subscriptions
+LIVE_HEARTBEAT_SECONDS = 15.0
+
 
 def get_registry() -> AgentRegistry:
     """Get the global registry instance.
@@ -66,18 +97,80 @@ def set_registry(registry: AgentRegistry | None) -> None:
     _registry = registry
 
 
+def get_encoder() -> EmbeddingEncoder:
+    """Get the global query encoder, creating the default one on first use.
+
+    Returns:
+        EmbeddingEncoder instance
+    """
+    global _encoder
+    if _encoder is None:
+        _encoder = create_encoder()
+    return _encoder
+
+
+def set_encoder(encoder: EmbeddingEncoder | None) -> None:
+    """Set the global query encoder.
+
+    This function is primarily for testing purposes to inject an encoder.
+
+    Args:
+        encoder: EmbeddingEncoder instance or None to reset to the default
+    """
+    global _encoder
+    _encoder = encoder
+
+
+def get_tracker() -> "CoordinationTracker":
+    """Get the global coordination tracker.
+
+    Returns:
+        CoordinationTracker instance
+
+    Raises:
+        HTTPException: 503 if coordination tracking is not enabled
+    """
+    if _tracker is None:
+        raise HTTPException(status_code=503, detail="Coordination tracking is not enabled")
+    return _tracker
+
+
+def set_tracker(tracker: "CoordinationTracker | None") -> None:
+    """Set the global coordination tracker.
+
+    This function is primarily for testing purposes to inject a tracker.
+
+    Args:
+        tracker: CoordinationTracker instance or None to disable the workflow endpoints
+    """
+    global _tracker
+    _tracker = tracker
+
+
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager.
 
-    Handles startup and shutdown of database connections.
+    Handles startup and shutdown of database connections and the rate limiter backend.
     """
-    global _registry
+    global _registry, _tracker
 
     # Startup: Initialize registry
     connection_string = os.getenv("DATABASE_URL", "postgresql://localhost:5432/mycelium_registry")
 
-    _registry = AgentRegistry(connection_string=connection_string)
+    # Read cache for the (small, rarely changing) catalog; REGISTRY_CACHE_TTL=0 disables it
+    cache_ttl = float(os.getenv("REGISTRY_CACHE_TTL", "60"))
+    cache = (
+        RegistryCache(ttl_seconds=cache_ttl, max_entries=int(os.getenv("REGISTRY_CACHE_SIZE", "1024")))
+        if cache_ttl > 0
+        else None
+    )
+
+    _registry = AgentRegistry(
+        connection_string=connection_string,
+        cache=cache,
+        notify_channel=os.getenv("REGISTRY_NOTIFY_CHANNEL", REGISTRY_NOTIFY_CHANNEL),
+    )
     await _registry.initialize()
 
     # Perform health check
@@ -85,24 +178,65 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     if health["status"] != "healthy":
         raise RuntimeError(f"Registry is unhealthy: {health}")
 
+    # Back-fill embeddings for new or changed agents (incremental, keyed on content hash)
+    if os.getenv("DISCOVERY_EMBED_ON_STARTUP", "true").lower() == "true":
+        await embed_agents(_registry, get_encoder())
+
+    # Workflow event endpoints get their own pool so long-running streams
+    # cannot starve registry queries
+    tracking_pool: asyncpg.Pool | None = None
+    if os.getenv("DISCOVERY_ENABLE_TRACKING", "false").lower() == "true":
+        # Imported here: the coordination package is optional for discovery
+        from coordination import CoordinationTracker, WorkflowNotifier, register_json_codecs
+
+        tracking_pool = await asyncpg.create_pool(
+            connection_string,
+            min_size=1,
+            max_size=int(os.getenv("DISCOVERY_TRACKING_POOL_SIZE", "5")),
+            init=register_json_codecs,
+        )
+        # Live subscriptions share one LISTEN connection from this pool
+        _tracker = CoordinationTracker(pool=tracking_pool, notifier=WorkflowNotifier(tracking_pool))
+        await _tracker.initialize()
+
     yield
 
-    # Shutdown: Close registry
+    # Shutdown: Close tracker, registry and rate limiter
+    if _tracker is not None and tracking_pool is not None:
+        if _tracker.notifier is not None:
+            await _tracker.notifier.close()
+        await _tracker.close()
+        await tracking_pool.close()
+        _tracker = None
+
     if _registry is not None:
         await _registry.close()
 
+    rate_limiter: RateLimiterBackend | None = getattr(application.state, "rate_limiter", None)
+    if rate_limiter is not None:
+        await rate_limiter.close()
+
 
 def create_app(
     rate_limit: int = 100,
+    burst_size: int = 10,
     enable_cors: bool = True,
     cors_origins: list[str] | None = None,
+    rate_limiter: RateLimiterBackend | None = None,
+    cache_max_age: int = 60,
+    response_cache_size: int = 1024,
 ) -> FastAPI:
     """Create and configure FastAPI application.
 
     Args:
         rate_limit: Requests per minute rate limit
+        burst_size: Maximum burst of requests allowed per client
         enable_cors: Whether to enable CORS
         cors_origins: List of allowed CORS origins
+        rate_limiter: Rate limiter backend. Defaults to ``create_rate_limiter``,
+            which uses Redis when DISCOVERY_RATE_LIMIT_REDIS_URL is set
+        cache_max_age: Cache-Control max-age (seconds) for ETag-validated responses
+        response_cache_size: Maximum serialized responses kept in memory
 
     Returns:
         Configured FastAPI application
@@ -130,7 +264,8 @@ def create_app(
     # Add custom middleware (order matters - outermost first)
     app.add_middleware(PerformanceMonitoringMiddleware)
     app.add_middleware(RequestValidationMiddleware)
-    app.add_middleware(RateLimitMiddleware, requests_per_minute=rate_limit)
+    app.state.rate_limiter = rate_limiter or create_rate_limiter(rate_limit, burst_size)
+    app.add_middleware(RateLimitMiddleware, backend=app.state.rate_limiter)
 
     # Exception handlers
     @app.exception_handler(AgentNotFoundError)
@@ -169,6 +304,51 @@ def create_app(
             },
         )
 
+    # Serialized bodies of cacheable GET responses, validated by catalog version
+    response_cache = ResponseCache(max_entries=response_cache_size)
+    app.state.response_cache = response_cache
+    cache_control = f"public, max-age={cache_max_age}, must-revalidate"
+
+    async def cached_response(
+        key: tuple[str, ...],
+        if_none_match: str | None,
+        build: Callable[[], Awaitable[BaseModel]],
+        check: Callable[[], Awaitable[None]] | None = None,
+    ) -> Response:
+        """Serve a catalog-versioned GET response with ETag and 304 handling.
+
+        ``build`` and ``check`` must read around the registry cache: some
+        writes (usage triggers, direct SQL, a NOTIFY still in flight) bump the
+        catalog version without invalidating it, and a stale row cached here
+        would be served under the new ETag until the next bump.
+
+        Args:
+            key: Response cache key for the resource
+            if_none_match: Client If-None-Match header
+            build: Coroutine building the response model on a cache miss
+            check: Coroutine raising HTTPException if the resource does not
+                exist, awaited before a 304 unless its body is already
+                cached for the current version
+
+        Returns:
+            304 if the client's copy is current, otherwise the JSON body
+        """
+        version = await get_registry().get_catalog_version()
+        etag = make_etag(version)
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+
+        if etag_matches(if_none_match, etag):
+            if check is not None and not response_cache.contains(key, version):
+                await check()
+            return Response(status_code=304, headers=headers)
+
+        body = response_cache.get(key, version)
+        if body is None:
+            body = (await build()).model_dump_json().encode()
+            response_cache.put(key, version, body)
+
+        return Response(content=body, media_type="application/json", headers=headers)
+
     # Health check endpoint
     @app.get(
         "/api/v1/health",
@@ -187,6 +367,7 @@ def create_app(
             pgvector_installed=health["pgvector_installed"],
             agent_count=health["agent_count"],
             database_size=health["database_size"],
+            cache=health.get("cache"),
             timestamp=health["timestamp"],
         )
 
@@ -206,8 +387,10 @@ def create_app(
     async def discover_agents(request: DiscoverRequest) -> DiscoverResponse:
         """Discover agents based on natural language query.
 
-        This endpoint performs full-text search on agent descriptions,
-        capabilities, keywords, and names to find relevant agents.
+        Combines ranked full-text matches (names, keywords, capabilities,
+        descriptions; GIN index) with vector similarity over agent embeddings
+        (HNSW index), so relevant agents are found without scanning every
+        description per query.
 
         Args:
             request: Discovery request with query and parameters
@@ -217,76 +400,18 @@ def create_app(
         """
         start_time = time.time()
         registry = get_registry()
-
-        # Perform search using registry
-        results = await registry.search_agents(
-            query=request.query,
-            limit=request.limit,
+        encoder = get_encoder()
+
+        # Fetch lexical and vector candidates concurrently
+        query_embedding = (await asyncio.to_thread(encoder.encode, [request.query]))[0]
+        candidate_limit = request.limit * 2
+        lexical_results, vector_results = await asyncio.gather(
+            registry.search_agents(query=request.query, limit=candidate_limit),
+            registry.similarity_search(embedding=query_embedding, limit=candidate_limit, threshold=0.0),
         )
 
-        # Convert to response format with confidence scores
-        # For now, use simple text matching for confidence
-        # This will be enhanced in Task 1.3 with NLP matching
-        matches: list[AgentMatch] = []
-        for agent_data in results:
-            # Calculate simple confidence based on keyword matches
-            query_lower = request.query.lower()
-            confidence = 0.0
-
-            # Exact type match = high confidence
-            if query_lower in agent_data["agent_type"].lower():
-                confidence = 0.95
-            # Name match
-            elif query_lower in agent_data["name"].lower():
-                confidence = 0.90
-            # Keyword match
-            elif any(query_lower in kw.lower() for kw in agent_data["keywords"]):
-                confidence = 0.85
-            # Description match
-            elif query_lower in agent_data["description"].lower():
-                confidence = 0.70
-            else:
-                confidence = 0.60
-
-            # Filter by threshold
-            if confidence >= request.threshold:
-                # Parse metadata from JSON string
-                metadata_str = agent_data.get("metadata", "{}")
-                if isinstance(metadata_str, str):
-                    json.loads(metadata_str)
-                else:
-                    pass
-
-                agent_meta = AgentMetadata(
-                    id=agent_data["id"],
-                    agent_id=agent_data["agent_id"],
-                    agent_type=agent_data["agent_type"],
-                    name=agent_data["name"],
-                    display_name=agent_data["display_name"],
-                    category=agent_data["category"],
-                    description=agent_data["description"],
-                    capabilities=agent_data["capabilities"],
-                    tools=agent_data["tools"],
-                    keywords=agent_data["keywords"],
-                    file_path=agent_data["file_path"],
-                    estimated_tokens=agent_data.get("estimated_tokens"),
-                    avg_response_time_ms=agent_data.get("avg_response_time_ms"),
-                    success_rate=agent_data.get("success_rate"),
-                    usage_count=agent_data.get("usage_count", 0),
-                    created_at=agent_data["created_at"],
-                    updated_at=agent_data["updated_at"],
-                    last_used_at=agent_data.get("last_used_at"),
-                )
-
-                match = AgentMatch(
-                    agent=agent_meta,
-                    confidence=confidence,
-                    match_reason=_get_match_reason(agent_data, query_lower),
-                )
-                matches.append(match)
-
-        # Sort by confidence descending
-        matches.sort(key=lambda m: m.confidence, reverse=True)
+        matches = _rank_hybrid(request.query.lower(), lexical_results, vector_results, request.threshold)
+        matches = matches[: request.limit]
 
         processing_time = (time.time() - start_time) * 1000  # Convert to ms
 
@@ -297,6 +422,53 @@ def create_app(
             processing_time_ms=processing_time,
         )
 
+    # Batch discovery endpoint
+    @app.post(
+        "/api/v1/agents/discover:batch",
+        response_model=BatchDiscoverResponse,
+        tags=["Discovery"],
+        summary="Discover agents for many queries",
+        description="Discover agents for several queries in a single request and database round trip",
+        responses={
+            200: {"description": "Successful discovery"},
+            400: {"model": ErrorResponse, "description": "Invalid request"},
+            500: {"model": ErrorResponse, "description": "Server error"},
+        },
+    )
+    async def discover_agents_batch(request: BatchDiscoverRequest) -> BatchDiscoverResponse:
+        """Discover agents for a batch of queries.
+
+        Ranks each query exactly like the single-query endpoint, but encodes
+        all queries in one batch and fetches every query's lexical and vector
+        candidates with a single registry statement.
+
+        Args:
+            request: Batch discovery request with queries and shared parameters
+
+        Returns:
+            Per-query matches in request order
+        """
+        start_time = time.time()
+        registry = get_registry()
+        encoder = get_encoder()
+
+        query_embeddings = await asyncio.to_thread(encoder.encode, request.queries)
+        candidates = await registry.hybrid_search_batch(
+            queries=request.queries,
+            embeddings=query_embeddings,
+            limit=request.limit * 2,
+        )
+
+        results = []
+        for query, (lexical_results, vector_results) in zip(request.queries, candidates, strict=True):
+            matches = _rank_hybrid(query.lower(), lexical_results, vector_results, request.threshold)
+            matches = matches[: request.limit]
+            results.append(DiscoverResult(query=query, matches=matches, total_count=len(matches)))
+
+        processing_time = (time.time() - start_time) * 1000  # Convert to ms
+
+        return BatchDiscoverResponse(results=results, processing_time_ms=processing_time)
+
     # Agent search endpoint
 
     @app.get(
@@ -331,68 +503,72 @@ def create_app(
         offset: int = Query(
             0,
             ge=0,
-            description="Offset for pagination",
+            description="Offset for pagination (prefer 'after' for deep pages)",
+        ),
+        after: str | None = Query(
+            None,
+            description="Keyset cursor '<name>,<id>' from the previous page's next_cursor",
+            max_length=300,
         ),
     ) -> AgentSearchResponse:
         """Search agents with optional filters.
 
+        The category filter is applied in SQL before limiting, and
+        ``total_count`` is the number of matching agents across all pages.
+
         Args:
             q: Search query (optional)
             category: Category filter (optional)
             limit: Maximum results to return
-            offset: Pagination offset
+            offset: Pagination offset (ignored when ``after`` is given)
+            after: Keyset cursor returned as ``next_cursor`` by the previous page
 
         Returns:
             List of matching agents
         """
         start_time = time.time()
         registry = get_registry()
+        cursor = _parse_cursor(after) if after else None
 
         # If query provided, use search
         if q:
-            results = await registry.search_agents(query=q, limit=limit)
-            # Apply category filter if provided
-            if category:
-                results = [r for r in results if r["category"] == category]
-        else:
-            # Otherwise list with category filter
-            results = await registry.list_agents(
-                category=category,
+            results = await registry.search_agents(
+                query=q,
                 limit=limit,
+                category=category,
                 offset=offset,
+                after=cursor,
+            )
+            if results:
+                total_count = int(results[0]["total_count"])
+            elif offset or cursor:
+                # Paged past the last match: no row carries the window count
+                total_count = await registry.count_search_matches(q, category=category)
+            else:
+                total_count = 0
+        else:
+            # Otherwise list with category filter
+            results, total_count = await asyncio.gather(
+                registry.list_agents(
+                    category=category,
+                    limit=limit,
+                    offset=offset,
+                    after=cursor,
+                ),
+                registry.get_agent_count(category=category),
             )
 
         # Convert to response format
-        agents: list[AgentMetadata] = []
-        for agent_data in results:
-            agent_meta = AgentMetadata(
-                id=agent_data["id"],
-                agent_id=agent_data["agent_id"],
-                agent_type=agent_data["agent_type"],
-                name=agent_data["name"],
-                display_name=agent_data["display_name"],
-                category=agent_data["category"],
-                description=agent_data["description"],
-                capabilities=agent_data["capabilities"],
-                tools=agent_data["tools"],
-                keywords=agent_data["keywords"],
-                file_path=agent_data["file_path"],
-                estimated_tokens=agent_data.get("estimated_tokens"),
-                avg_response_time_ms=agent_data.get("avg_response_time_ms"),
-                success_rate=agent_data.get("success_rate"),
-                usage_count=agent_data.get("usage_count", 0),
-                created_at=agent_data["created_at"],
-                updated_at=agent_data["updated_at"],
-                last_used_at=agent_data.get("last_used_at"),
-            )
-            agents.append(agent_meta)
+        agents = [_to_agent_metadata(agent_data) for agent_data in results]
+        next_cursor = f"{results[-1]['name']},{results[-1]['id']}" if len(results) == limit else None
 
         processing_time = (time.time() - start_time) * 1000  # Convert to ms
 
         return AgentSearchResponse(
             query=q or "",
             agents=agents,
-            total_count=len(agents),
+            total_count=total_count,
+            next_cursor=next_cursor,
             processing_time_ms=processing_time,
         )
 
@@ -416,72 +592,369 @@ def create_app(
             description=("Agent ID (e.g., 'backend-developer' or '01-core-backend-developer')"),
             examples=["backend-developer", "01-core-backend-developer"],
         ),
-    ) -> AgentDetailResponse:
+        if_none_match: str | None = Header(default=None),
+    ) -> Response:
         """Get detailed information about a specific agent.
 
         Args:
             agent_id: Agent ID or agent type
+            if_none_match: ETag(s) from a previous response for conditional GET
 
         Returns:
-            Agent metadata and details
+            Agent metadata and details, or 304 if the client's copy is current
 
         Raises:
             HTTPException: If agent is not found
         """
         registry = get_registry()
 
-        # Try to get by agent_id first
-        try:
-            agent_data = await registry.get_agent_by_id(agent_id)
-        except AgentNotFoundError:
-            # Try by agent_type
+        async def get_agent() -> dict[str, Any]:
             try:
-                agent_data = await registry.get_agent_by_type(agent_id)
+                return await registry.get_agent_by_id_or_type(agent_id, use_cache=False)
             except AgentNotFoundError as e:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Agent with ID or type '{agent_id}' not found",
                 ) from e
 
-        # Parse metadata
-        metadata_str = agent_data.get("metadata", "{}")
-        metadata_dict = json.loads(metadata_str) if isinstance(metadata_str, str) else metadata_str
-
-        agent_meta = AgentMetadata(
-            id=agent_data["id"],
-            agent_id=agent_data["agent_id"],
-            agent_type=agent_data["agent_type"],
-            name=agent_data["name"],
-            display_name=agent_data["display_name"],
-            category=agent_data["category"],
-            description=agent_data["description"],
-            capabilities=agent_data["capabilities"],
-            tools=agent_data["tools"],
-            keywords=agent_data["keywords"],
-            file_path=agent_data["file_path"],
-            estimated_tokens=agent_data.get("estimated_tokens"),
-            avg_response_time_ms=agent_data.get("avg_response_time_ms"),
-            success_rate=agent_data.get("success_rate"),
-            usage_count=agent_data.get("usage_count", 0),
-            created_at=agent_data["created_at"],
-            updated_at=agent_data["updated_at"],
-            last_used_at=agent_data.get("last_used_at"),
-        )
+        async def check() -> None:
+            await get_agent()
+
+        async def build() -> AgentDetailResponse:
+            agent_data = await get_agent()
+
+            # Parse metadata
+            metadata_str = agent_data.get("metadata", "{}")
+            metadata_dict = json.loads(metadata_str) if isinstance(metadata_str, str) else metadata_str
+
+            return AgentDetailResponse(
+                agent=_to_agent_metadata(agent_data),
+                metadata=metadata_dict,
+            )
 
-        return AgentDetailResponse(
-            agent=agent_meta,
-            metadata=metadata_dict,
+        return await cached_response(("agent", agent_id), if_none_match, build, check)
+
+    @app.get(
+        "/api/v1/categories",
+        response_model=CategoryListResponse,
+        tags=["Discovery"],
+        summary="List agent categories",
+        description="List all agent categories with their agent counts",
+        responses={
+            200: {"description": "Categories listed"},
+            500: {"model": ErrorResponse, "description": "Server error"},
+        },
+    )
+    async def list_categories(if_none_match: str | None = Header(default=None)) -> Response:
+        """List all agent categories.
+
+        Args:
+            if_none_match: ETag(s) from a previous response for conditional GET
+
+        Returns:
+            Categories with agent counts, or 304 if the client's copy is current
+        """
+        registry = get_registry()
+
+        async def build() -> CategoryListResponse:
+            counts = await registry.get_category_counts(use_cache=False)
+            return CategoryListResponse(
+                categories=[CategoryInfo(name=name, agent_count=count) for name, count in counts],
+                total_count=len(counts),
+            )
+
+        return await cached_response(("categories",), if_none_match, build)
+
+    # Workflow timeline endpoints
+
+    @app.get(
+        "/api/v1/workflows/{workflow_id}/summary",
+        response_model=WorkflowSummaryResponse,
+        tags=["Coordination"],
+        summary="Get workflow timeline summary",
+        description="Aggregate event counts and duration for a workflow, computed in the database",
+        responses={
+            200: {"description": "Workflow summary"},
+            503: {"model": ErrorResponse, "description": "Coordination tracking not enabled"},
+        },
+    )
+    async def get_workflow_summary(
+        workflow_id: str = Path(..., min_length=1, max_length=255, description="Workflow ID"),
+    ) -> WorkflowSummaryResponse:
+        """Get aggregate timeline figures for a workflow.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Workflow summary
+        """
+        summary = await get_tracker().get_workflow_summary(workflow_id)
+        return WorkflowSummaryResponse(**summary)
+
+    @app.get(
+        "/api/v1/workflows/{workflow_id}/events",
+        tags=["Coordination"],
+        summary="Stream workflow events",
+        description=(
+            "Stream a workflow's events in timestamp order as NDJSON, or as Server-Sent Events "
+            "when the client accepts text/event-stream"
+        ),
+        response_class=StreamingResponse,
+        responses={
+            200: {
+                "description": "Event stream",
+                "content": {"application/x-ndjson": {}, "text/event-stream": {}},
+            },
+            400: {"model": ErrorResponse, "description": "Invalid request"},
+            503: {"model": ErrorResponse, "description": "Coordination tracking not enabled"},
+        },
+    )
+    async def stream_workflow_events(
+        workflow_id: str = Path(..., min_length=1, max_length=255, description="Workflow ID"),
+        since: str | None = Query(
+            None,
+            description="Only return events after this ISO timestamp, or after a '<timestamp>,<event_id>' cursor",
+            max_length=128,
+        ),
+        accept: str | None = Header(default=None),
+        last_event_id: str | None = Header(default=None),
+    ) -> StreamingResponse:
+        """Stream a workflow's events without buffering them in memory.
+
+        SSE events use a '<timestamp>,<event_id>' keyset cursor as their id,
+        so a reconnecting client's Last-Event-ID resumes the stream exactly
+        where it stopped, even between events sharing a timestamp.
+
+        Args:
+            workflow_id: Workflow ID
+            since: Only return events after this ISO timestamp or cursor
+            accept: Client Accept header; text/event-stream selects SSE
+            last_event_id: SSE reconnection cursor (used when ``since`` is absent)
+
+        Returns:
+            Streaming NDJSON or SSE response
+        """
+        tracker = get_tracker()
+        cursor = since or last_event_id
+        # Reject malformed cursors before the response starts
+        since, after_event_id = _parse_stream_cursor(cursor) if cursor else (None, None)
+
+        sse = accept is not None and "text/event-stream" in accept
+        # Dicts straight from the rows; events are serialized without models
+        events = tracker.stream_workflow_events(workflow_id, since=since, raw=True, after_event_id=after_event_id)
+
+        async def body() -> AsyncIterator[str]:
+            async for event in events:
+                yield _format_stream_event(event, sse)
+
+        if sse:
+            return StreamingResponse(
+                body(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    @app.get(
+        "/api/v1/workflows/{workflow_id}/live",
+        tags=["Coordination"],
+        summary="Follow workflow changes",
+        description=(
+            "Server-Sent Events stream of compact change notifications (state, task, event, deleted) "
+            "published by the state manager and tracker, instead of polling"
+        ),
+        response_class=StreamingResponse,
+        responses={
+            200: {"description": "Notification stream", "content": {"text/event-stream": {}}},
+            503: {"model": ErrorResponse, "description": "Live notifications not enabled"},
+        },
+    )
+    async def follow_workflow(
+        workflow_id: str = Path(..., min_length=1, max_length=255, description="Workflow ID"),
+    ) -> StreamingResponse:
+        """Stream a workflow's change notifications as they are published.
+
+        Idle streams receive a keep-alive comment every
+        ``LIVE_HEARTBEAT_SECONDS``. The stream ends when the workflow is
+        deleted or the server's LISTEN connection is lost.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            SSE response
+        """
+        tracker = get_tracker()
+        if tracker.notifier is None:
+            raise HTTPException(status_code=503, detail="Live workflow notifications are not enabled")
+        subscription = tracker.subscribe(workflow_id)
+
+        async def body() -> AsyncIterator[str]:
+            async with subscription:
+                while not subscription.closed:
+                    change = await subscription.get(timeout=LIVE_HEARTBEAT_SECONDS)
+                    if change is None:
+                        yield ": keep-alive\n\n"
+                        continue
+                    data = json.dumps(change, separators=(",", ":"))
+                    yield f"event: {change['kind']}\ndata: {data}\n\n"
+                    if change["kind"] == "deleted":
+                        break
+
+        return StreamingResponse(
+            body(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
     return app
 
 
-def _get_match_reason(agent_data: dict[str, Any], query: str) -> str:
+def _format_stream_event(event: dict[str, Any], sse: bool) -> str:
+    """Serialize one event for the workflow event stream.
+
+    Args:
+        event: Event dictionary (``CoordinationEvent.to_dict()`` shape)
+        sse: Format as a Server-Sent Event instead of an NDJSON line
+
+    Returns:
+        Serialized event including its trailing newline(s)
+    """
+    data = json.dumps(event, separators=(",", ":"))
+    if sse:
+        return f"id: {event['timestamp']},{event['event_id']}\nevent: {event['event_type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+def _parse_stream_cursor(cursor: str) -> tuple[str, str | None]:
+    """Parse a '<timestamp>[,<event_id>]' event stream cursor.
+
+    Args:
+        cursor: ISO timestamp, or an SSE event id from a previous stream
+
+    Returns:
+        (timestamp, event_id) tuple; event_id is None for a bare timestamp
+
+    Raises:
+        ValueError: If the timestamp is malformed
+    """
+    timestamp, _, event_id = cursor.partition(",")
+    try:
+        datetime.fromisoformat(timestamp.rstrip("Z"))
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor '{cursor}': expected '<timestamp>[,<event_id>]'") from e
+    return timestamp, event_id or None
+
+
+def _parse_cursor(cursor: str) -> tuple[str, UUID]:
+    """Parse a '<name>,<id>' keyset cursor.
+
+    Args:
+        cursor: Cursor string from a previous page's ``next_cursor``
+
+    Returns:
+        (name, id) tuple
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    name, _, agent_uuid = cursor.rpartition(",")
+    if not name:
+        raise ValueError(f"Invalid cursor '{cursor}': expected '<name>,<id>'")
+    try:
+        return name, UUID(agent_uuid)
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor '{cursor}': expected '<name>,<id>'") from e
+
+
+def _to_agent_metadata(agent_data: dict[str, Any]) -> AgentMetadata:
+    """Convert a registry row to the API agent metadata model.
+
+    Args:
+        agent_data: Agent data dictionary from the registry
+
+    Returns:
+        AgentMetadata model
+    """
+    return AgentMetadata(
+        id=agent_data["id"],
+        agent_id=agent_data["agent_id"],
+        agent_type=agent_data["agent_type"],
+        name=agent_data["name"],
+        display_name=agent_data["display_name"],
+        category=agent_data["category"],
+        description=agent_data["description"],
+        capabilities=agent_data["capabilities"],
+        tools=agent_data["tools"],
+        keywords=agent_data["keywords"],
+        file_path=agent_data["file_path"],
+        estimated_tokens=agent_data.get("estimated_tokens"),
+        avg_response_time_ms=agent_data.get("avg_response_time_ms"),
+        success_rate=agent_data.get("success_rate"),
+        usage_count=agent_data.get("usage_count", 0),
+        created_at=agent_data["created_at"],
+        updated_at=agent_data["updated_at"],
+        last_used_at=agent_data.get("last_used_at"),
+    )
+
+
+def _rank_hybrid(
+    query: str,
+    lexical_results: list[dict[str, Any]],
+    vector_results: list[tuple[dict[str, Any], float]],
+    threshold: float,
+) -> list[AgentMatch]:
+    """Merge lexical and vector candidates into ranked matches.
+
+    Scores are fused as a noisy-OR, ``1 - (1 - lexical) * (1 - semantic)``,
+    so agents that match on both signals rank above agents that match on
+    only one, and purely semantic matches still surface. Cosine similarity
+    between a short query and a long agent description is compressed toward
+    zero, so the semantic score is ``sqrt(similarity)`` to put it on a scale
+    comparable to the lexical confidences.
+
+    Args:
+        query: Lower-cased search query
+        lexical_results: Agents returned by full-text search, with ``confidence``
+        vector_results: (agent, cosine similarity) pairs from vector search
+        threshold: Minimum confidence to keep a match
+
+    Returns:
+        Matches sorted by confidence descending
+    """
+    candidates: dict[str, tuple[dict[str, Any], float, float]] = {}
+    for agent_data in lexical_results:
+        candidates[agent_data["agent_id"]] = (agent_data, float(agent_data["confidence"]), 0.0)
+    for agent_data, similarity in vector_results:
+        existing = candidates.get(agent_data["agent_id"])
+        lexical = existing[1] if existing else 0.0
+        candidates[agent_data["agent_id"]] = (agent_data, lexical, max(similarity, 0.0))
+
+    matches: list[AgentMatch] = []
+    for agent_data, lexical, similarity in candidates.values():
+        confidence = 1.0 - (1.0 - lexical) * (1.0 - math.sqrt(similarity))
+        if confidence < threshold:
+            continue
+        matches.append(
+            AgentMatch(
+                agent=_to_agent_metadata(agent_data),
+                confidence=round(min(confidence, 1.0), 4),
+                match_reason=_get_match_reason(agent_data, query, similarity),
+            )
+        )
+
+    matches.sort(key=lambda m: m.confidence, reverse=True)
+    return matches
+
+
+def _get_match_reason(agent_data: dict[str, Any], query: str, similarity: float = 0.0) -> str:
     """Generate match reason explanation.
 
     Args:
         agent_data: Agent data dictionary
         query: Search query
+        similarity: Embedding similarity to the query (0 if not a vector match)
 
     Returns:
         Human-readable match reason
@@ -501,6 +974,9 @@ def _get_match_reason(agent_data: dict[str, Any], query: str) -> str:
     if query in agent_data["description"].lower():
         reasons.append("description contains query")
 
+    if similarity > 0.0:
+        reasons.append(f"semantic similarity: {similarity:.2f}")
+
     if not reasons:
         reasons.append("general relevance match")
 
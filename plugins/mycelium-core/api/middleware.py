@@ -1,87 +1,82 @@
-"""Middleware for rate limiting and request validation."""
+"""Middleware for rate limiting and request validation.
 
+All middleware here is pure ASGI: each class wraps the downstream app and
+rewrites the ``http.response.start`` message in place, so response bodies
+stream straight through without the extra task and memory stream that
+``BaseHTTPMiddleware`` puts in front of every request.
+"""
+
+import itertools
 import time
-from collections import defaultdict
-from collections.abc import Callable
-from typing import Any
 
-from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .ratelimit import InMemoryRateLimiter, RateLimiterBackend
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """Rate limiting middleware using token bucket algorithm.
 
     Implements per-IP rate limiting with configurable requests per minute.
+    Bucket storage is delegated to a ``RateLimiterBackend``: in-memory by
+    default, or Redis to share one limit across worker processes.
     """
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         requests_per_minute: int = 100,
         burst_size: int = 10,
+        max_clients: int = 10000,
+        backend: RateLimiterBackend | None = None,
     ):
         """Initialize rate limiter.
 
         Args:
-            app: FastAPI application
+            app: ASGI application
             requests_per_minute: Maximum requests allowed per minute per IP
             burst_size: Maximum burst size allowed
+            max_clients: Maximum number of client buckets kept by the default
+                in-memory backend
+            backend: Token bucket backend; overrides the limits above
         """
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
-        self.burst_size = burst_size
-        self.rate_per_second = requests_per_minute / 60.0
-
-        # Store token buckets per IP: {ip: (tokens, last_update_time)}
-        self._buckets: dict[str, tuple[float, float]] = defaultdict(lambda: (float(burst_size), time.time()))
+        self.app = app
+        self.backend = backend or InMemoryRateLimiter(requests_per_minute, burst_size, max_clients)
+        self.requests_per_minute = self.backend.requests_per_minute
+        self.burst_size = self.backend.burst_size
+        self.rate_per_second = self.backend.rate_per_second
 
-        # Cleanup old entries periodically
-        self._last_cleanup = time.time()
-        self._cleanup_interval = 300  # 5 minutes
-
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request.
+    def _get_client_ip(self, scope: Scope) -> str:
+        """Extract client IP from the connection scope.
 
         Args:
-            request: FastAPI request object
+            scope: ASGI connection scope
 
         Returns:
             Client IP address
         """
+        headers = Headers(scope=scope)
+
         # Check for forwarded IP (behind proxy)
-        forwarded = request.headers.get("X-Forwarded-For")
+        forwarded = headers.get("x-forwarded-for")
         if forwarded:
             return forwarded.split(",")[0].strip()
 
         # Check for real IP header
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
         # Fall back to direct client
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return str(client[0])
 
         return "unknown"
 
-    def _cleanup_old_buckets(self) -> None:
-        """Remove old bucket entries to prevent memory growth."""
-        current_time = time.time()
-
-        if current_time - self._last_cleanup > self._cleanup_interval:
-            # Remove buckets not updated in last 10 minutes
-            cutoff_time = current_time - 600
-
-            old_ips = [ip for ip, (_, last_update) in self._buckets.items() if last_update < cutoff_time]
-
-            for ip in old_ips:
-                del self._buckets[ip]
-
-            self._last_cleanup = current_time
-
-    def _check_rate_limit(self, client_ip: str) -> tuple[bool, dict[str, str]]:
+    async def _check_rate_limit(self, client_ip: str) -> tuple[bool, dict[str, str]]:
         """Check if request should be rate limited.
 
         Args:
@@ -90,29 +85,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             Tuple of (allowed, headers) where headers contain rate limit info
         """
-        current_time = time.time()
-
-        # Get or initialize bucket
-        tokens, last_update = self._buckets[client_ip]
-
-        # Add tokens based on time passed
-        time_passed = current_time - last_update
-        tokens = min(self.burst_size, tokens + (time_passed * self.rate_per_second))
-
-        # Check if we have tokens available
-        if tokens >= 1.0:
-            # Consume one token
-            tokens -= 1.0
-            allowed = True
-        else:
-            allowed = False
+        allowed, tokens = await self.backend.acquire(client_ip)
 
-        # Update bucket
-        self._buckets[client_ip] = (tokens, current_time)
-
-        # Calculate headers
-        remaining = int(tokens)
-        reset_time = int(current_time + ((1.0 - tokens % 1.0) / self.rate_per_second))
+        # Calculate headers (reset is reported as wall-clock epoch seconds)
+        remaining = max(0, int(tokens))
+        reset_time = int(time.time() + ((1.0 - tokens % 1.0) / self.rate_per_second))
 
         headers = {
             "X-RateLimit-Limit": str(self.requests_per_minute),
@@ -126,28 +103,23 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return allowed, headers
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with rate limiting.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint handler
-
-        Returns:
-            Response with rate limit headers
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Cleanup old buckets periodically
-        self._cleanup_old_buckets()
-
-        # Get client IP
-        client_ip = self._get_client_ip(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Check rate limit
-        allowed, headers = self._check_rate_limit(client_ip)
+        allowed, headers = await self._check_rate_limit(self._get_client_ip(scope))
 
         if not allowed:
             # Return 429 Too Many Requests
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": "RateLimitExceeded",
@@ -159,36 +131,50 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
                 headers=headers,
             )
+            await response(scope, receive, send)
+            return
 
-        # Process request
-        response: Response = await call_next(request)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers to response
+                response_headers = MutableHeaders(scope=message)
+                for key, value in headers.items():
+                    response_headers[key] = value
+            await send(message)
 
-        # Add rate limit headers to response
-        for key, value in headers.items():
-            response.headers[key] = value
+        await self.app(scope, receive, send_with_headers)
 
-        return response
 
-
-class RequestValidationMiddleware(BaseHTTPMiddleware):
+class RequestValidationMiddleware:
     """Middleware for additional request validation and security."""
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
-        """Process request with validation.
+    def __init__(self, app: ASGIApp):
+        """Initialize request validation.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint handler
+            app: ASGI application
+        """
+        self.app = app
+        self._counter = itertools.count()
 
-        Returns:
-            Response or error response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with validation.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Validate content type for POST requests
-        if request.method in ["POST", "PUT", "PATCH"]:
-            content_type = request.headers.get("content-type", "")
+        if scope["method"] in ("POST", "PUT", "PATCH"):
+            content_type = Headers(scope=scope).get("content-type", "")
 
             if not content_type.startswith("application/json"):
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=415,
                     content={
                         "error": "UnsupportedMediaType",
@@ -196,41 +182,54 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
                         "details": {"received": content_type},
                     },
                 )
+                await response(scope, receive, send)
+                return
 
-        # Add request ID for tracing
-        request.state.request_id = f"{int(time.time() * 1000)}-{id(request)}"
+        # Add request ID for tracing (exposed as request.state.request_id)
+        request_id = f"{int(time.time() * 1000)}-{next(self._counter)}"
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Process request
-        response: Response = await call_next(request)
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        # Add request ID to response
-        response.headers["X-Request-ID"] = request.state.request_id
+        await self.app(scope, receive, send_with_request_id)
 
-        return response
 
+class PerformanceMonitoringMiddleware:
+    """Middleware for monitoring request performance.
 
-class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
-    """Middleware for monitoring request performance."""
+    The timing header reports time until the response headers are sent,
+    since with pure ASGI the body may still be streaming at that point.
+    """
 
-    async def dispatch(self, request: Request, call_next: Callable[..., Any]) -> Response:
-        """Process request with timing.
+    def __init__(self, app: ASGIApp):
+        """Initialize performance monitoring.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint handler
-
-        Returns:
-            Response with timing header
+            app: ASGI application
         """
-        start_time = time.time()
+        self.app = app
 
-        # Process request
-        response: Response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with timing.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Calculate processing time
-        processing_time = (time.time() - start_time) * 1000  # Convert to ms
+        start_time = time.perf_counter()
 
-        # Add timing header
-        response.headers["X-Processing-Time-Ms"] = f"{processing_time:.2f}"
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                processing_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
+                MutableHeaders(scope=message)["X-Processing-Time-Ms"] = f"{processing_time:.2f}"
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_timing)
@@ -39,6 +39,41 @@ class DiscoverRequest(BaseModel):
         return v.strip()
 
 
+class BatchDiscoverRequest(BaseModel):
+    """Request model for the batch agent discovery endpoint."""
+
+    queries: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Natural language or structured queries, resolved together",
+        examples=[["python backend development", "kubernetes deployment"]],
+    )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Maximum number of agents to return per query",
+    )
+    threshold: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Minimum confidence threshold for matches (0.0-1.0)",
+    )
+
+    @field_validator("queries")
+    @classmethod
+    def queries_not_empty(cls, v: list[str]) -> list[str]:
+        """Validate each query is non-blank and within length limits."""
+        queries = [query.strip() for query in v]
+        if any(not query for query in queries):
+            raise ValueError("Queries cannot be empty or whitespace only")
+        if any(len(query) > 500 for query in queries):
+            raise ValueError("Queries must be at most 500 characters")
+        return queries
+
+
 class AgentMetadata(BaseModel):
     """Agent metadata model."""
 
@@ -144,6 +179,21 @@ class DiscoverResponse(BaseModel):
     )
 
 
+class DiscoverResult(BaseModel):
+    """Matches for a single query of a batch discovery request."""
+
+    query: str = Field(description="Original query")
+    matches: list[AgentMatch] = Field(description="List of matching agents with confidence scores")
+    total_count: int = Field(description="Total number of matches found")
+
+
+class BatchDiscoverResponse(BaseModel):
+    """Response model for the batch agent discovery endpoint."""
+
+    results: list[DiscoverResult] = Field(description="Per-query results, in request order")
+    processing_time_ms: float = Field(description="Processing time for the whole batch in milliseconds")
+
+
 class AgentDetailResponse(BaseModel):
     """Response model for agent detail endpoint."""
 
@@ -180,7 +230,11 @@ class AgentSearchResponse(BaseModel):
 
     query: str = Field(description="Search query")
     agents: list[AgentMetadata] = Field(description="List of matching agents")
-    total_count: int = Field(description="Total number of results")
+    total_count: int = Field(description="Total number of matching agents across all pages")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (pass as 'after'); null on the last page",
+    )
     processing_time_ms: float = Field(description="Processing time in milliseconds")
 
     model_config = ConfigDict(
@@ -212,6 +266,62 @@ class AgentSearchResponse(BaseModel):
     )
 
 
+class CategoryInfo(BaseModel):
+    """Agent category with its agent count."""
+
+    name: str = Field(description="Category name")
+    agent_count: int = Field(description="Number of agents in the category")
+
+
+class CategoryListResponse(BaseModel):
+    """Response model for the category listing endpoint."""
+
+    categories: list[CategoryInfo] = Field(description="Categories ordered by name")
+    total_count: int = Field(description="Number of categories")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "categories": [
+                    {"name": "Development", "agent_count": 24},
+                    {"name": "Security", "agent_count": 6},
+                ],
+                "total_count": 2,
+            }
+        }
+    )
+
+
+class WorkflowSummaryResponse(BaseModel):
+    """Response model for the workflow timeline summary endpoint."""
+
+    workflow_id: str = Field(description="Workflow ID")
+    total_events: int = Field(description="Number of tracked events")
+    start_time: str | None = Field(default=None, description="Timestamp of the first event")
+    end_time: str | None = Field(default=None, description="Timestamp of the last event")
+    duration_ms: float = Field(description="Time between the first and last event in milliseconds")
+    handoff_count: int = Field(description="Number of handoff events")
+    failure_count: int = Field(description="Number of failure events")
+    unique_agents: int = Field(description="Distinct agents involved, including handoff participants")
+    unique_tasks: int = Field(description="Distinct tasks with events")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "workflow_id": "wf-123",
+                "total_events": 120000,
+                "start_time": "2026-10-16T09:00:00Z",
+                "end_time": "2026-10-16T09:42:10.500000Z",
+                "duration_ms": 2530500.0,
+                "handoff_count": 340,
+                "failure_count": 2,
+                "unique_agents": 12,
+                "unique_tasks": 4100,
+            }
+        }
+    )
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
 
@@ -237,6 +347,7 @@ class HealthResponse(BaseModel):
     pgvector_installed: bool = Field(description="Whether pgvector is installed")
     agent_count: int = Field(description="Total number of agents in registry")
     database_size: str = Field(description="Database size")
+    cache: dict[str, int] | None = Field(default=None, description="Registry read cache statistics")
     timestamp: str = Field(description="Health check timestamp")
     version: str = Field(default="1.0.0", description="API version")
 
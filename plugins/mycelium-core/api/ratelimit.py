@@ -0,0 +1,319 @@
+"""Pluggable token-bucket backends for the Discovery API rate limiter.
+
+Two backends are provided:
+
+- ``InMemoryRateLimiter``: per-process buckets in a bounded LRU. Used for
+  tests and single-process deployments.
+- ``RedisRateLimiter``: one shared bucket per client in Redis, updated by an
+  atomic Lua script, so the configured limit holds across all workers of a
+  multi-process deployment (``uvicorn --workers N``).
+
+The Redis backend pre-aggregates locally: each script call leases a small
+batch of tokens to the calling worker, which then admits requests from its
+lease without touching Redis. Denials are cached locally until the bucket
+is expected to refill. Leased tokens are removed from the shared bucket
+up front, so pre-aggregation can only ever under-admit, never exceed the
+limit. After a Redis error the backend stops calling Redis for a short
+cooldown and limits per process instead.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+# Atomically refill a bucket and lease up to ARGV[3] tokens from it.
+#
+# At most half of the available tokens (but at least one, when available)
+# are granted per call so one worker cannot drain a shared burst. Uses the
+# Redis server clock so workers with skewed clocks agree on refill timing.
+#
+# KEYS[1]: bucket hash; ARGV: rate per second, burst size, tokens requested
+# Returns: {tokens granted, tokens left in the bucket (as a string)}
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+if tokens == nil then
+    tokens = burst
+else
+    tokens = math.min(burst, tokens + math.max(0, now - tonumber(state[2])) * rate)
+end
+
+local available = math.floor(tokens)
+local granted = math.min(requested, math.max(math.floor(available / 2), math.min(1, available)))
+tokens = tokens - granted
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+
+return {granted, tostring(tokens)}
+"""
+
+
+class RateLimiterBackend(Protocol):
+    """Interface for token-bucket storage used by ``RateLimitMiddleware``."""
+
+    requests_per_minute: int
+    burst_size: int
+    rate_per_second: float
+
+    async def acquire(self, key: str) -> tuple[bool, float]:
+        """Try to take one token from the bucket for ``key``.
+
+        Returns:
+            Tuple of (allowed, tokens remaining after the decision)
+        """
+        ...
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+        ...
+
+
+class InMemoryRateLimiter:
+    """Per-process token buckets kept in a bounded LRU.
+
+    Buckets are refilled against ``time.monotonic()``; beyond
+    ``max_clients`` the least recently seen client is evicted.
+
+    Example:
+        >>> limiter = InMemoryRateLimiter(requests_per_minute=60, burst_size=2)
+        >>> await limiter.acquire("10.0.0.1")
+        (True, 1.0)
+    """
+
+    def __init__(self, requests_per_minute: int = 100, burst_size: int = 10, max_clients: int = 10000):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum requests allowed per minute per client
+            burst_size: Maximum burst size allowed
+            max_clients: Maximum number of client buckets kept
+        """
+        self.requests_per_minute = requests_per_minute
+        self.burst_size = burst_size
+        self.rate_per_second = requests_per_minute / 60.0
+        self.max_clients = max_clients
+
+        # Token buckets per client in LRU order: {key: (tokens, last_update_monotonic)}
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def acquire(self, key: str) -> tuple[bool, float]:
+        """Try to take one token from the bucket for ``key``.
+
+        Args:
+            key: Client identifier (usually the IP address)
+
+        Returns:
+            Tuple of (allowed, tokens remaining after the decision)
+        """
+        now = time.monotonic()
+
+        # Get or initialize bucket, marking it most recently used
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            tokens = float(self.burst_size)
+            if len(self._buckets) >= self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            tokens, last_update = bucket
+            # Add tokens based on time passed
+            tokens = min(self.burst_size, tokens + ((now - last_update) * self.rate_per_second))
+
+        # Check if we have tokens available
+        allowed = tokens >= 1.0
+        if allowed:
+            # Consume one token
+            tokens -= 1.0
+
+        self._buckets[key] = (tokens, now)
+        return allowed, tokens
+
+    async def close(self) -> None:
+        """Drop all buckets."""
+        self._buckets.clear()
+
+
+class _Lease:
+    """Tokens pre-acquired from the shared bucket by this worker."""
+
+    __slots__ = ("tokens", "shared", "denied", "expires_at")
+
+    def __init__(self, tokens: float, shared: float, denied: bool, expires_at: float):
+        self.tokens = tokens
+        self.shared = shared
+        self.denied = denied
+        self.expires_at = expires_at
+
+
+class RedisRateLimiter:
+    """Token buckets shared across processes through Redis.
+
+    Each bucket is a Redis hash updated by an atomic Lua script. To keep the
+    hot path off the network, every script call leases up to ``lease_size``
+    tokens to this worker; they are spent locally until exhausted or until
+    ``lease_ttl`` passes (unspent tokens are then forfeited, which only makes
+    the limiter stricter). A denial is cached until one token should have
+    refilled.
+
+    If Redis is unreachable the limiter degrades to a per-process
+    ``InMemoryRateLimiter`` rather than failing requests. A Redis error opens
+    a circuit for ``error_cooldown`` seconds during which Redis is not
+    called at all, so an outage does not add a connection timeout to every
+    request.
+
+    Example:
+        >>> limiter = RedisRateLimiter("redis://localhost:6379", requests_per_minute=600)
+        >>> allowed, remaining = await limiter.acquire("10.0.0.1")
+        >>> await limiter.close()
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        requests_per_minute: int = 100,
+        burst_size: int = 10,
+        max_clients: int = 10000,
+        lease_size: int = 5,
+        lease_ttl: float = 1.0,
+        key_prefix: str = "mycelium:ratelimit:",
+        client: Any | None = None,
+        error_cooldown: float = 5.0,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            redis_url: Redis connection URL (ignored when ``client`` is given)
+            requests_per_minute: Maximum requests allowed per minute per client
+            burst_size: Maximum burst size allowed
+            max_clients: Maximum number of local leases kept
+            lease_size: Maximum tokens leased to this worker per Redis call
+            lease_ttl: Seconds a lease may be spent locally
+            key_prefix: Prefix for bucket keys in Redis
+            client: Existing ``redis.asyncio.Redis`` client to use
+            error_cooldown: Seconds to skip Redis after an error
+        """
+        if lease_size < 1:
+            raise ValueError("lease_size must be at least 1")
+
+        self.requests_per_minute = requests_per_minute
+        self.burst_size = burst_size
+        self.rate_per_second = requests_per_minute / 60.0
+        self.max_clients = max_clients
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
+        self.key_prefix = key_prefix
+        self.error_cooldown = error_cooldown
+
+        self._owns_client = client is None
+        self._redis: Any = client if client is not None else aioredis.from_url(redis_url)
+        self._script = self._redis.register_script(TOKEN_BUCKET_SCRIPT)
+        self._fallback = InMemoryRateLimiter(requests_per_minute, burst_size, max_clients)
+
+        # Local leases per client in LRU order
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        # Monotonic time until which Redis is skipped after an error
+        self._circuit_open_until = 0.0
+        self._stats = {"local_decisions": 0, "redis_calls": 0, "redis_errors": 0, "fallback_decisions": 0}
+
+    async def acquire(self, key: str) -> tuple[bool, float]:
+        """Try to take one token from the shared bucket for ``key``.
+
+        Args:
+            key: Client identifier (usually the IP address)
+
+        Returns:
+            Tuple of (allowed, tokens remaining after the decision)
+        """
+        now = time.monotonic()
+
+        lease = self._leases.get(key)
+        if lease is not None and now < lease.expires_at:
+            if lease.tokens >= 1.0:
+                lease.tokens -= 1.0
+                self._leases.move_to_end(key)
+                self._stats["local_decisions"] += 1
+                return True, lease.shared + lease.tokens
+            if lease.denied:
+                self._stats["local_decisions"] += 1
+                return False, lease.shared
+
+        if now < self._circuit_open_until:
+            self._stats["fallback_decisions"] += 1
+            return await self._fallback.acquire(key)
+
+        try:
+            self._stats["redis_calls"] += 1
+            granted_raw, shared_raw = await self._script(
+                keys=[self.key_prefix + key],
+                args=[self.rate_per_second, self.burst_size, self.lease_size],
+            )
+        except RedisError:
+            self._stats["redis_errors"] += 1
+            self._stats["fallback_decisions"] += 1
+            self._circuit_open_until = time.monotonic() + self.error_cooldown
+            return await self._fallback.acquire(key)
+
+        granted = int(granted_raw)
+        shared = float(shared_raw)
+
+        if granted > 0:
+            lease = _Lease(float(granted - 1), shared, False, now + self.lease_ttl)
+        else:
+            # Deny locally until one token should have refilled
+            refill_in = (1.0 - shared) / self.rate_per_second
+            lease = _Lease(0.0, shared, True, now + min(refill_in, self.lease_ttl))
+
+        self._leases.pop(key, None)
+        if len(self._leases) >= self.max_clients:
+            self._leases.popitem(last=False)
+        self._leases[key] = lease
+
+        return granted > 0, shared + lease.tokens
+
+    def get_stats(self) -> dict[str, int]:
+        """Get counters for local decisions, Redis calls, Redis errors and fallback decisions.
+
+        Returns:
+            Statistics dictionary
+        """
+        return dict(self._stats)
+
+    async def close(self) -> None:
+        """Close the Redis client if this limiter created it."""
+        self._leases.clear()
+        if self._owns_client:
+            await self._redis.aclose()
+
+
+def create_rate_limiter(
+    requests_per_minute: int = 100,
+    burst_size: int = 10,
+    redis_url: str | None = None,
+) -> RateLimiterBackend:
+    """Create a rate limiter backend.
+
+    Args:
+        requests_per_minute: Maximum requests allowed per minute per client
+        burst_size: Maximum burst size allowed
+        redis_url: Redis URL for a shared limiter. Defaults to the
+            DISCOVERY_RATE_LIMIT_REDIS_URL environment variable; when neither
+            is set, an in-memory limiter is returned.
+
+    Returns:
+        Rate limiter backend
+    """
+    redis_url = redis_url or os.getenv("DISCOVERY_RATE_LIMIT_REDIS_URL")
+    if redis_url:
+        return RedisRateLimiter(redis_url, requests_per_minute=requests_per_minute, burst_size=burst_size)
+    return InMemoryRateLimiter(requests_per_minute=requests_per_minute, burst_size=burst_size)
@@ -7,10 +7,14 @@ This module provides workflow orchestration capabilities including:
 - Failure recovery mechanisms
 - Agent handoff protocol
 - Coordination event tracking
+- Live workflow change notifications
 """
 
+from .event_store import InMemoryEventStore
+from .notifications import Subscription, WorkflowNotifier
 from .orchestrator import WorkflowOrchestrator
 from .protocol import HandoffContext, HandoffMessage, HandoffProtocol
+from .scheduling import FairScheduler
 from .state_manager import StateManager, TaskStatus, WorkflowState, WorkflowStatus
 from .tracker import (
     AgentInfo,
@@ -19,6 +23,7 @@ from .tracker import (
     ErrorInfo,
     EventType,
     PerformanceMetrics,
+    register_json_codecs,
     track_failure,
     track_handoff,
     track_task_execution,
@@ -26,6 +31,7 @@ from .tracker import (
 
 __all__ = [
     "WorkflowOrchestrator",
+    "FairScheduler",
     "WorkflowStatus",
     "TaskStatus",
     "StateManager",
@@ -35,10 +41,14 @@ __all__ = [
     "HandoffContext",
     "CoordinationTracker",
     "CoordinationEvent",
+    "InMemoryEventStore",
+    "WorkflowNotifier",
+    "Subscription",
     "EventType",
     "AgentInfo",
     "ErrorInfo",
     "PerformanceMetrics",
+    "register_json_codecs",
     "track_handoff",
     "track_task_execution",
     "track_failure",
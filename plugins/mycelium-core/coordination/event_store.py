@@ -0,0 +1,246 @@
+"""Bounded in-memory store for coordination events.
+
+Used by ``CoordinationTracker`` when no database pool is configured
+(development, tests, and Redis/PostgreSQL-less deployments).
+
+Events receive monotonically increasing sequence numbers and are kept in a
+sequence-keyed dict that behaves as a ring buffer: once ``capacity`` is
+reached, each append evicts the oldest live event in O(1). Per-workflow,
+per-task and per-agent indexes are deques of sequence numbers; entries for
+evicted or deleted events are pruned lazily from the left. Each index key
+also keeps a count of its live events, and a deque whose dead entries
+outnumber its live ones is compacted, so an index stays proportional to the
+live events even when its dead entries are not at the left (for example,
+when per-workflow retention removes events from the middle of an agent's
+deque).
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tracker import CoordinationEvent
+
+# Index deques shorter than this are never compacted
+COMPACT_MIN_LENGTH = 64
+
+
+class InMemoryEventStore:
+    """Ring-buffer event store with lazily pruned secondary indexes.
+
+    Args:
+        capacity: Maximum number of live events
+        max_events_per_workflow: Optional per-workflow retention limit; the
+            oldest events of a workflow are dropped beyond it
+    """
+
+    def __init__(self, capacity: int = 10000, max_events_per_workflow: int | None = None):
+        """Initialize the store.
+
+        Args:
+            capacity: Maximum number of live events
+            max_events_per_workflow: Optional per-workflow retention limit
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if max_events_per_workflow is not None and max_events_per_workflow < 1:
+            raise ValueError("max_events_per_workflow must be at least 1")
+
+        self.capacity = capacity
+        self.max_events_per_workflow = max_events_per_workflow
+
+        # {sequence: event}; insertion order == sequence order
+        self._events: dict[int, CoordinationEvent] = {}
+        self._next_seq = 0
+        # Lowest sequence number that may still be live
+        self._head = 0
+
+        self._by_workflow: dict[str, deque[int]] = {}
+        self._by_task: dict[str, deque[int]] = {}
+        self._by_agent: dict[str, deque[int]] = {}
+
+        # Live events per index key; a key is dropped when its count hits 0
+        self._workflow_live: dict[str, int] = {}
+        self._task_live: dict[str, int] = {}
+        self._agent_live: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of live events."""
+        return len(self._events)
+
+    def append(self, event: "CoordinationEvent") -> int:
+        """Store an event, evicting the oldest one if the store is full.
+
+        Args:
+            event: Event to store
+
+        Returns:
+            Sequence number assigned to the event
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        self._events[seq] = event
+
+        for index, live, key in self._index_keys(event):
+            index.setdefault(key, deque()).append(seq)
+            live[key] = live.get(key, 0) + 1
+
+        if len(self._events) > self.capacity:
+            self._evict_oldest()
+
+        if self.max_events_per_workflow is not None:
+            while self._workflow_live[event.workflow_id] > self.max_events_per_workflow:
+                workflow_seqs = self._by_workflow[event.workflow_id]
+                self._prune_left(workflow_seqs)
+                self._remove(workflow_seqs[0])
+
+        return seq
+
+    def events(self) -> Iterator["CoordinationEvent"]:
+        """Iterate over live events, oldest first."""
+        return iter(list(self._events.values()))
+
+    def workflow_events(self, workflow_id: str, limit: int | None = None) -> list["CoordinationEvent"]:
+        """Get the most recent events of a workflow, oldest first.
+
+        Args:
+            workflow_id: Workflow ID
+            limit: Maximum number of events (None for all)
+
+        Returns:
+            List of events
+        """
+        return self._lookup(self._by_workflow, workflow_id, limit)
+
+    def task_events(self, task_id: str, limit: int | None = None) -> list["CoordinationEvent"]:
+        """Get the most recent events of a task, oldest first.
+
+        Args:
+            task_id: Task ID
+            limit: Maximum number of events (None for all)
+
+        Returns:
+            List of events
+        """
+        return self._lookup(self._by_task, task_id, limit)
+
+    def agent_events(self, agent_id: str, limit: int | None = None) -> list["CoordinationEvent"]:
+        """Get the most recent events involving an agent, oldest first.
+
+        Matches the event's ``agent_id`` as well as handoff source and target.
+
+        Args:
+            agent_id: Agent ID
+            limit: Maximum number of events (None for all)
+
+        Returns:
+            List of events
+        """
+        return self._lookup(self._by_agent, agent_id, limit)
+
+    def workflow_count(self) -> int:
+        """Number of workflows with live events."""
+        return len(self._workflow_live)
+
+    def delete_workflow(self, workflow_id: str) -> int:
+        """Delete every event of a workflow.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Number of events deleted
+        """
+        seqs = self._by_workflow.pop(workflow_id, None)
+        self._workflow_live.pop(workflow_id, None)
+        if not seqs:
+            return 0
+        return sum(self._remove(seq) for seq in seqs)
+
+    def clear(self) -> None:
+        """Remove all events (sequence numbers keep increasing)."""
+        self._events.clear()
+        self._by_workflow.clear()
+        self._by_task.clear()
+        self._by_agent.clear()
+        self._workflow_live.clear()
+        self._task_live.clear()
+        self._agent_live.clear()
+        self._head = self._next_seq
+
+    def _index_keys(self, event: "CoordinationEvent") -> list[tuple[dict[str, deque[int]], dict[str, int], str]]:
+        """Get the (index, live counts, key) triples an event is indexed under."""
+        keys = [(self._by_workflow, self._workflow_live, event.workflow_id)]
+        if event.task_id:
+            keys.append((self._by_task, self._task_live, event.task_id))
+
+        agent_ids = {event.agent_id}
+        if event.source_agent:
+            agent_ids.add(event.source_agent.agent_id)
+        if event.target_agent:
+            agent_ids.add(event.target_agent.agent_id)
+        keys.extend((self._by_agent, self._agent_live, agent_id) for agent_id in agent_ids if agent_id)
+
+        return keys
+
+    def _prune_left(self, seqs: deque[int]) -> int:
+        """Drop dead sequence numbers from the left of an index deque.
+
+        Returns:
+            Remaining deque length
+        """
+        while seqs and seqs[0] not in self._events:
+            seqs.popleft()
+        return len(seqs)
+
+    def _remove(self, seq: int) -> int:
+        """Remove one event and prune the indexes it was in.
+
+        Returns:
+            1 if a live event was removed, else 0
+        """
+        event = self._events.pop(seq, None)
+        if event is None:
+            return 0
+
+        for index, live, key in self._index_keys(event):
+            if key not in live:
+                # Index entry already dropped (delete_workflow)
+                continue
+            live[key] -= 1
+            if not live[key]:
+                del live[key]
+                del index[key]
+                continue
+
+            seqs = index[key]
+            self._prune_left(seqs)
+            if len(seqs) >= COMPACT_MIN_LENGTH and len(seqs) > 2 * live[key]:
+                index[key] = deque(s for s in seqs if s in self._events)
+        return 1
+
+    def _evict_oldest(self) -> None:
+        """Evict the oldest live event."""
+        while self._head not in self._events:
+            self._head += 1
+        self._remove(self._head)
+        self._head += 1
+
+    def _lookup(self, index: dict[str, deque[int]], key: str, limit: int | None) -> list["CoordinationEvent"]:
+        """Collect the newest live events for an index key, oldest first."""
+        seqs = index.get(key)
+        if not seqs:
+            return []
+
+        found: list[CoordinationEvent] = []
+        for seq in reversed(seqs):
+            if limit is not None and len(found) >= limit:
+                break
+            event = self._events.get(seq)
+            if event is not None:
+                found.append(event)
+
+        self._prune_left(seqs)
+        found.reverse()
+        return found
@@ -0,0 +1,318 @@
+"""Live workflow change notifications over PostgreSQL LISTEN/NOTIFY.
+
+Given a ``WorkflowNotifier``, ``StateManager`` and ``CoordinationTracker``
+publish a compact JSON notification for every state change and tracked
+event. Followers of a workflow receive them through ``subscribe()`` instead
+of polling ``get_workflow`` / ``get_workflow_events``. A notification only
+carries identifiers, types and statuses, which is enough to decide whether
+to re-read anything.
+
+With a pool, notifications are sent with ``pg_notify`` on a single channel,
+so they reach subscribers in every process connected to the database, and
+notifications published on a transaction's connection are only delivered
+if it commits. A notifier holds one pooled connection for ``LISTEN`` while
+it has subscribers. Without a pool, notifications are delivered to
+subscribers in the same process.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+from asyncpg import Connection, Pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "mycelium_workflow_changes"
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+_MAX_PAYLOAD_BYTES = 7999
+
+
+class Subscription:
+    """Async iterator over the change notifications of one workflow.
+
+    Use as an async context manager so the subscription is always removed::
+
+        async with notifier.subscribe(workflow_id) as subscription:
+            async for change in subscription:
+                ...
+
+    Iteration ends when the subscription or its notifier is closed, or the
+    listening connection is lost. If the consumer falls ``max_queue``
+    notifications behind, the oldest pending ones are dropped and counted
+    in ``dropped``.
+    """
+
+    def __init__(self, notifier: "WorkflowNotifier", workflow_id: str, max_queue: int):
+        """Initialize subscription.
+
+        Args:
+            notifier: Notifier delivering the notifications
+            workflow_id: Workflow to follow
+            max_queue: Maximum number of pending notifications
+        """
+        self.workflow_id = workflow_id
+        self.dropped = 0
+        self._notifier = notifier
+        self._max_queue = max_queue
+        # One extra slot so the close sentinel never displaces a notification
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(max_queue + 1)
+        self._started = False
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription no longer receives notifications."""
+        return self._closed
+
+    async def __aenter__(self) -> "Subscription":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        change = await self.get()
+        if change is None:
+            raise StopAsyncIteration
+        return change
+
+    async def start(self) -> None:
+        """Register with the notifier (done implicitly by ``get``)."""
+        if not self._started and not self._closed:
+            self._started = True
+            await self._notifier._add(self)
+
+    async def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """Wait for the next notification.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Next notification, or None on timeout or once the subscription
+            is closed
+        """
+        await self.start()
+        if self._closed and self._queue.empty():
+            return None
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        """Stop receiving notifications and end iteration."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put_nowait(None)
+        if self._started:
+            await self._notifier._remove(self)
+
+    def _put(self, change: dict[str, Any]) -> None:
+        """Queue a notification, dropping the oldest pending one if full."""
+        if self._queue.qsize() >= self._max_queue:
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(change)
+
+
+class WorkflowNotifier:
+    """Publishes and fans out workflow change notifications.
+
+    Notifications are dicts with ``workflow_id`` and ``kind`` ("state" for
+    workflow status changes, "task" for task updates, "event" for tracked
+    coordination events, "deleted" when a workflow is removed) plus
+    kind-specific fields; None-valued fields are omitted.
+
+    Args:
+        pool: AsyncPG connection pool (None for in-process delivery only)
+        channel: NOTIFY channel shared by publishers and subscribers
+        max_queue: Default per-subscription queue bound
+    """
+
+    def __init__(self, pool: Pool | None = None, channel: str = DEFAULT_CHANNEL, max_queue: int = 1000):
+        """Initialize workflow notifier.
+
+        Args:
+            pool: AsyncPG connection pool (None for in-process delivery only)
+            channel: NOTIFY channel shared by publishers and subscribers
+            max_queue: Default per-subscription queue bound
+        """
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+
+        self.channel = channel
+        self.max_queue = max_queue
+        self._pool = pool
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._listener: Connection | None = None
+        self._listener_lock = asyncio.Lock()
+        # Releases of lost listening connections still in flight
+        self._releases: set[asyncio.Task[None]] = set()
+        self._stats = {"published": 0, "delivered": 0, "malformed": 0}
+
+    def subscribe(self, workflow_id: str, max_queue: int | None = None) -> Subscription:
+        """Follow a workflow's changes.
+
+        Args:
+            workflow_id: Workflow to follow
+            max_queue: Pending notification bound (default: ``self.max_queue``)
+
+        Returns:
+            Subscription; use it as an async context manager
+        """
+        return Subscription(self, workflow_id, max_queue or self.max_queue)
+
+    async def publish(self, workflow_id: str, kind: str, conn: Connection | None = None, **fields: Any) -> None:
+        """Publish one change notification.
+
+        Args:
+            workflow_id: Workflow that changed
+            kind: Notification kind
+            conn: Connection to send on; pass the connection of an open
+                transaction to deliver only on commit
+            **fields: Additional notification fields
+        """
+        await self.publish_many([{"workflow_id": workflow_id, "kind": kind, **fields}], conn=conn)
+
+    async def publish_many(self, changes: list[dict[str, Any]], conn: Connection | None = None) -> None:
+        """Publish change notifications in one round trip.
+
+        Args:
+            changes: Notifications, each with ``workflow_id`` and ``kind``
+            conn: Connection to send on (see ``publish``)
+        """
+        if not changes:
+            return
+        changes = [{key: value for key, value in change.items() if value is not None} for change in changes]
+        self._stats["published"] += len(changes)
+
+        if self._pool is None:
+            for change in changes:
+                self._dispatch(change)
+            return
+
+        payloads = [self._encode(change) for change in changes]
+        query = "SELECT pg_notify($1, payload) FROM unnest($2::TEXT[]) AS payload"
+        if conn is not None:
+            await conn.execute(query, self.channel, payloads)
+        else:
+            async with self._pool.acquire() as pool_conn:
+                await pool_conn.execute(query, self.channel, payloads)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get notifier statistics.
+
+        Returns:
+            Counts of published, delivered and malformed notifications, plus
+            current subscriptions
+        """
+        return {
+            **self._stats,
+            "subscriptions": sum(len(subscriptions) for subscriptions in self._subscriptions.values()),
+        }
+
+    async def close(self) -> None:
+        """Close every subscription and release the listening connection."""
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                await subscription.close()
+        await self._stop_listener()
+
+    @staticmethod
+    def _encode(change: dict[str, Any]) -> str:
+        """Serialize a notification, falling back to its identity if it is too large."""
+        payload = json.dumps(change, separators=(",", ":"), default=str)
+        if len(payload.encode()) > _MAX_PAYLOAD_BYTES:
+            payload = json.dumps({"workflow_id": change["workflow_id"], "kind": change["kind"], "truncated": True})
+        return payload
+
+    def _dispatch(self, change: dict[str, Any]) -> None:
+        """Deliver a notification to the workflow's subscribers."""
+        for subscription in self._subscriptions.get(change.get("workflow_id", ""), ()):
+            subscription._put(change)
+            self._stats["delivered"] += 1
+
+    def _on_notification(self, conn: Connection, pid: int, channel: str, payload: str) -> None:  # noqa: ARG002
+        """asyncpg listener callback."""
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            change = None
+        if not isinstance(change, dict) or not isinstance(change.get("workflow_id"), str):
+            self._stats["malformed"] += 1
+            logger.warning(f"Ignoring malformed notification on {channel}: {payload[:200]!r}")
+            return
+        self._dispatch(change)
+
+    def _on_listener_lost(self, conn: Connection) -> None:
+        """End all subscriptions when the listening connection terminates."""
+        logger.warning(f"Lost LISTEN connection for {self.channel}; closing subscriptions")
+        if self._listener is conn:
+            self._listener = None
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription._closed = True
+                subscription._queue.put_nowait(None)
+        self._subscriptions.clear()
+
+        # Give the dead connection's slot back to the pool
+        release = asyncio.get_running_loop().create_task(self._release_lost(conn))
+        self._releases.add(release)
+        release.add_done_callback(self._releases.discard)
+
+    async def _release_lost(self, conn: Connection) -> None:
+        """Return a terminated listening connection to the pool."""
+        if self._pool is None:
+            return
+        try:
+            await self._pool.release(conn)
+        except Exception:
+            logger.exception(f"Failed to release lost LISTEN connection for {self.channel}")
+
+    async def _add(self, subscription: Subscription) -> None:
+        """Register a subscription, starting the listener if needed."""
+        self._subscriptions.setdefault(subscription.workflow_id, set()).add(subscription)
+        if self._pool is None:
+            return
+
+        async with self._listener_lock:
+            if self._listener is None:
+                conn = await self._pool.acquire()
+                await conn.add_listener(self.channel, self._on_notification)
+                conn.add_termination_listener(self._on_listener_lost)
+                self._listener = conn
+
+    async def _remove(self, subscription: Subscription) -> None:
+        """Unregister a subscription, stopping the listener after the last one."""
+        subscriptions = self._subscriptions.get(subscription.workflow_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.workflow_id]
+
+        if not self._subscriptions:
+            await self._stop_listener()
+
+    async def _stop_listener(self) -> None:
+        """Stop listening and return the connection to the pool."""
+        async with self._listener_lock:
+            if self._subscriptions:
+                # Subscribed again while waiting for the lock
+                return
+            conn, self._listener = self._listener, None
+            if conn is None or self._pool is None:
+                return
+            conn.remove_termination_listener(self._on_listener_lost)
+            try:
+                await conn.remove_listener(self.channel, self._on_notification)
+            finally:
+                await self._pool.release(conn)
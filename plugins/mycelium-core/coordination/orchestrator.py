@@ -7,13 +7,17 @@ state management, and failure recovery mechanisms.
 
 import asyncio
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from typing import Any
 
 from .protocol import HandoffContext
+from .scheduling import FairScheduler
 from .state_manager import (
+    StateConflictError,
     StateManager,
     TaskState,
     TaskStatus,
@@ -83,6 +87,32 @@ class TaskExecutionContext:
 # Type alias for task executor function
 TaskExecutor = Callable[[TaskExecutionContext], Any]
 
+_TERMINAL_TASK_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED})
+
+# Read-then-update writes retry this often when task writes land in between
+_STATUS_CHANGE_ATTEMPTS = 5
+
+
+@dataclass
+class _WorkflowRun:
+    """Authoritative in-memory state of a workflow executing in this orchestrator.
+
+    Task updates are applied to ``state`` under ``lock`` and recorded in
+    ``dirty`` until the next checkpoint writes them to the state manager.
+    Checkpoints write a snapshot taken under ``lock`` without holding it,
+    so tasks keep reporting during the write; ``write_lock`` keeps the
+    writes themselves in version order. Tasks are replaced rather than
+    mutated so a snapshot never sees later updates.
+    """
+
+    state: WorkflowState
+    context_data: dict[str, Any]
+    weight: float = 1.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    write_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    dirty: set[str] = field(default_factory=set)
+    last_checkpoint: float = field(default_factory=time.monotonic)
+
 
 class WorkflowOrchestrator:
     """Orchestrates multi-agent workflow execution with dependency resolution.
@@ -94,6 +124,17 @@ class WorkflowOrchestrator:
     - Failure recovery (retry, fallback, abort)
     - Real-time progress tracking
     - Memory-efficient execution (<50MB overhead per workflow)
+
+    While a workflow executes, the orchestrator holds its state in memory:
+    task contexts and dependency results are read from that copy, and task
+    updates are written to the state manager as deltas of the changed task
+    rows only, never reading the workflow back. The per-task cost is
+    therefore independent of workflow size.
+
+    Task executions are admitted per agent type by a ``FairScheduler``:
+    ``max_parallel_tasks`` bounds each workflow, ``register_executor``'s
+    ``max_concurrency`` bounds an agent type across all workflows, and
+    waiting tasks are shared between workflows by their ``weight``.
     """
 
     def __init__(
@@ -101,6 +142,7 @@ class WorkflowOrchestrator:
         state_manager: StateManager,
         default_retry_policy: RetryPolicy | None = None,
         max_parallel_tasks: int = 10,
+        checkpoint_interval: float = 0.0,
     ):
         """Initialize workflow orchestrator.
 
@@ -108,21 +150,60 @@ class WorkflowOrchestrator:
             state_manager: State manager for persistence
             default_retry_policy: Default retry policy for tasks
             max_parallel_tasks: Maximum number of parallel tasks
+            checkpoint_interval: Minimum seconds between task-progress
+                checkpoints. 0 writes every task transition as it happens;
+                larger values batch transitions into fewer writes. The end
+                of a workflow is always checkpointed.
         """
+        if checkpoint_interval < 0:
+            raise ValueError("checkpoint_interval must be non-negative")
+
         self.state_manager = state_manager
         self.default_retry_policy = default_retry_policy or RetryPolicy()
         self.max_parallel_tasks = max_parallel_tasks
+        self.checkpoint_interval = checkpoint_interval
         self._task_executors: dict[str, TaskExecutor] = {}
+        self._executor_pools: dict[str, Executor] = {}
+        self._scheduler = FairScheduler()
         self._active_workflows: dict[str, asyncio.Task[Any]] = {}
+        self._runs: dict[str, _WorkflowRun] = {}
 
-    def register_executor(self, agent_type: str, executor: TaskExecutor) -> None:
+    def register_executor(
+        self,
+        agent_type: str,
+        executor: TaskExecutor,
+        max_concurrency: int | None = None,
+        pool: Executor | None = None,
+    ) -> None:
         """Register task executor for agent type.
 
         Args:
             agent_type: Agent type identifier
-            executor: Async function that executes the task
+            executor: Async function that executes the task, or a blocking
+                function if ``pool`` is given
+            max_concurrency: Maximum concurrent executions of this agent
+                type across all workflows (None for no limit)
+            pool: Thread or process pool to run a blocking executor in. For
+                a process pool the executor and its ``TaskExecutionContext``
+                must be picklable. On timeout the slot is released but the
+                call keeps running in the pool.
         """
+        self._scheduler.configure(agent_type, max_concurrency)
         self._task_executors[agent_type] = executor
+        if pool is not None:
+            self._executor_pools[agent_type] = pool
+        else:
+            self._executor_pools.pop(agent_type, None)
+
+    def get_executor_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-agent-type execution queue statistics.
+
+        Returns:
+            Mapping of agent type to its concurrency limit, active and queued
+            executions, dispatch count, and average and maximum slot wait
+            time in milliseconds
+        """
+        return self._scheduler.get_stats()
 
     async def create_workflow(
         self,
@@ -130,6 +211,7 @@ class WorkflowOrchestrator:
         workflow_id: str | None = None,
         context: HandoffContext | None = None,
         metadata: dict[str, Any] | None = None,
+        weight: float = 1.0,
     ) -> str:
         """Create a new workflow.
 
@@ -138,6 +220,8 @@ class WorkflowOrchestrator:
             workflow_id: Optional workflow ID
             context: Optional workflow context
             metadata: Optional workflow metadata
+            weight: Share of contended agent-type slots relative to other
+                workflows (2.0 is dispatched twice as often as 1.0)
 
         Returns:
             Workflow ID
@@ -146,6 +230,9 @@ class WorkflowOrchestrator:
             DependencyError: If task dependencies form a cycle
             OrchestrationError: If workflow creation fails
         """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+
         # Validate dependencies (no cycles)
         self._validate_dependencies(tasks)
 
@@ -182,6 +269,7 @@ class WorkflowOrchestrator:
             for t in tasks
         ]
         metadata["context"] = context.to_dict() if context else {}
+        metadata["weight"] = weight
 
         # Create workflow state
         state = await self.state_manager.create_workflow(
@@ -217,6 +305,7 @@ class WorkflowOrchestrator:
 
     async def _execute_workflow_impl(self, workflow_id: str) -> WorkflowState:
         """Internal workflow execution implementation."""
+        run: _WorkflowRun | None = None
         try:
             # Get workflow state
             state = await self.state_manager.get_workflow(workflow_id)
@@ -226,6 +315,11 @@ class WorkflowOrchestrator:
             state.started_at = state.updated_at
             await self.state_manager.update_workflow(state)
 
+            # From here on the in-memory copy is authoritative
+            run = self._runs[workflow_id] = _WorkflowRun(
+                state, state.metadata.get("context", {}), weight=state.metadata.get("weight", 1.0)
+            )
+
             # Reconstruct task definitions from metadata
             tasks = self._reconstruct_tasks(state)
 
@@ -233,10 +327,10 @@ class WorkflowOrchestrator:
             dep_graph = self._build_dependency_graph(tasks)
 
             # Execute tasks in topological order with parallelism
-            await self._execute_tasks(workflow_id, tasks, dep_graph, state)
+            await self._execute_tasks(workflow_id, tasks, dep_graph, run)
 
-            # Get final state
-            state = await self.state_manager.get_workflow(workflow_id)
+            # Write outstanding task updates before the final status
+            await self._checkpoint(run)
 
             # Determine final status
             if all(t.status == TaskStatus.COMPLETED for t in state.tasks.values()):
@@ -258,13 +352,16 @@ class WorkflowOrchestrator:
                 state.status = WorkflowStatus.COMPLETED
 
             state.completed_at = state.updated_at
-            await self.state_manager.update_workflow(state)
+            async with run.write_lock:
+                await self._write_final_state(state)
 
             return state
 
         except Exception as e:
             # Mark workflow as failed
             try:
+                if run is not None:
+                    await self._checkpoint(run)
                 state = await self.state_manager.get_workflow(workflow_id)
                 state.status = WorkflowStatus.FAILED
                 state.error = str(e)
@@ -275,6 +372,7 @@ class WorkflowOrchestrator:
             raise OrchestrationError(f"Workflow execution failed: {str(e)}") from e
         finally:
             # Clean up active workflows
+            self._runs.pop(workflow_id, None)
             if workflow_id in self._active_workflows:
                 del self._active_workflows[workflow_id]
 
@@ -363,103 +461,108 @@ class WorkflowOrchestrator:
         self,
         workflow_id: str,
         tasks: list[TaskDefinition],
-        _dep_graph: dict[str, list[str]],
-        state: WorkflowState,
+        dep_graph: dict[str, list[str]],
+        run: _WorkflowRun,
     ) -> None:
         """Execute tasks respecting dependencies and parallelism.
 
+        Tasks are scheduled from a ready queue driven by in-degree counters:
+        when a task finishes, each dependent's counter is decremented and the
+        dependent is dispatched as soon as it reaches zero. The scheduler waits
+        on the full running set, and a semaphore caps concurrent executions
+        at ``max_parallel_tasks``.
+
         Args:
             workflow_id: Workflow identifier
             tasks: Task definitions
-            dep_graph: Dependency graph
-            state: Current workflow state
+            dep_graph: Dependency graph (task -> dependent tasks)
+            run: In-memory state of the workflow
+
+        Raises:
+            ExecutionError: If a task that does not allow failure fails
+            OrchestrationError: If some tasks can never become ready
         """
         tasks_by_id = {t.task_id: t for t in tasks}
-        completed = set()
-        running: set[str] = set()
-        pending = {t.task_id for t in tasks}
-
-        while pending or running:
-            # Find tasks ready to execute (all dependencies completed)
-            ready = []
-            for task_id in list(pending):
-                task_def = tasks_by_id[task_id]
-                if all(dep in completed for dep in task_def.dependencies):
-                    ready.append(task_id)
-                    pending.remove(task_id)
-
-            # Start ready tasks up to parallel limit
-            tasks_to_start = ready[: self.max_parallel_tasks - len(running)]
-            if tasks_to_start:
-                task_futures = []
-                for task_id in tasks_to_start:
-                    running.add(task_id)
-                    future = asyncio.create_task(self._execute_task(workflow_id, tasks_by_id[task_id], state))
-                    task_futures.append((task_id, future))
-
-                # Wait for at least one task to complete
-                done, pending_futures = await asyncio.wait(
-                    [f for _, f in task_futures],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
+        # Number of unfinished dependencies per task (dep_graph counts duplicates too)
+        in_degree = {t.task_id: len(t.dependencies) for t in tasks}
+        ready = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        running: dict[asyncio.Task[None], str] = {}
+        finished: set[str] = set()
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_tasks))
 
-                # Process completed tasks
-                for task_id, future in task_futures:
-                    if future in done:
-                        running.remove(task_id)
-                        try:
-                            await future
-                            completed.add(task_id)
-                        except ExecutionError:
-                            # Check if failure is allowed
-                            if not tasks_by_id[task_id].allow_failure:
-                                raise
-                            completed.add(task_id)  # Mark as completed even though it failed
-            elif running:
-                # Wait for running tasks if no ready tasks
-                await asyncio.sleep(0.1)
-            else:
-                # No ready tasks and nothing running - check for deadlock
-                if pending:
-                    raise OrchestrationError(f"Workflow deadlock detected. Pending tasks: {pending}")
+        async def run_task(task_def: TaskDefinition) -> None:
+            async with semaphore:
+                await self._execute_task(workflow_id, task_def, run)
+
+        try:
+            while ready or running:
+                while ready:
+                    task_id = ready.popleft()
+                    running[asyncio.create_task(run_task(tasks_by_id[task_id]))] = task_id
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done:
+                    task_id = running.pop(future)
+                    try:
+                        future.result()
+                    except ExecutionError:
+                        # Check if failure is allowed
+                        if not tasks_by_id[task_id].allow_failure:
+                            raise
+                        # Dependents of an allowed failure still run
+
+                    finished.add(task_id)
+                    for dependent in dep_graph.get(task_id, []):
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            ready.append(dependent)
+        finally:
+            # Don't leave sibling tasks running after an abort or cancellation
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if len(finished) < len(tasks):
+            pending = set(tasks_by_id) - finished
+            raise OrchestrationError(f"Workflow deadlock detected. Pending tasks: {pending}")
 
     async def _execute_task(
         self,
         workflow_id: str,
         task_def: TaskDefinition,
-        state: WorkflowState,
+        run: _WorkflowRun,
     ) -> None:
         """Execute a single task with retry logic.
 
         Args:
             workflow_id: Workflow identifier
             task_def: Task definition
-            state: Current workflow state
+            run: In-memory state of the workflow
 
         Raises:
             ExecutionError: If task execution fails after retries
         """
-        task_state = state.tasks[task_def.task_id]
         attempt = 0
 
         while attempt < task_def.retry_policy.max_attempts:
             try:
                 # Update task status
-                await self.state_manager.update_task(
-                    workflow_id,
+                await self._update_task(
+                    run,
                     task_def.task_id,
                     status=TaskStatus.RUNNING if attempt == 0 else TaskStatus.RETRYING,
+                    retry_count=attempt,
                 )
-                task_state.retry_count = attempt
 
                 # Get executor
                 executor = self._task_executors.get(task_def.agent_type)
                 if not executor:
                     raise ExecutionError(f"No executor registered for agent type {task_def.agent_type}")
 
-                # Build execution context
-                state = await self.state_manager.get_workflow(workflow_id)
-                context_data = state.metadata.get("context", {})
+                # Build execution context from the in-memory state
+                context_data = run.context_data
                 workflow_context = HandoffContext(
                     task_description=context_data.get("task_description"),
                     previous_results=context_data.get("previous_results", []),
@@ -471,7 +574,7 @@ class WorkflowOrchestrator:
                 # Collect results from dependencies
                 previous_results = []
                 for dep_id in task_def.dependencies:
-                    dep_task = state.tasks.get(dep_id)
+                    dep_task = run.state.tasks.get(dep_id)
                     if dep_task and dep_task.result:
                         previous_results.append(
                             {
@@ -486,23 +589,24 @@ class WorkflowOrchestrator:
                     workflow_id=workflow_id,
                     workflow_context=workflow_context,
                     previous_results=previous_results,
-                    variables=state.variables.copy(),
+                    variables=run.state.variables.copy(),
                 )
 
-                # Execute task with timeout
-                start_time = time.time()
-                if task_def.timeout:
-                    result = await asyncio.wait_for(
-                        executor(exec_context),
-                        timeout=task_def.timeout,
-                    )
-                else:
-                    result = await executor(exec_context)
-                execution_time = (time.time() - start_time) * 1000  # Convert to ms
+                # Execute task with timeout once the agent type has a free slot
+                async with self._scheduler.slot(task_def.agent_type, workflow_id, run.weight):
+                    start_time = time.time()
+                    if task_def.timeout:
+                        result = await asyncio.wait_for(
+                            self._invoke(task_def.agent_type, executor, exec_context),
+                            timeout=task_def.timeout,
+                        )
+                    else:
+                        result = await self._invoke(task_def.agent_type, executor, exec_context)
+                    execution_time = (time.time() - start_time) * 1000  # Convert to ms
 
                 # Update task with result
-                await self.state_manager.update_task(
-                    workflow_id,
+                await self._update_task(
+                    run,
                     task_def.task_id,
                     status=TaskStatus.COMPLETED,
                     result={"data": result} if result else {},
@@ -516,7 +620,7 @@ class WorkflowOrchestrator:
                     "message": f"Task exceeded timeout of {task_def.timeout}s",
                     "attempt": attempt + 1,
                 }
-                await self._handle_task_failure(workflow_id, task_def, attempt, error_info)
+                await self._handle_task_failure(run, task_def, attempt, error_info)
                 attempt += 1
                 if attempt < task_def.retry_policy.max_attempts:
                     await asyncio.sleep(task_def.retry_policy.get_delay(attempt))
@@ -527,7 +631,7 @@ class WorkflowOrchestrator:
                     "message": str(e),
                     "attempt": attempt + 1,
                 }
-                await self._handle_task_failure(workflow_id, task_def, attempt, error_info)
+                await self._handle_task_failure(run, task_def, attempt, error_info)
                 attempt += 1
                 if attempt < task_def.retry_policy.max_attempts:
                     await asyncio.sleep(task_def.retry_policy.get_delay(attempt))
@@ -535,9 +639,16 @@ class WorkflowOrchestrator:
         # All retries exhausted
         raise ExecutionError(f"Task {task_def.task_id} failed after {attempt} attempts")
 
+    async def _invoke(self, agent_type: str, executor: TaskExecutor, exec_context: TaskExecutionContext) -> Any:
+        """Call an executor, in its pool if it is a blocking one."""
+        pool = self._executor_pools.get(agent_type)
+        if pool is None:
+            return await executor(exec_context)
+        return await asyncio.get_running_loop().run_in_executor(pool, executor, exec_context)
+
     async def _handle_task_failure(
         self,
-        workflow_id: str,
+        run: _WorkflowRun,
         task_def: TaskDefinition,
         attempt: int,
         error_info: dict[str, Any],
@@ -545,29 +656,179 @@ class WorkflowOrchestrator:
         """Handle task execution failure.
 
         Args:
-            workflow_id: Workflow identifier
+            run: In-memory state of the workflow
             task_def: Task definition
             attempt: Current attempt number
             error_info: Error information
         """
         if attempt >= task_def.retry_policy.max_attempts - 1:
             # Final failure
-            await self.state_manager.update_task(
-                workflow_id,
+            await self._update_task(
+                run,
                 task_def.task_id,
                 status=TaskStatus.FAILED,
                 error=error_info,
             )
 
+    async def _update_task(
+        self,
+        run: _WorkflowRun,
+        task_id: str,
+        status: TaskStatus,
+        result: dict[str, Any] | None = None,
+        error: dict[str, Any] | None = None,
+        execution_time: float | None = None,
+        retry_count: int | None = None,
+    ) -> None:
+        """Apply a task update in memory and checkpoint it when due.
+
+        Mirrors ``StateManager.update_task``: ``started_at`` is set on the
+        first transition to running, ``completed_at`` on terminal statuses,
+        and empty values leave fields unchanged.
+
+        Args:
+            run: In-memory state of the workflow
+            task_id: Task identifier
+            status: New task status
+            result: Optional task result
+            error: Optional error information
+            execution_time: Optional execution time in milliseconds
+            retry_count: Optional retry attempt number
+        """
+        async with run.lock:
+            task = replace(run.state.tasks[task_id])
+            now = datetime.now(timezone.utc).isoformat()
+
+            task.status = status
+            if status == TaskStatus.RUNNING and task.started_at is None:
+                task.started_at = now
+            if status in _TERMINAL_TASK_STATUSES:
+                task.completed_at = now
+            if result:
+                task.result = result
+            if error:
+                task.error = error
+            if execution_time is not None:
+                task.execution_time = execution_time
+            if retry_count is not None:
+                task.retry_count = retry_count
+
+            run.state.tasks[task_id] = task
+            run.dirty.add(task_id)
+            due = time.monotonic() - run.last_checkpoint >= self.checkpoint_interval
+
+        if due:
+            await self._checkpoint(run)
+
+    async def _checkpoint(self, run: _WorkflowRun) -> None:
+        """Write the tasks changed since the last checkpoint.
+
+        The changed tasks are snapshotted under ``run.lock`` and written
+        after releasing it; on failure they are marked dirty again.
+
+        Args:
+            run: In-memory state of the workflow
+        """
+        async with run.write_lock:
+            async with run.lock:
+                run.last_checkpoint = time.monotonic()
+                if not run.dirty:
+                    return
+                task_ids = sorted(run.dirty)
+                run.dirty.clear()
+                snapshot = replace(run.state, tasks=dict(run.state.tasks))
+
+            try:
+                try:
+                    await self.state_manager.update_tasks(snapshot, task_ids)
+                except StateConflictError:
+                    # Paused or cancelled since the last write: adopt that and write again
+                    run.state.status = await self._adopt_stored_status(snapshot)
+                    await self.state_manager.update_tasks(snapshot, task_ids)
+            except BaseException:
+                run.dirty.update(task_ids)
+                raise
+
+            run.state.version = snapshot.version
+            run.state.updated_at = snapshot.updated_at
+
+    async def _adopt_stored_status(self, state: WorkflowState) -> WorkflowStatus:
+        """Take the stored status and version of a workflow changed elsewhere.
+
+        Args:
+            state: In-memory workflow state, updated in place
+
+        Returns:
+            The stored status
+        """
+        stored = await self.state_manager.get_workflow(state.workflow_id)
+        state.status = stored.status
+        state.version = stored.version
+        return stored.status
+
+    async def _write_final_state(self, state: WorkflowState) -> None:
+        """Write a finished workflow's final status over concurrent changes.
+
+        A cancellation recorded since the last checkpoint wins; any other
+        status change (such as a pause) is overwritten.
+
+        Args:
+            state: In-memory workflow state with its final status set
+        """
+        final_status = state.status
+        attempts = 0
+        while True:
+            try:
+                await self.state_manager.update_workflow(state)
+                return
+            except StateConflictError:
+                attempts += 1
+                if attempts >= _STATUS_CHANGE_ATTEMPTS:
+                    raise
+            if await self._adopt_stored_status(state) == WorkflowStatus.CANCELLED:
+                return
+            state.status = final_status
+
+    async def _change_status(self, workflow_id: str, change: Callable[[WorkflowState], bool]) -> WorkflowState:
+        """Read, modify and write a workflow, retrying on version conflicts.
+
+        Task updates bump the workflow version, so a status change racing
+        with running tasks is retried on a fresh copy.
+
+        Args:
+            workflow_id: Workflow identifier
+            change: Applies the change to a fresh copy; returns False to skip the write
+
+        Returns:
+            Workflow state after the change
+        """
+        attempts = 0
+        while True:
+            state = await self.state_manager.get_workflow(workflow_id)
+            if not change(state):
+                return state
+            try:
+                return await self.state_manager.update_workflow(state)
+            except StateConflictError:
+                attempts += 1
+                if attempts >= _STATUS_CHANGE_ATTEMPTS:
+                    raise
+
     async def get_workflow_status(self, workflow_id: str) -> WorkflowState:
         """Get current workflow status.
 
+        Workflows executing in this orchestrator are answered from memory,
+        including task updates not yet checkpointed.
+
         Args:
             workflow_id: Workflow identifier
 
         Returns:
             Current workflow state
         """
+        run = self._runs.get(workflow_id)
+        if run is not None:
+            return WorkflowState.from_dict(run.state.to_dict())
         return await self.state_manager.get_workflow(workflow_id)
 
     async def cancel_workflow(self, workflow_id: str) -> WorkflowState:
@@ -579,16 +840,21 @@ class WorkflowOrchestrator:
         Returns:
             Updated workflow state
         """
-        state = await self.state_manager.get_workflow(workflow_id)
-        state.status = WorkflowStatus.CANCELLED
-        state.completed_at = state.updated_at
+        run = self._runs.get(workflow_id)
+        if run is not None:
+            await self._checkpoint(run)
+
+        def cancel(state: WorkflowState) -> bool:
+            state.status = WorkflowStatus.CANCELLED
+            state.completed_at = state.updated_at
 
-        # Cancel running tasks
-        for task in state.tasks.values():
-            if task.status == TaskStatus.RUNNING:
-                task.status = TaskStatus.SKIPPED
+            # Cancel running tasks
+            for task in state.tasks.values():
+                if task.status == TaskStatus.RUNNING:
+                    task.status = TaskStatus.SKIPPED
+            return True
 
-        await self.state_manager.update_workflow(state)
+        state = await self._change_status(workflow_id, cancel)
 
         # Cancel asyncio task if running
         if workflow_id in self._active_workflows:
@@ -606,11 +872,14 @@ class WorkflowOrchestrator:
         Returns:
             Updated workflow state
         """
-        state = await self.state_manager.get_workflow(workflow_id)
-        if state.status == WorkflowStatus.RUNNING:
+
+        def pause(state: WorkflowState) -> bool:
+            if state.status != WorkflowStatus.RUNNING:
+                return False
             state.status = WorkflowStatus.PAUSED
-            await self.state_manager.update_workflow(state)
-        return state
+            return True
+
+        return await self._change_status(workflow_id, pause)
 
     async def resume_workflow(self, workflow_id: str) -> WorkflowState:
         """Resume paused workflow.
@@ -621,10 +890,17 @@ class WorkflowOrchestrator:
         Returns:
             Execution started in background, returns current state
         """
-        state = await self.state_manager.get_workflow(workflow_id)
-        if state.status == WorkflowStatus.PAUSED:
-            state.status = WorkflowStatus.PENDING
-            await self.state_manager.update_workflow(state)
+        resumed = False
+
+        def resume(state: WorkflowState) -> bool:
+            nonlocal resumed
+            resumed = state.status == WorkflowStatus.PAUSED
+            if resumed:
+                state.status = WorkflowStatus.PENDING
+            return resumed
+
+        state = await self._change_status(workflow_id, resume)
+        if resumed:
             await self.execute_workflow(workflow_id, background=True)
         return state
 
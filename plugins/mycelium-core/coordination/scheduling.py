@@ -0,0 +1,178 @@
+"""Per-agent-type concurrency limits with weighted fair queuing.
+
+``WorkflowOrchestrator`` runs every task execution through a
+``FairScheduler`` slot for the task's agent type. Each agent type has its
+own lane with an optional concurrency limit, so an expensive (e.g.
+LLM-backed) type can be capped without throttling cheap ones.
+
+When a lane is full, waiting tasks are ordered by weighted fair queuing
+across workflows: each request gets a virtual finish tag of
+``max(virtual_time, previous tag of its workflow) + 1 / weight`` and the
+smallest tag is dispatched first. A workflow that queues many tasks
+therefore cannot starve one that queues a few, and a workflow with weight
+2 is dispatched twice as often as one with weight 1 while both are
+backlogged.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+
+class _Lane:
+    """Concurrency limit, wait queue and statistics of one agent type."""
+
+    def __init__(self, max_concurrency: int | None):
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.queued = 0
+        # Heap of (finish tag, sequence, enqueue time, future)
+        self.waiters: list[tuple[float, int, float, asyncio.Future[None]]] = []
+        self.virtual_time = 0.0
+        self.finish_tags: dict[str, float] = {}
+        self.dispatched = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def has_capacity(self) -> bool:
+        return self.max_concurrency is None or self.active < self.max_concurrency
+
+    def grant(self, waited: float) -> None:
+        self.active += 1
+        self.dispatched += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+
+class FairScheduler:
+    """Bounded, weighted-fair admission of task executions per agent type.
+
+    Agent types that were never configured have no concurrency limit but
+    are still counted in the statistics.
+    """
+
+    def __init__(self) -> None:
+        """Initialize scheduler."""
+        self._lanes: dict[str, _Lane] = {}
+        self._sequence = itertools.count()
+
+    def configure(self, agent_type: str, max_concurrency: int | None) -> None:
+        """Set the concurrency limit of an agent type.
+
+        Args:
+            agent_type: Agent type identifier
+            max_concurrency: Maximum concurrent executions (None for no limit)
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        lane = self._lane(agent_type)
+        lane.max_concurrency = max_concurrency
+        self._dispatch(lane)
+
+    @asynccontextmanager
+    async def slot(self, agent_type: str, workflow_id: str, weight: float = 1.0) -> AsyncIterator[None]:
+        """Hold an execution slot of an agent type.
+
+        Args:
+            agent_type: Agent type identifier
+            workflow_id: Workflow the execution belongs to
+            weight: Fair-share weight of the workflow
+        """
+        await self.acquire(agent_type, workflow_id, weight)
+        try:
+            yield
+        finally:
+            self.release(agent_type)
+
+    async def acquire(self, agent_type: str, workflow_id: str, weight: float = 1.0) -> None:
+        """Wait for an execution slot of an agent type.
+
+        Every successful ``acquire`` must be paired with a ``release``.
+
+        Args:
+            agent_type: Agent type identifier
+            workflow_id: Workflow the execution belongs to
+            weight: Fair-share weight of the workflow
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+
+        lane = self._lane(agent_type)
+        if lane.has_capacity() and not lane.queued:
+            lane.grant(0.0)
+            return
+
+        tag = max(lane.virtual_time, lane.finish_tags.get(workflow_id, 0.0)) + 1.0 / weight
+        lane.finish_tags[workflow_id] = tag
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(lane.waiters, (tag, next(self._sequence), time.monotonic(), future))
+        lane.queued += 1
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # Still queued; the stale heap entry is skipped on dispatch
+                lane.queued -= 1
+            else:
+                # Granted just before the cancellation arrived
+                self.release(agent_type)
+            raise
+
+    def release(self, agent_type: str) -> None:
+        """Return an execution slot and admit the next waiter.
+
+        Args:
+            agent_type: Agent type identifier
+        """
+        lane = self._lanes[agent_type]
+        lane.active -= 1
+        self._dispatch(lane)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-agent-type statistics.
+
+        Returns:
+            Mapping of agent type to its concurrency limit, active and queued
+            executions, dispatch count, and average and maximum time spent
+            waiting for a slot
+        """
+        return {
+            agent_type: {
+                "max_concurrency": lane.max_concurrency,
+                "active": lane.active,
+                "queued": lane.queued,
+                "dispatched": lane.dispatched,
+                "avg_wait_ms": lane.wait_total / lane.dispatched * 1000 if lane.dispatched else 0.0,
+                "max_wait_ms": lane.wait_max * 1000,
+            }
+            for agent_type, lane in self._lanes.items()
+        }
+
+    def _lane(self, agent_type: str) -> _Lane:
+        """Get or create the lane of an agent type."""
+        lane = self._lanes.get(agent_type)
+        if lane is None:
+            lane = self._lanes[agent_type] = _Lane(None)
+        return lane
+
+    def _dispatch(self, lane: _Lane) -> None:
+        """Admit waiters in finish-tag order while the lane has capacity."""
+        now = time.monotonic()
+        while lane.waiters and lane.has_capacity():
+            tag, _, enqueued_at, future = heapq.heappop(lane.waiters)
+            if future.done():
+                continue
+            lane.virtual_time = tag
+            lane.queued -= 1
+            lane.grant(now - enqueued_at)
+            future.set_result(None)
+
+        if not lane.waiters:
+            # Backlog drained: per-workflow tags are no longer needed
+            lane.finish_tags.clear()
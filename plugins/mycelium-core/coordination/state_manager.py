@@ -7,14 +7,18 @@ including state persistence, versioning, and rollback mechanisms.
 import json
 import os
 import uuid
-from dataclasses import asdict, dataclass, field
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import asyncpg
 from asyncpg import Pool
 
+if TYPE_CHECKING:
+    from .notifications import WorkflowNotifier
+
 
 def _parse_iso_datetime(iso_string: str) -> datetime:
     """Parse ISO format datetime string, ensuring it's timezone-aware.
@@ -53,6 +57,12 @@ class StateNotFoundError(StateManagerError):
     pass
 
 
+class StateConflictError(StateManagerError):
+    """Raised when a workflow was modified since the caller read it."""
+
+    pass
+
+
 class WorkflowStatus(str, Enum):
     """Workflow execution status."""
 
@@ -147,6 +157,20 @@ class WorkflowState:
         return cls(**data)
 
 
+_TERMINAL_WORKFLOW_STATUSES = frozenset({WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED})
+_TERMINAL_TASK_STATUSES = [TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, TaskStatus.SKIPPED.value]
+
+# Overwrite one task row; parameters follow StateManager._task_row_args
+_UPDATE_TASK_ROW = """
+    UPDATE task_states SET
+        agent_id = $3, agent_type = $4, status = $5,
+        started_at = $6::TIMESTAMPTZ, completed_at = $7::TIMESTAMPTZ,
+        execution_time = $8, result = $9, error = $10,
+        retry_count = $11, dependencies = $12
+    WHERE task_id = $1 AND workflow_id = $2
+"""
+
+
 def _deserialize_json_field(value: Any) -> Any:
     """Deserialize a JSON field that may be a string or dict.
 
@@ -167,16 +191,36 @@ class StateManager:
     """Manages workflow state with persistence and rollback support.
 
     Provides state persistence to PostgreSQL with versioning and rollback capabilities.
-    Supports concurrent workflow execution with isolation.
+    Supports concurrent workflow execution with isolation: task updates are
+    written in place, and every write bumps ``workflow_states.version``.
+    Whole-workflow updates and batched task writes from an in-memory copy
+    use optimistic concurrency on that version; callers doing a
+    read-then-update retry on ``StateConflictError``.
     """
 
-    def __init__(self, pool: Pool | None = None, connection_string: str | None = None):
+    def __init__(
+        self,
+        pool: Pool | None = None,
+        connection_string: str | None = None,
+        snapshot_interval: int = 100,
+        notifier: "WorkflowNotifier | None" = None,
+    ):
         """Initialize state manager.
 
         Args:
             pool: Optional existing connection pool
             connection_string: Optional PostgreSQL connection string
+            snapshot_interval: Save a rollback snapshot every N versions. The
+                initial version and terminal workflow states are always
+                snapshotted; 0 snapshots only those.
+            notifier: Optional notifier; every committed change publishes a
+                "state", "task" or "deleted" notification
         """
+        if snapshot_interval < 0:
+            raise ValueError("snapshot_interval must be non-negative")
+
+        self.snapshot_interval = snapshot_interval
+        self._notifier = notifier
         if pool is not None:
             self._pool: Pool | None = pool
             self._owns_pool = False
@@ -267,8 +311,29 @@ class StateManager:
             metadata=metadata or {},
         )
 
-        await self._persist_state(state)
-        await self._save_snapshot(state)
+        async with self._pool.acquire() as conn, conn.transaction():
+            try:
+                await conn.execute(
+                    """
+                    INSERT INTO workflow_states (
+                        workflow_id, status, created_at, updated_at, variables, metadata, version
+                    ) VALUES ($1, $2, $3::TIMESTAMPTZ, $4::TIMESTAMPTZ, $5, $6, $7)
+                    """,
+                    state.workflow_id,
+                    state.status.value,
+                    _parse_iso_datetime(state.created_at),
+                    _parse_iso_datetime(state.updated_at),
+                    json.dumps(state.variables),
+                    json.dumps(state.metadata),
+                    state.version,
+                )
+            except asyncpg.UniqueViolationError as e:
+                raise StateManagerError(f"Workflow {workflow_id} already exists") from e
+
+            await self._insert_tasks(conn, workflow_id, list(tasks_dict.values()))
+            await self._save_snapshot(conn, state)
+            await self._notify(conn, state)
+
         return state
 
     async def get_workflow(self, workflow_id: str) -> WorkflowState:
@@ -287,54 +352,15 @@ class StateManager:
             raise StateManagerError("State manager not initialized")
 
         async with self._pool.acquire() as conn:
-            # Get workflow
-            workflow_row = await conn.fetchrow(
-                "SELECT * FROM workflow_states WHERE workflow_id = $1",
-                workflow_id,
-            )
-            if not workflow_row:
-                raise StateNotFoundError(f"Workflow {workflow_id} not found")
-
-            # Get tasks
-            task_rows = await conn.fetch(
-                "SELECT * FROM task_states WHERE workflow_id = $1",
-                workflow_id,
-            )
-
-            tasks = {}
-            for row in task_rows:
-                task = TaskState(
-                    task_id=row["task_id"],
-                    agent_id=row["agent_id"],
-                    agent_type=row["agent_type"],
-                    status=TaskStatus(row["status"]),
-                    started_at=row["started_at"].isoformat() if row["started_at"] else None,
-                    completed_at=row["completed_at"].isoformat() if row["completed_at"] else None,
-                    execution_time=row["execution_time"],
-                    result=_deserialize_json_field(row["result"]),
-                    error=_deserialize_json_field(row["error"]),
-                    retry_count=row["retry_count"],
-                    dependencies=list(row["dependencies"]) if row["dependencies"] else [],
-                )
-                tasks[task.task_id] = task
-
-            return WorkflowState(
-                workflow_id=workflow_row["workflow_id"],
-                status=WorkflowStatus(workflow_row["status"]),
-                tasks=tasks,
-                created_at=workflow_row["created_at"].isoformat(),
-                updated_at=workflow_row["updated_at"].isoformat(),
-                started_at=workflow_row["started_at"].isoformat() if workflow_row["started_at"] else None,
-                completed_at=workflow_row["completed_at"].isoformat() if workflow_row["completed_at"] else None,
-                variables=_deserialize_json_field(workflow_row["variables"]) or {},
-                metadata=_deserialize_json_field(workflow_row["metadata"]) or {},
-                error=workflow_row["error"],
-                version=workflow_row["version"],
-            )
+            return await self._fetch_state(conn, workflow_id)
 
     async def update_workflow(self, state: WorkflowState) -> WorkflowState:
         """Update workflow state with versioning.
 
+        The write only succeeds if the stored version still equals
+        ``state.version``, so a stale copy cannot overwrite task updates
+        made since it was read.
+
         Args:
             state: Updated workflow state
 
@@ -342,16 +368,27 @@ class StateManager:
             Updated workflow state with incremented version
 
         Raises:
+            StateNotFoundError: If workflow not found
+            StateConflictError: If the workflow was modified since it was read
             StateManagerError: If update fails
         """
         if self._pool is None:
             raise StateManagerError("State manager not initialized")
 
-        state.updated_at = datetime.now(timezone.utc).isoformat()
-        state.version += 1
+        expected_version = state.version
+        updated = replace(
+            state,
+            updated_at=datetime.now(timezone.utc).isoformat(),
+            version=expected_version + 1,
+        )
+
+        async with self._pool.acquire() as conn, conn.transaction():
+            await self._persist_state(conn, updated, expected_version=expected_version)
+            await self._save_snapshot(conn, updated)
+            await self._notify(conn, updated)
 
-        await self._persist_state(state)
-        await self._save_snapshot(state)
+        state.updated_at = updated.updated_at
+        state.version = updated.version
         return state
 
     async def update_task(
@@ -362,8 +399,13 @@ class StateManager:
         result: dict[str, Any] | None = None,
         error: dict[str, Any] | None = None,
         execution_time: float | None = None,
-    ) -> WorkflowState:
-        """Update individual task state.
+        retry_count: int | None = None,
+        expected_version: int | None = None,
+    ) -> TaskState:
+        """Update individual task state in place.
+
+        Only the task row and the workflow version are written; the full
+        workflow is read back only when a rollback snapshot is due.
 
         Args:
             workflow_id: Workflow identifier
@@ -372,40 +414,103 @@ class StateManager:
             result: Optional task result
             error: Optional error information
             execution_time: Optional execution time in milliseconds
+            retry_count: Optional retry attempt number
+            expected_version: If given, only write if the stored version matches
 
         Returns:
-            Updated workflow state
+            Updated task state
 
         Raises:
             StateNotFoundError: If workflow or task not found
+            StateConflictError: If the stored version differs from expected_version
         """
-        state = await self.get_workflow(workflow_id)
+        if self._pool is None:
+            raise StateManagerError("State manager not initialized")
 
-        if task_id not in state.tasks:
-            raise StateNotFoundError(f"Task {task_id} not found in workflow {workflow_id}")
+        now = datetime.now(timezone.utc)
 
-        task = state.tasks[task_id]
-        now = datetime.now(timezone.utc).isoformat()
+        async with self._pool.acquire() as conn, conn.transaction():
+            # Bumping the version first takes the workflow row lock, which
+            # serializes concurrent task updates within the workflow
+            version, workflow_status = await self._bump_version(conn, workflow_id, now, expected_version)
+
+            row = await conn.fetchrow(
+                """
+                UPDATE task_states SET
+                    status = COALESCE($3::TEXT, status),
+                    started_at = CASE
+                        WHEN $3::TEXT = 'running' THEN COALESCE(started_at, $4::TIMESTAMPTZ)
+                        ELSE started_at
+                    END,
+                    completed_at = CASE
+                        WHEN $3::TEXT = ANY($5::TEXT[]) THEN $4::TIMESTAMPTZ
+                        ELSE completed_at
+                    END,
+                    result = COALESCE($6, result),
+                    error = COALESCE($7, error),
+                    execution_time = COALESCE($8, execution_time),
+                    retry_count = COALESCE($9, retry_count)
+                WHERE workflow_id = $1 AND task_id = $2
+                RETURNING *
+                """,
+                workflow_id,
+                task_id,
+                status.value if status else None,
+                now,
+                _TERMINAL_TASK_STATUSES,
+                json.dumps(result) if result else None,
+                json.dumps(error) if error else None,
+                execution_time,
+                retry_count,
+            )
+            if row is None:
+                raise StateNotFoundError(f"Task {task_id} not found in workflow {workflow_id}")
+
+            task = self._task_from_row(row)
+            if self._should_snapshot(version, workflow_status):
+                await self._save_snapshot(conn, await self._fetch_state(conn, workflow_id))
+            await self._notify_tasks(conn, workflow_id, workflow_status, version, [task])
+            return task
+
+    async def update_tasks(self, state: WorkflowState, task_ids: Iterable[str]) -> WorkflowState:
+        """Write task rows from an in-memory state without reading the workflow back.
+
+        For callers that own the authoritative copy of a running workflow
+        (the orchestrator): only the listed tasks are written, the version
+        is bumped once for the whole batch, and snapshots are taken from
+        ``state`` itself.
+
+        Args:
+            state: Workflow state holding the changed tasks; its ``version``
+                and ``updated_at`` are updated in place
+            task_ids: Tasks to write
+
+        Returns:
+            The same state
+
+        Raises:
+            StateNotFoundError: If workflow not found
+            StateConflictError: If the workflow was modified since
+                ``state.version`` (for example, paused or cancelled)
+        """
+        if self._pool is None:
+            raise StateManagerError("State manager not initialized")
+
+        tasks = [state.tasks[task_id] for task_id in task_ids]
+        now = datetime.now(timezone.utc)
+
+        async with self._pool.acquire() as conn, conn.transaction():
+            version, _ = await self._bump_version(conn, state.workflow_id, now, state.version)
+
+            if tasks:
+                await conn.executemany(_UPDATE_TASK_ROW, [self._task_row_args(state.workflow_id, t) for t in tasks])
 
-        if status:
-            task.status = status
-            if status == TaskStatus.RUNNING and not task.started_at:
-                task.started_at = now
-            elif status in (
-                TaskStatus.COMPLETED,
-                TaskStatus.FAILED,
-                TaskStatus.SKIPPED,
-            ):
-                task.completed_at = now
-
-        if result is not None:
-            task.result = result
-        if error is not None:
-            task.error = error
-        if execution_time is not None:
-            task.execution_time = execution_time
-
-        return await self.update_workflow(state)
+            state.version = version
+            state.updated_at = now.isoformat()
+            await self._save_snapshot(conn, state)
+            await self._notify_tasks(conn, state.workflow_id, state.status, version, tasks)
+
+        return state
 
     async def rollback_workflow(self, workflow_id: str, version: int) -> WorkflowState:
         """Rollback workflow to a previous version.
@@ -436,7 +541,9 @@ class StateManager:
             # Deserialize state_snapshot - it may be a string or dict depending on asyncpg version
             state_snapshot = _deserialize_json_field(row["state_snapshot"])
             state = WorkflowState.from_dict(state_snapshot)
-            await self._persist_state(state)
+            async with conn.transaction():
+                await self._persist_state(conn, state)
+                await self._notify(conn, state)
             return state
 
     async def delete_workflow(self, workflow_id: str) -> None:
@@ -448,11 +555,13 @@ class StateManager:
         if self._pool is None:
             raise StateManagerError("State manager not initialized")
 
-        async with self._pool.acquire() as conn:
+        async with self._pool.acquire() as conn, conn.transaction():
             await conn.execute(
                 "DELETE FROM workflow_states WHERE workflow_id = $1",
                 workflow_id,
             )
+            if self._notifier is not None:
+                await self._notifier.publish(workflow_id, "deleted", conn=conn)
 
     async def list_workflows(
         self,
@@ -493,96 +602,315 @@ class StateManager:
 
             return workflows
 
-    async def _persist_state(self, state: WorkflowState) -> None:
-        """Persist workflow state to database.
+    async def _fetch_state(self, conn: asyncpg.Connection, workflow_id: str) -> WorkflowState:
+        """Load a workflow and its tasks.
+
+        Args:
+            conn: Database connection
+            workflow_id: Workflow identifier
+
+        Returns:
+            Workflow state
+
+        Raises:
+            StateNotFoundError: If workflow not found
+        """
+        # Get workflow
+        workflow_row = await conn.fetchrow(
+            "SELECT * FROM workflow_states WHERE workflow_id = $1",
+            workflow_id,
+        )
+        if not workflow_row:
+            raise StateNotFoundError(f"Workflow {workflow_id} not found")
+
+        # Get tasks
+        task_rows = await conn.fetch(
+            "SELECT * FROM task_states WHERE workflow_id = $1",
+            workflow_id,
+        )
+
+        tasks = {row["task_id"]: self._task_from_row(row) for row in task_rows}
+
+        return WorkflowState(
+            workflow_id=workflow_row["workflow_id"],
+            status=WorkflowStatus(workflow_row["status"]),
+            tasks=tasks,
+            created_at=workflow_row["created_at"].isoformat(),
+            updated_at=workflow_row["updated_at"].isoformat(),
+            started_at=workflow_row["started_at"].isoformat() if workflow_row["started_at"] else None,
+            completed_at=workflow_row["completed_at"].isoformat() if workflow_row["completed_at"] else None,
+            variables=_deserialize_json_field(workflow_row["variables"]) or {},
+            metadata=_deserialize_json_field(workflow_row["metadata"]) or {},
+            error=workflow_row["error"],
+            version=workflow_row["version"],
+        )
+
+    @staticmethod
+    def _task_from_row(row: asyncpg.Record) -> TaskState:
+        """Build a task state from a task_states row."""
+        return TaskState(
+            task_id=row["task_id"],
+            agent_id=row["agent_id"],
+            agent_type=row["agent_type"],
+            status=TaskStatus(row["status"]),
+            started_at=row["started_at"].isoformat() if row["started_at"] else None,
+            completed_at=row["completed_at"].isoformat() if row["completed_at"] else None,
+            execution_time=row["execution_time"],
+            result=_deserialize_json_field(row["result"]),
+            error=_deserialize_json_field(row["error"]),
+            retry_count=row["retry_count"],
+            dependencies=list(row["dependencies"]) if row["dependencies"] else [],
+        )
+
+    async def _bump_version(
+        self,
+        conn: asyncpg.Connection,
+        workflow_id: str,
+        now: datetime,
+        expected_version: int | None = None,
+    ) -> tuple[int, WorkflowStatus]:
+        """Increment a workflow's version, taking its row lock.
 
         Args:
+            conn: Database connection with an open transaction
+            workflow_id: Workflow identifier
+            now: New ``updated_at``
+            expected_version: If given, only bump if the stored version matches
+
+        Returns:
+            New version and the workflow's current status
+
+        Raises:
+            StateNotFoundError: If workflow not found
+            StateConflictError: If the stored version differs from expected_version
+        """
+        row = await conn.fetchrow(
+            """
+            UPDATE workflow_states SET version = version + 1, updated_at = $2
+            WHERE workflow_id = $1 AND ($3::INTEGER IS NULL OR version = $3::INTEGER)
+            RETURNING version, status
+            """,
+            workflow_id,
+            now,
+            expected_version,
+        )
+        if row is None:
+            await self._raise_missing_or_conflict(conn, workflow_id, expected_version)
+        return row["version"], WorkflowStatus(row["status"])
+
+    @staticmethod
+    async def _raise_missing_or_conflict(
+        conn: asyncpg.Connection, workflow_id: str, expected_version: int | None
+    ) -> NoReturn:
+        """Explain a versioned write that matched no row.
+
+        Raises:
+            StateNotFoundError: If workflow not found
+            StateConflictError: If it exists at another version
+        """
+        current = await conn.fetchval("SELECT version FROM workflow_states WHERE workflow_id = $1", workflow_id)
+        if current is None:
+            raise StateNotFoundError(f"Workflow {workflow_id} not found")
+        raise StateConflictError(f"Workflow {workflow_id} is at version {current}, expected {expected_version}")
+
+    @staticmethod
+    def _task_row_args(workflow_id: str, task: TaskState) -> tuple[Any, ...]:
+        """Build task_states column values as (task_id, workflow_id, ...)."""
+        return (
+            task.task_id,
+            workflow_id,
+            task.agent_id,
+            task.agent_type,
+            task.status.value,
+            _parse_iso_datetime(task.started_at) if task.started_at else None,
+            _parse_iso_datetime(task.completed_at) if task.completed_at else None,
+            task.execution_time,
+            json.dumps(task.result) if task.result else None,
+            json.dumps(task.error) if task.error else None,
+            task.retry_count,
+            task.dependencies,
+        )
+
+    async def _insert_tasks(self, conn: asyncpg.Connection, workflow_id: str, tasks: list[TaskState]) -> None:
+        """Insert task rows in one batched statement.
+
+        Args:
+            conn: Database connection
+            workflow_id: Workflow identifier
+            tasks: Task states to insert
+        """
+        if not tasks:
+            return
+
+        await conn.executemany(
+            """
+            INSERT INTO task_states (
+                task_id, workflow_id, agent_id, agent_type, status,
+                started_at, completed_at, execution_time, result,
+                error, retry_count, dependencies
+            ) VALUES ($1, $2, $3, $4, $5, $6::TIMESTAMPTZ, $7::TIMESTAMPTZ, $8, $9, $10, $11, $12)
+            """,
+            [self._task_row_args(workflow_id, task) for task in tasks],
+        )
+
+    async def _persist_state(
+        self,
+        conn: asyncpg.Connection,
+        state: WorkflowState,
+        expected_version: int | None = None,
+    ) -> None:
+        """Write a full workflow state over the stored one.
+
+        Must be called inside a transaction. Task rows are updated in place;
+        tasks added to or removed from ``state.tasks`` are inserted or deleted.
+
+        Args:
+            conn: Database connection
             state: Workflow state to persist
+            expected_version: If given, only write if the stored version matches
+
+        Raises:
+            StateNotFoundError: If workflow not found
+            StateConflictError: If the stored version differs from expected_version
         """
-        if self._pool is None:
-            raise StateManagerError("State manager not initialized")
+        status_tag = await conn.execute(
+            """
+            UPDATE workflow_states SET
+                status = $2,
+                updated_at = $3::TIMESTAMPTZ,
+                started_at = $4::TIMESTAMPTZ,
+                completed_at = $5::TIMESTAMPTZ,
+                variables = $6,
+                metadata = $7,
+                error = $8,
+                version = $9
+            WHERE workflow_id = $1 AND ($10::INTEGER IS NULL OR version = $10::INTEGER)
+            """,
+            state.workflow_id,
+            state.status.value,
+            _parse_iso_datetime(state.updated_at),
+            _parse_iso_datetime(state.started_at) if state.started_at else None,
+            _parse_iso_datetime(state.completed_at) if state.completed_at else None,
+            json.dumps(state.variables if isinstance(state.variables, dict) else {}),
+            json.dumps(state.metadata if isinstance(state.metadata, dict) else {}),
+            state.error,
+            state.version,
+            expected_version,
+        )
+        if status_tag == "UPDATE 0":
+            await self._raise_missing_or_conflict(conn, state.workflow_id, expected_version)
 
-        async with self._pool.acquire() as conn, conn.transaction():
-            # Upsert workflow
-            await conn.execute(
-                """
-                    INSERT INTO workflow_states (
-                        workflow_id, status, created_at, updated_at, started_at,
-                        completed_at, variables, metadata, error, version
-                    ) VALUES (
-                        $1, $2, $3::TIMESTAMPTZ, $4::TIMESTAMPTZ, $5::TIMESTAMPTZ,
-                        $6::TIMESTAMPTZ, $7, $8, $9, $10
-                    )
-                    ON CONFLICT (workflow_id) DO UPDATE SET
-                        status = EXCLUDED.status,
-                        updated_at = EXCLUDED.updated_at,
-                        started_at = EXCLUDED.started_at,
-                        completed_at = EXCLUDED.completed_at,
-                        variables = EXCLUDED.variables,
-                        metadata = EXCLUDED.metadata,
-                        error = EXCLUDED.error,
-                        version = EXCLUDED.version
-                    """,
+        stored = {
+            row["task_id"]
+            for row in await conn.fetch(
+                "SELECT task_id FROM task_states WHERE workflow_id = $1",
                 state.workflow_id,
-                state.status.value,
-                _parse_iso_datetime(state.created_at),
-                _parse_iso_datetime(state.updated_at),
-                _parse_iso_datetime(state.started_at) if state.started_at else None,
-                _parse_iso_datetime(state.completed_at) if state.completed_at else None,
-                json.dumps(state.variables if isinstance(state.variables, dict) else {}),
-                json.dumps(state.metadata if isinstance(state.metadata, dict) else {}),
-                state.error,
-                state.version,
+            )
+        }
+
+        existing = [task for task in state.tasks.values() if task.task_id in stored]
+        if existing:
+            await conn.executemany(
+                _UPDATE_TASK_ROW,
+                [self._task_row_args(state.workflow_id, task) for task in existing],
             )
 
-            # Delete existing tasks and re-insert (simpler than complex upsert logic)
+        await self._insert_tasks(
+            conn,
+            state.workflow_id,
+            [task for task in state.tasks.values() if task.task_id not in stored],
+        )
+
+        removed = stored - state.tasks.keys()
+        if removed:
             await conn.execute(
-                "DELETE FROM task_states WHERE workflow_id = $1",
+                "DELETE FROM task_states WHERE workflow_id = $1 AND task_id = ANY($2::TEXT[])",
                 state.workflow_id,
+                list(removed),
             )
 
-            # Insert tasks
-            for task in state.tasks.values():
-                await conn.execute(
-                    """
-                        INSERT INTO task_states (
-                            task_id, workflow_id, agent_id, agent_type, status,
-                            started_at, completed_at, execution_time, result,
-                            error, retry_count, dependencies
-                        ) VALUES ($1, $2, $3, $4, $5, $6::TIMESTAMPTZ, $7::TIMESTAMPTZ, $8, $9, $10, $11, $12)
-                        """,
-                    task.task_id,
-                    state.workflow_id,
-                    task.agent_id,
-                    task.agent_type,
-                    task.status.value,
-                    _parse_iso_datetime(task.started_at) if task.started_at else None,
-                    _parse_iso_datetime(task.completed_at) if task.completed_at else None,
-                    task.execution_time,
-                    json.dumps(task.result) if task.result else None,
-                    json.dumps(task.error) if task.error else None,
-                    task.retry_count,
-                    task.dependencies,
-                )
+    async def _notify(self, conn: asyncpg.Connection, state: WorkflowState) -> None:
+        """Publish a workflow state notification on the transaction's connection.
+
+        Args:
+            conn: Database connection with the open transaction
+            state: Workflow state after the change
+        """
+        if self._notifier is None:
+            return
+
+        await self._notifier.publish(
+            state.workflow_id, "state", conn=conn, status=state.status.value, version=state.version
+        )
 
-    async def _save_snapshot(self, state: WorkflowState) -> None:
-        """Save state snapshot for rollback.
+    async def _notify_tasks(
+        self,
+        conn: asyncpg.Connection,
+        workflow_id: str,
+        status: WorkflowStatus,
+        version: int,
+        tasks: Sequence[TaskState],
+    ) -> None:
+        """Publish one task notification per changed task on the transaction's connection.
 
         Args:
+            conn: Database connection with the open transaction
+            workflow_id: Workflow identifier
+            status: Workflow status after the change
+            version: Workflow version after the change
+            tasks: Tasks that changed
+        """
+        if self._notifier is None or not tasks:
+            return
+
+        await self._notifier.publish_many(
+            [
+                {
+                    "workflow_id": workflow_id,
+                    "kind": "task",
+                    "status": status.value,
+                    "version": version,
+                    "task_id": task.task_id,
+                    "task_status": task.status.value,
+                }
+                for task in tasks
+            ],
+            conn=conn,
+        )
+
+    def _should_snapshot(self, version: int, status: WorkflowStatus) -> bool:
+        """Check whether a version is due a rollback snapshot.
+
+        Args:
+            version: Workflow version
+            status: Workflow status at that version
+
+        Returns:
+            True for the initial version, terminal states and every
+            ``snapshot_interval``-th version
+        """
+        if version == 1 or status in _TERMINAL_WORKFLOW_STATUSES:
+            return True
+        return self.snapshot_interval > 0 and version % self.snapshot_interval == 0
+
+    async def _save_snapshot(self, conn: asyncpg.Connection, state: WorkflowState) -> None:
+        """Save state snapshot for rollback if one is due.
+
+        Args:
+            conn: Database connection
             state: Workflow state to snapshot
         """
-        if self._pool is None:
-            raise StateManagerError("State manager not initialized")
+        if not self._should_snapshot(state.version, state.status):
+            return
 
-        async with self._pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO workflow_state_history
-                    (workflow_id, version, state_snapshot)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (workflow_id, version) DO NOTHING
-                """,
-                state.workflow_id,
-                state.version,
-                json.dumps(state.to_dict()),
-            )
+        await conn.execute(
+            """
+            INSERT INTO workflow_state_history
+                (workflow_id, version, state_snapshot)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (workflow_id, version) DO NOTHING
+            """,
+            state.workflow_id,
+            state.version,
+            json.dumps(state.to_dict()),
+        )
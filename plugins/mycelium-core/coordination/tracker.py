@@ -15,17 +15,26 @@ Provides:
 - Event replay for debugging
 """
 
+import asyncio
+import contextlib
 import json
 import logging
+import os
+import tempfile
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal, overload
 
 import asyncpg
 from pydantic import BaseModel, Field, field_validator
 
+from .event_store import InMemoryEventStore
+from .notifications import Subscription, WorkflowNotifier
+
 logger = logging.getLogger(__name__)
 
 
@@ -196,26 +205,195 @@ class CoordinationQuery(BaseModel):
         return json.dumps(data, indent=indent)
 
 
+# Column order of coordination_events rows written by the tracker
+_EVENT_COLUMNS = (
+    "event_id",
+    "event_type",
+    "workflow_id",
+    "task_id",
+    "timestamp",
+    "agent_id",
+    "agent_type",
+    "source_agent",
+    "target_agent",
+    "status",
+    "duration_ms",
+    "error",
+    "metadata",
+    "context",
+    "performance",
+)
+
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "spill")
+
+# Quantiles reported from the rollup duration histograms
+_ROLLUP_QUANTILES = {"p50_duration_ms": 0.5, "p95_duration_ms": 0.95, "p99_duration_ms": 0.99}
+
+
+def _histogram_quantile(histogram: list[int], q: float) -> float:
+    """Estimate a quantile from a rollup duration histogram.
+
+    Bucket 0 counts durations below 1 ms and bucket ``i`` counts durations in
+    ``[2**(i-1), 2**i)`` ms, so the estimate is the upper bound of the bucket
+    holding the quantile and is within a factor of two of the true value.
+
+    Args:
+        histogram: Per-bucket counts
+        q: Quantile in [0, 1]
+
+    Returns:
+        Estimated duration in milliseconds (0 for an empty histogram)
+    """
+    total = sum(histogram)
+    if total == 0:
+        return 0.0
+
+    rank = q * total
+    seen = 0
+    for i, count in enumerate(histogram):
+        seen += count
+        if seen >= rank and count:
+            return float(2**i)
+    return float(2 ** (len(histogram) - 1))
+
+
+def _event_to_record(event: CoordinationEvent) -> tuple[Any, ...]:
+    """Convert an event to a coordination_events row in ``_EVENT_COLUMNS`` order.
+
+    Args:
+        event: Coordination event
+
+    Returns:
+        Row tuple with JSONB fields serialized
+    """
+    return (
+        event.event_id,
+        event.event_type.value,
+        event.workflow_id,
+        event.task_id,
+        datetime.fromisoformat(event.timestamp.rstrip("Z")),
+        event.agent_id,
+        event.agent_type,
+        json.dumps(event.source_agent.to_dict()) if event.source_agent else None,
+        json.dumps(event.target_agent.to_dict()) if event.target_agent else None,
+        event.status,
+        event.duration_ms,
+        json.dumps(event.error.to_dict()) if event.error else None,
+        json.dumps(event.metadata) if event.metadata else None,
+        json.dumps(event.context) if event.context else None,
+        json.dumps(event.performance.to_dict()) if event.performance else None,
+    )
+
+
+def _encode_json(value: Any) -> str:
+    """Encode a json/jsonb parameter, passing already-serialized text through."""
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _load_json(value: Any) -> Any:
+    """Decode a json/jsonb column that arrives as text when no codec is registered."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+async def register_json_codecs(conn: asyncpg.Connection) -> None:
+    """Register json/jsonb codecs that decode columns to Python objects.
+
+    Intended as the ``init`` callback of the tracker's pool
+    (``asyncpg.create_pool(..., init=register_json_codecs)``) so JSONB
+    columns are decoded once by the driver. Parameters that are already
+    JSON text are sent unchanged, so the tracker's write path works with
+    or without the codecs; top-level JSON strings therefore cannot be
+    written through a connection that has them registered.
+
+    Args:
+        conn: Connection to configure
+    """
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(typename, encoder=_encode_json, decoder=json.loads, schema="pg_catalog")
+
+
+def _row_to_dict(row: asyncpg.Record) -> dict[str, Any]:
+    """Convert a coordination_events row to the ``CoordinationEvent.to_dict()`` shape.
+
+    Args:
+        row: Database row
+
+    Returns:
+        Event dictionary built without Pydantic models
+    """
+    return {
+        "event_id": row["event_id"],
+        "event_type": row["event_type"],
+        "workflow_id": row["workflow_id"],
+        "task_id": row["task_id"],
+        "timestamp": row["timestamp"].isoformat() + "Z",
+        "agent_id": row["agent_id"],
+        "agent_type": row["agent_type"],
+        "source_agent": _load_json(row["source_agent"]) or None,
+        "target_agent": _load_json(row["target_agent"]) or None,
+        "status": row["status"],
+        "duration_ms": row["duration_ms"],
+        "error": _load_json(row["error"]) or None,
+        "metadata": _load_json(row["metadata"]),
+        "context": _load_json(row["context"]),
+        "performance": _load_json(row["performance"]) or None,
+    }
+
+
 class CoordinationTracker:
-    """Tracks coordination events between agents."""
+    """Tracks coordination events between agents.
+
+    With a pool, events are written with one INSERT each by default. Set
+    ``config["buffered"]`` to queue events in memory and write them in
+    batches with COPY, either when ``batch_size`` events are pending or
+    every ``flush_interval`` seconds. Buffered events are flushed before
+    any query and on ``close()``.
+
+    Buffered-mode config:
+        batch_size: Events per COPY (default 500)
+        flush_interval: Seconds between background flushes (default 1.0)
+        max_buffered_events: Buffer bound (default 10000)
+        backpressure: What ``track_event`` does when the buffer is full:
+            "block" waits for a flush, "drop_oldest" discards the oldest
+            pending event, "spill" appends the event to ``spill_path``
+            (JSONL) to be loaded by the next flush (default "block")
+        spill_path: Spill file path (default: a per-process file in the
+            system temp directory)
+
+    On a database migrated to the partitioned schema, ``maintain_partitions()``
+    is the retention job and ``get_statistics(use_rollups=True)`` answers
+    dashboard queries from hourly rollups instead of raw events.
+
+    Without a pool, events are kept in a bounded ``InMemoryEventStore``:
+    ``max_memory_events`` (default 10000) caps the total and
+    ``max_events_per_workflow`` (default unlimited) caps each workflow,
+    evicting the oldest events first.
+
+    Query methods accept ``raw=True`` to skip Pydantic models altogether and
+    return ``to_dict()``-shaped dictionaries. Create the pool with
+    ``init=register_json_codecs`` to have the driver decode JSONB columns.
+
+    With a ``WorkflowNotifier``, every stored event also publishes an "event"
+    notification (after the write, or per COPY batch in buffered mode), and
+    ``subscribe()`` follows a workflow live instead of polling.
+    """
 
     def __init__(
         self,
         pool: asyncpg.pool.Pool | None = None,
         config: dict[str, Any] | None = None,
+        notifier: WorkflowNotifier | None = None,
     ):
         """Initialize coordination tracker.
 
         Args:
             pool: AsyncPG connection pool
             config: Configuration options
+            notifier: Optional notifier for live event subscriptions
         """
         self._pool = pool
         self._config = config or {}
-
-        # In-memory storage for testing/development
-        self._events: list[CoordinationEvent] = []
-        self._event_index: dict[str, list[int]] = defaultdict(list)
+        self.notifier = notifier
 
         # Metrics
         self._event_counts: dict[str, int] = defaultdict(int)
@@ -223,8 +401,40 @@ class CoordinationTracker:
 
         # Configuration
         self._max_memory_events = self._config.get("max_memory_events", 10000)
+        self._max_events_per_workflow = self._config.get("max_events_per_workflow")
         self._enable_logging = self._config.get("enable_logging", True)
 
+        # In-memory storage for testing/development
+        self._store = InMemoryEventStore(self._max_memory_events, self._max_events_per_workflow)
+
+        # Write-behind buffering
+        self._buffered = bool(self._config.get("buffered", False))
+        self._batch_size = self._config.get("batch_size", 500)
+        self._flush_interval = self._config.get("flush_interval", 1.0)
+        self._max_buffered_events = self._config.get("max_buffered_events", 10000)
+        self._backpressure = self._config.get("backpressure", "block")
+        self._spill_path = Path(
+            self._config.get("spill_path")
+            or Path(tempfile.gettempdir()) / f"mycelium-coordination-spill-{os.getpid()}.jsonl"
+        )
+
+        if self._backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"backpressure must be one of {BACKPRESSURE_POLICIES}, got {self._backpressure!r}")
+        if self._batch_size < 1 or self._max_buffered_events < self._batch_size:
+            raise ValueError("batch_size must be at least 1 and no larger than max_buffered_events")
+
+        self._buffer: deque[CoordinationEvent] = deque()
+        self._space_available = asyncio.Event()
+        self._space_available.set()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+        self._closing = False
+        self._buffer_stats = {"flushed": 0, "dropped": 0, "spilled": 0, "malformed": 0, "flush_errors": 0}
+
+        # Set by initialize() when the hourly rollup table exists
+        self._rollups_available = False
+
     async def initialize(self) -> None:
         """Initialize the tracker and create necessary database tables."""
         if self._pool is None:
@@ -255,19 +465,255 @@ class CoordinationTracker:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_workflow_id ON coordination_events(workflow_id);
+                CREATE INDEX IF NOT EXISTS idx_coordination_events_workflow_ts
+                    ON coordination_events(workflow_id, timestamp);
                 CREATE INDEX IF NOT EXISTS idx_task_id ON coordination_events(task_id);
                 CREATE INDEX IF NOT EXISTS idx_agent_id ON coordination_events(agent_id);
-                CREATE INDEX IF NOT EXISTS idx_event_type ON coordination_events(event_type);
                 CREATE INDEX IF NOT EXISTS idx_timestamp ON coordination_events(timestamp);
                 """
             )
+            self._rollups_available = await conn.fetchval(
+                "SELECT to_regclass('coordination_event_rollups') IS NOT NULL"
+            )
+
+        if self._buffered:
+            self._closing = False
+            self._start_flusher()
 
     async def close(self) -> None:
-        """Close the tracker and clean up resources."""
+        """Close the tracker and clean up resources.
+
+        In buffered mode, pending events are flushed first.
+        """
+        if self._flusher is not None:
+            # Wake the flusher for a final round instead of cancelling it mid-COPY
+            self._closing = True
+            self._flush_requested.set()
+            await self._flusher
+            self._flusher = None
+
+        if self._pool is not None and self._buffered:
+            await self.flush()
+
         # Clear in-memory storage
-        self._events.clear()
-        self._event_index.clear()
+        self._store.clear()
+
+    def _start_flusher(self) -> None:
+        """Start the background flush task if it is not running."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush the buffer when a batch is full or the flush interval elapses."""
+        while not self._closing:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self._flush_interval)
+            self._flush_requested.clear()
+
+            try:
+                await self.flush()
+            except TrackerError:
+                # Events stay buffered; the next round retries
+                logger.exception("Failed to flush coordination events")
+
+    async def flush(self) -> int:
+        """Write all buffered (and spilled) events to the database.
+
+        Returns:
+            Number of events written
+
+        Raises:
+            TrackerError: If a batch cannot be written. Its events are put
+                back at the front of the buffer.
+        """
+        if self._pool is None:
+            return 0
+
+        written = 0
+        async with self._flush_lock:
+            written += await self._drain_spill()
+
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self._batch_size, len(self._buffer)))]
+                self._space_available.set()
+                try:
+                    await self._copy_events(batch)
+                except Exception as e:
+                    self._buffer.extendleft(reversed(batch))
+                    self._buffer_stats["flush_errors"] += 1
+                    raise TrackerError(f"Failed to flush events: {e}") from e
+
+                for event in batch:
+                    self._event_counts[event.event_type.value] += 1
+                self._buffer_stats["flushed"] += len(batch)
+                written += len(batch)
+
+        if written and self._enable_logging:
+            logger.info(f"Flushed {written} coordination events")
+
+        return written
+
+    async def _copy_events(self, events: list[CoordinationEvent]) -> None:
+        """Write events to coordination_events with a single COPY.
+
+        Notifications for the batch are sent in the same transaction.
+
+        Args:
+            events: Events to write
+        """
+        assert self._pool is not None
+        records = [_event_to_record(event) for event in events]
+        async with self._pool.acquire() as conn, conn.transaction():
+            await conn.copy_records_to_table("coordination_events", records=records, columns=list(_EVENT_COLUMNS))
+            await self._notify(events, conn)
+
+    async def _notify(self, events: list[CoordinationEvent], conn: asyncpg.Connection | None = None) -> None:
+        """Publish "event" notifications for stored events.
+
+        Args:
+            events: Stored events
+            conn: Connection the events were written on
+        """
+        if self.notifier is None:
+            return
+
+        await self.notifier.publish_many(
+            [
+                {
+                    "workflow_id": event.workflow_id,
+                    "kind": "event",
+                    "event_id": event.event_id,
+                    "event_type": event.event_type.value,
+                    "task_id": event.task_id,
+                    "agent_id": event.agent_id,
+                    "status": event.status,
+                    "timestamp": event.timestamp,
+                }
+                for event in events
+            ],
+            conn=conn,
+        )
+
+    def subscribe(self, workflow_id: str) -> Subscription:
+        """Follow a workflow's changes as they are published.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Notifier subscription; use it as an async context manager
+
+        Raises:
+            TrackerError: If the tracker has no notifier
+        """
+        if self.notifier is None:
+            raise TrackerError("Live subscriptions require a WorkflowNotifier")
+        return self.notifier.subscribe(workflow_id)
+
+    def _spill(self, event: CoordinationEvent) -> None:
+        """Append an event to the spill file.
+
+        Args:
+            event: Event that did not fit in the buffer
+        """
+        with self._spill_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(event.to_dict()) + "\n")
+        self._buffer_stats["spilled"] += 1
+
+    async def _drain_spill(self) -> int:
+        """Write spilled events to the database and remove the spill file.
+
+        The spill file is renamed to a private drain file before it is read,
+        so events spilled while its batches are written start a new spill
+        file instead of being unlinked with the old one. A drain file left by
+        a failed flush is written first.
+
+        Returns:
+            Number of events written
+        """
+        drain_path = self._spill_path.with_name(self._spill_path.name + ".draining")
+        written = 0
+        for _ in range(2):
+            if not drain_path.exists():
+                if not self._spill_path.exists():
+                    break
+                self._spill_path.replace(drain_path)
+            written += await self._drain_file(drain_path)
+        return written
+
+    async def _drain_file(self, path: Path) -> int:
+        """Write the events in a drain file to the database and remove it.
+
+        Lines that do not decode to an event (e.g. a line truncated by a
+        crash during ``_spill``) are skipped and counted as malformed.
+
+        Args:
+            path: Drain file owned by the current flush
+
+        Returns:
+            Number of events written
+        """
+        events: list[CoordinationEvent] = []
+        # A truncated multi-byte character must not abort the read
+        with path.open(encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    events.append(CoordinationEvent.model_validate(json.loads(line)))
+                except ValueError:
+                    self._buffer_stats["malformed"] += 1
+                    logger.warning("Skipping malformed line in coordination event spill file %s", path)
+
+        for start in range(0, len(events), self._batch_size):
+            try:
+                await self._copy_events(events[start : start + self._batch_size])
+            except Exception as e:
+                # Keep the unwritten tail on disk for the next flush
+                with path.open("w", encoding="utf-8") as f:
+                    f.writelines(json.dumps(event.to_dict()) + "\n" for event in events[start:])
+                self._buffer_stats["flush_errors"] += 1
+                raise TrackerError(f"Failed to flush spilled events: {e}") from e
+
+        path.unlink()
+        for event in events:
+            self._event_counts[event.event_type.value] += 1
+        self._buffer_stats["flushed"] += len(events)
+        return len(events)
+
+    async def _enqueue(self, event: CoordinationEvent) -> None:
+        """Add an event to the write-behind buffer, applying backpressure.
+
+        Args:
+            event: Validated event
+        """
+        self._start_flusher()
+
+        while len(self._buffer) >= self._max_buffered_events:
+            if self._backpressure == "drop_oldest":
+                self._buffer.popleft()
+                self._buffer_stats["dropped"] += 1
+            elif self._backpressure == "spill":
+                self._spill(event)
+                self._flush_requested.set()
+                return
+            else:
+                self._space_available.clear()
+                self._flush_requested.set()
+                await self._space_available.wait()
+
+        self._buffer.append(event)
+        if len(self._buffer) >= self._batch_size:
+            self._flush_requested.set()
+
+    def get_buffer_stats(self) -> dict[str, int]:
+        """Get write-behind buffer statistics.
+
+        Returns:
+            Dict with pending, flushed, dropped, spilled, malformed and
+            flush_errors counts
+        """
+        return {"pending": len(self._buffer), **self._buffer_stats}
 
     def _validate_event(self, event: CoordinationEvent) -> None:
         """Validate a coordination event.
@@ -305,22 +751,17 @@ class CoordinationTracker:
         if self._pool is None:
             # Use in-memory storage
             self._validate_event(event)
-            self._events.append(event)
-            self._event_index[event.workflow_id].append(len(self._events) - 1)
-            if event.task_id:
-                self._event_index[f"task:{event.task_id}"].append(len(self._events) - 1)
-            if event.agent_id:
-                self._event_index[f"agent:{event.agent_id}"].append(len(self._events) - 1)
-
-            # Cleanup old events if limit exceeded
-            if len(self._events) > self._max_memory_events:
-                self._cleanup_old_events()
-
+            self._store.append(event)
+            await self._notify([event])
             return event.event_id
 
         # Validate event
         self._validate_event(event)
 
+        if self._buffered:
+            await self._enqueue(event)
+            return event.event_id
+
         # Store event
         try:
             async with self._pool.acquire() as conn:
@@ -332,22 +773,9 @@ class CoordinationTracker:
                         duration_ms, error, metadata, context, performance
                     ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
                     """,
-                    event.event_id,
-                    event.event_type.value,
-                    event.workflow_id,
-                    event.task_id,
-                    datetime.fromisoformat(event.timestamp.rstrip("Z")),
-                    event.agent_id,
-                    event.agent_type,
-                    json.dumps(event.source_agent.to_dict()) if event.source_agent else None,
-                    json.dumps(event.target_agent.to_dict()) if event.target_agent else None,
-                    event.status,
-                    event.duration_ms,
-                    json.dumps(event.error.to_dict()) if event.error else None,
-                    json.dumps(event.metadata) if event.metadata else None,
-                    json.dumps(event.context) if event.context else None,
-                    json.dumps(event.performance.to_dict()) if event.performance else None,
+                    *_event_to_record(event),
                 )
+                await self._notify([event], conn)
 
             # Update event counts for monitoring
             self._event_counts[event.event_type.value] = self._event_counts.get(event.event_type.value, 0) + 1
@@ -368,29 +796,54 @@ class CoordinationTracker:
         except Exception as e:
             raise TrackerError(f"Failed to track event: {e}") from e
 
+    @overload
     async def get_workflow_events(
         self,
         workflow_id: str,
         event_type: EventType | None = None,
         limit: int = 100,
-    ) -> list[CoordinationEvent]:
+        raw: Literal[False] = False,
+    ) -> list[CoordinationEvent]: ...
+
+    @overload
+    async def get_workflow_events(
+        self,
+        workflow_id: str,
+        event_type: EventType | None = None,
+        limit: int = 100,
+        *,
+        raw: Literal[True],
+    ) -> list[dict[str, Any]]: ...
+
+    async def get_workflow_events(
+        self,
+        workflow_id: str,
+        event_type: EventType | None = None,
+        limit: int = 100,
+        raw: bool = False,
+    ) -> list[CoordinationEvent] | list[dict[str, Any]]:
         """Get events for a workflow.
 
         Args:
             workflow_id: Workflow ID
             event_type: Optional event type filter
             limit: Maximum number of events
+            raw: Return ``to_dict()``-shaped dictionaries instead of models
 
         Returns:
-            List of coordination events
+            List of coordination events (oldest first)
         """
         if self._pool is None:
             # Use in-memory storage
-            indices = self._event_index.get(workflow_id, [])
-            events = [self._events[i] for i in indices[-limit:]]
-            if event_type:
-                events = [e for e in events if e.event_type == event_type]
-            return events
+            if event_type is None:
+                events = self._store.workflow_events(workflow_id, limit)
+            else:
+                events = [e for e in self._store.workflow_events(workflow_id) if e.event_type == event_type][-limit:]
+            return [e.to_dict() for e in events] if raw else events
+
+        # Make buffered events visible to the query
+        if self._buffered:
+            await self.flush()
 
         try:
             async with self._pool.acquire() as conn:
@@ -418,29 +871,54 @@ class CoordinationTracker:
                         limit,
                     )
 
+                if raw:
+                    return [_row_to_dict(row) for row in reversed(rows)]
                 return [self._row_to_event(row) for row in reversed(rows)]
 
         except Exception as e:
             raise TrackerError(f"Failed to get workflow events: {e}") from e
 
+    @overload
+    async def get_task_events(
+        self,
+        task_id: str,
+        limit: int = 100,
+        raw: Literal[False] = False,
+    ) -> list[CoordinationEvent]: ...
+
+    @overload
     async def get_task_events(
         self,
         task_id: str,
         limit: int = 100,
-    ) -> list[CoordinationEvent]:
+        *,
+        raw: Literal[True],
+    ) -> list[dict[str, Any]]: ...
+
+    async def get_task_events(
+        self,
+        task_id: str,
+        limit: int = 100,
+        raw: bool = False,
+    ) -> list[CoordinationEvent] | list[dict[str, Any]]:
         """Get events for a task.
 
         Args:
             task_id: Task ID
             limit: Maximum number of events
+            raw: Return ``to_dict()``-shaped dictionaries instead of models
 
         Returns:
-            List of coordination events
+            List of coordination events (oldest first)
         """
         if self._pool is None:
             # Use in-memory storage
-            indices = self._event_index.get(f"task:{task_id}", [])
-            return [self._events[i] for i in indices[-limit:]]
+            events = self._store.task_events(task_id, limit)
+            return [e.to_dict() for e in events] if raw else events
+
+        # Make buffered events visible to the query
+        if self._buffered:
+            await self.flush()
 
         try:
             async with self._pool.acquire() as conn:
@@ -455,42 +933,54 @@ class CoordinationTracker:
                     limit,
                 )
 
+                if raw:
+                    return [_row_to_dict(row) for row in reversed(rows)]
                 return [self._row_to_event(row) for row in reversed(rows)]
 
         except Exception as e:
             raise TrackerError(f"Failed to get task events: {e}") from e
 
+    @overload
+    async def get_agent_events(
+        self,
+        agent_id: str,
+        limit: int = 100,
+        raw: Literal[False] = False,
+    ) -> list[CoordinationEvent]: ...
+
+    @overload
     async def get_agent_events(
         self,
         agent_id: str,
         limit: int = 100,
-    ) -> list[CoordinationEvent]:
+        *,
+        raw: Literal[True],
+    ) -> list[dict[str, Any]]: ...
+
+    async def get_agent_events(
+        self,
+        agent_id: str,
+        limit: int = 100,
+        raw: bool = False,
+    ) -> list[CoordinationEvent] | list[dict[str, Any]]:
         """Get events for an agent.
 
         Args:
             agent_id: Agent ID
             limit: Maximum number of events
+            raw: Return ``to_dict()``-shaped dictionaries instead of models
 
         Returns:
-            List of coordination events
+            List of coordination events (oldest first)
         """
         if self._pool is None:
-            # Use in-memory storage
-            indices = self._event_index.get(f"agent:{agent_id}", [])
-            events = [self._events[i] for i in indices[-limit:]]
-
-            # Also include events where agent is source or target
-            additional = []
-            for event in self._events:
-                if event not in events and (
-                    event.source_agent
-                    and event.source_agent.agent_id == agent_id
-                    or event.target_agent
-                    and event.target_agent.agent_id == agent_id
-                ):
-                    additional.append(event)
+            # Use in-memory storage (indexed by agent_id, source and target)
+            events = sorted(self._store.agent_events(agent_id, limit), key=lambda e: e.timestamp)
+            return [e.to_dict() for e in events] if raw else events
 
-            return sorted(events + additional, key=lambda e: e.timestamp)[-limit:]
+        # Make buffered events visible to the query
+        if self._buffered:
+            await self.flush()
 
         try:
             async with self._pool.acquire() as conn:
@@ -507,6 +997,8 @@ class CoordinationTracker:
                     limit,
                 )
 
+                if raw:
+                    return [_row_to_dict(row) for row in reversed(rows)]
                 return [self._row_to_event(row) for row in reversed(rows)]
 
         except Exception as e:
@@ -524,41 +1016,197 @@ class CoordinationTracker:
         events = await self.get_workflow_events(workflow_id, EventType.HANDOFF, limit=1000)
         return sorted(events, key=lambda e: e.timestamp)
 
+    @overload
+    def stream_workflow_events(
+        self,
+        workflow_id: str,
+        since: str | None = None,
+        batch_size: int = 500,
+        raw: Literal[False] = False,
+        after_event_id: str | None = None,
+    ) -> AsyncIterator[CoordinationEvent]: ...
+
+    @overload
+    def stream_workflow_events(
+        self,
+        workflow_id: str,
+        since: str | None = None,
+        batch_size: int = 500,
+        *,
+        raw: Literal[True],
+        after_event_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+    async def stream_workflow_events(
+        self,
+        workflow_id: str,
+        since: str | None = None,
+        batch_size: int = 500,
+        raw: bool = False,
+        after_event_id: str | None = None,
+    ) -> AsyncIterator[CoordinationEvent | dict[str, Any]]:
+        """Stream a workflow's events in timestamp order.
+
+        Events are ordered by ``(timestamp, event_id)``, and a stream is
+        resumed from the last event received by passing its timestamp as
+        ``since`` and its id as ``after_event_id``; events sharing that
+        timestamp are then not skipped.
+
+        Rows are read through a server-side cursor ``batch_size`` at a time,
+        so arbitrarily long workflows can be consumed without loading them
+        into memory. The pooled connection is held until the iterator is
+        exhausted or closed.
+
+        Args:
+            workflow_id: Workflow ID
+            since: Only yield events strictly after this ISO timestamp
+            batch_size: Rows fetched per cursor round trip
+            raw: Yield ``to_dict()``-shaped dictionaries instead of models
+            after_event_id: With ``since``, also yield events at exactly that
+                timestamp whose id sorts after this one
+
+        Yields:
+            Coordination events, oldest first
+
+        Raises:
+            TrackerError: If the query fails
+        """
+        since_dt = datetime.fromisoformat(since.rstrip("Z")) if since else None
+
+        if self._pool is None:
+
+            def key(event: CoordinationEvent) -> tuple[datetime, str]:
+                return datetime.fromisoformat(event.timestamp.rstrip("Z")), event.event_id
+
+            for event in sorted(self._store.workflow_events(workflow_id), key=key):
+                timestamp, event_id = key(event)
+                if (
+                    since_dt is None
+                    or timestamp > since_dt
+                    or (timestamp == since_dt and after_event_id is not None and event_id > after_event_id)
+                ):
+                    yield event.to_dict() if raw else event
+            return
+
+        # Make buffered events visible to the query
+        if self._buffered:
+            await self.flush()
+
+        try:
+            async with self._pool.acquire() as conn, conn.transaction():
+                cursor = conn.cursor(
+                    """
+                    SELECT * FROM coordination_events
+                    WHERE workflow_id = $1
+                      AND ($2::timestamp IS NULL OR (timestamp, event_id) > ($2, $3::VARCHAR))
+                    ORDER BY timestamp, event_id
+                    """,
+                    workflow_id,
+                    since_dt,
+                    after_event_id,
+                    prefetch=batch_size,
+                )
+                convert = _row_to_dict if raw else self._row_to_event
+                async for row in cursor:
+                    yield convert(row)
+
+        except Exception as e:
+            raise TrackerError(f"Failed to stream workflow events: {e}") from e
+
+    async def get_workflow_summary(self, workflow_id: str) -> dict[str, Any]:
+        """Get aggregate timeline figures for a workflow without loading its events.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Summary with ``total_events``, ``start_time``, ``end_time``,
+            ``duration_ms``, ``handoff_count``, ``failure_count``,
+            ``unique_agents`` and ``unique_tasks``
+
+        Raises:
+            TrackerError: If the query fails
+        """
+        if self._pool is None:
+            return self._summarize_events(workflow_id, self._store.workflow_events(workflow_id))
+
+        # Make buffered events visible to the query
+        if self._buffered:
+            await self.flush()
+
+        try:
+            async with self._pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    """
+                    SELECT
+                        COUNT(*) AS total_events,
+                        MIN(timestamp) AS start_time,
+                        MAX(timestamp) AS end_time,
+                        COUNT(*) FILTER (WHERE event_type = 'handoff') AS handoff_count,
+                        COUNT(*) FILTER (WHERE event_type = 'failure') AS failure_count,
+                        COUNT(DISTINCT task_id) AS unique_tasks,
+                        (
+                            SELECT COUNT(DISTINCT agent)
+                            FROM coordination_events,
+                            LATERAL (
+                                VALUES (agent_id), (source_agent->>'agent_id'), (target_agent->>'agent_id')
+                            ) AS agents(agent)
+                            WHERE workflow_id = $1 AND agent IS NOT NULL
+                        ) AS unique_agents
+                    FROM coordination_events
+                    WHERE workflow_id = $1
+                    """,
+                    workflow_id,
+                )
+
+        except Exception as e:
+            raise TrackerError(f"Failed to get workflow summary: {e}") from e
+
+        start_time, end_time = row["start_time"], row["end_time"]
+        return {
+            "workflow_id": workflow_id,
+            "total_events": row["total_events"],
+            "start_time": start_time.isoformat() + "Z" if start_time else None,
+            "end_time": end_time.isoformat() + "Z" if end_time else None,
+            "duration_ms": (end_time - start_time).total_seconds() * 1000 if start_time else 0,
+            "handoff_count": row["handoff_count"],
+            "failure_count": row["failure_count"],
+            "unique_agents": row["unique_agents"],
+            "unique_tasks": row["unique_tasks"],
+        }
+
     async def get_workflow_timeline(
         self,
         workflow_id: str,
     ) -> dict[str, Any]:
         """Get workflow execution timeline.
 
+        Builds the full event list in memory; use ``get_workflow_summary``
+        and ``stream_workflow_events`` for very large workflows.
+
         Args:
             workflow_id: Workflow ID
 
         Returns:
             Timeline information
         """
-        events = await self.get_workflow_events(workflow_id, limit=10000)
+        timeline = await self.get_workflow_summary(workflow_id)
+        timeline["events"] = [event.to_dict() async for event in self.stream_workflow_events(workflow_id)]
+        return timeline
 
-        if not events:
-            return {
-                "workflow_id": workflow_id,
-                "total_events": 0,
-                "duration_ms": 0,
-                "handoff_count": 0,
-                "failure_count": 0,
-                "unique_agents": 0,
-                "unique_tasks": 0,
-                "events": [],
-            }
+    @staticmethod
+    def _summarize_events(workflow_id: str, events: list[CoordinationEvent]) -> dict[str, Any]:
+        """Compute ``get_workflow_summary`` figures from in-memory events.
 
-        # Sort by timestamp
-        events.sort(key=lambda e: e.timestamp)
+        Args:
+            workflow_id: Workflow ID
+            events: The workflow's events
 
-        # Extract timeline data
-        handoffs = [e for e in events if e.event_type == EventType.HANDOFF]
-        failures = [e for e in events if e.event_type == EventType.FAILURE]
+        Returns:
+            Summary dictionary
+        """
         agents = set()
         tasks = set()
-
         for event in events:
             if event.agent_id:
                 agents.add(event.agent_id)
@@ -569,20 +1217,23 @@ class CoordinationTracker:
             if event.target_agent:
                 agents.add(event.target_agent.agent_id)
 
-        # Calculate duration
-        start_time = datetime.fromisoformat(events[0].timestamp.rstrip("Z"))
-        end_time = datetime.fromisoformat(events[-1].timestamp.rstrip("Z"))
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        timestamps = sorted(event.timestamp for event in events)
+        duration_ms: float = 0
+        if timestamps:
+            start_time = datetime.fromisoformat(timestamps[0].rstrip("Z"))
+            end_time = datetime.fromisoformat(timestamps[-1].rstrip("Z"))
+            duration_ms = (end_time - start_time).total_seconds() * 1000
 
         return {
             "workflow_id": workflow_id,
             "total_events": len(events),
+            "start_time": timestamps[0] if timestamps else None,
+            "end_time": timestamps[-1] if timestamps else None,
             "duration_ms": duration_ms,
-            "handoff_count": len(handoffs),
-            "failure_count": len(failures),
+            "handoff_count": sum(1 for e in events if e.event_type == EventType.HANDOFF),
+            "failure_count": sum(1 for e in events if e.event_type == EventType.FAILURE),
             "unique_agents": len(agents),
             "unique_tasks": len(tasks),
-            "events": [e.to_dict() for e in events],
         }
 
     async def get_statistics(
@@ -590,6 +1241,7 @@ class CoordinationTracker:
         workflow_id: str | None = None,
         start_time: str | None = None,
         end_time: str | None = None,
+        use_rollups: bool = False,
     ) -> dict[str, Any]:
         """Get coordination statistics.
 
@@ -597,16 +1249,16 @@ class CoordinationTracker:
             workflow_id: Optional workflow filter
             start_time: Optional start time filter
             end_time: Optional end time filter
+            use_rollups: Serve global statistics from the hourly rollup table
+                when it exists (see ``_get_rollup_statistics``); ignored with
+                a workflow filter
 
         Returns:
             Statistics dictionary
         """
         if self._pool is None:
             # Calculate from in-memory events
-            events = self._events
-            if workflow_id:
-                indices = self._event_index.get(workflow_id, [])
-                events = [self._events[i] for i in indices]
+            events = self._store.workflow_events(workflow_id) if workflow_id else list(self._store.events())
 
             total_events = len(events)
             event_types: defaultdict[str, int] = defaultdict(int)
@@ -628,14 +1280,21 @@ class CoordinationTracker:
                 "failure_count": failure_count,
                 "failure_rate": failure_count / total_events if total_events > 0 else 0,
                 "avg_duration_ms": total_duration / duration_count if duration_count > 0 else 0,
-                "unique_workflows": len(self._event_index),
+                "unique_workflows": self._store.workflow_count(),
             }
 
+        # Make buffered events visible to the query
+        if self._buffered:
+            await self.flush()
+
+        if use_rollups and workflow_id is None and self._rollups_available:
+            return await self._get_rollup_statistics(start_time, end_time)
+
         try:
             async with self._pool.acquire() as conn:
                 # Build query conditions
                 conditions = []
-                params = []
+                params: list[Any] = []
                 param_num = 1
 
                 if workflow_id:
@@ -645,12 +1304,12 @@ class CoordinationTracker:
 
                 if start_time:
                     conditions.append(f"timestamp >= ${param_num}")
-                    params.append(datetime.fromisoformat(start_time.rstrip("Z")).isoformat())
+                    params.append(datetime.fromisoformat(start_time.rstrip("Z")))
                     param_num += 1
 
                 if end_time:
                     conditions.append(f"timestamp <= ${param_num}")
-                    params.append(datetime.fromisoformat(end_time.rstrip("Z")).isoformat())
+                    params.append(datetime.fromisoformat(end_time.rstrip("Z")))
                     param_num += 1
 
                 where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
@@ -702,6 +1361,140 @@ class CoordinationTracker:
         except Exception as e:
             raise TrackerError(f"Failed to get statistics: {e}") from e
 
+    async def _get_rollup_statistics(
+        self,
+        start_time: str | None = None,
+        end_time: str | None = None,
+    ) -> dict[str, Any]:
+        """Get global statistics from the hourly rollup table.
+
+        Windows are widened to whole hours. Rollups outlive dropped partitions
+        but carry no per-workflow/task/agent identity, so ``unique_*`` counts
+        are not reported; duration percentiles come from the merged
+        histograms instead (see ``_histogram_quantile``).
+
+        Args:
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+
+        Returns:
+            Statistics dictionary
+        """
+        conditions = []
+        params: list[Any] = []
+        if start_time:
+            params.append(datetime.fromisoformat(start_time.rstrip("Z")))
+            conditions.append(f"bucket >= date_trunc('hour', ${len(params)}::timestamp)")
+        if end_time:
+            params.append(datetime.fromisoformat(end_time.rstrip("Z")))
+            conditions.append(f"bucket <= ${len(params)}")
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        assert self._pool is not None
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    f"""
+                    SELECT
+                        event_type,
+                        agent_type,
+                        SUM(event_count)::bigint AS event_count,
+                        SUM(duration_count)::bigint AS duration_count,
+                        SUM(duration_sum) AS duration_sum,
+                        MIN(duration_min) AS duration_min,
+                        MAX(duration_max) AS duration_max,
+                        coordination_duration_hist_sum(duration_histogram) AS duration_histogram
+                    FROM coordination_event_rollups
+                    {where_clause}
+                    GROUP BY event_type, agent_type
+                    """,
+                    *params,
+                )
+        except Exception as e:
+            raise TrackerError(f"Failed to get rollup statistics: {e}") from e
+
+        event_types: defaultdict[str, int] = defaultdict(int)
+        agent_types: defaultdict[str, int] = defaultdict(int)
+        histogram: list[int] = []
+        duration_count = 0
+        duration_sum = 0.0
+        durations_min = []
+        durations_max = []
+
+        for row in rows:
+            event_types[row["event_type"]] += row["event_count"]
+            if row["agent_type"]:
+                agent_types[row["agent_type"]] += row["event_count"]
+            duration_count += row["duration_count"]
+            duration_sum += row["duration_sum"]
+            if row["duration_min"] is not None:
+                durations_min.append(row["duration_min"])
+                durations_max.append(row["duration_max"])
+            row_histogram = row["duration_histogram"] or []
+            histogram.extend([0] * (len(row_histogram) - len(histogram)))
+            for i, count in enumerate(row_histogram):
+                histogram[i] += count
+
+        total_events = sum(event_types.values())
+        failure_count = event_types.get(EventType.FAILURE.value, 0)
+
+        stats: dict[str, Any] = {
+            "total_events": total_events,
+            "failure_count": failure_count,
+            "failure_rate": failure_count / total_events if total_events > 0 else 0,
+            "avg_duration_ms": duration_sum / duration_count if duration_count > 0 else 0,
+            "max_duration_ms": float(max(durations_max, default=0)),
+            "min_duration_ms": float(min(durations_min, default=0)),
+            "event_types": dict(event_types),
+            "agent_types": dict(agent_types),
+            "source": "rollups",
+        }
+        for key, q in _ROLLUP_QUANTILES.items():
+            stats[key] = _histogram_quantile(histogram, q)
+        return stats
+
+    async def maintain_partitions(
+        self,
+        retention_months: int | None = None,
+        months_ahead: int = 2,
+    ) -> dict[str, list[str]]:
+        """Run the partition retention job for coordination_events.
+
+        Creates monthly partitions for the current month and ``months_ahead``
+        months after it, then drops partitions older than the current month
+        plus ``retention_months`` previous months. Dropping a partition does
+        not touch the hourly rollups. Requires the partitioned schema from the
+        Alembic migrations; schedule it daily (e.g. cron or pg_cron).
+
+        Args:
+            retention_months: Months of raw events to keep (None to keep all)
+            months_ahead: Months of partitions to create ahead of time
+
+        Returns:
+            Dictionary with ``created`` and ``dropped`` partition names
+
+        Raises:
+            TrackerError: If maintenance fails
+        """
+        result: dict[str, list[str]] = {"created": [], "dropped": []}
+        if self._pool is None:
+            # In-memory retention is handled by the event store
+            return result
+
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT action, partition_name FROM maintain_coordination_event_partitions($1, $2)",
+                    retention_months,
+                    months_ahead,
+                )
+        except Exception as e:
+            raise TrackerError(f"Failed to maintain partitions: {e}") from e
+
+        for row in rows:
+            result[row["action"]].append(row["partition_name"])
+        return result
+
     async def delete_workflow_events(self, workflow_id: str) -> int:
         """Delete all events for a workflow.
 
@@ -713,9 +1506,11 @@ class CoordinationTracker:
         """
         if self._pool is None:
             # Remove from in-memory storage
-            indices = self._event_index.get(workflow_id, [])
-            return len(indices)
-            # This is complex to do efficiently in-memory, so just clear for now
+            return self._store.delete_workflow(workflow_id)
+
+        # Make buffered events visible to the query
+        if self._buffered:
+            await self.flush()
 
         try:
             async with self._pool.acquire() as conn:
@@ -735,96 +1530,17 @@ class CoordinationTracker:
     def _row_to_event(self, row: asyncpg.Record) -> CoordinationEvent:
         """Convert database row to CoordinationEvent.
 
+        The row is flattened to a dict first and validated in one
+        ``model_validate`` call, which builds the nested models inside
+        pydantic-core instead of through their Python constructors.
+
         Args:
             row: Database row
 
         Returns:
             CoordinationEvent instance
         """
-        # Parse JSON fields
-        source_agent = None
-        if row["source_agent"]:
-            agent_data = (
-                json.loads(row["source_agent"]) if isinstance(row["source_agent"], str) else row["source_agent"]
-            )
-            source_agent = AgentInfo(
-                agent_id=agent_data["agent_id"],
-                agent_type=agent_data["agent_type"],
-                metadata=agent_data.get("metadata"),
-            )
-
-        target_agent = None
-        if row["target_agent"]:
-            agent_data = (
-                json.loads(row["target_agent"]) if isinstance(row["target_agent"], str) else row["target_agent"]
-            )
-            target_agent = AgentInfo(
-                agent_id=agent_data["agent_id"],
-                agent_type=agent_data["agent_type"],
-                metadata=agent_data.get("metadata"),
-            )
-
-        error = None
-        if row["error"]:
-            error_data = json.loads(row["error"]) if isinstance(row["error"], str) else row["error"]
-            error = ErrorInfo(
-                error_type=error_data["error_type"],
-                error_message=error_data["error_message"],
-                stack_trace=error_data.get("stack_trace"),
-                retry_count=error_data.get("retry_count", 0),
-                will_retry=error_data.get("will_retry", False),
-            )
-
-        performance = None
-        if row["performance"]:
-            perf_data = json.loads(row["performance"]) if isinstance(row["performance"], str) else row["performance"]
-            performance = PerformanceMetrics(
-                cpu_usage=perf_data.get("cpu_usage"),
-                memory_mb=perf_data.get("memory_mb"),
-                io_operations=perf_data.get("io_operations"),
-                network_bytes=perf_data.get("network_bytes"),
-                custom_metrics=perf_data.get("custom_metrics"),
-            )
-
-        return CoordinationEvent(
-            event_id=row["event_id"],
-            event_type=EventType(row["event_type"]),
-            workflow_id=row["workflow_id"],
-            task_id=row["task_id"],
-            timestamp=row["timestamp"].isoformat() + "Z",
-            agent_id=row["agent_id"],
-            agent_type=row["agent_type"],
-            source_agent=source_agent,
-            target_agent=target_agent,
-            status=row["status"],
-            duration_ms=row["duration_ms"],
-            error=error,
-            metadata=json.loads(row["metadata"])
-            if row["metadata"] and isinstance(row["metadata"], str)
-            else row["metadata"],
-            context=json.loads(row["context"])
-            if row["context"] and isinstance(row["context"], str)
-            else row["context"],
-            performance=performance,
-        )
-
-    def _cleanup_old_events(self) -> None:
-        """Clean up old events from memory when limit exceeded."""
-        # Keep most recent 80% of max events
-        keep_count = int(self._max_memory_events * 0.8)
-        if len(self._events) > keep_count:
-            # Remove oldest events
-            remove_count = len(self._events) - keep_count
-            self._events = self._events[remove_count:]
-
-            # Rebuild index
-            self._event_index.clear()
-            for i, event in enumerate(self._events):
-                self._event_index[event.workflow_id].append(i)
-                if event.task_id:
-                    self._event_index[f"task:{event.task_id}"].append(i)
-                if event.agent_id:
-                    self._event_index[f"agent:{event.agent_id}"].append(i)
+        return CoordinationEvent.model_validate(_row_to_dict(row))
 
 
 # Convenience functions for common tracking operations
@@ -11,12 +11,14 @@ from .tools.discovery_tools import (
     check_discovery_health,
     close_http_client,
     discover_agents,
+    discover_agents_batch,
     get_agent_details,
     mcp,
 )
 
 __all__ = [
     "discover_agents",
+    "discover_agents_batch",
     "get_agent_details",
     "check_discovery_health",
     "close_http_client",
@@ -5,8 +5,9 @@ enabling automatic JSON schema generation and validation.
 """
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 
 class DiscoverAgentsRequest(BaseModel):
@@ -61,6 +62,44 @@ class DiscoverAgentsResponse(BaseModel):
     processing_time_ms: float
 
 
+class DiscoverAgentsBatchRequest(BaseModel):
+    """Request model for batch agent discovery."""
+
+    queries: list[Annotated[str, StringConstraints(min_length=1, max_length=500)]] = Field(
+        min_length=1,
+        max_length=50,
+        description="Natural language descriptions of desired capabilities, one per subtask",
+    )
+    limit: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="Maximum number of agents to return per query",
+    )
+    threshold: float = Field(
+        default=0.6,
+        ge=0.0,
+        le=1.0,
+        description="Minimum confidence threshold",
+    )
+
+
+class QueryMatches(BaseModel):
+    """Agent matches for one query of a batch discovery."""
+
+    query: str
+    agents: list[AgentMatch]
+    total_count: int
+
+
+class DiscoverAgentsBatchResponse(BaseModel):
+    """Response model for batch agent discovery."""
+
+    success: bool
+    results: list[QueryMatches]
+    processing_time_ms: float
+
+
 class GetAgentDetailsRequest(BaseModel):
     """Request model for agent details retrieval."""
 
@@ -17,11 +17,14 @@ from fastmcp import FastMCP
 from ..models import (
     AgentDetails,
     AgentMatch,
+    DiscoverAgentsBatchRequest,
+    DiscoverAgentsBatchResponse,
     DiscoverAgentsRequest,
     DiscoverAgentsResponse,
     GetAgentDetailsRequest,
     GetAgentDetailsResponse,
     HealthCheckResponse,
+    QueryMatches,
 )
 
 # Configuration
@@ -131,24 +134,7 @@ async def discover_agents(
 
                 # Parse and transform response
                 data = response.json()
-                agents = [
-                    AgentMatch(
-                        agent_id=match["agent"]["agent_id"],
-                        agent_type=match["agent"]["agent_type"],
-                        name=match["agent"]["name"],
-                        display_name=match["agent"]["display_name"],
-                        category=match["agent"]["category"],
-                        description=match["agent"]["description"],
-                        capabilities=match["agent"].get("capabilities", []),
-                        tools=match["agent"].get("tools", []),
-                        keywords=match["agent"].get("keywords", []),
-                        confidence=match["confidence"],
-                        match_reason=match.get("match_reason", ""),
-                        estimated_tokens=match["agent"].get("estimated_tokens"),
-                        avg_response_time_ms=match["agent"].get("avg_response_time_ms"),
-                    )
-                    for match in data.get("matches", [])
-                ]
+                agents = [_to_agent_match(match) for match in data.get("matches", [])]
 
                 return DiscoverAgentsResponse(
                     success=True,
@@ -177,6 +163,113 @@ async def discover_agents(
     raise DiscoveryToolError("Unknown error occurred")
 
 
+async def discover_agents_batch(
+    queries: list[str],
+    limit: int = 5,
+    threshold: float = 0.6,
+) -> DiscoverAgentsBatchResponse:
+    """Discover agents for several natural language queries at once.
+
+    Use this instead of calling discover_agents once per subtask: all
+    queries are resolved by a single Discovery API request (one database
+    round trip), and results are returned per query in the same order.
+
+    Args:
+        queries: Natural language descriptions of desired capabilities (1-50)
+        limit: Maximum number of agents to return per query (1-20)
+        threshold: Minimum confidence threshold (0.0-1.0)
+
+    Returns:
+        Batch discovery response with matched agents for each query
+
+    Raises:
+        DiscoveryAPIError: If the API returns an error
+        DiscoveryTimeoutError: If the request times out
+        DiscoveryToolError: For other errors
+    """
+    # Validate with Pydantic
+    request = DiscoverAgentsBatchRequest(queries=queries, limit=limit, threshold=threshold)
+
+    # Execute with retry logic
+    last_error: DiscoveryTimeoutError | DiscoveryAPIError | None = None
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with get_http_client() as client:
+                response = await client.post(
+                    "/api/v1/agents/discover:batch",
+                    json=request.model_dump(),
+                )
+
+                # Handle error responses
+                if response.status_code == 400:
+                    error_data = response.json()
+                    raise DiscoveryAPIError(f"Invalid request: {error_data.get('message', 'Unknown error')}")
+                if response.status_code == 404:
+                    raise DiscoveryAPIError("Discovery API batch endpoint not found")
+                if response.status_code == 500:
+                    error_data = response.json()
+                    raise DiscoveryAPIError(f"Server error: {error_data.get('message', 'Unknown error')}")
+
+                response.raise_for_status()
+
+                # Parse and transform response
+                data = response.json()
+                results = []
+                for result in data.get("results", []):
+                    agents = [_to_agent_match(match) for match in result.get("matches", [])]
+                    results.append(
+                        QueryMatches(
+                            query=result["query"],
+                            agents=agents,
+                            total_count=result.get("total_count", len(agents)),
+                        )
+                    )
+
+                return DiscoverAgentsBatchResponse(
+                    success=True,
+                    results=results,
+                    processing_time_ms=data.get("processing_time_ms", 0),
+                )
+
+        except httpx.TimeoutException:
+            last_error = DiscoveryTimeoutError(f"Request timed out after {DEFAULT_TIMEOUT}s")
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(0.5 * (attempt + 1))
+                continue
+        except httpx.HTTPError as e:
+            last_error = DiscoveryAPIError(f"HTTP error: {str(e)}")
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(0.5 * (attempt + 1))
+                continue
+        except DiscoveryAPIError:
+            raise  # Don't retry known API errors
+
+    # All retries failed
+    if last_error:
+        raise last_error
+    raise DiscoveryToolError("Unknown error occurred")
+
+
+def _to_agent_match(match: dict[str, Any]) -> AgentMatch:
+    """Convert a Discovery API match to the MCP agent match model."""
+    agent = match["agent"]
+    return AgentMatch(
+        agent_id=agent["agent_id"],
+        agent_type=agent["agent_type"],
+        name=agent["name"],
+        display_name=agent["display_name"],
+        category=agent["category"],
+        description=agent["description"],
+        capabilities=agent.get("capabilities", []),
+        tools=agent.get("tools", []),
+        keywords=agent.get("keywords", []),
+        confidence=match["confidence"],
+        match_reason=match.get("match_reason", ""),
+        estimated_tokens=agent.get("estimated_tokens"),
+        avg_response_time_ms=agent.get("avg_response_time_ms"),
+    )
+
+
 async def get_agent_details(agent_id: str) -> GetAgentDetailsResponse:
     """Get detailed information about a specific agent.
 
@@ -322,6 +415,17 @@ async def mcp_discover_agents(
     return result.model_dump()
 
 
+@mcp.tool()
+async def mcp_discover_agents_batch(
+    queries: list[str],
+    limit: int = 5,
+    threshold: float = 0.6,
+) -> dict[str, Any]:
+    """Discover agents for many queries in one request (MCP wrapper)."""
+    result = await discover_agents_batch(queries, limit, threshold)
+    return result.model_dump()
+
+
 @mcp.tool()
 async def mcp_get_agent_details(agent_id: str) -> dict[str, Any]:
     """Get detailed information about a specific agent (MCP wrapper)."""
@@ -4,6 +4,14 @@ This module provides a centralized registry for managing agent metadata
 with PostgreSQL backend and pgvector support for semantic search.
 """
 
+from .cache import REGISTRY_NOTIFY_CHANNEL, RegistryCache
+from .embeddings import (
+    EmbeddingEncoder,
+    HashingEncoder,
+    SentenceTransformerEncoder,
+    create_encoder,
+    embed_agents,
+)
 from .registry import (
     AgentAlreadyExistsError,
     AgentNotFoundError,
@@ -17,6 +25,13 @@ __all__ = [
     "AgentRegistryError",
     "AgentNotFoundError",
     "AgentAlreadyExistsError",
+    "RegistryCache",
+    "REGISTRY_NOTIFY_CHANNEL",
+    "EmbeddingEncoder",
+    "HashingEncoder",
+    "SentenceTransformerEncoder",
+    "create_encoder",
+    "embed_agents",
     "load_agents_from_index",
 ]
 
@@ -0,0 +1,143 @@
+"""In-process read-through cache for the Agent Registry.
+
+The agent catalog is small and changes rarely, so hot read paths
+(lookups by id/type, listings, categories) can be served from memory
+instead of paying a pool acquire and a network round trip per call.
+Entries expire after a TTL and the cache is bounded with LRU eviction.
+Any registry write invalidates the whole cache and bumps its generation;
+a read that started before the invalidation passes the generation it saw
+to ``put`` and its (possibly pre-write) result is dropped.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+# Default channel used for cross-process invalidation via LISTEN/NOTIFY
+REGISTRY_NOTIFY_CHANNEL = "mycelium_registry_changes"
+
+
+class RegistryCache:
+    """TTL + LRU cache for registry read results with statistics tracking.
+
+    Values are stored as returned by the registry (agent dicts or lists of
+    them). Values are deep-copied on the way in and out, so neither the
+    caller that filled an entry nor later readers can mutate it.
+
+    Args:
+        ttl_seconds: Time-to-live for each entry in seconds
+        max_entries: Maximum cached entries before LRU eviction
+
+    Example:
+        >>> cache = RegistryCache(ttl_seconds=30.0, max_entries=256)
+        >>> cache.put(("id", "backend-developer"), {"agent_id": "backend-developer"})
+        >>> cache.get(("id", "backend-developer"))
+        {'agent_id': 'backend-developer'}
+        >>> cache.get_stats()["hits"]
+        1
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Time-to-live for each entry in seconds
+            max_entries: Maximum cached entries before LRU eviction
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        # {key: (expires_at, value)}
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "stale_puts": 0,
+        }
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every ``invalidate()``.
+
+        Read it before querying the database and pass it to ``put``.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value, moving it to the most-recently-used position.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            A copy of the cached value, or None on miss or expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return _copy(value)
+
+    def put(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """Cache a value with LRU eviction.
+
+        Args:
+            key: Cache key
+            value: Agent dict, list of agent dicts, or list of strings
+            generation: ``generation`` observed before the value was read.
+                If the cache has been invalidated since, the value may
+                predate a write and is not cached.
+        """
+        if generation is not None and generation != self._generation:
+            self._stats["stale_puts"] += 1
+            return
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+        self._entries[key] = (time.monotonic() + self._ttl, _copy(value))
+
+    def invalidate(self) -> None:
+        """Drop all cached entries (called on any registry write)."""
+        self._entries.clear()
+        self._generation += 1
+        self._stats["invalidations"] += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, evictions, expirations, invalidations,
+            stale_puts, size
+        """
+        return {**self._stats, "size": len(self._entries)}
+
+
+def _copy(value: Any) -> Any:
+    """Deep-copy agent dicts (and their nested lists and metadata) so cached entries stay private."""
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
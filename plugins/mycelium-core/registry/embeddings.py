@@ -0,0 +1,251 @@
+"""Embedding pipeline for semantic agent discovery.
+
+Computes ``agents.embedding`` vectors with a pluggable encoder and back-fills
+them incrementally: each agent's embedding text is hashed together with the
+encoder name, the hash is stored in ``agents.embedding_hash`` and agents
+whose hash is unchanged are skipped on the next run. Encoding runs in a worker
+thread so a slow model does not block the event loop.
+
+Two encoders are provided:
+
+- ``HashingEncoder``: deterministic, dependency-free feature hashing of word
+  and character n-grams. Used as the offline default.
+- ``SentenceTransformerEncoder``: ``all-MiniLM-L6-v2`` via the optional
+  ``sentence-transformers`` package.
+
+Both produce 384-dimensional, L2-normalized vectors matching the
+``vector(384)`` column and its cosine HNSW index.
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import re
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from .registry import AgentRegistry
+
+EMBEDDING_DIMENSION = 384
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset(
+    {"a", "an", "and", "are", "as", "at", "by", "for", "in", "is", "of", "on", "or", "the", "to", "with"}
+)
+
+
+class EmbeddingEncoder(Protocol):
+    """Interface for text encoders used by the embedding pipeline."""
+
+    name: str
+    dimension: int
+
+    def encode(self, texts: Sequence[str]) -> list[list[float]]:
+        """Encode a batch of texts into L2-normalized vectors."""
+        ...
+
+
+class HashingEncoder:
+    """Deterministic feature-hashing encoder (no model download required).
+
+    Words contribute their unigram and bigram features; character trigrams
+    of longer words give partial credit to morphological variants
+    ("develop" / "developer" / "development"). Features are hashed with
+    BLAKE2b (stable across processes, unlike ``hash()``) into signed buckets,
+    weighted with sublinear term frequency and L2-normalized.
+
+    Example:
+        >>> encoder = HashingEncoder()
+        >>> vector = encoder.encode(["backend api development"])[0]
+        >>> len(vector)
+        384
+    """
+
+    name = "hashing-v1"
+
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION):
+        """Initialize the encoder.
+
+        Args:
+            dimension: Output vector dimension
+        """
+        self.dimension = dimension
+
+    def encode(self, texts: Sequence[str]) -> list[list[float]]:
+        """Encode a batch of texts.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            One L2-normalized vector per text (all zeros for empty text)
+        """
+        return [self._encode_one(text) for text in texts]
+
+    def _encode_one(self, text: str) -> list[float]:
+        tokens = [t for t in _TOKEN_PATTERN.findall(text.lower()) if t not in _STOPWORDS]
+
+        counts: dict[str, float] = {}
+        for token in tokens:
+            counts[f"w:{token}"] = counts.get(f"w:{token}", 0.0) + 1.0
+            if len(token) > 4:
+                padded = f"<{token}>"
+                trigrams = [padded[i : i + 3] for i in range(len(padded) - 2)]
+                for trigram in trigrams:
+                    counts[f"c:{trigram}"] = counts.get(f"c:{trigram}", 0.0) + 1.0 / len(trigrams)
+        for left, right in zip(tokens, tokens[1:], strict=False):
+            counts[f"b:{left}_{right}"] = counts.get(f"b:{left}_{right}", 0.0) + 0.5
+
+        vector = [0.0] * self.dimension
+        for feature, count in counts.items():
+            digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+            sign = 1.0 if digest & 1 else -1.0
+            vector[(digest >> 1) % self.dimension] += sign * (1.0 + math.log(count) if count >= 1.0 else count)
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0.0:
+            return vector
+        return [v / norm for v in vector]
+
+
+class SentenceTransformerEncoder:
+    """Encoder backed by a sentence-transformers model.
+
+    Requires the optional ``sentence-transformers`` dependency. The model is
+    loaded on first use.
+    """
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", dimension: int = EMBEDDING_DIMENSION):
+        """Initialize the encoder.
+
+        Args:
+            model_name: sentence-transformers model name
+            dimension: Expected output dimension of the model
+        """
+        self.name = f"sentence-transformers:{model_name}"
+        self.dimension = dimension
+        self._model_name = model_name
+        self._model: Any = None
+
+    def encode(self, texts: Sequence[str]) -> list[list[float]]:
+        """Encode a batch of texts.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            One L2-normalized vector per text
+        """
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "sentence-transformers is required for SentenceTransformerEncoder. "
+                    "Install with: uv add sentence-transformers"
+                ) from e
+            self._model = SentenceTransformer(self._model_name)
+
+        vectors = self._model.encode(list(texts), normalize_embeddings=True)
+        return [[float(v) for v in vector] for vector in vectors]
+
+
+def create_encoder(name: str | None = None) -> EmbeddingEncoder:
+    """Create an encoder by name.
+
+    Args:
+        name: "hashing" or "sentence-transformers". Defaults to the
+            DISCOVERY_ENCODER environment variable, then "hashing".
+
+    Returns:
+        Encoder instance
+
+    Raises:
+        ValueError: If the encoder name is unknown
+    """
+    name = name or os.getenv("DISCOVERY_ENCODER", "hashing")
+    if name == "hashing":
+        return HashingEncoder()
+    if name == "sentence-transformers":
+        return SentenceTransformerEncoder()
+    raise ValueError(f"Unknown encoder '{name}'. Expected 'hashing' or 'sentence-transformers'.")
+
+
+def agent_embedding_text(agent: dict[str, Any]) -> str:
+    """Build the text that represents an agent for embedding.
+
+    Args:
+        agent: Agent dictionary (registry row or index entry)
+
+    Returns:
+        Concatenated name, category, description, capabilities and keywords
+    """
+    parts = [
+        agent.get("display_name") or agent.get("name") or "",
+        agent.get("agent_type") or "",
+        agent.get("category") or "",
+        agent.get("description") or "",
+        " ".join(agent.get("capabilities") or []),
+        " ".join(agent.get("keywords") or []),
+    ]
+    return "\n".join(part for part in parts if part)
+
+
+def embedding_content_hash(text: str, encoder: EmbeddingEncoder) -> str:
+    """Hash embedding input together with the encoder identity.
+
+    Switching encoders changes every hash, so all agents get re-embedded.
+
+    Args:
+        text: Embedding input text
+        encoder: Encoder that will embed the text
+
+    Returns:
+        Hex digest identifying the (encoder, text) pair
+    """
+    return hashlib.sha256(f"{encoder.name}\n{text}".encode()).hexdigest()
+
+
+async def embed_agents(
+    registry: "AgentRegistry",
+    encoder: EmbeddingEncoder | None = None,
+    batch_size: int = 64,
+    force: bool = False,
+) -> dict[str, int]:
+    """Compute and store embeddings for agents whose content changed.
+
+    Args:
+        registry: Initialized AgentRegistry
+        encoder: Encoder to use (defaults to ``create_encoder()``)
+        batch_size: Number of texts encoded and written per batch
+        force: Re-embed every agent even if its content hash is unchanged
+
+    Returns:
+        Dict with "embedded" and "skipped" counts
+    """
+    encoder = encoder or create_encoder()
+
+    pending: list[tuple[Any, str, str]] = []
+    skipped = 0
+    for agent in await registry.get_embedding_state():
+        text = agent_embedding_text(agent)
+        content_hash = embedding_content_hash(text, encoder)
+        if not force and agent["has_embedding"] and agent["embedding_hash"] == content_hash:
+            skipped += 1
+            continue
+        pending.append((agent["id"], text, content_hash))
+
+    for i in range(0, len(pending), batch_size):
+        batch = pending[i : i + batch_size]
+        vectors = await asyncio.to_thread(encoder.encode, [text for _, text, _ in batch])
+        await registry.store_embeddings(
+            [
+                (agent_uuid, vector, content_hash)
+                for (agent_uuid, _, content_hash), vector in zip(batch, vectors, strict=True)
+            ]
+        )
+
+    return {"embedded": len(pending), "skipped": skipped}
@@ -9,7 +9,7 @@ import asyncio
 import sys
 from pathlib import Path
 
-from registry import AgentRegistry, load_agents_from_index
+from registry import AgentRegistry, create_encoder, load_agents_from_index
 
 
 async def main() -> int:
@@ -45,9 +45,9 @@ async def main() -> int:
 
             # Load agents
             print("\nLoading agents from index.json...")
-            count = await load_agents_from_index(index_path, registry)
+            count = await load_agents_from_index(index_path, registry, encoder=create_encoder())
 
-            print(f"\nSuccessfully loaded {count} agents")
+            print(f"\nSuccessfully inserted or updated {count} agents")
 
             # Show summary by category
             print("\nAgents by category:")
@@ -8,12 +8,15 @@ import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 from uuid import UUID
 
 import asyncpg
 from asyncpg import Pool
 
+from .cache import RegistryCache
+from .embeddings import EmbeddingEncoder, embed_agents
+
 
 class AgentRegistryError(Exception):
     """Base exception for agent registry errors."""
@@ -33,17 +36,40 @@ class AgentAlreadyExistsError(AgentRegistryError):
     pass
 
 
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _to_vector(embedding: list[float] | None) -> str | None:
+    """Format an embedding as a pgvector text literal.
+
+    asyncpg has no built-in codec for the ``vector`` type, so embeddings are
+    sent in their text representation (e.g. ``[0.1,0.2,0.3]``).
+    """
+    if embedding is None:
+        return None
+    return "[" + ",".join(repr(float(v)) for v in embedding) + "]"
+
+
 class AgentRegistry:
     """Centralized agent registry with PostgreSQL backend and pgvector support.
 
     This class provides CRUD operations for agent metadata and supports
     semantic search using vector embeddings for capability matching.
+
+    Reads by id/type, listings and categories can optionally be served from
+    an in-process ``RegistryCache``. Every write invalidates the cache and,
+    when ``notify_channel`` is set, publishes a NOTIFY so other processes
+    sharing the database drop their caches too.
     """
 
     def __init__(
         self,
         connection_string: str | None = None,
         pool: Pool | None = None,
+        cache: RegistryCache | None = None,
+        notify_channel: str | None = None,
     ):
         """Initialize the agent registry.
 
@@ -51,7 +77,15 @@ class AgentRegistry:
             connection_string: PostgreSQL connection string. If not provided,
                              uses DATABASE_URL environment variable.
             pool: Existing connection pool. If provided, connection_string is ignored.
+            cache: Optional read-through cache for hot read paths.
+            notify_channel: Optional LISTEN/NOTIFY channel used to keep caches
+                          coherent across processes. Writes publish to it and,
+                          when a cache is configured, the registry listens on it.
         """
+        self._cache = cache
+        self._notify_channel = notify_channel
+        self._listener_conn: asyncpg.Connection | None = None
+
         if pool is not None:
             self._pool: Pool | None = pool
             self._owns_pool = False
@@ -63,7 +97,11 @@ class AgentRegistry:
             self._owns_pool = True
 
     async def initialize(self) -> None:
-        """Initialize the database connection pool."""
+        """Initialize the database connection pool.
+
+        When both a cache and a notify channel are configured, a pooled
+        connection is held to LISTEN for invalidations from other processes.
+        """
         if self._pool is None and self._owns_pool:
             self._pool = await asyncpg.create_pool(
                 self._connection_string,
@@ -72,12 +110,46 @@ class AgentRegistry:
                 command_timeout=60,
             )
 
+        if (
+            self._pool is not None
+            and self._cache is not None
+            and self._notify_channel is not None
+            and self._listener_conn is None
+        ):
+            self._listener_conn = await self._pool.acquire()
+            await self._listener_conn.add_listener(self._notify_channel, self._on_invalidation_notify)
+
     async def close(self) -> None:
         """Close the database connection pool."""
+        if self._listener_conn is not None and self._pool is not None:
+            await self._listener_conn.remove_listener(self._notify_channel, self._on_invalidation_notify)
+            await self._pool.release(self._listener_conn)
+            self._listener_conn = None
+
         if self._pool is not None and self._owns_pool:
             await self._pool.close()
             self._pool = None
 
+    # Cache helpers
+
+    def _on_invalidation_notify(self, _conn: Any, _pid: int, _channel: str, _payload: str) -> None:
+        """Drop cached reads when another process reports a registry write."""
+        if self._cache is not None:
+            self._cache.invalidate()
+
+    async def _invalidate_cache(self, conn: asyncpg.Connection, operation: str) -> None:
+        """Invalidate the local cache and notify other processes of a write.
+
+        Args:
+            conn: Connection the write was performed on
+            operation: Name of the write operation (used as NOTIFY payload)
+        """
+        if self._cache is not None:
+            self._cache.invalidate()
+
+        if self._notify_channel is not None:
+            await conn.execute("SELECT pg_notify($1, $2)", self._notify_channel, operation)
+
     # CRUD Operations
 
     async def create_agent(
@@ -146,10 +218,11 @@ class AgentRegistry:
                     capabilities or [],
                     tools or [],
                     keywords or [],
-                    embedding,
+                    _to_vector(embedding),
                     estimated_tokens,
                     json.dumps(metadata or {}),
                 )
+                await self._invalidate_cache(conn, "create_agent")
                 return result
 
             except asyncpg.UniqueViolationError as e:
@@ -172,6 +245,11 @@ class AgentRegistry:
         if self._pool is None:
             raise AgentRegistryError("Registry not initialized. Call initialize() first.")
 
+        cache_key = ("agent_id", agent_id)
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cast(dict[str, Any], cached)
+        generation = self._cache.generation if self._cache is not None else 0
+
         async with self._pool.acquire() as conn:
             query = """
                 SELECT
@@ -187,7 +265,10 @@ class AgentRegistry:
             if row is None:
                 raise AgentNotFoundError(f"Agent with agent_id '{agent_id}' not found")
 
-            return dict(row)
+            agent = dict(row)
+            if self._cache is not None:
+                self._cache.put(cache_key, agent, generation)
+            return agent
 
     async def get_agent_by_type(self, agent_type: str) -> dict[str, Any]:
         """Get an agent by its agent_type.
@@ -204,6 +285,11 @@ class AgentRegistry:
         if self._pool is None:
             raise AgentRegistryError("Registry not initialized. Call initialize() first.")
 
+        cache_key = ("agent_type", agent_type)
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cast(dict[str, Any], cached)
+        generation = self._cache.generation if self._cache is not None else 0
+
         async with self._pool.acquire() as conn:
             query = """
                 SELECT
@@ -219,7 +305,74 @@ class AgentRegistry:
             if row is None:
                 raise AgentNotFoundError(f"Agent with agent_type '{agent_type}' not found")
 
-            return dict(row)
+            agent = dict(row)
+            if self._cache is not None:
+                self._cache.put(cache_key, agent, generation)
+            return agent
+
+    async def get_agent_by_id_or_type(self, identifier: str, use_cache: bool = True) -> dict[str, Any]:
+        """Get an agent by agent_id, falling back to agent_type, in one query.
+
+        Args:
+            identifier: An agent_id or agent_type
+            use_cache: Read through the registry cache. Pass False when the
+                result must match the current catalog version.
+
+        Returns:
+            Dict containing agent data (the agent_id match wins if both exist)
+
+        Raises:
+            AgentNotFoundError: If no agent has that agent_id or agent_type
+        """
+        if self._pool is None:
+            raise AgentRegistryError("Registry not initialized. Call initialize() first.")
+
+        cache_key = ("agent_id_or_type", identifier)
+        cache = self._cache if use_cache else None
+        if cache is not None and (cached := cache.get(cache_key)) is not None:
+            return cast(dict[str, Any], cached)
+        generation = cache.generation if cache is not None else 0
+
+        async with self._pool.acquire() as conn:
+            query = """
+                SELECT
+                    id, agent_id, agent_type, name, display_name, category,
+                    description, capabilities, tools, keywords, file_path,
+                    estimated_tokens, metadata, avg_response_time_ms,
+                    success_rate, usage_count, created_at, updated_at, last_used_at
+                FROM agents
+                WHERE agent_id = $1 OR agent_type = $1
+                ORDER BY agent_id = $1 DESC, name
+                LIMIT 1
+            """
+
+            row = await conn.fetchrow(query, identifier)
+            if row is None:
+                raise AgentNotFoundError(f"Agent with ID or type '{identifier}' not found")
+
+            agent = dict(row)
+            if cache is not None:
+                cache.put(cache_key, agent, generation)
+            return agent
+
+    async def get_catalog_version(self) -> int:
+        """Get the catalog version stamp.
+
+        The stamp is bumped by a trigger on every write to the agents table
+        (from any process), so it can be used to validate cached responses.
+        It is always read from the database: a cached copy could lag writes
+        that bypass this registry (bulk loads, other processes without a
+        notify channel) by up to the cache TTL.
+
+        Returns:
+            Current catalog version
+        """
+        if self._pool is None:
+            raise AgentRegistryError("Registry not initialized. Call initialize() first.")
+
+        async with self._pool.acquire() as conn:
+            version: int = await conn.fetchval("SELECT version FROM agent_catalog_version")
+            return version
 
     async def get_agent_by_uuid(self, uuid: UUID) -> dict[str, Any]:
         """Get an agent by its UUID.
@@ -282,23 +435,27 @@ class AgentRegistry:
             for field, value in fields.items():
                 if field == "metadata" and isinstance(value, dict):
                     value = json.dumps(value)
+                elif field == "embedding" and isinstance(value, list):
+                    value = _to_vector(value)
                 set_clauses.append(f"{field} = ${param_idx}")
                 values.append(value)
                 param_idx += 1
 
             values.append(agent_id)
             # Using parameterized queries with $ placeholders - safe from SQL injection
-            query = f"""  # nosec B608 - Using parameterized queries with asyncpg $ placeholders
+            query = f"""
                 UPDATE agents
                 SET {", ".join(set_clauses)}
                 WHERE agent_id = ${param_idx}
                 RETURNING id
-            """
+            """  # nosec B608 - Using parameterized queries with asyncpg $ placeholders
 
             result = await conn.fetchval(query, *values)
             if result is None:
                 raise AgentNotFoundError(f"Agent with agent_id '{agent_id}' not found")
 
+            await self._invalidate_cache(conn, "update_agent")
+
     async def delete_agent(self, agent_id: str) -> None:
         """Delete an agent from the registry.
 
@@ -318,18 +475,27 @@ class AgentRegistry:
             if result is None:
                 raise AgentNotFoundError(f"Agent with agent_id '{agent_id}' not found")
 
+            await self._invalidate_cache(conn, "delete_agent")
+
     async def list_agents(
         self,
         category: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: tuple[str, UUID] | None = None,
     ) -> list[dict[str, Any]]:
-        """List agents with optional filtering.
+        """List agents ordered by (name, id) with optional filtering.
+
+        Prefer ``after`` over ``offset`` for paging: it seeks directly to the
+        cursor position through the composite (category, name, id) / (name, id)
+        indexes instead of reading and discarding ``offset`` rows.
 
         Args:
             category: Filter by category
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when ``after`` is given)
+            after: Keyset cursor, the (name, id) of the last agent on the
+                previous page
 
         Returns:
             List of agent dictionaries
@@ -337,80 +503,171 @@ class AgentRegistry:
         if self._pool is None:
             raise AgentRegistryError("Registry not initialized. Call initialize() first.")
 
+        cache_key = ("list_agents", category, limit, offset, after)
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cast(list[dict[str, Any]], cached)
+        generation = self._cache.generation if self._cache is not None else 0
+
         async with self._pool.acquire() as conn:
+            conditions = []
+            params: list[Any] = []
             if category:
-                query = """
-                    SELECT
-                        id, agent_id, agent_type, name, display_name, category,
-                        description, capabilities, tools, keywords, file_path,
-                        estimated_tokens, metadata, avg_response_time_ms,
-                        success_rate, usage_count, created_at, updated_at, last_used_at
-                    FROM agents
-                    WHERE category = $1
-                    ORDER BY name
-                    LIMIT $2 OFFSET $3
-                """
-                rows = await conn.fetch(query, category, limit, offset)
+                params.append(category)
+                conditions.append(f"category = ${len(params)}")
+            if after is not None:
+                params.extend(after)
+                conditions.append(f"(name, id) > (${len(params) - 1}, ${len(params)})")
             else:
-                query = """
-                    SELECT
-                        id, agent_id, agent_type, name, display_name, category,
-                        description, capabilities, tools, keywords, file_path,
-                        estimated_tokens, metadata, avg_response_time_ms,
-                        success_rate, usage_count, created_at, updated_at, last_used_at
-                    FROM agents
-                    ORDER BY name
-                    LIMIT $1 OFFSET $2
-                """
-                rows = await conn.fetch(query, limit, offset)
+                params.append(offset)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            skip = "" if after is not None else f"OFFSET ${len(params)}"
+            params.append(limit)
 
-            return [dict(row) for row in rows]
+            query = f"""
+                SELECT
+                    id, agent_id, agent_type, name, display_name, category,
+                    description, capabilities, tools, keywords, file_path,
+                    estimated_tokens, metadata, avg_response_time_ms,
+                    success_rate, usage_count, created_at, updated_at, last_used_at
+                FROM agents
+                {where}
+                ORDER BY name, id
+                LIMIT ${len(params)} {skip}
+            """  # nosec B608 - only fixed conditions and placeholders are interpolated
+
+            rows = await conn.fetch(query, *params)
+
+            agents = [dict(row) for row in rows]
+            if self._cache is not None:
+                self._cache.put(cache_key, agents, generation)
+            return agents
 
     async def search_agents(
         self,
         query: str,
         limit: int = 10,
+        category: str | None = None,
+        offset: int = 0,
+        after: tuple[str, UUID] | None = None,
     ) -> list[dict[str, Any]]:
-        """Search agents using full-text search on description and keywords.
+        """Search agents using ranked full-text search.
+
+        The query is parsed with ``websearch_to_tsquery`` (quoted phrases,
+        ``or``, ``-exclusion``) and matched against the weighted
+        ``search_vector`` column (names > keywords/capabilities > description)
+        through its GIN index. Substring matches on name and agent_type are
+        also included (served by trigram indexes). Results are ordered by
+        ``ts_rank_cd``, then (name, id).
 
         Args:
             query: Search query
             limit: Maximum number of results
+            category: Filter by category (applied before ranking and limiting)
+            offset: Offset for pagination (ignored when ``after`` is given)
+            after: Keyset cursor, the (name, id) of the last agent on the
+                previous page. Its rank is recomputed server-side; if that
+                agent no longer matches the query, no rows are returned.
 
         Returns:
-            List of agent dictionaries matching the query
+            List of agent dictionaries matching the query, each with a
+            ``confidence`` key holding the normalized rank (0.0-1.0) and a
+            ``total_count`` key holding the number of matches across all pages
         """
         if self._pool is None:
             raise AgentRegistryError("Registry not initialized. Call initialize() first.")
 
-        async with self._pool.acquire() as conn:
-            sql = """
-                SELECT
-                    id, agent_id, agent_type, name, display_name, category,
-                    description, capabilities, tools, keywords, file_path,
-                    estimated_tokens, metadata, avg_response_time_ms,
-                    success_rate, usage_count, created_at, updated_at, last_used_at
-                FROM agents
-                WHERE
-                    description ILIKE $1
-                    OR $1 = ANY(keywords)
-                    OR agent_type ILIKE $1
-                    OR name ILIKE $1
-                ORDER BY
-                    CASE
-                        WHEN agent_type ILIKE $1 THEN 1
-                        WHEN name ILIKE $1 THEN 2
-                        WHEN $1 = ANY(keywords) THEN 3
-                        ELSE 4
-                    END,
-                    name
-                LIMIT $2
+        params: list[Any] = [query, f"%{_escape_like(query)}%"]
+        category_filter = ""
+        if category:
+            params.append(category)
+            category_filter = f"AND category = ${len(params)}"
+        if after is not None:
+            params.extend(after)
+            name_param, id_param = len(params) - 1, len(params)
+            page_filter = f"""
+                WHERE EXISTS (
+                    SELECT 1 FROM ranked c
+                    WHERE c.id = ${id_param}
+                        AND (
+                            r.confidence < c.confidence
+                            OR (r.confidence = c.confidence AND (r.name, r.id) > (${name_param}, ${id_param}))
+                        )
+                )
             """
+            skip = ""
+        else:
+            params.append(offset)
+            page_filter = ""
+            skip = f"OFFSET ${len(params)}"
+        params.append(limit)
 
-            search_pattern = f"%{query}%"
-            rows = await conn.fetch(sql, search_pattern, limit)
+        async with self._pool.acquire() as conn:
+            # Normalization flag 32 maps rank to rank / (rank + 1), i.e. into [0, 1).
+            # The window count is taken before paging, so it is the total number of matches.
+            sql = f"""
+                WITH q AS (SELECT websearch_to_tsquery('english', $1) AS tsq),
+                ranked AS (
+                    SELECT
+                        id, agent_id, agent_type, name, display_name, category,
+                        description, capabilities, tools, keywords, file_path,
+                        estimated_tokens, metadata, avg_response_time_ms,
+                        success_rate, usage_count, created_at, updated_at, last_used_at,
+                        GREATEST(
+                            ts_rank_cd(search_vector, q.tsq, 32),
+                            CASE
+                                WHEN agent_type ILIKE $2 THEN 0.95
+                                WHEN name ILIKE $2 THEN 0.90
+                                ELSE 0.0
+                            END
+                        )::float8 AS confidence,
+                        COUNT(*) OVER () AS total_count
+                    FROM agents, q
+                    WHERE
+                        (search_vector @@ q.tsq OR agent_type ILIKE $2 OR name ILIKE $2)
+                        {category_filter}
+                )
+                SELECT r.* FROM ranked r
+                {page_filter}
+                ORDER BY r.confidence DESC, r.name, r.id
+                LIMIT ${len(params)} {skip}
+            """  # nosec B608 - only fixed conditions and placeholders are interpolated
+
+            rows = await conn.fetch(sql, *params)
             return [dict(row) for row in rows]
 
+    async def count_search_matches(self, query: str, category: str | None = None) -> int:
+        """Count the agents ``search_agents`` would match across all pages.
+
+        ``search_agents`` reports the total on each row it returns, so callers
+        paging past the last match use this to get it.
+
+        Args:
+            query: Search query
+            category: Filter by category
+
+        Returns:
+            Number of matching agents
+        """
+        if self._pool is None:
+            raise AgentRegistryError("Registry not initialized. Call initialize() first.")
+
+        params: list[Any] = [query, f"%{_escape_like(query)}%"]
+        category_filter = ""
+        if category:
+            params.append(category)
+            category_filter = f"AND category = ${len(params)}"
+
+        async with self._pool.acquire() as conn:
+            sql = f"""
+                SELECT COUNT(*)
+                FROM agents, websearch_to_tsquery('english', $1) AS tsq
+                WHERE
+                    (search_vector @@ tsq OR agent_type ILIKE $2 OR name ILIKE $2)
+                    {category_filter}
+            """  # nosec B608 - only fixed conditions and placeholders are interpolated
+            count: int = await conn.fetchval(sql, *params)
+            return count
+
     async def similarity_search(
         self,
         embedding: list[float],
@@ -445,7 +702,7 @@ class AgentRegistry:
                 LIMIT $3
             """
 
-            rows = await conn.fetch(query, embedding, threshold, limit)
+            rows = await conn.fetch(query, _to_vector(embedding), threshold, limit)
 
             results = []
             for row in rows:
@@ -455,6 +712,154 @@ class AgentRegistry:
 
             return results
 
+    async def hybrid_search_batch(
+        self,
+        queries: list[str],
+        embeddings: list[list[float]],
+        limit: int = 10,
+    ) -> list[tuple[list[dict[str, Any]], list[tuple[dict[str, Any], float]]]]:
+        """Run full-text and vector search for many queries in one round trip.
+
+        The queries are sent as arrays and expanded server-side with
+        ``UNNEST ... WITH ORDINALITY``; each one is joined LATERALly against
+        the search index and the embedding index, so N queries cost a single
+        statement instead of 2N.
+
+        Args:
+            queries: Search queries (same semantics as ``search_agents``)
+            embeddings: One query embedding per query (384-dim)
+            limit: Maximum candidates per query from each index
+
+        Returns:
+            One ``(lexical_results, vector_results)`` pair per query, in input
+            order, shaped like the results of ``search_agents`` and
+            ``similarity_search(threshold=0.0)``
+        """
+        if self._pool is None:
+            raise AgentRegistryError("Registry not initialized. Call initialize() first.")
+        if len(queries) != len(embeddings):
+            raise ValueError("queries and embeddings must have the same length")
+
+        results: list[tuple[list[dict[str, Any]], list[tuple[dict[str, Any], float]]]] = [([], []) for _ in queries]
+        if not queries:
+            return results
+
+        async with self._pool.acquire() as conn:
+            columns = """
+                a.id, a.agent_id, a.agent_type, a.name, a.display_name, a.category,
+                a.description, a.capabilities, a.tools, a.keywords, a.file_path,
+                a.estimated_tokens, a.metadata, a.avg_response_time_ms,
+                a.success_rate, a.usage_count, a.created_at, a.updated_at, a.last_used_at
+            """
+            sql = f"""
+                WITH q AS (
+                    SELECT
+                        t.ord,
+                        websearch_to_tsquery('english', t.query) AS tsq,
+                        t.pattern,
+                        t.embedding::vector AS embedding
+                    FROM unnest($1::text[], $2::text[], $3::text[])
+                        WITH ORDINALITY AS t(query, pattern, embedding, ord)
+                )
+                SELECT q.ord, FALSE AS is_vector, m.*
+                FROM q CROSS JOIN LATERAL (
+                    SELECT {columns},
+                        GREATEST(
+                            ts_rank_cd(a.search_vector, q.tsq, 32),
+                            CASE
+                                WHEN a.agent_type ILIKE q.pattern THEN 0.95
+                                WHEN a.name ILIKE q.pattern THEN 0.90
+                                ELSE 0.0
+                            END
+                        ) AS score
+                    FROM agents a
+                    WHERE
+                        a.search_vector @@ q.tsq
+                        OR a.agent_type ILIKE q.pattern
+                        OR a.name ILIKE q.pattern
+                    ORDER BY score DESC, a.name
+                    LIMIT $4
+                ) m
+                UNION ALL
+                SELECT q.ord, TRUE AS is_vector, m.*
+                FROM q CROSS JOIN LATERAL (
+                    SELECT {columns},
+                        1 - (a.embedding <=> q.embedding) AS score
+                    FROM agents a
+                    WHERE a.embedding IS NOT NULL
+                    ORDER BY a.embedding <=> q.embedding
+                    LIMIT $4
+                ) m
+                ORDER BY ord, is_vector, score DESC
+            """  # nosec B608 - only the static column list is interpolated
+
+            rows = await conn.fetch(
+                sql,
+                queries,
+                [f"%{_escape_like(query)}%" for query in queries],
+                [_to_vector(embedding) for embedding in embeddings],
+                limit,
+            )
+
+        for row in rows:
+            agent_data = {k: v for k, v in dict(row).items() if k not in ("ord", "is_vector", "score")}
+            lexical_results, vector_results = results[row["ord"] - 1]
+            if row["is_vector"]:
+                vector_results.append((agent_data, float(row["score"])))
+            else:
+                agent_data["confidence"] = float(row["score"])
+                lexical_results.append(agent_data)
+
+        return results
+
+    async def get_embedding_state(self) -> list[dict[str, Any]]:
+        """Get the fields the embedding pipeline needs for every agent.
+
+        Returns:
+            List of dicts with id, the text fields used to build embedding
+            input, ``has_embedding`` and the stored ``embedding_hash``
+        """
+        if self._pool is None:
+            raise AgentRegistryError("Registry not initialized. Call initialize() first.")
+
+        async with self._pool.acquire() as conn:
+            query = """
+                SELECT
+                    id, agent_type, name, display_name, category, description,
+                    capabilities, keywords,
+                    embedding IS NOT NULL AS has_embedding,
+                    embedding_hash
+                FROM agents
+            """
+            rows = await conn.fetch(query)
+            return [dict(row) for row in rows]
+
+    async def store_embeddings(self, embeddings: list[tuple[UUID, list[float], str]]) -> None:
+        """Store computed embeddings and their content hashes.
+
+        Args:
+            embeddings: List of (agent UUID, embedding vector, content hash)
+        """
+        if not embeddings:
+            return
+
+        if self._pool is None:
+            raise AgentRegistryError("Registry not initialized. Call initialize() first.")
+
+        async with self._pool.acquire() as conn:
+            query = """
+                UPDATE agents
+                SET
+                    embedding = $2::vector,
+                    embedding_hash = $3
+                WHERE id = $1
+            """
+            await conn.executemany(
+                query,
+                [(agent_uuid, _to_vector(vector), content_hash) for agent_uuid, vector, content_hash in embeddings],
+            )
+            await self._invalidate_cache(conn, "store_embeddings")
+
     async def get_agent_count(self, category: str | None = None) -> int:
         """Get the total number of agents in the registry.
 
@@ -467,14 +872,21 @@ class AgentRegistry:
         if self._pool is None:
             raise AgentRegistryError("Registry not initialized. Call initialize() first.")
 
+        cache_key = ("agent_count", category)
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cast(int, cached)
+        generation = self._cache.generation if self._cache is not None else 0
+
         async with self._pool.acquire() as conn:
             if category:
                 query = "SELECT COUNT(*) FROM agents WHERE category = $1"
                 count: int = await conn.fetchval(query, category)
-                return count
-            query = "SELECT COUNT(*) FROM agents"
-            result: int = await conn.fetchval(query)
-            return result
+            else:
+                query = "SELECT COUNT(*) FROM agents"
+                count = await conn.fetchval(query)
+            if self._cache is not None:
+                self._cache.put(cache_key, count, generation)
+            return count
 
     async def get_categories(self) -> list[str]:
         """Get all unique categories in the registry.
@@ -485,71 +897,206 @@ class AgentRegistry:
         if self._pool is None:
             raise AgentRegistryError("Registry not initialized. Call initialize() first.")
 
+        cache_key = ("categories",)
+        if self._cache is not None and (cached := self._cache.get(cache_key)) is not None:
+            return cast(list[str], cached)
+        generation = self._cache.generation if self._cache is not None else 0
+
         async with self._pool.acquire() as conn:
             query = "SELECT DISTINCT category FROM agents ORDER BY category"
             rows = await conn.fetch(query)
-            return [row["category"] for row in rows]
+            categories = [row["category"] for row in rows]
+            if self._cache is not None:
+                self._cache.put(cache_key, categories, generation)
+            return categories
+
+    async def get_category_counts(self, use_cache: bool = True) -> list[tuple[str, int]]:
+        """Get every category with its agent count.
+
+        Args:
+            use_cache: Read through the registry cache. Pass False when the
+                result must match the current catalog version.
+
+        Returns:
+            List of (category, agent_count) tuples ordered by category
+        """
+        if self._pool is None:
+            raise AgentRegistryError("Registry not initialized. Call initialize() first.")
+
+        cache_key = ("category_counts",)
+        cache = self._cache if use_cache else None
+        if cache is not None and (cached := cache.get(cache_key)) is not None:
+            return cast(list[tuple[str, int]], cached)
+        generation = cache.generation if cache is not None else 0
+
+        async with self._pool.acquire() as conn:
+            query = "SELECT category, COUNT(*) AS agent_count FROM agents GROUP BY category ORDER BY category"
+            rows = await conn.fetch(query)
+            counts = [(row["category"], row["agent_count"]) for row in rows]
+            if cache is not None:
+                cache.put(cache_key, counts, generation)
+            return counts
 
     # Bulk operations
 
     async def bulk_insert_agents(
         self,
         agents: list[dict[str, Any]],
-        batch_size: int = 100,
+        batch_size: int = 100,  # noqa: ARG002 - kept for backwards compatibility
     ) -> int:
-        """Bulk insert agents into the registry.
+        """Bulk insert agents into the registry, skipping existing agent_ids.
+
+        Rows are staged with a single COPY and merged set-based, so a duplicate
+        no longer aborts the rest of its batch.
 
         Args:
             agents: List of agent dictionaries
-            batch_size: Number of agents to insert per batch
+            batch_size: Unused; all rows are staged with a single COPY
 
         Returns:
             Number of agents inserted
         """
+        counts = await self._merge_agents(agents, update_existing=False, operation="bulk_insert_agents")
+        return counts["inserted"]
+
+    async def bulk_upsert_agents(self, agents: list[dict[str, Any]]) -> dict[str, int]:
+        """Insert new agents and update changed ones in one set-based merge.
+
+        Rows are staged into a temporary table with ``copy_records_to_table``
+        and merged with ``INSERT ... ON CONFLICT (agent_id) DO UPDATE``. Rows
+        whose content is identical to the stored agent are left untouched, so
+        re-running an index load is idempotent. An incoming row without an
+        embedding keeps the stored embedding (and its ``embedding_hash``), and
+        incoming metadata is merged into the stored metadata.
+
+        Args:
+            agents: List of agent dictionaries. If an agent_id appears more
+                    than once, the last occurrence wins.
+
+        Returns:
+            Dict with "inserted", "updated" and "unchanged" counts
+        """
+        return await self._merge_agents(agents, update_existing=True, operation="bulk_upsert_agents")
+
+    async def _merge_agents(
+        self,
+        agents: list[dict[str, Any]],
+        update_existing: bool,
+        operation: str,
+    ) -> dict[str, int]:
+        """Stage agents with COPY and merge them into the agents table.
+
+        Args:
+            agents: List of agent dictionaries
+            update_existing: Update changed rows on conflict instead of skipping them
+            operation: Name of the write operation (used for cache invalidation)
+
+        Returns:
+            Dict with "inserted", "updated" and "unchanged" counts
+        """
         if self._pool is None:
             raise AgentRegistryError("Registry not initialized. Call initialize() first.")
 
-        inserted = 0
+        if not agents:
+            return {"inserted": 0, "updated": 0, "unchanged": 0}
+
+        records = [
+            (
+                position,
+                agent["agent_id"],
+                agent["agent_type"],
+                agent["name"],
+                agent["display_name"],
+                agent["category"],
+                agent["description"],
+                agent["file_path"],
+                agent.get("capabilities") or [],
+                agent.get("tools") or [],
+                agent.get("keywords") or [],
+                _to_vector(agent.get("embedding")),
+                agent.get("estimated_tokens"),
+                json.dumps(agent.get("metadata") or {}),
+            )
+            for position, agent in enumerate(agents)
+        ]
+        distinct_count = len({agent["agent_id"] for agent in agents})
+
+        if update_existing:
+            on_conflict = """
+                ON CONFLICT (agent_id) DO UPDATE SET
+                    agent_type = EXCLUDED.agent_type,
+                    name = EXCLUDED.name,
+                    display_name = EXCLUDED.display_name,
+                    category = EXCLUDED.category,
+                    description = EXCLUDED.description,
+                    file_path = EXCLUDED.file_path,
+                    capabilities = EXCLUDED.capabilities,
+                    tools = EXCLUDED.tools,
+                    keywords = EXCLUDED.keywords,
+                    embedding = COALESCE(EXCLUDED.embedding, agents.embedding),
+                    estimated_tokens = EXCLUDED.estimated_tokens,
+                    metadata = COALESCE(agents.metadata, '{}'::jsonb) || EXCLUDED.metadata
+                WHERE (
+                    agents.agent_type, agents.name, agents.display_name, agents.category,
+                    agents.description, agents.file_path, agents.capabilities, agents.tools,
+                    agents.keywords, agents.embedding, agents.estimated_tokens, agents.metadata
+                ) IS DISTINCT FROM (
+                    EXCLUDED.agent_type, EXCLUDED.name, EXCLUDED.display_name, EXCLUDED.category,
+                    EXCLUDED.description, EXCLUDED.file_path, EXCLUDED.capabilities, EXCLUDED.tools,
+                    EXCLUDED.keywords, COALESCE(EXCLUDED.embedding, agents.embedding),
+                    EXCLUDED.estimated_tokens, COALESCE(agents.metadata, '{}'::jsonb) || EXCLUDED.metadata
+                )
+            """
+        else:
+            on_conflict = "ON CONFLICT (agent_id) DO NOTHING"
 
-        async with self._pool.acquire() as conn:
-            for i in range(0, len(agents), batch_size):
-                batch = agents[i : i + batch_size]
-
-                async with conn.transaction():
-                    for agent in batch:
-                        try:
-                            # Use direct insert within transaction instead of calling create_agent
-                            # to avoid nested connection acquisition
-                            query = """
-                                INSERT INTO agents (
-                                    agent_id, agent_type, name, display_name, category,
-                                    description, file_path, capabilities, tools, keywords,
-                                    embedding, estimated_tokens, metadata
-                                )
-                                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
-                            """
-                            await conn.execute(
-                                query,
-                                agent["agent_id"],
-                                agent["agent_type"],
-                                agent["name"],
-                                agent["display_name"],
-                                agent["category"],
-                                agent["description"],
-                                agent["file_path"],
-                                agent.get("capabilities", []),
-                                agent.get("tools", []),
-                                agent.get("keywords", []),
-                                agent.get("embedding"),
-                                agent.get("estimated_tokens"),
-                                json.dumps(agent.get("metadata", {})),
-                            )
-                            inserted += 1
-                        except asyncpg.UniqueViolationError:
-                            # Skip duplicates
-                            continue
-
-        return inserted
+        async with self._pool.acquire() as conn, conn.transaction():
+            await conn.execute(
+                """
+                CREATE TEMP TABLE agents_staging (
+                    position INTEGER,
+                    agent_id TEXT,
+                    agent_type TEXT,
+                    name TEXT,
+                    display_name TEXT,
+                    category TEXT,
+                    description TEXT,
+                    file_path TEXT,
+                    capabilities TEXT[],
+                    tools TEXT[],
+                    keywords TEXT[],
+                    embedding TEXT,
+                    estimated_tokens INTEGER,
+                    metadata JSONB
+                ) ON COMMIT DROP
+                """
+            )
+            await conn.copy_records_to_table("agents_staging", records=records)
+
+            # xmax = 0 identifies freshly inserted rows; updated rows carry the updating xid
+            merge_query = f"""
+                INSERT INTO agents (
+                    agent_id, agent_type, name, display_name, category,
+                    description, file_path, capabilities, tools, keywords,
+                    embedding, estimated_tokens, metadata
+                )
+                SELECT DISTINCT ON (agent_id)
+                    agent_id, agent_type, name, display_name, category,
+                    description, file_path, capabilities, tools, keywords,
+                    embedding::vector, estimated_tokens, metadata
+                FROM agents_staging
+                ORDER BY agent_id, position DESC
+                {on_conflict}
+                RETURNING (xmax = 0) AS inserted
+            """  # nosec B608 - on_conflict is a constant clause, values are staged via COPY
+            rows = await conn.fetch(merge_query)
+
+            inserted = sum(1 for row in rows if row["inserted"])
+            updated = len(rows) - inserted
+            if rows:
+                await self._invalidate_cache(conn, operation)
+
+        return {"inserted": inserted, "updated": updated, "unchanged": distinct_count - inserted - updated}
 
     # Utility methods
 
@@ -583,6 +1130,7 @@ class AgentRegistry:
                     "pgvector_installed": pgvector_installed,
                     "agent_count": agent_count,
                     "database_size": db_size,
+                    "cache": self._cache.get_stats() if self._cache is not None else None,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
 
@@ -606,15 +1154,21 @@ class AgentRegistry:
 async def load_agents_from_index(
     index_path: str | Path,
     registry: AgentRegistry,
+    encoder: EmbeddingEncoder | None = None,
 ) -> int:
     """Load agents from index.json file into the registry.
 
+    New agents are inserted and changed agents updated in a single set-based
+    merge, so reloading the same index is idempotent.
+
     Args:
         index_path: Path to the index.json file
         registry: AgentRegistry instance
+        encoder: Optional encoder; when given, embeddings are back-filled for
+                 new or changed agents after loading
 
     Returns:
-        Number of agents loaded
+        Number of agents inserted or updated
     """
     index_path = Path(index_path)
 
@@ -645,4 +1199,9 @@ async def load_agents_from_index(
         }
         agents_data.append(agent_data)
 
-    return await registry.bulk_insert_agents(agents_data)
+    counts = await registry.bulk_upsert_agents(agents_data)
+
+    if encoder is not None:
+        await embed_agents(registry, encoder)
+
+    return counts["inserted"] + counts["updated"]
@@ -195,7 +195,8 @@ class AgentDiscovery:
         try:
             from mycelium_analytics import EventStorage, TelemetryCollector
 
-            storage = EventStorage()
+            # Buffered: discovery calls only queue events, never touch disk
+            storage = EventStorage(buffered=True)
             self.telemetry = TelemetryCollector(storage)
         except Exception:
             # Telemetry unavailable - continue without it
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Benchmark for MetricsAnalyzer report generation over a large event store.
+
+Writes a synthetic store of discovery and agent load events, spread over
+the report window as one closed segment per day, then times
+``get_summary_report`` on a cold store (no segment summaries yet, so every
+event is parsed in one pass) and on a warm one (persisted segment summaries
+are merged), and the four separate ``get_*`` reports on the warm store.
+With ``--compact``, the closed segments are then compacted into columnar
+archives and the cold report is timed again over them. Peak Python memory
+is measured with tracemalloc in a second, untimed run (tracing slows Python
+code down several times over).
+
+Usage:
+    uv run python scripts/benchmark_analytics.py
+    uv run python scripts/benchmark_analytics.py --events 1000000 --days 7
+    uv run python scripts/benchmark_analytics.py --store /tmp/analytics-bench --keep
+    uv run python scripts/benchmark_analytics.py --events 1000000 --compact
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mycelium_analytics import EventStorage, MetricsAnalyzer  # noqa: E402
+from mycelium_analytics.aggregation import SUMMARY_SUFFIX  # noqa: E402
+
+OPERATIONS = ("list_agents", "get_agent", "search")
+
+
+def build_store(storage_dir: Path, events: int, days: int, seed: int = 0) -> None:
+    """Write a synthetic event store with one closed segment per day.
+
+    Args:
+        storage_dir: Directory to write segments into
+        events: Total number of events
+        days: Number of days the events span (ending now)
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    per_day = events // days
+
+    for day in range(days):
+        start = now - timedelta(days=days - day)
+        step = 86400 / per_day
+        path = storage_dir / EventStorage.ROTATED_FILENAME_PATTERN.format(timestamp=start.strftime("%Y%m%d_%H%M%S_%f"))
+        with path.open("w", encoding="utf-8") as f:
+            for i in range(per_day):
+                timestamp = (start + timedelta(seconds=i * step)).isoformat()
+                if i % 50 == 0:
+                    event: dict[str, Any] = {
+                        "timestamp": timestamp,
+                        "event_type": "agent_load",
+                        "agent_id": f"agent-{rng.randrange(119)}",
+                        "estimated_tokens": rng.randrange(300, 600),
+                    }
+                else:
+                    event = {
+                        "timestamp": timestamp,
+                        "event_type": "agent_discovery",
+                        "operation": rng.choice(OPERATIONS),
+                        "duration_ms": round(rng.lognormvariate(1.5, 0.6), 3),
+                        "cache_hit": rng.random() < 0.8,
+                    }
+                f.write(json.dumps(event) + "\n")
+
+
+def measure(label: str, run: Callable[[], Any], reset: Callable[[], None] = lambda: None) -> tuple[float, float]:
+    """Time one run, then record peak traced memory of another.
+
+    Args:
+        label: Label printed with the result
+        run: Function to measure
+        reset: Called before each run
+
+    Returns:
+        (seconds, peak MiB)
+    """
+    reset()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+
+    reset()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    peak_mib = peak / 2**20
+    print(f"{label:<28} {elapsed:>9.2f}s {peak_mib:>9.1f}MiB")
+    return elapsed, peak_mib
+
+
+def main() -> None:
+    """Build the store (unless it exists) and print timings per strategy."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10_000_000, help="Synthetic events (default: 10000000)")
+    parser.add_argument("--days", type=int, default=7, help="Days spanned and reported on (default: 7)")
+    parser.add_argument("--store", type=Path, help="Store directory, reused if it already has segments")
+    parser.add_argument("--keep", action="store_true", help="Keep a temporary store after the run")
+    parser.add_argument("--compact", action="store_true", help="Also time reports over columnar archives")
+    args = parser.parse_args()
+
+    storage_dir = args.store or Path(tempfile.mkdtemp(prefix="mycelium-analytics-bench-"))
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        if not any(storage_dir.glob("events*")):
+            print(f"Writing {args.events} events to {storage_dir} ...")
+            start = time.perf_counter()
+            build_store(storage_dir, args.events, args.days)
+            print(f"  written in {time.perf_counter() - start:.1f}s")
+
+        storage = EventStorage(storage_dir=storage_dir)
+        # Build segment indexes up front so both strategies read the same way
+        stats = storage.get_storage_stats()
+        print(f"Store: {stats['total_events']} events, {stats['total_size_bytes'] / 2**20:.0f} MiB\n")
+
+        analyzer = MetricsAnalyzer(storage)
+        days = args.days + 1
+
+        def separate() -> None:
+            analyzer.get_discovery_stats(days)
+            analyzer.get_token_savings(days)
+            analyzer.get_cache_performance(days)
+            analyzer.get_performance_trends(days)
+
+        def drop_summaries() -> None:
+            for sidecar in storage_dir.glob(f"events*{SUMMARY_SUFFIX}"):
+                sidecar.unlink()
+
+        def summary() -> None:
+            analyzer.get_summary_report(days)
+
+        print(f"{'strategy':<28} {'time':>10} {'peak':>12}")
+        cold_time, _ = measure("get_summary_report, cold", summary, drop_summaries)
+        warm_time, _ = measure("get_summary_report, warm", summary)
+        measure("four separate reports, warm", separate)
+        print(f"\npersisted summaries speedup: {cold_time / warm_time:.0f}x")
+
+        if args.compact:
+            start = time.perf_counter()
+            result = storage.compact_segments()
+            print(
+                f"\nCompacted {result['segments_compacted']} segments in {time.perf_counter() - start:.1f}s: "
+                f"{result['bytes_before'] / 2**20:.0f} MiB -> {result['bytes_after'] / 2**20:.1f} MiB\n"
+            )
+            archive_time, _ = measure("get_summary_report, archived", summary, drop_summaries)
+            print(f"\narchive speedup over cold JSONL: {cold_time / archive_time:.0f}x")
+    finally:
+        if args.store is None and not args.keep:
+            shutil.rmtree(storage_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the Discovery API middleware stack.
+
+Drives a minimal FastAPI app through an in-process ASGI transport (no
+sockets, no database) so the numbers isolate per-request middleware
+overhead: rate limiting, request validation and performance timing, in
+the same order as ``api.discovery.create_app``.
+
+Usage:
+    uv run python scripts/benchmark_discovery_middleware.py
+    uv run python scripts/benchmark_discovery_middleware.py --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "plugins" / "mycelium-core"))
+
+from api.middleware import (  # noqa: E402
+    PerformanceMonitoringMiddleware,
+    RateLimitMiddleware,
+    RequestValidationMiddleware,
+)
+
+
+def build_app(with_middleware: bool) -> FastAPI:
+    """Build a benchmark app with a trivial JSON endpoint.
+
+    Args:
+        with_middleware: Whether to install the Discovery API middleware stack
+
+    Returns:
+        FastAPI application
+    """
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    if with_middleware:
+        app.add_middleware(PerformanceMonitoringMiddleware)
+        app.add_middleware(RequestValidationMiddleware)
+        # Limit high enough that every request is admitted
+        app.add_middleware(RateLimitMiddleware, requests_per_minute=10**9, burst_size=10**9)
+
+    return app
+
+
+async def measure(app: FastAPI, total: int, concurrency: int) -> float:
+    """Send ``total`` GET requests with ``concurrency`` workers.
+
+    Args:
+        app: Application under test
+        total: Number of requests
+        concurrency: Number of concurrent client tasks
+
+    Returns:
+        Requests per second
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        remaining = total
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get("/ping")
+                response.raise_for_status()
+
+        # Warm-up
+        for _ in range(100):
+            await client.get("/ping")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return total / elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print requests/sec with and without middleware."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10000, help="Requests per run (default: 10000)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients (default: 20)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per configuration, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    results = {}
+    for label, with_middleware in (("no middleware", False), ("middleware stack", True)):
+        app = build_app(with_middleware)
+        results[label] = max(asyncio.run(measure(app, args.requests, args.concurrency)) for _ in range(args.runs))
+
+    baseline = results["no middleware"]
+    print(f"{'configuration':<20} {'req/s':>10} {'overhead':>10}")
+    for label, rps in results.items():
+        overhead_us = (1 / rps - 1 / baseline) * 1e6
+        print(f"{label:<20} {rps:>10.0f} {overhead_us:>8.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -90,11 +90,12 @@ def generate_health_report(days: int = 7) -> str:
     storage = EventStorage()
     analyzer = MetricsAnalyzer(storage)
 
-    # Get metrics
-    discovery = analyzer.get_discovery_stats(days)
-    tokens = analyzer.get_token_savings(days)
-    cache = analyzer.get_cache_performance(days)
-    trends = analyzer.get_performance_trends(days)
+    # Get metrics (one pass over the event store)
+    summary = analyzer.get_summary_report(days)
+    discovery = summary["discovery_stats"]
+    tokens = summary["token_savings"]
+    cache = summary["cache_performance"]
+    trends = summary["trends"]
     storage_stats = storage.get_storage_stats()
 
     # Build report
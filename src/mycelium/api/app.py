@@ -5,6 +5,8 @@ Includes rate limiting and security configurations.
 """
 
 from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -22,7 +24,7 @@ from mycelium.api.models import (
     HealthResponse,
 )
 from mycelium.errors import MyceliumError
-from mycelium.registry.client import RegistryClient
+from mycelium.registry.client import AsyncRegistryClient
 
 # Rate limiter configuration
 limiter = Limiter(key_func=get_remote_address, default_limits=["100/second"])
@@ -37,6 +39,15 @@ def create_app(redis_url: str = "redis://localhost:6379") -> FastAPI:
     Returns:
         Configured FastAPI application
     """
+    # Initialize registry client (pooled, non-blocking)
+    registry = AsyncRegistryClient(redis_url=redis_url)
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        """Close the registry connection pool on shutdown."""
+        yield
+        await registry.close()
+
     app = FastAPI(
         title="Mycelium API",
         description="RESTful API for Mycelium multi-agent orchestration platform",
@@ -44,6 +55,7 @@ def create_app(redis_url: str = "redis://localhost:6379") -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
 
     # Add rate limiting state
@@ -66,9 +78,6 @@ def create_app(redis_url: str = "redis://localhost:6379") -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Initialize registry client
-    registry = RegistryClient(redis_url=redis_url)
-
     # Custom exception handler for MyceliumError
     @app.exception_handler(MyceliumError)
     async def mycelium_error_handler(request: Request, exc: MyceliumError) -> JSONResponse:
@@ -97,10 +106,10 @@ def create_app(redis_url: str = "redis://localhost:6379") -> FastAPI:
             Health status including registry connection and agent counts
         """
         try:
-            is_healthy = registry.health_check()
+            is_healthy = await registry.health_check()
 
             if is_healthy:
-                stats = registry.get_stats()
+                stats = await registry.get_stats()
                 return HealthResponse(
                     status="healthy",
                     registry_connected=True,
@@ -140,7 +149,7 @@ def create_app(redis_url: str = "redis://localhost:6379") -> FastAPI:
             HTTPException: If registry is unavailable
         """
         try:
-            agents = registry.list_agents(category=category)
+            agents = await registry.list_agents(category=category)
             agent_responses = [
                 AgentResponse(
                     name=agent.name,
@@ -195,7 +204,7 @@ def create_app(redis_url: str = "redis://localhost:6379") -> FastAPI:
             HTTPException: If agent not found or registry unavailable
         """
         try:
-            agent = registry.get_agent(name)
+            agent = await registry.get_agent(name)
 
             if not agent:
                 raise HTTPException(
@@ -243,7 +252,7 @@ def create_app(redis_url: str = "redis://localhost:6379") -> FastAPI:
             HTTPException: If registry is unavailable
         """
         try:
-            agents = registry.list_agents()
+            agents = await registry.list_agents()
 
             # Count agents per category
             category_counts: dict[str, int] = defaultdict(int)
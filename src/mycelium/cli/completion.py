@@ -7,7 +7,19 @@ Uses Click's built-in shell completion framework.
 
 import click
 
-from mycelium.registry.client import RegistryClient
+from mycelium.registry.client import AgentInfo, RegistryClient
+
+
+def _fetch_agents() -> list[AgentInfo]:
+    """Fetch all registered agents in a single pipelined registry round trip.
+
+    Completion runs once per keypress in a fresh process, so this stays on the
+    synchronous client without an event loop, pool, or connection PING.
+
+    Returns:
+        List of registered agents
+    """
+    return RegistryClient(verify_connection=False).list_agents()
 
 
 def complete_agent_names(
@@ -26,8 +38,7 @@ def complete_agent_names(
         List of matching agent names
     """
     try:
-        registry = RegistryClient()
-        agents = registry.list_agents()
+        agents = _fetch_agents()
         agent_names = [agent.name for agent in agents]
         return [name for name in agent_names if name.startswith(incomplete)]
     except Exception:
@@ -51,8 +62,7 @@ def complete_running_agent_names(
         List of matching running agent names
     """
     try:
-        registry = RegistryClient()
-        agents = registry.list_agents()
+        agents = _fetch_agents()
         # Filter for running agents (healthy status)
         running_names = [
             agent.name for agent in agents
@@ -79,8 +89,7 @@ def complete_categories(
         List of matching category names
     """
     try:
-        registry = RegistryClient()
-        agents = registry.list_agents()
+        agents = _fetch_agents()
         # Get unique categories
         categories = list({agent.category for agent in agents})
         return [cat for cat in categories if cat.startswith(incomplete)]
@@ -4,13 +4,14 @@ Manages agent discovery, registration, and heartbeat tracking.
 Uses Redis for coordination per user instructions.
 """
 
-import json
-from typing import Optional
+import asyncio
+from typing import Optional, cast
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 
 try:
     import redis
+    import redis.asyncio as aioredis
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
@@ -18,6 +19,31 @@ except ImportError:
 from mycelium.errors import RegistryError
 
 
+AGENT_KEY_PREFIX = "mycelium:agents:"
+AGENT_NAMES_KEY = "mycelium:agent_names"
+
+
+def _decode_hash(data: dict[str, str]) -> dict[str, str | int | None]:
+    """Convert a raw agent hash from Redis to AgentInfo field values.
+
+    Empty strings become None and numeric pid/port become ints.
+    """
+    result: dict[str, str | int | None] = {}
+    for k, v in data.items():
+        if v == "":
+            result[k] = None
+        elif k in ("pid", "port") and v.isdigit():
+            result[k] = int(v)
+        else:
+            result[k] = v
+    return result
+
+
+def _encode_hash(data: dict[str, str | int | None]) -> dict[str, str | int]:
+    """Convert None values to empty strings for storage in a Redis hash."""
+    return {k: ("" if v is None else v) for k, v in data.items()}
+
+
 @dataclass
 class AgentInfo:
     """Agent registration information."""
@@ -63,13 +89,16 @@ class RegistryClient:
     - Agent list: mycelium:agent_names (set of agent names)
     """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(self, redis_url: str = "redis://localhost:6379", verify_connection: bool = True):
         """Initialize registry client.
 
         Args:
             redis_url: Redis connection URL
+            verify_connection: PING Redis when connecting. Short-lived callers
+                such as shell completion skip it and let the first command fail.
         """
         self.redis_url = redis_url
+        self.verify_connection = verify_connection
         self._redis_client: Optional["redis.Redis[str]"] = None
         self._connected = False
 
@@ -91,7 +120,8 @@ class RegistryClient:
                 decode_responses=True,
             )
             # Test connection
-            self._redis_client.ping()
+            if self.verify_connection:
+                self._redis_client.ping()
             self._connected = True
         except Exception as e:
             raise RegistryError(
@@ -206,14 +236,22 @@ class RegistryClient:
         # Get all agent names from set
         # agent_names = mcp__RedisMCPServer__smembers("mycelium:agent_names")
         agent_names = self._redis_get_set_members("mycelium:agent_names")
+        if not agent_names or not self._redis_client:
+            return []
 
-        agents = []
+        # Fetch every agent hash in one pipelined round trip instead of one per agent
+        pipe = self._redis_client.pipeline(transaction=False)
         for name in agent_names:
-            agent = self.get_agent(name)
-            if agent:
-                # Filter by category if specified
-                if category is None or agent.category == category:
-                    agents.append(agent)
+            pipe.hgetall(f"{AGENT_KEY_PREFIX}{name}")
+
+        agents = []
+        for data in pipe.execute():
+            if not data or not data.get("name"):
+                continue
+            agent = AgentInfo.from_dict(_decode_hash(data))
+            # Filter by category if specified
+            if category is None or agent.category == category:
+                agents.append(agent)
 
         return agents
 
@@ -272,10 +310,7 @@ class RegistryClient:
         if not self._redis_client:
             return
         # Convert None values to empty strings for Redis
-        clean_data: dict[str, str | int] = {
-            k: ("" if v is None else v) for k, v in data.items()
-        }
-        self._redis_client.hset(key, mapping=clean_data)
+        self._redis_client.hset(key, mapping=_encode_hash(data))
 
     def _redis_update_field(self, key: str, field: str, value: str) -> None:
         """Update single field in Redis hash."""
@@ -288,17 +323,8 @@ class RegistryClient:
         self._ensure_connection()
         if not self._redis_client:
             return {}
-        data = self._redis_client.hgetall(key)
         # Convert empty strings back to None for optional fields
-        result: dict[str, str | int | None] = {}
-        for k, v in data.items():
-            if v == "":
-                result[k] = None
-            elif k in ("pid", "port") and v.isdigit():
-                result[k] = int(v)
-            else:
-                result[k] = v
-        return result
+        return _decode_hash(self._redis_client.hgetall(key))
 
     def _redis_add_to_set(self, key: str, value: str) -> None:
         """Add to Redis set."""
@@ -324,3 +350,223 @@ class RegistryClient:
         if not self._redis_client:
             return
         self._redis_client.delete(key)
+
+
+class AsyncRegistryClient:
+    """Asynchronous client for the agent registry.
+
+    Same storage schema and semantics as RegistryClient, on redis.asyncio
+    with a shared connection pool so it can be used from async code (e.g.
+    FastAPI handlers) without blocking the event loop. Listing fetches all
+    agent hashes in one pipelined round trip.
+
+    Example:
+        >>> registry = AsyncRegistryClient()
+        >>> agents = await registry.list_agents(category="backend")
+        >>> await registry.close()
+    """
+
+    def __init__(self, redis_url: str = "redis://localhost:6379", max_connections: int = 10):
+        """Initialize registry client.
+
+        Args:
+            redis_url: Redis connection URL
+            max_connections: Maximum connections in the pool
+        """
+        self.redis_url = redis_url
+        self.max_connections = max_connections
+        self._redis_client: aioredis.Redis | None = None
+        self._connect_lock = asyncio.Lock()
+
+    async def _ensure_connection(self) -> "aioredis.Redis":
+        """Ensure the pooled Redis connection is established.
+
+        Returns:
+            Connected Redis client
+        """
+        if self._redis_client is None:
+            async with self._connect_lock:
+                if self._redis_client is None:
+                    self._redis_client = await self._connect()
+        return self._redis_client
+
+    async def _connect(self) -> "aioredis.Redis":
+        """Create the connection pool and verify Redis is reachable."""
+        if not REDIS_AVAILABLE:
+            raise RegistryError(
+                "Redis library not available",
+                suggestion="Install redis: uv add redis",
+                docs_url="https://docs.mycelium.dev/setup/redis",
+            )
+
+        client = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool.from_url(
+                self.redis_url,
+                decode_responses=True,
+                max_connections=self.max_connections,
+            )
+        )
+        try:
+            await client.ping()
+        except Exception as e:
+            await client.aclose(close_connection_pool=True)
+            raise RegistryError(
+                "Failed to connect to agent registry",
+                suggestion="Ensure Redis is running: redis-cli ping",
+                docs_url="https://docs.mycelium.dev/setup/redis",
+                debug_info={"redis_url": self.redis_url, "error": str(e)},
+            ) from e
+        return client
+
+    async def close(self) -> None:
+        """Close the client and its connection pool."""
+        if self._redis_client is not None:
+            await self._redis_client.aclose(close_connection_pool=True)
+            self._redis_client = None
+
+    async def register_agent(
+        self,
+        name: str,
+        category: str,
+        pid: int | None = None,
+        port: int | None = None,
+        description: str | None = None,
+    ) -> AgentInfo:
+        """Register an agent in the registry.
+
+        Args:
+            name: Agent name
+            category: Agent category
+            pid: Process ID
+            port: Port number
+            description: Agent description
+
+        Returns:
+            Registered agent info
+        """
+        client = await self._ensure_connection()
+
+        agent = AgentInfo(
+            name=name,
+            category=category,
+            status="starting",
+            pid=pid,
+            port=port,
+            description=description,
+            started_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(f"{AGENT_KEY_PREFIX}{name}", mapping=_encode_hash(agent.to_dict()))
+            pipe.sadd(AGENT_NAMES_KEY, name)
+            await pipe.execute()
+
+        return agent
+
+    async def update_heartbeat(self, name: str) -> None:
+        """Update agent heartbeat timestamp.
+
+        Args:
+            name: Agent name
+        """
+        client = await self._ensure_connection()
+        timestamp = datetime.now(timezone.utc).isoformat()
+        await client.hset(f"{AGENT_KEY_PREFIX}{name}", "last_heartbeat", timestamp)
+
+    async def get_agent(self, name: str) -> AgentInfo | None:
+        """Get agent information.
+
+        Args:
+            name: Agent name
+
+        Returns:
+            Agent info or None if not found
+        """
+        client = await self._ensure_connection()
+        data = cast(dict[str, str], await client.hgetall(f"{AGENT_KEY_PREFIX}{name}"))
+
+        if not data or not data.get("name"):
+            return None
+
+        return AgentInfo.from_dict(_decode_hash(data))
+
+    async def list_agents(self, category: str | None = None) -> list[AgentInfo]:
+        """List registered agents.
+
+        Args:
+            category: Optional category filter
+
+        Returns:
+            List of agent info
+        """
+        client = await self._ensure_connection()
+
+        agent_names = cast(set[str], await client.smembers(AGENT_NAMES_KEY))
+        if not agent_names:
+            return []
+
+        async with client.pipeline(transaction=False) as pipe:
+            for name in agent_names:
+                pipe.hgetall(f"{AGENT_KEY_PREFIX}{name}")
+            rows = await pipe.execute()
+
+        agents = []
+        for data in rows:
+            if not data or not data.get("name"):
+                continue
+            agent = AgentInfo.from_dict(_decode_hash(data))
+            if category is None or agent.category == category:
+                agents.append(agent)
+
+        return agents
+
+    async def unregister_agent(self, name: str) -> None:
+        """Unregister an agent.
+
+        Args:
+            name: Agent name
+        """
+        client = await self._ensure_connection()
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(f"{AGENT_KEY_PREFIX}{name}")
+            pipe.srem(AGENT_NAMES_KEY, name)
+            await pipe.execute()
+
+    async def health_check(self) -> bool:
+        """Check if registry is healthy.
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        try:
+            client = await self._ensure_connection()
+            return bool(await client.ping())
+        except Exception:
+            return False
+
+    async def get_stats(self) -> dict[str, int]:
+        """Get registry statistics.
+
+        Only each agent's status field is fetched (pipelined), not the full
+        agent hashes.
+
+        Returns:
+            Statistics dictionary
+        """
+        client = await self._ensure_connection()
+
+        agent_names = cast(set[str], await client.smembers(AGENT_NAMES_KEY))
+        if not agent_names:
+            return {"agent_count": 0, "active_count": 0}
+
+        async with client.pipeline(transaction=False) as pipe:
+            for name in agent_names:
+                pipe.hget(f"{AGENT_KEY_PREFIX}{name}", "status")
+            statuses = await pipe.execute()
+
+        registered = [status for status in statuses if status is not None]
+        return {
+            "agent_count": len(registered),
+            "active_count": sum(1 for status in registered if status == "healthy"),
+        }
@@ -14,6 +14,23 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "plugins" / "myceli
 
 from registry import AgentRegistry
 
+PLUGIN_DIR = sys.path[0]
+
+
+def pytest_collectstart(collector: pytest.Collector) -> None:
+    """Drop a cached tests/coordination package before each module is imported.
+
+    tests/coordination shares its name with the plugin's coordination
+    package; modules that import the plugin put PLUGIN_DIR first on sys.path
+    themselves, since pytest puts tests/ ahead of it for this package.
+    """
+    if not isinstance(collector, pytest.Module):
+        return
+    module = sys.modules.get("coordination")
+    if module is not None and not str(getattr(module, "__file__", "")).startswith(PLUGIN_DIR):
+        for name in [name for name in sys.modules if name == "coordination" or name.startswith("coordination.")]:
+            del sys.modules[name]
+
 
 @pytest.fixture(scope="session")
 def database_url():
@@ -276,5 +276,51 @@ def test_postgresql_migration(postgres_alembic_config, postgres_test_url):
             assert has_agents, "agents table should exist with vector support"
 
 
+@pytest.mark.skipif(not os.getenv("DATABASE_URL"), reason="PostgreSQL database URL not configured")
+def test_postgresql_coordination_events_partitioned(postgres_alembic_config, postgres_test_url):
+    """Test coordination_events is range-partitioned by month with hourly rollups."""
+    command.upgrade(postgres_alembic_config, "heads")
+
+    engine = create_engine(postgres_test_url)
+    with engine.begin() as conn:
+        partitioned = conn.execute(
+            text("SELECT COUNT(*) FROM pg_partitioned_table WHERE partrelid = 'coordination_events'::regclass")
+        ).scalar()
+        assert partitioned == 1
+
+        conn.execute(
+            text("""
+                INSERT INTO coordination_events (event_id, event_type, workflow_id, timestamp, agent_type, duration_ms)
+                VALUES
+                    ('e1', 'task_completed', 'wf', NOW() AT TIME ZONE 'UTC', 'coder', 3),
+                    ('e2', 'task_completed', 'wf', NOW() AT TIME ZONE 'UTC', 'coder', 120),
+                    ('e3', 'failure', 'wf', NOW() AT TIME ZONE 'UTC', NULL, NULL)
+            """)
+        )
+        partition = conn.execute(text("SELECT DISTINCT tableoid::regclass::text FROM coordination_events")).scalar()
+        assert partition != "coordination_events_default"
+
+        rollups = {
+            row.event_type: row
+            for row in conn.execute(text("SELECT * FROM coordination_event_rollups WHERE agent_type IN ('coder', '')"))
+        }
+        assert rollups["task_completed"].event_count == 2
+        assert rollups["task_completed"].duration_sum == 123
+        assert sum(rollups["task_completed"].duration_histogram) == 2
+        assert rollups["failure"].event_count == 1
+        assert sum(rollups["failure"].duration_histogram) == 0
+
+        conn.execute(text("DELETE FROM coordination_events WHERE event_id = 'e2'"))
+        count = conn.execute(
+            text("SELECT event_count FROM coordination_event_rollups WHERE event_type = 'task_completed'")
+        ).scalar()
+        assert count == 1
+
+        # Retention keeps the current month; rollups outlive dropped partitions
+        actions = conn.execute(text("SELECT action FROM maintain_coordination_event_partitions(0, 3)")).scalars().all()
+        assert "dropped" not in actions
+        assert conn.execute(text("SELECT COUNT(*) FROM coordination_events")).scalar() == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
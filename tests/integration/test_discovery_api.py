@@ -4,14 +4,24 @@ These tests validate the complete Discovery API functionality including
 all endpoints, error handling, and integration with the agent registry.
 """
 
+import json
 import os
+import sys
 from collections.abc import Generator
 from contextlib import suppress
+from pathlib import Path
+from typing import Any
 
 import pytest
-from api.discovery import create_app
+from api.discovery import create_app, set_tracker
 from fastapi.testclient import TestClient
-from registry import AgentRegistry
+from registry import REGISTRY_NOTIFY_CHANNEL, AgentRegistry
+
+# tests/ precedes the plugin on sys.path here, and tests/coordination shadows its coordination package
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "plugins" / "mycelium-core"))
+
+from coordination import notifications  # noqa: E402
+from coordination import tracker as tracking  # noqa: E402
 
 
 @pytest.fixture(scope="module")
@@ -72,7 +82,7 @@ def client(test_database_url: str, check_postgres_connection: None) -> Generator
 
     try:
         # Create app - TestClient will handle lifespan
-        test_app = create_app(rate_limit=10000, enable_cors=True)  # Very high limit for testing
+        test_app = create_app(rate_limit=10000, burst_size=10000, enable_cors=True)  # Very high limit for testing
 
         # Use TestClient as context manager to properly handle lifespan
         with TestClient(test_app) as test_client:
@@ -373,6 +383,52 @@ class TestDiscoverEndpoint:
             assert confidences == sorted(confidences, reverse=True)
 
 
+class TestBatchDiscoverEndpoint:
+    """Tests for batch agent discovery endpoint."""
+
+    def test_batch_returns_results_per_query(self, client: TestClient):
+        """Test batch discovery returns one result per query, in order."""
+        queries = ["backend development", "frontend react", "security"]
+
+        response = client.post(
+            "/api/v1/agents/discover:batch",
+            json={"queries": queries, "limit": 5, "threshold": 0.0},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [result["query"] for result in data["results"]] == queries
+        for result in data["results"]:
+            assert len(result["matches"]) <= 5
+            assert result["total_count"] == len(result["matches"])
+
+    def test_batch_matches_single_query_results(self, client: TestClient):
+        """Test batch results are ranked like the single-query endpoint."""
+        request = {"query": "backend development", "limit": 5, "threshold": 0.3}
+
+        single = client.post("/api/v1/agents/discover", json=request).json()
+        batch = client.post(
+            "/api/v1/agents/discover:batch",
+            json={"queries": [request["query"]], "limit": 5, "threshold": 0.3},
+        ).json()
+
+        single_ids = [m["agent"]["agent_id"] for m in single["matches"]]
+        batch_ids = [m["agent"]["agent_id"] for m in batch["results"][0]["matches"]]
+        assert batch_ids == single_ids
+
+    def test_batch_with_empty_query_fails(self, client: TestClient):
+        """Test batch discovery rejects blank queries."""
+        response = client.post("/api/v1/agents/discover:batch", json={"queries": ["backend", "  "]})
+
+        assert response.status_code == 422
+
+    def test_batch_with_no_queries_fails(self, client: TestClient):
+        """Test batch discovery requires at least one query."""
+        response = client.post("/api/v1/agents/discover:batch", json={"queries": []})
+
+        assert response.status_code == 422
+
+
 class TestAgentDetailEndpoint:
     """Tests for agent detail endpoint."""
 
@@ -420,6 +476,13 @@ class TestAgentDetailEndpoint:
         assert "agent" in data
         assert "metadata" in data
 
+    def test_get_agent_omits_embedding_hash(self, client: TestClient):
+        """Test the embedding pipeline's content hash stays out of agent metadata."""
+        response = client.get("/api/v1/agents/test-backend-developer")
+
+        assert response.status_code == 200
+        assert "embedding_hash" not in (response.json()["metadata"] or {})
+
     def test_get_agent_includes_performance_metrics(self, client: TestClient):
         """Test agent details include performance metrics."""
         response = client.get("/api/v1/agents/test-backend-developer")
@@ -434,6 +497,299 @@ class TestAgentDetailEndpoint:
         assert "usage_count" in agent
 
 
+class TestCategoriesEndpoint:
+    """Tests for category listing endpoint."""
+
+    def test_list_categories(self, client: TestClient):
+        """Test categories are listed with agent counts."""
+        response = client.get("/api/v1/categories")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        names = [category["name"] for category in data["categories"]]
+        assert names == sorted(names)
+        assert {"Development", "Security"} <= set(names)
+        assert data["total_count"] == len(names)
+        assert all(category["agent_count"] >= 1 for category in data["categories"])
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match handling on cacheable endpoints."""
+
+    @pytest.mark.parametrize("path", ["/api/v1/agents/test-backend-developer", "/api/v1/categories"])
+    def test_etag_and_cache_control(self, client: TestClient, path: str):
+        """Test cacheable responses carry an ETag and Cache-Control."""
+        response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"catalog-')
+        assert "max-age=" in response.headers["Cache-Control"]
+
+    @pytest.mark.parametrize("path", ["/api/v1/agents/test-backend-developer", "/api/v1/categories"])
+    def test_if_none_match_returns_304(self, client: TestClient, path: str):
+        """Test a current ETag yields 304 with no body."""
+        etag = client.get(path).headers["ETag"]
+
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_stale_etag_returns_body(self, client: TestClient):
+        """Test a non-matching ETag yields the full response."""
+        response = client.get("/api/v1/agents/security-expert", headers={"If-None-Match": 'W/"catalog-0"'})
+
+        assert response.status_code == 200
+        assert response.json()["agent"]["agent_type"] == "security-expert"
+
+    def test_repeat_lookups_served_from_response_cache(self, client: TestClient):
+        """Test repeat detail lookups are served from the serialized-response cache."""
+        first = client.get("/api/v1/agents/test-security-expert")
+        hits_before = client.app.state.response_cache.get_stats()["hits"]
+        second = client.get("/api/v1/agents/test-security-expert")
+
+        assert first.content == second.content
+        assert client.app.state.response_cache.get_stats()["hits"] == hits_before + 1
+
+    def test_write_changes_etag(self, client: TestClient, test_database_url: str):
+        """Test a registry write from another process invalidates the ETag."""
+        import asyncio
+        import time
+
+        etag = client.get("/api/v1/agents/test-backend-developer").headers["ETag"]
+
+        async def touch_agent() -> None:
+            reg = AgentRegistry(connection_string=test_database_url, notify_channel=REGISTRY_NOTIFY_CHANNEL)
+            await reg.initialize()
+            try:
+                await reg.update_agent("test-backend-developer", usage_count=7)
+            finally:
+                await reg.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(touch_agent())
+        finally:
+            loop.close()
+
+        # The NOTIFY is delivered to the app's listener asynchronously
+        deadline = time.monotonic() + 5.0
+        response = client.get("/api/v1/agents/test-backend-developer", headers={"If-None-Match": etag})
+        while response.status_code == 304 and time.monotonic() < deadline:
+            time.sleep(0.05)
+            response = client.get("/api/v1/agents/test-backend-developer", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["agent"]["usage_count"] == 7
+
+    def test_direct_write_changes_etag_immediately(self, client: TestClient, test_database_url: str):
+        """Test a write bypassing the registry changes the ETag and the body without waiting for a cache TTL."""
+        import asyncio
+
+        import asyncpg
+
+        path = "/api/v1/agents/test-python-pro"
+        before = client.get(path)
+        etag = before.headers["ETag"]
+        usage_count = before.json()["agent"]["usage_count"]
+
+        async def touch_agent() -> None:
+            conn = await asyncpg.connect(test_database_url)
+            try:
+                await conn.execute("UPDATE agents SET usage_count = usage_count + 1 WHERE agent_id = 'test-python-pro'")
+            finally:
+                await conn.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(touch_agent())
+        finally:
+            loop.close()
+
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["agent"]["usage_count"] == usage_count + 1
+
+    @pytest.mark.parametrize("if_none_match", ["*", "current"])
+    def test_missing_agent_is_404_before_304(self, client: TestClient, if_none_match: str):
+        """Test a conditional GET for an unknown agent is a 404, not a 304."""
+        if if_none_match == "current":
+            if_none_match = client.get("/api/v1/categories").headers["ETag"]
+
+        response = client.get("/api/v1/agents/nonexistent-agent-xyz", headers={"If-None-Match": if_none_match})
+
+        assert response.status_code == 404
+
+
+class TestWorkflowEventEndpoints:
+    """Tests for the workflow summary and event streaming endpoints."""
+
+    @pytest.fixture
+    def tracker(self) -> Generator[Any, None, None]:
+        """Inject an in-memory tracker holding one small workflow."""
+        import asyncio
+
+        tracker = tracking.CoordinationTracker()
+
+        events = [
+            tracking.CoordinationEvent(
+                event_type=tracking.EventType.EXECUTION_START,
+                workflow_id="wf-stream",
+                task_id="task-1",
+                agent_id="agent-a",
+                timestamp="2026-10-16T09:00:00Z",
+            ),
+            tracking.CoordinationEvent(
+                event_type=tracking.EventType.HANDOFF,
+                workflow_id="wf-stream",
+                source_agent=tracking.AgentInfo(agent_id="agent-a", agent_type="planner"),
+                target_agent=tracking.AgentInfo(agent_id="agent-b", agent_type="coder"),
+                timestamp="2026-10-16T09:00:01Z",
+            ),
+            tracking.CoordinationEvent(
+                event_type=tracking.EventType.FAILURE,
+                workflow_id="wf-stream",
+                task_id="task-2",
+                agent_id="agent-b",
+                timestamp="2026-10-16T09:00:02.500000Z",
+            ),
+        ]
+        for event in events:
+            asyncio.run(tracker.track_event(event))
+
+        set_tracker(tracker)
+        yield tracker
+        set_tracker(None)
+
+    def test_workflow_summary(self, client: TestClient, tracker: Any):
+        """Test the summary endpoint aggregates without returning events."""
+        response = client.get("/api/v1/workflows/wf-stream/summary")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_events"] == 3
+        assert data["handoff_count"] == 1
+        assert data["failure_count"] == 1
+        assert data["unique_agents"] == 2
+        assert data["unique_tasks"] == 2
+        assert data["duration_ms"] == 2500
+        assert "events" not in data
+
+    def test_stream_events_ndjson(self, client: TestClient, tracker: Any):
+        """Test events stream as NDJSON in timestamp order."""
+        response = client.get("/api/v1/workflows/wf-stream/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["event_type"] for e in events] == ["execution_start", "handoff", "failure"]
+
+    def test_stream_events_since(self, client: TestClient, tracker: Any):
+        """Test the since cursor resumes after the given timestamp."""
+        response = client.get("/api/v1/workflows/wf-stream/events", params={"since": "2026-10-16T09:00:01Z"})
+
+        assert response.status_code == 200
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["event_type"] for e in events] == ["failure"]
+
+    def test_stream_events_sse(self, client: TestClient, tracker: Any):
+        """Test SSE framing and Last-Event-ID resumption."""
+        response = client.get(
+            "/api/v1/workflows/wf-stream/events",
+            headers={"Accept": "text/event-stream", "Last-Event-ID": "2026-10-16T09:00:00Z"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        assert len(frames) == 2
+        event_id, event_type, data = frames[0].splitlines()
+        assert event_id == f"id: 2026-10-16T09:00:01Z,{json.loads(data.removeprefix('data: '))['event_id']}"
+        assert event_type == "event: handoff"
+
+    def test_stream_events_resume_at_shared_timestamp(self, client: TestClient, tracker: Any):
+        """Test Last-Event-ID resumes between events that share a timestamp."""
+        import asyncio
+
+        asyncio.run(
+            tracker.track_event(
+                tracking.CoordinationEvent(
+                    event_type=tracking.EventType.EXECUTION_END,
+                    workflow_id="wf-stream",
+                    task_id="task-1",
+                    timestamp="2026-10-16T09:00:01Z",
+                )
+            )
+        )
+        headers = {"Accept": "text/event-stream"}
+        ids = [
+            frame.splitlines()[0].removeprefix("id: ")
+            for frame in client.get("/api/v1/workflows/wf-stream/events", headers=headers).text.split("\n\n")
+            if frame
+        ]
+        assert len(ids) == 4
+
+        response = client.get("/api/v1/workflows/wf-stream/events", headers={**headers, "Last-Event-ID": ids[1]})
+
+        resumed = [frame.splitlines()[0].removeprefix("id: ") for frame in response.text.split("\n\n") if frame]
+        assert resumed == ids[2:]
+
+    def test_stream_events_invalid_since(self, client: TestClient, tracker: Any):
+        """Test a malformed since cursor is rejected before streaming."""
+        response = client.get("/api/v1/workflows/wf-stream/events", params={"since": "yesterday"})
+
+        assert response.status_code == 400
+
+    def test_tracking_disabled(self, client: TestClient):
+        """Test workflow endpoints report 503 without a tracker."""
+        response = client.get("/api/v1/workflows/wf-stream/summary")
+
+        assert response.status_code == 503
+
+    def test_live_notifications(self, client: TestClient, tracker: Any, monkeypatch: pytest.MonkeyPatch):
+        """Test the live endpoint relays notifications until the workflow is deleted."""
+        import asyncio
+
+        notifier = tracker.notifier = notifications.WorkflowNotifier()
+        monkeypatch.setattr("api.discovery.LIVE_HEARTBEAT_SECONDS", 0.05)
+
+        async def publish_when_subscribed() -> None:
+            while not notifier.get_stats()["subscriptions"]:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.1)
+            await notifier.publish("wf-stream", "state", status="running", version=2)
+            await notifier.publish("wf-stream", "deleted")
+
+        client.portal.start_task_soon(publish_when_subscribed)
+        response = client.get("/api/v1/workflows/wf-stream/live")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = [frame for frame in response.text.split("\n\n") if frame]
+        assert frames[0] == ": keep-alive"
+        event, data = frames[-2].split("\n")
+        assert event == "event: state"
+        assert json.loads(data.removeprefix("data: ")) == {
+            "workflow_id": "wf-stream",
+            "kind": "state",
+            "status": "running",
+            "version": 2,
+        }
+        assert frames[-1].startswith("event: deleted\n")
+        assert notifier.get_stats()["subscriptions"] == 0
+
+    def test_live_requires_notifier(self, client: TestClient, tracker: Any):
+        """Test the live endpoint reports 503 when the tracker has no notifier."""
+        response = client.get("/api/v1/workflows/wf-stream/live")
+
+        assert response.status_code == 503
+
+
 class TestSearchEndpoint:
     """Tests for agent search endpoint."""
 
@@ -523,6 +879,67 @@ class TestSearchEndpoint:
         for agent in data["agents"]:
             assert agent["category"] == "Development"
 
+    def test_search_total_count_is_not_page_size(self, client: TestClient):
+        """Test total_count reports all matches, not just the returned page."""
+        full = client.get("/api/v1/agents/search?limit=100").json()
+        page = client.get("/api/v1/agents/search?limit=1").json()
+
+        assert len(page["agents"]) == 1
+        assert page["total_count"] == full["total_count"] >= len(full["agents"])
+
+    def test_search_query_total_count_past_last_page(self, client: TestClient):
+        """Test an empty page past the last match still reports the total."""
+        full = client.get("/api/v1/agents/search?q=python&limit=100").json()
+        last = full["agents"][-1]
+
+        by_offset = client.get(f"/api/v1/agents/search?q=python&offset={len(full['agents'])}").json()
+        by_cursor = client.get(
+            "/api/v1/agents/search", params={"q": "python", "after": f"{last['name']},{last['id']}"}
+        ).json()
+
+        assert by_offset["agents"] == by_cursor["agents"] == []
+        assert by_offset["total_count"] == by_cursor["total_count"] == full["total_count"] > 0
+
+    def test_search_cursor_pagination_walks_all_agents(self, client: TestClient):
+        """Test following next_cursor visits every agent exactly once."""
+        seen: list[str] = []
+        params: dict[str, str | int] = {"limit": 50}
+        while True:
+            data = client.get("/api/v1/agents/search", params=params).json()
+            seen.extend(a["agent_id"] for a in data["agents"])
+            if data["next_cursor"] is None:
+                break
+            params["after"] = data["next_cursor"]
+
+        assert len(seen) == len(set(seen)) == data["total_count"]
+
+    def test_search_query_cursor_pagination(self, client: TestClient):
+        """Test cursor pagination of ranked search results."""
+        expected = [a["agent_id"] for a in client.get("/api/v1/agents/search?q=python&limit=100").json()["agents"]]
+
+        first = client.get("/api/v1/agents/search?q=python&limit=1").json()
+        assert first["total_count"] == len(expected)
+        if first["next_cursor"]:
+            second = client.get(
+                "/api/v1/agents/search", params={"q": "python", "limit": 1, "after": first["next_cursor"]}
+            )
+            assert [a["agent_id"] for a in second.json()["agents"]] == expected[1:2]
+
+    def test_search_category_filter_applied_before_limit(self, client: TestClient):
+        """Test a filtered search fills the page instead of filtering a truncated one."""
+        response = client.get("/api/v1/agents/search?q=security OR python&category=Development&limit=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["agents"]) == 1
+        assert data["agents"][0]["category"] == "Development"
+
+    def test_search_with_invalid_cursor(self, client: TestClient):
+        """Test malformed cursors are rejected."""
+        response = client.get("/api/v1/agents/search?after=not-a-cursor")
+
+        assert response.status_code == 400
+
 
 class TestRateLimiting:
     """Tests for rate limiting middleware."""
@@ -10,6 +10,7 @@ import pytest
 from mycelium_mcp.models import (
     AgentDetails,
     AgentMatch,
+    DiscoverAgentsBatchResponse,
     DiscoverAgentsResponse,
     GetAgentDetailsResponse,
     HealthCheckResponse,
@@ -20,6 +21,7 @@ from mycelium_mcp.tools.discovery_tools import (
     check_discovery_health,
     close_http_client,
     discover_agents,
+    discover_agents_batch,
     get_agent_details,
 )
 from pydantic import ValidationError
@@ -99,6 +101,53 @@ class TestDiscoverAgents:
         assert result.total_count == 0
 
 
+class TestDiscoverAgentsBatch:
+    """Tests for discover_agents_batch MCP tool."""
+
+    @pytest.mark.asyncio
+    async def test_discover_agents_batch_success(self, mock_batch_discovery_response):
+        """Test batch discovery returns results per query in order."""
+        result = await discover_agents_batch(
+            queries=["Python backend development", "nonexistent capability"],
+            limit=3,
+        )
+
+        assert isinstance(result, DiscoverAgentsBatchResponse)
+        assert result.success is True
+        assert [r.query for r in result.results] == ["Python backend development", "nonexistent capability"]
+        assert result.results[0].agents[0].id == "backend-developer"
+        assert result.results[1].agents == []
+        assert mock_batch_discovery_response["url"] == "/api/v1/agents/discover:batch"
+        assert mock_batch_discovery_response["json"]["queries"] == [
+            "Python backend development",
+            "nonexistent capability",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_discover_agents_batch_validation_errors(self):
+        """Test Pydantic validation catches invalid inputs."""
+        with pytest.raises(ValidationError):
+            await discover_agents_batch(queries=[])
+
+        with pytest.raises(ValidationError):
+            await discover_agents_batch(queries=["ok", ""])
+
+        with pytest.raises(ValidationError):
+            await discover_agents_batch(queries=["test"], limit=0)
+
+    @pytest.mark.asyncio
+    async def test_discover_agents_batch_api_error(self, mock_api_500):
+        """Test handling of API errors."""
+        with pytest.raises(DiscoveryAPIError, match="Server error"):
+            await discover_agents_batch(queries=["test"])
+
+    @pytest.mark.asyncio
+    async def test_discover_agents_batch_timeout(self, mock_timeout):
+        """Test handling of timeout errors."""
+        with pytest.raises(DiscoveryTimeoutError, match="timed out"):
+            await discover_agents_batch(queries=["test"])
+
+
 class TestGetAgentDetails:
     """Tests for get_agent_details MCP tool."""
 
@@ -206,6 +255,49 @@ def mock_discovery_response(monkeypatch):
     monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
 
 
+@pytest.fixture
+def mock_batch_discovery_response(monkeypatch):
+    """Mock successful batch discovery API response, recording the request."""
+    captured = {}
+
+    async def mock_post(self, url, **kwargs):
+        captured["url"] = url
+        captured["json"] = kwargs.get("json")
+        return Mock(
+            status_code=200,
+            json=lambda: {
+                "results": [
+                    {
+                        "query": "Python backend development",
+                        "matches": [
+                            {
+                                "agent": {
+                                    "agent_id": "backend-developer",
+                                    "agent_type": "backend-developer",
+                                    "name": "Backend Developer",
+                                    "display_name": "Backend Developer",
+                                    "category": "core",
+                                    "description": "Full-stack backend development expert",
+                                    "capabilities": ["API development"],
+                                    "tools": ["FastAPI"],
+                                    "keywords": ["backend"],
+                                },
+                                "confidence": 0.95,
+                                "match_reason": "exact match on keywords",
+                            }
+                        ],
+                        "total_count": 1,
+                    },
+                    {"query": "nonexistent capability", "matches": [], "total_count": 0},
+                ],
+                "processing_time_ms": 95,
+            },
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+    return captured
+
+
 @pytest.fixture
 def mock_agent_details(monkeypatch):
     """Mock successful agent details response."""
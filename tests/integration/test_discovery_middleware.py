@@ -0,0 +1,163 @@
+"""Integration tests for the Discovery API ASGI middleware.
+
+These tests drive the middleware stack through a minimal FastAPI app, so
+they need no database.
+"""
+
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from api.middleware import (
+    PerformanceMonitoringMiddleware,
+    RateLimitMiddleware,
+    RequestValidationMiddleware,
+)
+from api.ratelimit import InMemoryRateLimiter
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+
+def build_app(requests_per_minute: int = 60, burst_size: int = 3, max_clients: int = 10000) -> FastAPI:
+    """Build an app with the same middleware order as the Discovery API."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request) -> dict[str, str]:
+        return {"request_id": request.state.request_id}
+
+    @app.post("/echo")
+    async def echo(payload: dict[str, str]) -> dict[str, str]:
+        return payload
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(3):
+                yield f"chunk-{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(PerformanceMonitoringMiddleware)
+    app.add_middleware(RequestValidationMiddleware)
+    app.add_middleware(
+        RateLimitMiddleware,
+        requests_per_minute=requests_per_minute,
+        burst_size=burst_size,
+        max_clients=max_clients,
+    )
+    return app
+
+
+def build_app_with_backend(backend: InMemoryRateLimiter) -> FastAPI:
+    """Build a minimal app rate limited by an explicit backend."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_middleware(RateLimitMiddleware, backend=backend)
+    return app
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create test client for the middleware app."""
+    return TestClient(build_app())
+
+
+class TestRateLimitMiddleware:
+    """Tests for the token bucket rate limiter."""
+
+    def test_rate_limit_headers(self, client: TestClient):
+        """Test rate limit headers are added to successful responses."""
+        response = client.get("/ping")
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "60"
+        assert response.headers["X-RateLimit-Remaining"] == "2"
+        # Reset is reported as wall-clock epoch seconds
+        assert int(response.headers["X-RateLimit-Reset"]) >= int(time.time())
+
+    def test_burst_exhaustion_returns_429(self, client: TestClient):
+        """Test requests beyond the burst size are rejected."""
+        for _ in range(3):
+            assert client.get("/ping").status_code == 200
+
+        response = client.get("/ping")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        data = response.json()
+        assert data["error"] == "RateLimitExceeded"
+        assert data["details"]["limit"] == 60
+
+    def test_buckets_are_per_client(self, client: TestClient):
+        """Test forwarded client IPs get independent buckets."""
+        for _ in range(3):
+            client.get("/ping", headers={"X-Forwarded-For": "10.0.0.1, 192.168.0.1"})
+
+        assert client.get("/ping", headers={"X-Forwarded-For": "10.0.0.1"}).status_code == 429
+        assert client.get("/ping", headers={"X-Real-IP": "10.0.0.2"}).status_code == 200
+
+    def test_custom_backend_sets_limits(self):
+        """Test limits are taken from an explicit backend."""
+        client = TestClient(build_app_with_backend(InMemoryRateLimiter(requests_per_minute=120, burst_size=1)))
+
+        assert client.get("/ping").headers["X-RateLimit-Limit"] == "120"
+        assert client.get("/ping").status_code == 429
+
+
+class TestRequestValidationMiddleware:
+    """Tests for request validation and tracing."""
+
+    def test_request_id_header_matches_state(self, client: TestClient):
+        """Test X-Request-ID matches request.state.request_id."""
+        response = client.get("/ping")
+
+        assert response.status_code == 200
+        assert response.headers["X-Request-ID"] == response.json()["request_id"]
+
+    def test_request_ids_are_unique(self, client: TestClient):
+        """Test each request gets a distinct ID."""
+        first = client.get("/ping").headers["X-Request-ID"]
+        second = client.get("/ping").headers["X-Request-ID"]
+
+        assert first != second
+
+    def test_json_post_is_accepted(self, client: TestClient):
+        """Test POST with JSON content type reaches the endpoint."""
+        response = client.post("/echo", json={"key": "value"})
+
+        assert response.status_code == 200
+        assert response.json() == {"key": "value"}
+
+    def test_non_json_post_returns_415(self, client: TestClient):
+        """Test POST without JSON content type is rejected."""
+        response = client.post("/echo", content=b"key=value", headers={"Content-Type": "text/plain"})
+
+        assert response.status_code == 415
+        data = response.json()
+        assert data["error"] == "UnsupportedMediaType"
+        assert data["details"]["received"] == "text/plain"
+
+
+class TestPerformanceMonitoringMiddleware:
+    """Tests for request timing."""
+
+    def test_processing_time_header(self, client: TestClient):
+        """Test X-Processing-Time-Ms header is a valid duration."""
+        response = client.get("/ping")
+
+        assert float(response.headers["X-Processing-Time-Ms"]) >= 0
+
+    def test_streaming_response_passes_through(self, client: TestClient):
+        """Test streamed bodies are forwarded intact with all headers."""
+        response = client.get("/stream")
+
+        assert response.status_code == 200
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        for header in ("X-Processing-Time-Ms", "X-Request-ID", "X-RateLimit-Remaining"):
+            assert header in response.headers
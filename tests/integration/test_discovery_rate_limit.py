@@ -0,0 +1,226 @@
+"""Tests for the Discovery API rate limiter backends.
+
+The in-memory backend and the Redis backend's local pre-aggregation are
+tested without external services. The Lua token bucket itself runs only
+when Redis is reachable at REDIS_URL (default redis://localhost:6379).
+"""
+
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from api.ratelimit import InMemoryRateLimiter, RedisRateLimiter, create_rate_limiter
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+
+def make_redis_limiter(script: AsyncMock, **kwargs: Any) -> RedisRateLimiter:
+    """Create a RedisRateLimiter whose Lua script is replaced by ``script``."""
+    client = MagicMock()
+    client.register_script.return_value = script
+    return RedisRateLimiter(client=client, **kwargs)
+
+
+class TestInMemoryRateLimiter:
+    """Tests for the per-process token bucket."""
+
+    async def test_burst_then_deny(self):
+        """Test the burst is admitted and the next request denied."""
+        limiter = InMemoryRateLimiter(requests_per_minute=60, burst_size=2)
+
+        assert await limiter.acquire("a") == (True, 1.0)
+        assert (await limiter.acquire("a"))[0]
+        assert not (await limiter.acquire("a"))[0]
+
+    async def test_refill_uses_monotonic_clock(self, monkeypatch: pytest.MonkeyPatch):
+        """Test tokens refill from time.monotonic, not wall-clock time."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        limiter = InMemoryRateLimiter(requests_per_minute=60, burst_size=1)
+
+        assert (await limiter.acquire("a"))[0]
+        assert not (await limiter.acquire("a"))[0]
+
+        now[0] += 1.0
+
+        assert (await limiter.acquire("a"))[0]
+
+    async def test_buckets_are_bounded_lru(self):
+        """Test the least recently seen client is evicted at capacity."""
+        limiter = InMemoryRateLimiter(burst_size=1, max_clients=2)
+
+        for key in ("a", "b", "a", "c"):
+            await limiter.acquire(key)
+
+        assert list(limiter._buckets) == ["a", "c"]
+
+
+class TestRedisRateLimiter:
+    """Tests for local pre-aggregation in the Redis backend."""
+
+    async def test_lease_is_spent_locally(self):
+        """Test one script call admits a whole lease of requests."""
+        script = AsyncMock(return_value=[3, b"5"])
+        limiter = make_redis_limiter(script, lease_size=3)
+
+        results = [await limiter.acquire("a") for _ in range(3)]
+
+        assert [allowed for allowed, _ in results] == [True, True, True]
+        assert [remaining for _, remaining in results] == [7.0, 6.0, 5.0]
+        assert script.await_count == 1
+        assert limiter.get_stats() == {
+            "local_decisions": 2,
+            "redis_calls": 1,
+            "redis_errors": 0,
+            "fallback_decisions": 0,
+        }
+
+    async def test_exhausted_lease_calls_redis(self):
+        """Test a new lease is requested once local tokens run out."""
+        script = AsyncMock(return_value=[1, b"0.5"])
+        limiter = make_redis_limiter(script, lease_size=3)
+
+        await limiter.acquire("a")
+        await limiter.acquire("a")
+
+        assert script.await_count == 2
+        script.assert_awaited_with(keys=["mycelium:ratelimit:a"], args=[100 / 60.0, 10, 3])
+
+    async def test_denial_is_cached_until_refill(self, monkeypatch: pytest.MonkeyPatch):
+        """Test denied clients are rejected locally until a token should refill."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        script = AsyncMock(return_value=[0, b"0.5"])
+        limiter = make_redis_limiter(script, requests_per_minute=60)
+
+        assert await limiter.acquire("a") == (False, 0.5)
+        assert await limiter.acquire("a") == (False, 0.5)
+        assert script.await_count == 1
+
+        now[0] += 0.5
+
+        await limiter.acquire("a")
+        assert script.await_count == 2
+
+    async def test_lease_expires(self, monkeypatch: pytest.MonkeyPatch):
+        """Test unspent leased tokens are forfeited after lease_ttl."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        script = AsyncMock(return_value=[5, b"0"])
+        limiter = make_redis_limiter(script, lease_ttl=1.0)
+
+        await limiter.acquire("a")
+        now[0] += 1.0
+        await limiter.acquire("a")
+
+        assert script.await_count == 2
+
+    async def test_leases_are_bounded(self):
+        """Test local leases are kept in a bounded LRU."""
+        limiter = make_redis_limiter(AsyncMock(return_value=[2, b"3"]), max_clients=2)
+
+        for key in ("a", "b", "a", "c"):
+            await limiter.acquire(key)
+
+        assert list(limiter._leases) == ["a", "c"]
+
+    async def test_redis_error_falls_back_to_memory(self):
+        """Test the limiter degrades to per-process buckets when Redis fails."""
+        script = AsyncMock(side_effect=RedisConnectionError("down"))
+        limiter = make_redis_limiter(script, burst_size=1)
+
+        assert (await limiter.acquire("a"))[0]
+        assert not (await limiter.acquire("a"))[0]
+        assert limiter.get_stats()["fallback_decisions"] == 2
+
+    async def test_redis_error_opens_circuit(self, monkeypatch: pytest.MonkeyPatch):
+        """Test Redis is skipped for error_cooldown seconds after an error."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        script = AsyncMock(side_effect=[RedisConnectionError("down"), [1, b"5"]])
+        limiter = make_redis_limiter(script, error_cooldown=5.0)
+
+        await limiter.acquire("a")
+        await limiter.acquire("b")
+        assert script.await_count == 1
+        assert limiter.get_stats()["redis_errors"] == 1
+
+        now[0] += 5.0
+
+        assert await limiter.acquire("c") == (True, 5.0)
+        assert script.await_count == 2
+
+    def test_invalid_lease_size(self):
+        """Test lease_size must be positive."""
+        with pytest.raises(ValueError, match="lease_size"):
+            make_redis_limiter(AsyncMock(), lease_size=0)
+
+
+class TestCreateRateLimiter:
+    """Tests for backend selection."""
+
+    def test_defaults_to_memory(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the in-memory backend is used without a Redis URL."""
+        monkeypatch.delenv("DISCOVERY_RATE_LIMIT_REDIS_URL", raising=False)
+
+        assert isinstance(create_rate_limiter(), InMemoryRateLimiter)
+
+    async def test_redis_url_from_environment(self, monkeypatch: pytest.MonkeyPatch):
+        """Test DISCOVERY_RATE_LIMIT_REDIS_URL selects the Redis backend."""
+        monkeypatch.setenv("DISCOVERY_RATE_LIMIT_REDIS_URL", "redis://localhost:6379/1")
+
+        limiter = create_rate_limiter(requests_per_minute=30, burst_size=4)
+
+        assert isinstance(limiter, RedisRateLimiter)
+        assert (limiter.requests_per_minute, limiter.burst_size) == (30, 4)
+        await limiter.close()
+
+
+@pytest.fixture
+async def redis_limiter() -> AsyncIterator[RedisRateLimiter]:
+    """Create a RedisRateLimiter against a live Redis, skipping if unavailable."""
+    limiter = RedisRateLimiter(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        requests_per_minute=60,
+        burst_size=4,
+        lease_size=2,
+        key_prefix=f"mycelium:test:ratelimit:{uuid.uuid4().hex}:",
+    )
+    try:
+        await limiter._redis.ping()
+    except Exception as e:
+        await limiter.close()
+        pytest.skip(f"Cannot connect to Redis: {e}")
+    yield limiter
+    await limiter.close()
+
+
+class TestRedisTokenBucketScript:
+    """Tests for the Lua token bucket against a live Redis."""
+
+    async def test_shared_bucket_enforces_limit_across_workers(self, redis_limiter: RedisRateLimiter):
+        """Test two limiters sharing a bucket admit exactly the burst."""
+        other = RedisRateLimiter(
+            client=redis_limiter._redis,
+            requests_per_minute=60,
+            burst_size=4,
+            lease_size=2,
+            key_prefix=redis_limiter.key_prefix,
+        )
+
+        admitted = 0
+        for _ in range(4):
+            admitted += (await redis_limiter.acquire("a"))[0]
+            admitted += (await other.acquire("a"))[0]
+
+        assert admitted == 4
+
+    async def test_grant_is_capped_at_half_the_bucket(self, redis_limiter: RedisRateLimiter):
+        """Test one call never leases more than half of the available tokens."""
+        granted, remaining = await redis_limiter._script(keys=[redis_limiter.key_prefix + "b"], args=[1.0, 4, 10])
+
+        assert int(granted) == 2
+        assert float(remaining) == 2.0
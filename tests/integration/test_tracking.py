@@ -20,16 +20,17 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "plugins" / "myceli
 
 # Conditional imports - avoid import errors when module is skipped
 try:
+    from coordination.notifications import WorkflowNotifier
     from coordination.state_manager import WorkflowStatus
     from coordination.tracker import (
         CoordinationEvent,
         CoordinationTracker,
         EventType,
         PerformanceMetrics,
+        register_json_codecs,
         track_failure,
         track_handoff,
         track_task_execution,
-        track_workflow_completion,
     )
 except ImportError:
     # Module not yet implemented - define stubs for type hints
@@ -42,12 +43,13 @@ except ImportError:
 
     CoordinationEvent = None  # type: ignore
     CoordinationTracker = None  # type: ignore
+    WorkflowNotifier = None  # type: ignore
     EventType = None  # type: ignore
     PerformanceMetrics = None  # type: ignore
+    register_json_codecs = None  # type: ignore
     track_failure = None  # type: ignore
     track_handoff = None  # type: ignore
     track_task_execution = None  # type: ignore
-    track_workflow_completion = None  # type: ignore
 
 
 @dataclass
@@ -745,3 +747,221 @@ class TestDatabaseIntegration:
             if "connection" in str(e).lower():
                 pytest.skip(f"Database connection failed: {e}")
             raise
+
+
+class TestBufferedTracking:
+    """Integration tests for write-behind (buffered) event tracking."""
+
+    @pytest.fixture
+    async def pool(self):
+        """Create a connection pool, skipping if PostgreSQL is unavailable."""
+        import asyncpg
+
+        db_url = os.environ.get("DATABASE_URL", "postgresql://localhost/test_mycelium")
+        try:
+            pool = await asyncpg.create_pool(db_url, min_size=1, max_size=5)
+        except (OSError, asyncpg.PostgresError) as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+        yield pool
+        await pool.close()
+
+    @staticmethod
+    def _event(workflow_id: str, i: int) -> CoordinationEvent:
+        return CoordinationEvent(
+            event_type=EventType.EXECUTION_START,
+            workflow_id=workflow_id,
+            task_id=f"task-{i}",
+            agent_id="agent",
+            metadata={"i": i},
+        )
+
+    @pytest.mark.asyncio
+    async def test_buffered_events_flushed_on_close(self, pool) -> None:
+        """Test buffered events reach the database by close()."""
+        tracker = CoordinationTracker(pool=pool, config={"buffered": True, "batch_size": 50, "flush_interval": 60})
+        await tracker.initialize()
+        await tracker.delete_workflow_events("buffered-close")
+
+        for i in range(120):
+            await tracker.track_event(self._event("buffered-close", i))
+        await tracker.close()
+
+        count = await pool.fetchval("SELECT COUNT(*) FROM coordination_events WHERE workflow_id = 'buffered-close'")
+        assert count == 120
+        assert tracker.get_buffer_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queries_see_buffered_events(self, pool) -> None:
+        """Test reads flush pending events first."""
+        tracker = CoordinationTracker(pool=pool, config={"buffered": True, "flush_interval": 60})
+        await tracker.initialize()
+        await tracker.delete_workflow_events("buffered-read")
+
+        await track_handoff(tracker, "buffered-read", "agent-a", "planner", "agent-b", "coder")
+
+        chain = await tracker.get_handoff_chain("buffered-read")
+        assert len(chain) == 1
+        assert chain[0].target_agent.agent_id == "agent-b"
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("backpressure", "expected_rows"),
+        [("block", 30), ("drop_oldest", 10), ("spill", 30)],
+    )
+    async def test_backpressure(self, pool, tmp_path: Path, backpressure: str, expected_rows: int) -> None:
+        """Test each backpressure policy when the buffer is full."""
+        workflow_id = f"buffered-{backpressure}"
+        tracker = CoordinationTracker(
+            pool=pool,
+            config={
+                "buffered": True,
+                "batch_size": 5,
+                "max_buffered_events": 10,
+                "flush_interval": 60,
+                "backpressure": backpressure,
+                "spill_path": str(tmp_path / "spill.jsonl"),
+            },
+        )
+        await tracker.initialize()
+        await tracker.delete_workflow_events(workflow_id)
+
+        if backpressure == "block":
+            for i in range(30):
+                await tracker.track_event(self._event(workflow_id, i))
+        else:
+            # Stall flushes so the buffer overflows
+            async with tracker._flush_lock:
+                for i in range(30):
+                    await tracker.track_event(self._event(workflow_id, i))
+        await tracker.close()
+
+        count = await pool.fetchval("SELECT COUNT(*) FROM coordination_events WHERE workflow_id = $1", workflow_id)
+        assert count == expected_rows
+        assert not (tmp_path / "spill.jsonl").exists()
+
+    @pytest.mark.asyncio
+    async def test_stream_and_summary(self, pool) -> None:
+        """Test streaming with a since cursor and the SQL-computed summary."""
+        tracker = CoordinationTracker(pool=pool, config={"buffered": True, "flush_interval": 60})
+        await tracker.initialize()
+        await tracker.delete_workflow_events("buffered-stream")
+
+        for i in range(25):
+            event = self._event("buffered-stream", i)
+            event.timestamp = f"2026-10-16T09:00:{i:02d}Z"
+            await tracker.track_event(event)
+        await track_handoff(tracker, "buffered-stream", "agent", "planner", "agent-b", "coder")
+
+        events = [e async for e in tracker.stream_workflow_events("buffered-stream", batch_size=10)]
+        assert [e.metadata["i"] for e in events[:25]] == list(range(25))
+
+        resumed = [e async for e in tracker.stream_workflow_events("buffered-stream", since="2026-10-16T09:00:20Z")]
+        assert [e.metadata["i"] for e in resumed[:4]] == [21, 22, 23, 24]
+
+        summary = await tracker.get_workflow_summary("buffered-stream")
+        assert summary["total_events"] == 26
+        assert summary["handoff_count"] == 1
+        assert summary["unique_agents"] == 2
+        assert summary["unique_tasks"] == 25
+        assert summary["start_time"] == "2026-10-16T09:00:00Z"
+        await tracker.close()
+
+
+class TestRowDecoding:
+    """Tests for the validation-free read path and JSONB codecs."""
+
+    @pytest.fixture(params=[False, True], ids=["text-json", "json-codec"])
+    async def pool(self, request):
+        """Create a pool with and without the JSON codecs registered."""
+        import asyncpg
+
+        db_url = os.environ.get("DATABASE_URL", "postgresql://localhost/test_mycelium")
+        try:
+            pool = await asyncpg.create_pool(
+                db_url, min_size=1, max_size=2, init=register_json_codecs if request.param else None
+            )
+        except (OSError, asyncpg.PostgresError) as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+        yield pool
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_raw_and_model_reads_match(self, pool) -> None:
+        """Test raw dicts and constructed models agree with validated models."""
+        tracker = CoordinationTracker(pool=pool)
+        await tracker.initialize()
+        await tracker.delete_workflow_events("wf-decode")
+
+        await track_handoff(tracker, "wf-decode", "agent-a", "planner", "agent-b", "coder", context={"k": [1, 2]})
+        await track_task_execution(
+            tracker,
+            "wf-decode",
+            "task-1",
+            "agent-b",
+            "coder",
+            "completed",
+            duration_ms=5.0,
+            performance=PerformanceMetrics(cpu_usage=0.25, custom_metrics={"tokens": 42.0}),
+        )
+        await track_failure(tracker, "wf-decode", "task-1", "agent-b", "coder", "ValueError", "bad input")
+
+        events = await tracker.get_workflow_events("wf-decode")
+        raw = await tracker.get_workflow_events("wf-decode", raw=True)
+        assert raw == [e.to_dict() for e in events]
+        assert events == [CoordinationEvent.model_validate(r) for r in raw]
+        assert events[0].target_agent.agent_id == "agent-b"
+        assert events[2].error.error_type == "ValueError"
+
+        streamed = [e async for e in tracker.stream_workflow_events("wf-decode", raw=True)]
+        assert streamed == raw
+        agent_events = await tracker.get_agent_events("agent-b", raw=True)
+        assert [e for e in agent_events if e["workflow_id"] == "wf-decode"] == raw
+        await tracker.delete_workflow_events("wf-decode")
+
+
+class TestWorkflowNotifier:
+    """Tests for live workflow change notifications."""
+
+    @pytest.fixture
+    async def pool(self):
+        """Create a connection pool, skipping if PostgreSQL is unavailable."""
+        import asyncpg
+
+        db_url = os.environ.get("DATABASE_URL", "postgresql://localhost/test_mycelium")
+        try:
+            pool = await asyncpg.create_pool(db_url, min_size=1, max_size=5)
+        except (OSError, asyncpg.PostgresError) as e:
+            pytest.skip(f"PostgreSQL not available: {e}")
+        yield pool
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_listen_notify_across_connections(self, pool) -> None:
+        """Test buffered batches reach a LISTEN subscriber through PostgreSQL."""
+        notifier = WorkflowNotifier(pool, channel="test_workflow_changes")
+        tracker = CoordinationTracker(pool=pool, config={"buffered": True, "flush_interval": 60}, notifier=notifier)
+        await tracker.initialize()
+        await tracker.delete_workflow_events("wf-notify")
+
+        async with tracker.subscribe("wf-notify") as subscription:
+            for i in range(3):
+                await tracker.track_event(
+                    CoordinationEvent(
+                        event_type=EventType.EXECUTION_START,
+                        workflow_id="wf-notify",
+                        task_id=f"task-{i}",
+                        agent_id="agent",
+                    )
+                )
+            # Nothing is published before the batch is written
+            assert await subscription.get(timeout=0.2) is None
+            await tracker.flush()
+
+            changes = [await subscription.get(timeout=5) for _ in range(3)]
+            assert [c["task_id"] for c in changes] == ["task-0", "task-1", "task-2"]
+
+        # The LISTEN connection goes back to the pool with the last subscriber
+        assert notifier._listener is None
+        await notifier.close()
+        await tracker.close()
@@ -0,0 +1,291 @@
+"""Unit tests for single-pass streaming aggregation.
+
+Tests:
+    - Reducer routing by event type
+    - Single pass over the event store for many reports
+    - Persisted segment summaries and window boundaries
+    - Summary report consistency with the individual reports
+
+Author: @python-pro
+Phase: 2 Performance Analytics
+Date: 2026-10-16
+"""
+
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mycelium_analytics import aggregation
+from mycelium_analytics.aggregation import (
+    CachePerformanceReducer,
+    DiscoveryStatsReducer,
+    PerformanceTrendsReducer,
+    Reducer,
+    StreamingAggregator,
+    TokenSavingsReducer,
+    summary_path,
+)
+from mycelium_analytics.metrics import MetricsAnalyzer
+from mycelium_analytics.storage import EventStorage
+
+
+@pytest.fixture
+def storage():
+    """Create EventStorage instance in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield EventStorage(storage_dir=Path(tmpdir))
+
+
+class CountingReducer(Reducer):
+    """Counts every event it receives."""
+
+    def __init__(self, event_types: frozenset[str] | None = None):
+        self.event_types = event_types
+        self.count = 0
+
+    def add(self, event: dict[str, Any]) -> None:
+        self.count += 1
+
+    def result(self) -> int:
+        return self.count
+
+
+def _populate(storage: EventStorage, days: int = 3) -> None:
+    """Store discovery and load events spread over several days."""
+    now = datetime.now(timezone.utc)
+    for day in range(days):
+        timestamp = (now - timedelta(days=day)).isoformat()
+        for i in range(20):
+            storage.append_event(
+                {
+                    "timestamp": timestamp,
+                    "event_type": "agent_discovery",
+                    "operation": "get_agent" if i % 2 else "list_agents",
+                    "duration_ms": float(i + day),
+                    "cache_hit": i % 4 == 1,
+                }
+            )
+        storage.append_event({"timestamp": timestamp, "event_type": "agent_load", "estimated_tokens": 400})
+
+
+class TestStreamingAggregator:
+    """Test reducer routing and single-pass execution."""
+
+    def test_routes_by_event_type(self, storage):
+        """Test reducers only receive the event types they consume."""
+        _populate(storage)
+        aggregator = StreamingAggregator(storage)
+        aggregator.register("discovery", CountingReducer(frozenset({"agent_discovery"})))
+        aggregator.register("loads", CountingReducer(frozenset({"agent_load"})))
+        aggregator.register("all", CountingReducer())
+
+        results = aggregator.run()
+
+        assert results == {"discovery": 60, "loads": 3, "all": 63}
+
+    def test_single_pass(self, storage, monkeypatch):
+        """Test any number of reducers share one scan of the store."""
+        _populate(storage)
+        chunks = []
+        decode_lines = aggregation.decode_lines
+
+        def counting_decode_lines(data, *args, **kwargs):
+            chunks.append(data)
+            return decode_lines(data, *args, **kwargs)
+
+        monkeypatch.setattr(aggregation, "decode_lines", counting_decode_lines)
+
+        aggregator = StreamingAggregator(storage)
+        aggregator.register("tokens", TokenSavingsReducer())
+        aggregator.register("cache", CachePerformanceReducer())
+        aggregator.register("trends", PerformanceTrendsReducer())
+        results = aggregator.run()
+
+        assert len(chunks) == 1
+        assert results["tokens"]["total_agents_loaded"] == 3
+        assert results["cache"]["total_lookups"] == 30
+        assert len(results["trends"]["daily_stats"]) == 3
+
+    def test_active_segment_parsed_incrementally(self, storage, monkeypatch):
+        """Test only lines appended since the last run are parsed."""
+        _populate(storage)
+        analyzer = MetricsAnalyzer(storage)
+        assert analyzer.get_token_savings(days=7)["total_agents_loaded"] == 3
+
+        chunks = []
+        decode_lines = aggregation.decode_lines
+
+        def counting_decode_lines(data, *args, **kwargs):
+            chunks.append(data)
+            return decode_lines(data, *args, **kwargs)
+
+        monkeypatch.setattr(aggregation, "decode_lines", counting_decode_lines)
+        assert analyzer.get_token_savings(days=7)["total_agents_loaded"] == 3
+        assert chunks == []
+
+        event = {"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "agent_load", "estimated_tokens": 1}
+        storage.append_event(event)
+        assert analyzer.get_token_savings(days=7)["total_agents_loaded"] == 4
+        assert [json.loads(chunk) for chunk in chunks] == [event]
+
+    def test_active_segment_recreated(self, storage):
+        """Test a summary of a replaced active segment is not reused."""
+        _populate(storage)
+        analyzer = MetricsAnalyzer(storage)
+        assert analyzer.get_token_savings(days=7)["total_agents_loaded"] == 3
+
+        storage.active_segment.unlink()
+        storage.append_event({"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "agent_load"})
+
+        assert analyzer.get_token_savings(days=7)["total_agents_loaded"] == 1
+
+    def test_start_date_filter(self, storage):
+        """Test events older than the start date are not aggregated."""
+        _populate(storage)
+        aggregator = StreamingAggregator(storage)
+        aggregator.register("loads", CountingReducer(frozenset({"agent_load"})))
+
+        results = aggregator.run(start_date=datetime.now(timezone.utc) - timedelta(hours=12))
+
+        assert results["loads"] == 1
+
+    def test_no_reducers(self, storage):
+        """Test running without reducers returns no results."""
+        _populate(storage)
+        assert StreamingAggregator(storage).run() == {}
+
+
+def _write_segment(storage: EventStorage, name: str, events: list[dict[str, Any]]) -> Path:
+    """Write a closed segment directly."""
+    path = storage.storage_dir / f"events_{name}.jsonl"
+    path.write_text("".join(json.dumps(event) + "\n" for event in events))
+    return path
+
+
+def _discovery(moment: datetime, duration: float, operation: str = "list_agents") -> dict[str, Any]:
+    """Build an agent_discovery event."""
+    return {
+        "timestamp": moment.isoformat(),
+        "event_type": "agent_discovery",
+        "operation": operation,
+        "duration_ms": duration,
+        "cache_hit": False,
+    }
+
+
+class TestSegmentSummaries:
+    """Test persisted per-segment reducer state."""
+
+    def test_summary_persisted_and_reused(self, storage, monkeypatch):
+        """Test segments inside the window are merged from their summary."""
+        now = datetime.now(timezone.utc)
+        segment = _write_segment(storage, "a", [_discovery(now - timedelta(hours=1), float(i)) for i in range(1, 101)])
+
+        first = MetricsAnalyzer(storage).get_discovery_stats(days=1)
+        assert summary_path(segment).exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("segment reread")
+
+        monkeypatch.setattr(aggregation, "iter_segment", fail)
+        second = MetricsAnalyzer(storage).get_discovery_stats(days=1)
+
+        assert second == first
+        assert second["total_operations"] == 100
+
+    def test_boundary_segment_streamed(self, storage):
+        """Test a segment straddling the window start is filtered per event."""
+        now = datetime.now(timezone.utc)
+        _write_segment(
+            storage,
+            "a",
+            [_discovery(now - timedelta(days=3), 1000.0), _discovery(now - timedelta(hours=1), 10.0)],
+        )
+
+        stats = MetricsAnalyzer(storage).get_discovery_stats(days=1)
+
+        assert stats["total_operations"] == 1
+        assert stats["overall"]["p99_ms"] == pytest.approx(10.0, rel=0.01)
+
+    def test_stale_summary_rebuilt(self, storage):
+        """Test a summary is rebuilt once its segment changes."""
+        now = datetime.now(timezone.utc)
+        segment = _write_segment(storage, "a", [_discovery(now, 5.0)])
+        assert MetricsAnalyzer(storage).get_discovery_stats(days=1)["total_operations"] == 1
+
+        with segment.open("a") as f:
+            f.write(json.dumps(_discovery(now, 6.0)) + "\n")
+
+        assert MetricsAnalyzer(storage).get_discovery_stats(days=1)["total_operations"] == 2
+
+    def test_untimed_events_excluded_from_window(self, storage):
+        """Test events without timestamps only count without a window."""
+        now = datetime.now(timezone.utc)
+        untimed = {"event_type": "agent_load", "estimated_tokens": 100}
+        _write_segment(storage, "a", [{"timestamp": now.isoformat(), **untimed}, untimed])
+
+        aggregator = StreamingAggregator(storage)
+        aggregator.register("tokens", TokenSavingsReducer())
+        assert aggregator.run()["tokens"]["total_agents_loaded"] == 2
+
+        aggregator = StreamingAggregator(storage)
+        aggregator.register("tokens", TokenSavingsReducer())
+        assert aggregator.run(now - timedelta(days=1))["tokens"]["total_agents_loaded"] == 1
+
+    def test_custom_reducers_still_streamed(self, storage):
+        """Test reducers without persisted state see every event."""
+        now = datetime.now(timezone.utc)
+        _write_segment(storage, "a", [_discovery(now, 5.0), _discovery(now, 7.0)])
+        aggregator = StreamingAggregator(storage)
+        aggregator.register("discovery", DiscoveryStatsReducer())
+        aggregator.register("count", CountingReducer(frozenset({"agent_discovery"})))
+
+        results = aggregator.run(now - timedelta(days=1))
+
+        assert results["discovery"]["total_operations"] == 2
+        assert results["count"] == 2
+
+    def test_state_merge_round_trip(self, storage):
+        """Test merging states equals reducing all events in one reducer."""
+        _populate(storage)
+        events = list(storage.iter_events())
+        for reducer_type in aggregation.SUMMARY_REDUCERS:
+            whole, first, second = reducer_type(), reducer_type(), reducer_type()
+            for i, event in enumerate(events):
+                if whole.event_types is None or event.get("event_type") in whole.event_types:
+                    whole.add(event)
+                    (first if i % 2 else second).add(event)
+
+            first.merge(json.loads(json.dumps(second.state())))
+
+            assert first.result() == whole.result()
+
+
+class TestSummaryReport:
+    """Test the single-pass summary report."""
+
+    def test_matches_individual_reports(self, storage):
+        """Test summary sections equal the separately computed reports."""
+        _populate(storage)
+        analyzer = MetricsAnalyzer(storage)
+
+        summary = analyzer.get_summary_report(days=7)
+
+        assert summary["discovery_stats"] == analyzer.get_discovery_stats(days=7)
+        assert summary["token_savings"] == analyzer.get_token_savings(days=7)
+        assert summary["cache_performance"] == analyzer.get_cache_performance(days=7)
+        assert summary["trends"] == analyzer.get_performance_trends(days=7)
+
+    def test_beyond_former_read_limit(self, storage):
+        """Test every event in the window is aggregated, not a capped prefix."""
+        now = datetime.now(timezone.utc).isoformat()
+        line = f'{{"timestamp": "{now}", "event_type": "agent_load", "estimated_tokens": 1}}\n'
+        (storage.storage_dir / EventStorage.DEFAULT_FILENAME).write_text(line * 100005)
+
+        tokens = MetricsAnalyzer(storage).get_token_savings(days=1)
+
+        assert tokens["total_agents_loaded"] == 100005
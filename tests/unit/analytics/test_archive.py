@@ -0,0 +1,336 @@
+"""Unit tests for the compressed columnar archive.
+
+Tests:
+    - Round trip of archived events
+    - Compaction of closed segments and reads across archives
+    - Vectorized and fallback aggregation over archives
+    - Retention by age and size
+
+Author: @python-pro
+Phase: 2 Performance Analytics
+Date: 2026-10-17
+"""
+
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mycelium_analytics import aggregation, archive
+from mycelium_analytics.aggregation import Reducer, StreamingAggregator
+from mycelium_analytics.archive import ARCHIVE_SUFFIX, iter_archive, load_archive_index, read_archive, write_archive
+from mycelium_analytics.metrics import MetricsAnalyzer
+from mycelium_analytics.segments import index_path
+from mycelium_analytics.storage import EventStorage
+
+
+@pytest.fixture
+def storage():
+    """Create EventStorage instance in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield EventStorage(storage_dir=Path(tmpdir))
+
+
+def _write_segment(storage: EventStorage, name: str, events: list[Any]) -> Path:
+    """Write a closed segment directly."""
+    path = storage.storage_dir / f"events_{name}.jsonl"
+    path.write_text("".join(json.dumps(event) + "\n" for event in events))
+    return path
+
+
+def _discovery_events(start: datetime, count: int) -> list[dict[str, Any]]:
+    """Build agent_discovery events, one minute apart."""
+    return [
+        {
+            "timestamp": (start + timedelta(minutes=i)).isoformat(),
+            "event_type": "agent_discovery",
+            "operation": ("list_agents", "get_agent", "search")[i % 3],
+            "duration_ms": round(1.5 + i * 0.25, 3),
+            "cache_hit": i % 4 == 1,
+            "agent_count": i % 7,
+        }
+        for i in range(count)
+    ]
+
+
+def _load_events(start: datetime, count: int) -> list[dict[str, Any]]:
+    """Build agent_load events, one minute apart."""
+    return [
+        {
+            "timestamp": (start + timedelta(minutes=i, seconds=30)).isoformat(),
+            "event_type": "agent_load",
+            "agent_id": f"a{i}",
+            "estimated_tokens": 300 + i,
+        }
+        for i in range(count)
+    ]
+
+
+class TestArchiveFormat:
+    """Test writing and decoding archives."""
+
+    def test_round_trip(self, storage):
+        """Test archived events decode to the original events."""
+        start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+        events = _discovery_events(start, 50) + _load_events(start, 10)
+        segment = _write_segment(storage, "a", events)
+
+        decoded = list(iter_archive(write_archive(segment)))
+
+        assert decoded == events
+
+    def test_irregular_events_preserved(self, storage):
+        """Test fields without a column, odd types and untimed events survive."""
+        events = [
+            {"event_type": "session_start", "custom": {"nested": [1, 2]}},
+            {"timestamp": "not a timestamp", "event_type": "agent_discovery", "operation": None},
+            {"timestamp": "2026-10-01T12:00:00+00:00", "duration_ms": "slow", "cache_hit": 1},
+            {"timestamp": "2026-10-01T12:00:01+00:00", "event_type": "agent_load", "estimated_tokens": 2.5},
+        ]
+        segment = _write_segment(storage, "a", [*events, "not an object"])
+        segment.write_text(segment.read_text() + "{broken\n")
+
+        path = write_archive(segment)
+
+        assert list(iter_archive(path)) == events
+        assert read_archive(path).untimed == 2
+
+    def test_timestamps_normalized_to_utc(self, storage):
+        """Test timestamps are stored as UTC instants."""
+        segment = _write_segment(storage, "a", [{"timestamp": "2026-10-01T14:00:00.5+02:00", "event_type": "x"}])
+
+        (event,) = iter_archive(write_archive(segment))
+
+        assert event["timestamp"] == "2026-10-01T12:00:00.500000+00:00"
+
+    def test_durations_stored_as_float32(self, storage):
+        """Test durations read back at float32 precision."""
+        segment = _write_segment(storage, "a", [{"event_type": "x", "duration_ms": 1 / 3}])
+
+        (event,) = iter_archive(write_archive(segment))
+
+        assert event["duration_ms"] == pytest.approx(1 / 3, rel=1e-6)
+
+    def test_header_index(self, storage):
+        """Test the archive header describes the archived events."""
+        start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+        segment = _write_segment(storage, "a", _discovery_events(start, 30) + _load_events(start, 5))
+
+        path = write_archive(segment)
+        index = load_archive_index(path)
+
+        assert index.count == 35
+        assert index.event_types == {"agent_discovery": 30, "agent_load": 5}
+        assert index.min_ts == start.timestamp()
+        assert index.size == path.stat().st_size
+        assert index.blocks == []
+
+    def test_matching_filters(self, storage):
+        """Test time and event type filters over columns."""
+        start = datetime(2026, 10, 1, tzinfo=timezone.utc)
+        segment = _write_segment(storage, "a", _discovery_events(start, 60) + _load_events(start, 60))
+        columns = read_archive(write_archive(segment))
+
+        selected = columns.matching((start + timedelta(minutes=30)).timestamp(), frozenset({"agent_load"}))
+
+        assert selected.count == 30
+        assert [event["agent_id"] for event in selected.events()][:2] == ["a30", "a31"]
+
+    def test_gzip_codec(self, storage):
+        """Test gzip archives can always be written and read."""
+        segment = _write_segment(storage, "a", _load_events(datetime(2026, 10, 1, tzinfo=timezone.utc), 5))
+
+        path = write_archive(segment, codec="gzip")
+
+        assert read_archive(path).count == 5
+        with pytest.raises(ValueError):
+            write_archive(segment, codec="brotli")
+
+    def test_zstd_codec(self, storage):
+        """Test zstd archives when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        segment = _write_segment(storage, "a", _load_events(datetime(2026, 10, 1, tzinfo=timezone.utc), 5))
+
+        assert read_archive(write_archive(segment, codec="zstd")).count == 5
+
+    def test_not_an_archive(self, storage):
+        """Test unreadable archives are skipped when listing."""
+        path = storage.storage_dir / f"events_a{ARCHIVE_SUFFIX}"
+        path.write_bytes(b"garbage")
+
+        assert load_archive_index(path) is None
+        assert storage.list_segments() == []
+
+
+class TestCompaction:
+    """Test compacting closed segments through EventStorage."""
+
+    def test_compact_replaces_segments(self, storage):
+        """Test segments and their sidecars are replaced by archives."""
+        start = datetime.now(timezone.utc) - timedelta(days=2)
+        segment = _write_segment(storage, "a", _discovery_events(start, 100))
+        storage.append_event({"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "active"})
+        before = storage.read_events(limit=1000)
+        assert index_path(segment).exists()
+
+        result = storage.compact_segments(codec="gzip")
+
+        assert result["segments_compacted"] == 1
+        assert result["events_compacted"] == 100
+        assert result["bytes_after"] < result["bytes_before"]
+        assert not segment.exists()
+        assert not index_path(segment).exists()
+        assert storage.active_segment.exists()
+        assert storage.read_events(limit=1000) == before
+        assert storage.get_storage_stats()["total_events"] == 101
+        # Already compacted
+        assert storage.compact_segments()["segments_compacted"] == 0
+
+    def test_interrupted_compaction_not_double_counted(self, storage):
+        """Test an archive is ignored while its segment still exists."""
+        segment = _write_segment(storage, "a", _load_events(datetime.now(timezone.utc), 5))
+        write_archive(segment)
+
+        assert len(storage.read_events(limit=100)) == 5
+
+        storage.compact_segments()
+        assert len(storage.read_events(limit=100)) == 5
+
+    def test_read_order_across_archives(self, storage):
+        """Test newest-first reads span archives and segments in time order."""
+        now = datetime.now(timezone.utc)
+        _write_segment(storage, "a", _load_events(now - timedelta(days=2), 3))
+        storage.compact_segments()
+        _write_segment(storage, "b", _load_events(now - timedelta(days=1), 3))
+
+        events = storage.read_events(limit=4)
+
+        assert [event["agent_id"] for event in events] == ["a2", "a0", "a1", "a2"]
+
+    def test_clear_removes_archives(self, storage):
+        """Test clearing the store deletes archives and their sidecars."""
+        _write_segment(storage, "a", _discovery_events(datetime.now(timezone.utc), 5))
+        storage.compact_segments()
+        MetricsAnalyzer(storage).get_discovery_stats(days=1)
+
+        storage.clear_all_events()
+
+        assert list(storage.storage_dir.iterdir()) == []
+
+
+class CountingReducer(Reducer):
+    """Counts every event it receives."""
+
+    def __init__(self, event_types: frozenset[str] | None = None):
+        self.event_types = event_types
+        self.count = 0
+
+    def add(self, event: dict[str, Any]) -> None:
+        self.count += 1
+
+    def result(self) -> int:
+        return self.count
+
+
+class TestArchiveAggregation:
+    """Test reports over archived segments."""
+
+    def _populate(self, storage: EventStorage) -> None:
+        """Write three days of closed segments and an active one."""
+        now = datetime.now(timezone.utc)
+        for day in range(3):
+            start = now - timedelta(days=day + 1)
+            _write_segment(storage, f"day{day}", _discovery_events(start, 120) + _load_events(start, 12))
+        for event in _discovery_events(now - timedelta(minutes=10), 5):
+            storage.append_event(event)
+
+    def _reports(self, storage: EventStorage, days: float) -> dict[str, Any]:
+        """Summary report without its generation metadata."""
+        for sidecar in storage.storage_dir.glob("*.summary"):
+            sidecar.unlink()
+        report = MetricsAnalyzer(storage).get_summary_report(days=days)
+        return {key: report[key] for key in ("discovery_stats", "token_savings", "cache_performance", "trends")}
+
+    @pytest.mark.parametrize("days", [7, 2.5])
+    def test_reports_unchanged_by_compaction(self, storage, days):
+        """Test vectorized reports over archives equal reports over JSONL."""
+        self._populate(storage)
+        before = self._reports(storage, days)
+
+        storage.compact_segments()
+
+        assert self._reports(storage, days) == before
+
+    @pytest.mark.parametrize("days", [7, 2.5])
+    def test_reports_without_numpy(self, storage, monkeypatch, days):
+        """Test archives are aggregated per event when NumPy is unavailable."""
+        self._populate(storage)
+        storage.compact_segments()
+        expected = self._reports(storage, days)
+
+        monkeypatch.setattr(archive, "NUMPY_AVAILABLE", False)
+        assert not read_archive(next(storage.storage_dir.glob(f"*{ARCHIVE_SUFFIX}"))).vectorized
+
+        assert self._reports(storage, days) == expected
+
+    def test_vectorized_path_skips_event_decoding(self, storage, monkeypatch):
+        """Test built-in reducers never rebuild event dictionaries."""
+        self._populate(storage)
+        storage.compact_segments()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("events decoded")
+
+        monkeypatch.setattr(archive.EventColumns, "events", fail)
+        assert self._reports(storage, 7)["token_savings"]["total_agents_loaded"] == 36
+
+    def test_custom_reducer_receives_events(self, storage):
+        """Test reducers without add_columns see decoded archived events."""
+        self._populate(storage)
+        storage.compact_segments()
+        aggregator = StreamingAggregator(storage)
+        aggregator.register("loads", CountingReducer(frozenset({"agent_load"})))
+        aggregator.register("tokens", aggregation.TokenSavingsReducer())
+
+        results = aggregator.run(datetime.now(timezone.utc) - timedelta(days=7))
+
+        assert results["loads"] == 36
+        assert results["tokens"]["total_agents_loaded"] == 36
+
+
+class TestRetention:
+    """Test deleting old data by age and size."""
+
+    def test_retention_by_age(self, storage):
+        """Test segments whose newest event is too old are deleted."""
+        now = datetime.now(timezone.utc)
+        old = _write_segment(storage, "old", _load_events(now - timedelta(days=40), 3))
+        recent = _write_segment(storage, "recent", _load_events(now - timedelta(days=5), 3))
+        storage.compact_segments()
+
+        result = storage.apply_retention(max_age_days=30)
+
+        assert result["files_deleted"] == 1
+        assert not old.with_suffix(ARCHIVE_SUFFIX).exists()
+        assert recent.with_suffix(ARCHIVE_SUFFIX).exists()
+
+    def test_retention_by_size(self, storage):
+        """Test the oldest segments are deleted until the store fits."""
+        now = datetime.now(timezone.utc)
+        paths = [_write_segment(storage, f"s{day}", _load_events(now - timedelta(days=day), 50)) for day in (3, 2, 1)]
+        sizes = [path.stat().st_size for path in paths]
+
+        result = storage.apply_retention(max_bytes=sizes[2] + 1)
+
+        assert result == {"files_deleted": 2, "bytes_freed": sizes[0] + sizes[1]}
+        assert [path.exists() for path in paths] == [False, False, True]
+
+    def test_active_segment_kept(self, storage):
+        """Test retention never deletes the active segment."""
+        storage.append_event({"timestamp": "2020-01-01T00:00:00+00:00", "event_type": "old"})
+
+        assert storage.apply_retention(max_age_days=1, max_bytes=0)["files_deleted"] == 0
+        assert storage.active_segment.exists()
@@ -0,0 +1,138 @@
+"""Unit tests for QuantileSketch.
+
+Tests:
+    - Relative accuracy of quantiles
+    - Exact count, sum, min and max
+    - Merging and serialization
+    - Adding arrays of values
+    - Bucket collapsing and edge cases
+
+Author: @python-pro
+Phase: 2 Performance Analytics
+Date: 2026-10-17
+"""
+
+import json
+import random
+
+import pytest
+
+from mycelium_analytics.sketch import QuantileSketch
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    """Lower closest-rank quantile of a list."""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Test quantile sketch accuracy and mergeability."""
+
+    def test_relative_accuracy(self):
+        """Test quantiles are within the configured relative error."""
+        rng = random.Random(3)
+        values = [rng.lognormvariate(1.5, 0.8) for _ in range(50000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.0, 0.25, 0.5, 0.95, 0.99, 1.0):
+            exact = _exact_quantile(values, q)
+            assert abs(sketch.quantile(q) - exact) <= 0.01 * exact
+
+    def test_exact_moments(self):
+        """Test count, sum, min and max are exact."""
+        sketch = QuantileSketch()
+        for value in [5.0, 1.0, 3.0]:
+            sketch.add(value)
+
+        assert sketch.count == 3
+        assert sketch.total == 9.0
+        assert sketch.min == 1.0
+        assert sketch.max == 5.0
+        assert sketch.quantile(0) == 1.0
+        assert sketch.quantile(1) == 5.0
+
+    def test_merge_equals_single_sketch(self):
+        """Test merging sketches equals sketching all values at once."""
+        rng = random.Random(5)
+        values = [rng.uniform(0.1, 500.0) for _ in range(10000)]
+        whole, first, second = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (first if i % 2 else second).add(value)
+
+        first.merge(second)
+
+        assert first.bins == whole.bins
+        assert first.count == whole.count
+        assert first.percentile(95) == whole.percentile(95)
+
+    def test_add_many_matches_add(self):
+        """Test binning an array at once equals adding values one by one."""
+        np = pytest.importorskip("numpy")
+        rng = random.Random(7)
+        values = [0.0] + [rng.lognormvariate(1.0, 1.2) for _ in range(5000)]
+        single, batch = QuantileSketch(), QuantileSketch()
+        for value in values:
+            single.add(value)
+
+        batch.add_many(np.array(values))
+
+        assert batch.bins == single.bins
+        assert batch.zero_count == single.zero_count
+        assert batch.count == single.count
+        assert batch.total == pytest.approx(single.total)
+        assert (batch.min, batch.max) == (single.min, single.max)
+
+    def test_merge_different_accuracy(self):
+        """Test sketches with different accuracy cannot be merged."""
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_round_trip(self):
+        """Test JSON serialization preserves the sketch."""
+        sketch = QuantileSketch()
+        for value in [0.0, 2.5, 40.0, 40.0, 900.0]:
+            sketch.add(value)
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.to_dict() == sketch.to_dict()
+        assert restored.percentile(50) == sketch.percentile(50)
+
+    def test_zero_values(self):
+        """Test zero durations land in the zero bucket."""
+        sketch = QuantileSketch()
+        for value in [0.0, 0.0, 0.0, 10.0]:
+            sketch.add(value)
+
+        assert sketch.zero_count == 3
+        assert sketch.quantile(0.5) == 0.0
+
+    def test_collapse_keeps_bins_bounded(self):
+        """Test the lowest buckets are folded beyond max_bins."""
+        sketch = QuantileSketch(max_bins=10)
+        for exponent in range(-5, 20):
+            sketch.add(2.0**exponent)
+
+        assert len(sketch.bins) == 10
+        assert sum(sketch.bins.values()) == 25
+        # High quantiles are unaffected by collapsing low buckets
+        assert abs(sketch.quantile(1) - 2.0**19) <= 0.01 * 2.0**19
+
+    def test_empty(self):
+        """Test empty sketch."""
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.99) == 0.0
+        assert QuantileSketch.from_dict(sketch.to_dict()).count == 0
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=0)
+        with pytest.raises(ValueError):
+            QuantileSketch(max_bins=0)
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(1.5)
@@ -7,6 +7,8 @@ Tests:
     - Filtering by start_date
     - Storage statistics
     - Graceful error handling
+    - Segment indexes, windowed reads and migration
+    - Buffered background writer
 
 Author: @python-pro
 Phase: 2 Performance Analytics
@@ -16,11 +18,13 @@ Date: 2025-10-18
 import json
 import tempfile
 import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
+from mycelium_analytics import segments
 from mycelium_analytics.storage import EventStorage
 
 
@@ -398,3 +402,424 @@ class TestErrorHandling:
 
         read_events = storage.read_events()
         assert len(read_events) == 3
+
+
+def write_segment(path: Path, events: list[dict]) -> None:
+    """Write events to a JSONL segment file."""
+    with path.open("w", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def make_events(start: datetime, count: int, step: timedelta, event_type: str = "agent_discovery") -> list[dict]:
+    """Create events with increasing timestamps."""
+    return [{"timestamp": (start + step * i).isoformat(), "event_type": event_type, "seq": i} for i in range(count)]
+
+
+class TestSegments:
+    """Test indexed segments and windowed reads."""
+
+    def test_index_built_on_first_read(self, storage):
+        """Test rotated segments get a sidecar index describing them."""
+        start = datetime(2025, 10, 18, tzinfo=timezone.utc)
+        events = make_events(start, 2500, timedelta(seconds=1)) + make_events(start, 5, timedelta(0), "agent_load")
+        segment = storage.storage_dir / "events_20251018_000000_000000.jsonl"
+        write_segment(segment, events)
+
+        assert len(storage.read_events(limit=1)) == 1
+
+        data = json.loads(segments.index_path(segment).read_text())
+        assert data["count"] == 2505
+        assert data["event_types"] == {"agent_discovery": 2500, "agent_load": 5}
+        assert data["min_ts"] == start.timestamp()
+        assert data["max_ts"] == (start + timedelta(seconds=2499)).timestamp()
+        assert len(data["blocks"]) == 3
+        assert data["size"] == segment.stat().st_size
+
+    def test_stale_index_rebuilt(self, storage):
+        """Test an index that no longer matches its segment is rebuilt."""
+        segment = storage.storage_dir / "events_20251018_000000_000000.jsonl"
+        write_segment(segment, make_events(datetime(2025, 10, 18, tzinfo=timezone.utc), 3, timedelta(seconds=1)))
+        assert len(storage.read_events()) == 3
+
+        with segment.open("a") as f:
+            f.write(json.dumps({"timestamp": "2025-10-18T01:00:00+00:00", "event_type": "late"}) + "\n")
+
+        assert len(storage.read_events()) == 4
+        assert segments.load_index(segment).event_types["late"] == 1
+
+    def test_limit_returns_newest_events(self, storage):
+        """Test a limit keeps the newest events, returned oldest first."""
+        old_start = datetime.now(timezone.utc) - timedelta(days=3)
+        write_segment(
+            storage.storage_dir / "events_20000101_000000_000000.jsonl",
+            make_events(old_start, 50, timedelta(minutes=1)),
+        )
+        recent_start = datetime.now(timezone.utc) - timedelta(hours=1)
+        for event in make_events(recent_start, 10, timedelta(seconds=1), "recent"):
+            storage.append_event(event)
+
+        events = storage.read_events(limit=15)
+
+        assert len(events) == 15
+        assert [e["event_type"] for e in events] == ["agent_discovery"] * 5 + ["recent"] * 10
+        assert [e["seq"] for e in events[:5]] == [45, 46, 47, 48, 49]
+        assert [e["seq"] for e in events[5:]] == list(range(10))
+
+    def test_start_date_skips_old_segments(self, storage, monkeypatch):
+        """Test segments entirely before start_date are not read."""
+        now = datetime.now(timezone.utc)
+        old = storage.storage_dir / "events_20000101_000000_000000.jsonl"
+        new = storage.storage_dir / "events_20000102_000000_000000.jsonl"
+        write_segment(old, make_events(now - timedelta(days=30), 100, timedelta(minutes=1)))
+        write_segment(new, make_events(now - timedelta(hours=2), 100, timedelta(seconds=1)))
+
+        read_paths = []
+        iter_segment = segments.iter_segment
+
+        def recording_iter_segment(path, *args, **kwargs):
+            read_paths.append(path)
+            return iter_segment(path, *args, **kwargs)
+
+        monkeypatch.setattr("mycelium_analytics.storage.iter_segment", recording_iter_segment)
+
+        events = storage.read_events(start_date=now - timedelta(days=1), limit=1000)
+
+        assert len(events) == 100
+        assert read_paths == [new]
+
+    def test_start_date_within_segment(self, storage):
+        """Test block skipping keeps every event at or after start_date."""
+        start = datetime.now(timezone.utc) - timedelta(hours=5)
+        write_segment(
+            storage.storage_dir / "events_20000101_000000_000000.jsonl",
+            make_events(start, 5000, timedelta(seconds=3)),
+        )
+
+        cutoff = start + timedelta(seconds=3 * 3456)
+        events = storage.read_events(start_date=cutoff, limit=10000)
+
+        assert [e["seq"] for e in events] == list(range(3456, 5000))
+
+    def test_event_type_filter(self, storage):
+        """Test reads restricted to event types skip other segments."""
+        start = datetime.now(timezone.utc) - timedelta(hours=1)
+        write_segment(
+            storage.storage_dir / "events_20000101_000000_000000.jsonl",
+            make_events(start, 20, timedelta(seconds=1), "agent_load"),
+        )
+        for event in make_events(start, 5, timedelta(seconds=1)):
+            storage.append_event(event)
+
+        assert len(storage.read_events(event_types=["agent_load"])) == 20
+        assert len(storage.read_events(event_types=["agent_discovery"])) == 5
+        assert list(storage.iter_events(event_types=["missing"])) == []
+
+    def test_iter_events_streams_oldest_first(self, storage):
+        """Test iter_events visits closed segments then the active one."""
+        start = datetime(2025, 10, 18, tzinfo=timezone.utc)
+        write_segment(
+            storage.storage_dir / "events_20251018_000000_000000.jsonl", make_events(start, 3, timedelta(seconds=1))
+        )
+        for event in make_events(start + timedelta(days=1), 2, timedelta(seconds=1), "recent"):
+            storage.append_event(event)
+
+        event_types = [e["event_type"] for e in storage.iter_events()]
+        assert event_types == ["agent_discovery"] * 3 + ["recent"] * 2
+        assert [e["event_type"] for e in storage.iter_events(newest_first=True)] == event_types[::-1]
+
+    def test_rotation_at_period_boundary(self, temp_storage_dir):
+        """Test the active segment rotates when its period has ended."""
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        write_segment(temp_storage_dir / "events.jsonl", make_events(yesterday, 3, timedelta(seconds=1)))
+
+        storage = EventStorage(storage_dir=temp_storage_dir, segment_period="day")
+        storage.append_event({"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "today"})
+
+        rotated = list(temp_storage_dir.glob("events_*.jsonl"))
+        assert len(rotated) == 1
+        assert len(rotated[0].read_text().splitlines()) == 3
+        assert len((temp_storage_dir / "events.jsonl").read_text().splitlines()) == 1
+
+    def test_size_only_rotation(self, temp_storage_dir):
+        """Test segment_period=None keeps a stale period's segment active."""
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        write_segment(temp_storage_dir / "events.jsonl", make_events(yesterday, 3, timedelta(seconds=1)))
+
+        storage = EventStorage(storage_dir=temp_storage_dir, segment_period=None)
+        storage.append_event({"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "today"})
+
+        assert list(temp_storage_dir.glob("events_*.jsonl")) == []
+
+        with pytest.raises(ValueError):
+            EventStorage(storage_dir=temp_storage_dir, segment_period="week")
+
+    def test_stats_from_indexes(self, storage):
+        """Test storage stats combine segment indexes and the active segment."""
+        start = datetime(2025, 10, 18, tzinfo=timezone.utc)
+        write_segment(
+            storage.storage_dir / "events_20251018_000000_000000.jsonl",
+            make_events(start, 10, timedelta(seconds=1), "agent_load"),
+        )
+        storage.append_event({"timestamp": "2025-10-19T00:00:00+00:00", "event_type": "agent_discovery"})
+
+        stats = storage.get_storage_stats()
+
+        assert stats["file_count"] == 2
+        assert stats["total_events"] == 11
+        assert stats["event_type_counts"] == {"agent_load": 10, "agent_discovery": 1}
+        assert stats["latest_event_time"] == "2025-10-19T00:00:00+00:00"
+
+    def test_active_index_extended(self, storage, monkeypatch):
+        """Test stats only index lines appended since the last call."""
+        start = datetime(2025, 10, 18, tzinfo=timezone.utc)
+        for event in make_events(start, 5, timedelta(seconds=1)):
+            storage.append_event(event)
+        assert storage.get_storage_stats()["total_events"] == 5
+
+        extended = []
+        extend = segments.SegmentIndex.extend
+
+        def counting_extend(index, lines):
+            lines = list(lines)
+            extended.append(len(lines))
+            extend(index, lines)
+
+        monkeypatch.setattr(segments.SegmentIndex, "extend", counting_extend)
+        storage.append_event({"timestamp": "2025-10-19T00:00:00+00:00", "event_type": "agent_load"})
+        # A partially written line is left for the next call
+        with storage.active_segment.open("a") as f:
+            f.write('{"timestamp": "2025-10-19')
+
+        stats = storage.get_storage_stats()
+
+        assert extended == [1]
+        assert stats["total_events"] == 6
+        assert stats["latest_event_time"] == "2025-10-19T00:00:00+00:00"
+
+    def test_active_index_not_reused_after_rotation(self, temp_storage_dir):
+        """Test a new active segment does not inherit the previous index."""
+        storage = EventStorage(storage_dir=temp_storage_dir, max_file_size=1, segment_period=None)
+        storage.append_event({"timestamp": "2025-10-18T00:00:00+00:00", "event_type": "a"})
+        assert storage.get_storage_stats()["event_type_counts"] == {"a": 1}
+
+        storage.append_event({"timestamp": "2025-10-18T00:00:01+00:00", "event_type": "b"})
+        stats = storage.get_storage_stats()
+
+        assert stats["file_count"] == 2
+        assert stats["event_type_counts"] == {"a": 1, "b": 1}
+
+    def test_clear_removes_indexes(self, storage):
+        """Test clearing storage also removes sidecar indexes."""
+        segment = storage.storage_dir / "events_20251018_000000_000000.jsonl"
+        write_segment(segment, make_events(datetime(2025, 10, 18, tzinfo=timezone.utc), 3, timedelta(seconds=1)))
+        storage.read_events()
+        assert segments.index_path(segment).exists()
+
+        storage.clear_all_events()
+
+        assert list(storage.storage_dir.iterdir()) == []
+
+
+class TestSegmentMigration:
+    """Test the one-time migration of legacy rotated files."""
+
+    def test_migrate_partitions_by_day(self, storage):
+        """Test legacy files are regrouped into sorted per-day segments."""
+        day1 = datetime(2025, 10, 18, 12, tzinfo=timezone.utc)
+        day2 = datetime(2025, 10, 19, 12, tzinfo=timezone.utc)
+        legacy_a = make_events(day2, 3, timedelta(minutes=1)) + make_events(day1, 3, timedelta(minutes=1))
+        legacy_b = make_events(day1 + timedelta(hours=1), 2, timedelta(minutes=1)) + [{"event_type": "undated"}]
+        write_segment(storage.storage_dir / "events_20251019_130000_000000.jsonl", legacy_a)
+        write_segment(storage.storage_dir / "events_20251019_140000_000000.jsonl", legacy_b)
+        with (storage.storage_dir / "events_20251019_140000_000000.jsonl").open("a") as f:
+            f.write("not valid json\n")
+        storage.append_event({"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "active"})
+
+        result = storage.migrate_segments()
+
+        assert result == {"files_migrated": 2, "segments_written": 3, "events_migrated": 9}
+        names = sorted(p.name for p in storage.storage_dir.glob("events*.jsonl"))
+        assert names == [
+            "events.jsonl",
+            "events_20251018_migrated.jsonl",
+            "events_20251019_migrated.jsonl",
+            "events_undated_migrated.jsonl",
+        ]
+
+        day1_events = [json.loads(line) for line in (storage.storage_dir / names[1]).read_text().splitlines()]
+        timestamps = [e["timestamp"] for e in day1_events]
+        assert len(timestamps) == 5
+        assert timestamps == sorted(timestamps)
+        assert segments.index_path(storage.storage_dir / names[1]).exists()
+
+        assert len(storage.read_events(limit=100)) == 10
+        assert storage.read_events(limit=1)[0]["event_type"] == "active"
+
+        # One-time: later calls do nothing
+        assert storage.migrate_segments() == {"files_migrated": 0, "segments_written": 0, "events_migrated": 0}
+
+    def test_migrate_resumes_interrupted_run(self, storage):
+        """Test staged sources from an interrupted migration are not lost or duplicated."""
+        staged = storage.storage_dir / ".migrating" / "sources"
+        staged.mkdir(parents=True)
+        day = datetime(2025, 10, 18, tzinfo=timezone.utc)
+        write_segment(staged / "events_20251018_120000_000000.jsonl", make_events(day, 4, timedelta(minutes=1)))
+        # Output of the interrupted run already moved in place
+        write_segment(storage.storage_dir / "events_20251018_migrated.jsonl", make_events(day, 2, timedelta(minutes=1)))
+
+        result = storage.migrate_segments()
+
+        assert result["events_migrated"] == 4
+        assert len(storage.read_events(limit=100)) == 4
+        assert not (storage.storage_dir / ".migrating").exists()
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def active_lines(storage: EventStorage) -> list[dict]:
+    """Read the events written to the active segment."""
+    if not storage.active_segment.exists():
+        return []
+    return [json.loads(line) for line in storage.active_segment.read_text().splitlines()]
+
+
+@pytest.fixture
+def buffered(temp_storage_dir):
+    """Create a buffered EventStorage that only flushes when asked."""
+    storage = EventStorage(storage_dir=temp_storage_dir, buffered=True, flush_every=1000, flush_interval_ms=60000)
+    yield storage
+    storage.close()
+
+
+class TestBufferedWriter:
+    """Test the opt-in background writer."""
+
+    def test_events_queued_until_flush(self, buffered):
+        """Test appends stay in memory until flushed, in order."""
+        for i in range(5):
+            buffered.append_event({"event_type": "test", "index": i})
+
+        assert active_lines(buffered) == []
+        assert buffered.get_writer_stats()["pending"] == 5
+
+        buffered.flush()
+
+        assert [event["index"] for event in active_lines(buffered)] == [0, 1, 2, 3, 4]
+        stats = buffered.get_writer_stats()
+        assert stats["written"] == 5
+        assert stats["flushes"] == 1
+        assert stats["pending"] == 0
+
+    def test_flush_on_batch_size(self, temp_storage_dir):
+        """Test the writer commits once flush_every events are queued."""
+        storage = EventStorage(storage_dir=temp_storage_dir, buffered=True, flush_every=10, flush_interval_ms=60000)
+        try:
+            for i in range(10):
+                storage.append_event({"event_type": "test", "index": i})
+
+            assert wait_for(lambda: len(active_lines(storage)) == 10)
+            assert storage.get_writer_stats()["flushes"] == 1
+        finally:
+            storage.close()
+
+    def test_flush_on_interval(self, temp_storage_dir):
+        """Test a partial batch is committed after flush_interval_ms."""
+        storage = EventStorage(storage_dir=temp_storage_dir, buffered=True, flush_every=1000, flush_interval_ms=20)
+        try:
+            storage.append_event({"event_type": "test"})
+
+            assert wait_for(lambda: len(active_lines(storage)) == 1)
+        finally:
+            storage.close()
+
+    def test_idle_writer_exits(self, temp_storage_dir):
+        """Test the writer thread stops once the queue is drained."""
+        storage = EventStorage(storage_dir=temp_storage_dir, buffered=True, flush_interval_ms=10)
+        try:
+            storage.append_event({"event_type": "test"})
+            assert storage._writer is not None
+
+            assert wait_for(lambda: storage._writer is None)
+            assert len(active_lines(storage)) == 1
+
+            storage.append_event({"event_type": "test"})
+            assert wait_for(lambda: len(active_lines(storage)) == 2)
+        finally:
+            storage.close()
+
+    def test_full_queue_drops_events(self, temp_storage_dir):
+        """Test appends beyond max_queue are dropped and counted."""
+        storage = EventStorage(storage_dir=temp_storage_dir, buffered=True, max_queue=3, flush_interval_ms=60000)
+        try:
+            for i in range(5):
+                storage.append_event({"event_type": "test", "index": i})
+
+            assert storage.get_writer_stats()["dropped"] == 2
+            storage.flush()
+            assert [event["index"] for event in active_lines(storage)] == [0, 1, 2]
+        finally:
+            storage.close()
+
+    def test_close_flushes(self, buffered):
+        """Test close writes queued events and later appends go straight to disk."""
+        buffered.append_event({"event_type": "queued"})
+        buffered.close()
+
+        assert [event["event_type"] for event in active_lines(buffered)] == ["queued"]
+
+        buffered.append_event({"event_type": "direct"})
+        assert [event["event_type"] for event in active_lines(buffered)] == ["queued", "direct"]
+
+    def test_reads_see_queued_events(self, buffered):
+        """Test reads through the same instance flush first."""
+        buffered.append_event({"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "test"})
+
+        assert len(buffered.read_events()) == 1
+        buffered.append_event({"timestamp": datetime.now(timezone.utc).isoformat(), "event_type": "test"})
+        assert buffered.get_storage_stats()["total_events"] == 2
+
+    def test_non_serializable_raises_in_caller(self, buffered):
+        """Test serialization errors are not deferred to the writer."""
+        with pytest.raises(TypeError):
+            buffered.append_event({"event_type": "test", "data": object()})
+
+        assert buffered.get_writer_stats()["queued"] == 0
+
+    def test_append_does_not_stat(self, storage, monkeypatch):
+        """Test rotation checks use the cached size instead of stat() per write."""
+        storage.append_event({"event_type": "test"})
+        stats = []
+        original = Path.stat
+
+        def counting_stat(self, *args, **kwargs):
+            stats.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", counting_stat)
+        for _ in range(50):
+            storage.append_event({"event_type": "test"})
+
+        assert stats == []
+        monkeypatch.undo()
+        assert storage._active_size == storage.active_segment.stat().st_size
+
+    def test_cached_size_rotates(self, temp_storage_dir):
+        """Test size rotation still triggers from the cached size."""
+        storage = EventStorage(storage_dir=temp_storage_dir, max_file_size=1024, buffered=True)
+        try:
+            for _ in range(3):
+                storage.append_event({"event_type": "large_event", "data": "x" * 500})
+                storage.flush()
+
+            assert len(list(temp_storage_dir.glob("events_*.jsonl"))) == 1
+        finally:
+            storage.close()
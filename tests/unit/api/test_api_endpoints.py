@@ -4,7 +4,7 @@ Tests all API endpoints including health check, agent listing,
 agent details, and categories.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -16,7 +16,7 @@ from mycelium.registry.client import AgentInfo
 @pytest.fixture
 def mock_registry():
     """Create a mock registry client."""
-    registry = Mock()
+    registry = AsyncMock()
 
     # Mock agents for testing
     mock_agents = [
@@ -66,7 +66,7 @@ def mock_registry():
 @pytest.fixture
 def client(mock_registry):
     """Create a test client with mocked registry."""
-    with patch("mycelium.api.app.RegistryClient", return_value=mock_registry):
+    with patch("mycelium.api.app.AsyncRegistryClient", return_value=mock_registry):
         app = create_app()
         # Create a fresh client for each test to avoid rate limiting issues
         return TestClient(app, raise_server_exceptions=False)
@@ -253,7 +253,7 @@ class TestRateLimiting:
     def test_rate_limit_applied(self, mock_registry):
         """Test that rate limiting is configured on endpoints."""
         # Create a fresh app to test rate limiting
-        with patch("mycelium.api.app.RegistryClient", return_value=mock_registry):
+        with patch("mycelium.api.app.AsyncRegistryClient", return_value=mock_registry):
             app = create_app()
             test_client = TestClient(app, raise_server_exceptions=False)
 
@@ -267,7 +267,7 @@ class TestRateLimiting:
 
     def test_rate_limit_configuration(self, mock_registry):
         """Test that rate limit configuration is applied to app."""
-        with patch("mycelium.api.app.RegistryClient", return_value=mock_registry):
+        with patch("mycelium.api.app.AsyncRegistryClient", return_value=mock_registry):
             app = create_app()
 
             # Verify rate limiter is attached to app state
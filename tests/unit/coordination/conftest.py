@@ -0,0 +1,30 @@
+"""Pytest configuration for coordination plugin unit tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PLUGIN_DIR = str(Path(__file__).parent.parent.parent.parent / "plugins" / "mycelium-core")
+
+
+def _use_plugin_package() -> None:
+    """Make ``coordination`` resolve to the plugin package.
+
+    tests/coordination is collected earlier as a package of the same name,
+    which puts tests/ ahead on sys.path and caches it in sys.modules.
+    """
+    if PLUGIN_DIR in sys.path:
+        sys.path.remove(PLUGIN_DIR)
+    sys.path.insert(0, PLUGIN_DIR)
+
+    module = sys.modules.get("coordination")
+    if module is not None and not str(getattr(module, "__file__", "")).startswith(PLUGIN_DIR):
+        for name in [name for name in sys.modules if name == "coordination" or name.startswith("coordination.")]:
+            del sys.modules[name]
+
+
+def pytest_collectstart(collector: pytest.Collector) -> None:
+    """Switch to the plugin package before each test module is imported."""
+    if isinstance(collector, pytest.Module):
+        _use_plugin_package()
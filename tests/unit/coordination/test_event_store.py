@@ -0,0 +1,143 @@
+"""Unit tests for the in-memory coordination event store."""
+
+from typing import Any
+
+import pytest
+from coordination.event_store import InMemoryEventStore
+from coordination.tracker import AgentInfo, CoordinationEvent, CoordinationTracker, EventType
+
+
+class TestInMemoryEventStore:
+    """Tests for the ring-buffer store behind in-memory tracking."""
+
+    @staticmethod
+    def _event(workflow_id: str = "wf-1", **kwargs: Any) -> CoordinationEvent:
+        return CoordinationEvent(
+            event_type=kwargs.pop("event_type", EventType.MESSAGE),
+            workflow_id=workflow_id,
+            **kwargs,
+        )
+
+    def test_capacity_evicts_oldest(self) -> None:
+        """Test the oldest events are evicted once capacity is reached."""
+        store = InMemoryEventStore(capacity=3)
+        events = [self._event(f"wf-{i}", task_id=f"task-{i}") for i in range(5)]
+        for event in events:
+            store.append(event)
+
+        assert len(store) == 3
+        assert list(store.events()) == events[2:]
+        assert store.workflow_events("wf-0") == []
+        assert store.task_events("task-1") == []
+        assert store.workflow_count() == 3
+
+    def test_lookup_returns_newest_in_order(self) -> None:
+        """Test limited lookups return the newest events, oldest first."""
+        store = InMemoryEventStore(capacity=100)
+        events = [self._event(task_id="task-1") for _ in range(10)]
+        for event in events:
+            store.append(event)
+
+        assert store.workflow_events("wf-1", limit=3) == events[-3:]
+        assert store.task_events("task-1") == events
+
+    def test_agent_index_covers_handoff_participants(self) -> None:
+        """Test agent lookups match handoff source and target agents."""
+        store = InMemoryEventStore()
+        handoff = self._event(
+            event_type=EventType.HANDOFF,
+            source_agent=AgentInfo(agent_id="a-1", agent_type="backend"),
+            target_agent=AgentInfo(agent_id="a-2", agent_type="frontend"),
+        )
+        own = self._event(agent_id="a-2")
+        store.append(handoff)
+        store.append(own)
+
+        assert store.agent_events("a-1") == [handoff]
+        assert store.agent_events("a-2") == [handoff, own]
+
+    def test_delete_workflow(self) -> None:
+        """Test deleting a workflow removes its events from every index."""
+        store = InMemoryEventStore()
+        kept = self._event("wf-2", task_id="task-2")
+        store.append(self._event("wf-1", task_id="task-1"))
+        store.append(kept)
+        store.append(self._event("wf-1", task_id="task-2"))
+
+        assert store.delete_workflow("wf-1") == 2
+        assert store.delete_workflow("wf-1") == 0
+        assert list(store.events()) == [kept]
+        assert store.task_events("task-1") == []
+        assert store.task_events("task-2") == [kept]
+
+        # Eviction skips over the deleted sequence numbers
+        small = InMemoryEventStore(capacity=2)
+        small.append(self._event("wf-1"))
+        small.append(self._event("wf-2"))
+        small.delete_workflow("wf-1")
+        small.append(self._event("wf-3"))
+        small.append(self._event("wf-4"))
+        assert [e.workflow_id for e in small.events()] == ["wf-3", "wf-4"]
+
+    def test_per_workflow_retention(self) -> None:
+        """Test max_events_per_workflow drops a workflow's oldest events."""
+        store = InMemoryEventStore(capacity=100, max_events_per_workflow=2)
+        other = self._event("wf-2")
+        store.append(other)
+        events = [self._event("wf-1") for _ in range(4)]
+        for event in events:
+            store.append(event)
+
+        assert store.workflow_events("wf-1") == events[-2:]
+        assert store.workflow_events("wf-2") == [other]
+        assert len(store) == 3
+
+    def test_invalid_limits(self) -> None:
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            InMemoryEventStore(capacity=0)
+        with pytest.raises(ValueError):
+            InMemoryEventStore(max_events_per_workflow=0)
+
+    @pytest.mark.asyncio
+    async def test_tracker_deletes_workflow_events(self) -> None:
+        """Test in-memory delete_workflow_events actually deletes."""
+        tracker = CoordinationTracker()
+        await tracker.track_event(self._event("wf-1"))
+        await tracker.track_event(self._event("wf-1"))
+        await tracker.track_event(self._event("wf-2"))
+
+        assert await tracker.delete_workflow_events("wf-1") == 2
+        assert await tracker.get_workflow_events("wf-1") == []
+        stats = await tracker.get_statistics()
+        assert stats["total_events"] == 1
+        assert stats["unique_workflows"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tracker_memory_limits(self) -> None:
+        """Test max_memory_events and max_events_per_workflow config."""
+        tracker = CoordinationTracker(config={"max_memory_events": 5, "max_events_per_workflow": 2})
+        failure = self._event("wf-0", event_type=EventType.FAILURE)
+        await tracker.track_event(failure)
+        for i in range(9):
+            await tracker.track_event(self._event(f"wf-{i % 4}"))
+
+        stats = await tracker.get_statistics()
+        assert stats["total_events"] == 5
+        assert len(await tracker.get_workflow_events("wf-0")) == 2
+        assert await tracker.get_workflow_events("wf-0", EventType.FAILURE) == []
+
+    def test_index_memory_tracks_live_events(self) -> None:
+        """Test indexes are compacted when dead entries are not at the left."""
+        store = InMemoryEventStore(capacity=10000, max_events_per_workflow=10)
+        old = self._event("old", agent_id="a")
+        store.append(old)
+        for _ in range(20000):
+            store.append(self._event("hot", agent_id="a"))
+
+        assert len(store) == 11
+        assert len(store._by_agent["a"]) < 2 * 11 + 64
+        assert len(store._by_workflow["hot"]) <= 10
+        assert store.agent_events("a")[0] is old
+        assert len(store.agent_events("a")) == 11
+        assert store.workflow_count() == 2
@@ -0,0 +1,542 @@
+"""Unit tests for WorkflowOrchestrator scheduling against an in-memory state manager."""
+
+import asyncio
+import copy
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from coordination.orchestrator import TaskDefinition, TaskExecutionContext, WorkflowOrchestrator, _WorkflowRun
+from coordination.scheduling import FairScheduler
+from coordination.state_manager import (
+    StateConflictError,
+    StateNotFoundError,
+    TaskState,
+    TaskStatus,
+    WorkflowState,
+    WorkflowStatus,
+)
+
+
+class InMemoryStateManager:
+    """StateManager stand-in that keeps workflows in a dict.
+
+    Follows StateManager's versioning: every write bumps the version, and
+    update_workflow and update_tasks only succeed against the stored version.
+    """
+
+    def __init__(self) -> None:
+        self.workflows: dict[str, WorkflowState] = {}
+        self.snapshots: dict[tuple[str, int], WorkflowState] = {}
+
+    def _stored(self, workflow_id: str) -> WorkflowState:
+        try:
+            return self.workflows[workflow_id]
+        except KeyError:
+            raise StateNotFoundError(f"Workflow {workflow_id} not found") from None
+
+    def _save(self, state: WorkflowState) -> None:
+        self.workflows[state.workflow_id] = copy.deepcopy(state)
+        self.snapshots[(state.workflow_id, state.version)] = copy.deepcopy(state)
+
+    async def create_workflow(
+        self,
+        workflow_id: str | None = None,
+        tasks: list[TaskState] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> WorkflowState:
+        now = datetime.now(timezone.utc).isoformat()
+        state = WorkflowState(
+            workflow_id=workflow_id or str(uuid.uuid4()),
+            status=WorkflowStatus.PENDING,
+            tasks={task.task_id: task for task in tasks or []},
+            created_at=now,
+            updated_at=now,
+            metadata=metadata or {},
+        )
+        self._save(state)
+        return state
+
+    async def get_workflow(self, workflow_id: str) -> WorkflowState:
+        return copy.deepcopy(self._stored(workflow_id))
+
+    async def update_workflow(self, state: WorkflowState) -> WorkflowState:
+        if self._stored(state.workflow_id).version != state.version:
+            raise StateConflictError(f"Workflow {state.workflow_id} was modified concurrently")
+        state.version += 1
+        state.updated_at = datetime.now(timezone.utc).isoformat()
+        self._save(state)
+        return state
+
+    async def update_tasks(self, state: WorkflowState, task_ids: list[str]) -> WorkflowState:
+        stored = copy.deepcopy(self._stored(state.workflow_id))
+        if stored.version != state.version:
+            raise StateConflictError(f"Workflow {state.workflow_id} was modified concurrently")
+        for task_id in task_ids:
+            stored.tasks[task_id] = copy.deepcopy(state.tasks[task_id])
+        stored.version += 1
+        stored.updated_at = datetime.now(timezone.utc).isoformat()
+        self._save(stored)
+        state.version = stored.version
+        state.updated_at = stored.updated_at
+        return state
+
+    async def rollback_workflow(self, workflow_id: str, version: int) -> WorkflowState:
+        try:
+            state = copy.deepcopy(self.snapshots[(workflow_id, version)])
+        except KeyError:
+            raise StateNotFoundError(f"Version {version} not found for workflow {workflow_id}") from None
+        self.workflows[workflow_id] = copy.deepcopy(state)
+        return state
+
+
+@pytest.fixture
+def state_manager() -> InMemoryStateManager:
+    """Create an in-memory state manager."""
+    return InMemoryStateManager()
+
+
+@pytest.fixture
+def orchestrator(state_manager: InMemoryStateManager) -> WorkflowOrchestrator:
+    """Create an orchestrator over the in-memory state manager."""
+    return WorkflowOrchestrator(state_manager)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_dependents_dispatched_when_parent_finishes(orchestrator):
+    """Test a dependent starts as soon as its parent finishes, not after siblings."""
+    started = {}
+
+    async def timed_task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        task_id = ctx.task_def.task_id
+        started[task_id] = asyncio.get_event_loop().time()
+        await asyncio.sleep(ctx.task_def.metadata.get("duration", 0.0))
+        return {"output": f"{task_id} done"}
+
+    orchestrator.register_executor("test_agent", timed_task)
+
+    # fast -> after_fast runs while slow (started in the same round) is still running
+    tasks = [
+        TaskDefinition(task_id="fast", agent_id="a", agent_type="test_agent", metadata={"duration": 0.05}),
+        TaskDefinition(task_id="slow", agent_id="b", agent_type="test_agent", metadata={"duration": 0.5}),
+        TaskDefinition(task_id="after_fast", agent_id="c", agent_type="test_agent", dependencies=["fast"]),
+    ]
+
+    workflow_id = await orchestrator.create_workflow(tasks)
+    final_state = await orchestrator.execute_workflow(workflow_id)
+
+    assert final_state.status == WorkflowStatus.COMPLETED
+    assert started["after_fast"] - started["fast"] < 0.4
+
+
+@pytest.mark.asyncio
+async def test_max_parallel_tasks_respected(state_manager):
+    """Test no more than max_parallel_tasks executors run at once."""
+    orchestrator = WorkflowOrchestrator(state_manager, max_parallel_tasks=2)  # type: ignore[arg-type]
+    active = 0
+    peak = 0
+
+    async def counted_task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+        return {"output": ctx.task_def.task_id}
+
+    orchestrator.register_executor("test_agent", counted_task)
+
+    tasks = [TaskDefinition(task_id=f"task_{i}", agent_id=f"agent_{i}", agent_type="test_agent") for i in range(6)]
+
+    workflow_id = await orchestrator.create_workflow(tasks)
+    final_state = await orchestrator.execute_workflow(workflow_id)
+
+    assert final_state.status == WorkflowStatus.COMPLETED
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_running_workflow_not_read_back(orchestrator, state_manager):
+    """Test task execution never re-reads the workflow and writes only changed tasks."""
+    reads = 0
+    written: list[list[str]] = []
+    get_workflow = state_manager.get_workflow
+    update_tasks = state_manager.update_tasks
+
+    async def counting_get_workflow(workflow_id):
+        nonlocal reads
+        reads += 1
+        return await get_workflow(workflow_id)
+
+    async def recording_update_tasks(state, task_ids):
+        task_ids = list(task_ids)
+        written.append(task_ids)
+        return await update_tasks(state, task_ids)
+
+    state_manager.get_workflow = counting_get_workflow
+    state_manager.update_tasks = recording_update_tasks
+
+    async def task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        return {"output": ctx.task_def.task_id}
+
+    orchestrator.register_executor("test_agent", task)
+    tasks = [TaskDefinition(task_id="task_0", agent_id="agent_0", agent_type="test_agent")] + [
+        TaskDefinition(task_id=f"task_{i}", agent_id=f"agent_{i}", agent_type="test_agent", dependencies=["task_0"])
+        for i in range(1, 20)
+    ]
+
+    workflow_id = await orchestrator.create_workflow(tasks)
+    final_state = await orchestrator.execute_workflow(workflow_id)
+
+    assert final_state.status == WorkflowStatus.COMPLETED
+    assert reads == 1  # Only the initial load
+    assert all(len(task_ids) == 1 for task_ids in written)
+    assert len(written) == 2 * len(tasks)  # Running + completed per task
+
+    stored = await get_workflow(workflow_id)
+    assert stored.version == final_state.version
+    assert all(t.status == TaskStatus.COMPLETED and t.result for t in stored.tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_interval_batches_writes(state_manager):
+    """Test a checkpoint interval coalesces task updates into fewer writes."""
+    orchestrator = WorkflowOrchestrator(state_manager, checkpoint_interval=60.0)  # type: ignore[arg-type]
+    written: list[list[str]] = []
+    update_tasks = state_manager.update_tasks
+
+    async def recording_update_tasks(state, task_ids):
+        task_ids = list(task_ids)
+        written.append(task_ids)
+        return await update_tasks(state, task_ids)
+
+    state_manager.update_tasks = recording_update_tasks
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        if ctx.task_def.task_id == "task_9":
+            started.set()
+            await release.wait()
+        return {"output": ctx.task_def.task_id}
+
+    orchestrator.register_executor("test_agent", task)
+    tasks = [
+        TaskDefinition(
+            task_id=f"task_{i}",
+            agent_id=f"agent_{i}",
+            agent_type="test_agent",
+            dependencies=[f"task_{i - 1}"] if i else [],
+        )
+        for i in range(10)
+    ]
+
+    workflow_id = await orchestrator.create_workflow(tasks)
+    await orchestrator.execute_workflow(workflow_id, background=True)
+    execution = orchestrator._active_workflows[workflow_id]
+    await started.wait()
+
+    # Uncheckpointed progress is visible through the orchestrator only
+    live = await orchestrator.get_workflow_status(workflow_id)
+    stored = await state_manager.get_workflow(workflow_id)
+    assert live.tasks["task_8"].status == TaskStatus.COMPLETED
+    assert live.tasks["task_9"].status == TaskStatus.RUNNING
+    assert stored.tasks["task_8"].status == TaskStatus.PENDING
+
+    release.set()
+    final_state = await execution
+
+    assert final_state.status == WorkflowStatus.COMPLETED
+    assert written == [sorted(t.task_id for t in tasks)]
+    stored = await state_manager.get_workflow(workflow_id)
+    assert all(t.status == TaskStatus.COMPLETED for t in stored.tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_agent_type_concurrency_limit(orchestrator):
+    """Test an agent type's limit holds across workflows without blocking other types."""
+    running = 0
+    peak = 0
+    cheap_done_while_saturated = 0
+
+    async def expensive_task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return {"output": "expensive"}
+
+    async def cheap_task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        nonlocal cheap_done_while_saturated
+        if running == 2:
+            cheap_done_while_saturated += 1
+        return {"output": "cheap"}
+
+    orchestrator.register_executor("llm_agent", expensive_task, max_concurrency=2)
+    orchestrator.register_executor("cheap_agent", cheap_task)
+
+    workflow_ids = []
+    for w in range(2):
+        tasks = [
+            TaskDefinition(task_id=f"llm_{i}", agent_id=f"agent_{i}", agent_type="llm_agent") for i in range(4)
+        ] + [TaskDefinition(task_id=f"cheap_{i}", agent_id=f"agent_{i}", agent_type="cheap_agent") for i in range(4)]
+        workflow_ids.append(await orchestrator.create_workflow(tasks, workflow_id=f"limited_{w}_{os.getpid()}"))
+
+    states = await asyncio.gather(*(orchestrator.execute_workflow(wid) for wid in workflow_ids))
+
+    assert all(state.status == WorkflowStatus.COMPLETED for state in states)
+    assert peak == 2
+    assert cheap_done_while_saturated > 0
+
+    stats = orchestrator.get_executor_stats()
+    assert stats["llm_agent"]["max_concurrency"] == 2
+    assert stats["llm_agent"]["dispatched"] == 8
+    assert stats["llm_agent"]["active"] == stats["llm_agent"]["queued"] == 0
+    assert stats["llm_agent"]["max_wait_ms"] > 0
+    assert stats["cheap_agent"]["max_concurrency"] is None
+    assert stats["cheap_agent"]["max_wait_ms"] == 0
+
+
+@pytest.mark.asyncio
+async def test_blocking_executor_in_thread_pool(orchestrator):
+    """Test blocking executors run in their pool instead of on the event loop."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    threads = set()
+
+    def blocking_task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        threads.add(threading.get_ident())
+        time.sleep(0.05)
+        return {"output": ctx.task_def.task_id}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        orchestrator.register_executor("blocking_agent", blocking_task, max_concurrency=4, pool=pool)
+        tasks = [
+            TaskDefinition(task_id=f"task_{i}", agent_id=f"agent_{i}", agent_type="blocking_agent") for i in range(4)
+        ]
+
+        workflow_id = await orchestrator.create_workflow(tasks)
+        final_state = await orchestrator.execute_workflow(workflow_id)
+
+    assert final_state.status == WorkflowStatus.COMPLETED
+    assert final_state.tasks["task_0"].result == {"data": {"output": "task_0"}}
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_queuing():
+    """Test contended slots are shared between workflows by weight, not by arrival."""
+    scheduler = FairScheduler()
+    scheduler.configure("llm_agent", 1)
+    order = []
+
+    async def request(workflow_id: str, weight: float) -> None:
+        async with scheduler.slot("llm_agent", workflow_id, weight):
+            order.append(workflow_id)
+
+    await scheduler.acquire("llm_agent", "holder")
+    # Workflow A floods the queue before B arrives; B has twice A's weight
+    waiters = [asyncio.create_task(request("A", 1.0)) for _ in range(6)]
+    await asyncio.sleep(0)
+    waiters += [asyncio.create_task(request("B", 2.0)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    assert scheduler.get_stats()["llm_agent"]["queued"] == 9
+    scheduler.release("llm_agent")
+    await asyncio.gather(*waiters)
+
+    assert order == ["B", "A", "B", "B", "A", "A", "A", "A", "A"]
+    stats = scheduler.get_stats()["llm_agent"]
+    assert stats["dispatched"] == 10
+    assert stats["active"] == stats["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    """Test a cancelled waiter never takes a slot."""
+    scheduler = FairScheduler()
+    scheduler.configure("llm_agent", 1)
+
+    await scheduler.acquire("llm_agent", "holder")
+    cancelled = asyncio.create_task(scheduler.acquire("llm_agent", "A"))
+    waiting = asyncio.create_task(scheduler.acquire("llm_agent", "B"))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert scheduler.get_stats()["llm_agent"]["queued"] == 1
+
+    scheduler.release("llm_agent")
+    await waiting
+    stats = scheduler.get_stats()["llm_agent"]
+    assert stats["active"] == 1
+    assert stats["queued"] == 0
+
+    with pytest.raises(ValueError):
+        await scheduler.acquire("llm_agent", "A", weight=0)
+
+
+def _chain(length: int) -> list[TaskDefinition]:
+    """Build a chain of tasks, each depending on the previous one."""
+    return [
+        TaskDefinition(
+            task_id=f"task_{i}",
+            agent_id=f"agent_{i}",
+            agent_type="test_agent",
+            dependencies=[f"task_{i - 1}"] if i else [],
+        )
+        for i in range(length)
+    ]
+
+
+async def _echo(ctx: TaskExecutionContext) -> dict[str, Any]:
+    return {"output": ctx.task_def.task_id}
+
+
+@pytest.mark.asyncio
+async def test_pause_while_tasks_report(orchestrator, state_manager):
+    """Test a pause between task writes neither conflicts nor fails the run."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        if ctx.task_def.task_id == "task_1":
+            started.set()
+            await release.wait()
+        return {"output": ctx.task_def.task_id}
+
+    orchestrator.register_executor("test_agent", task)
+    workflow_id = await orchestrator.create_workflow(_chain(3))
+    await orchestrator.execute_workflow(workflow_id, background=True)
+    execution = orchestrator._active_workflows[workflow_id]
+    await started.wait()
+
+    paused = await orchestrator.pause_workflow(workflow_id)
+    assert paused.status == WorkflowStatus.PAUSED
+    release.set()
+
+    final_state = await execution
+    assert final_state.status == WorkflowStatus.COMPLETED
+    stored = await state_manager.get_workflow(workflow_id)
+    assert stored.status == WorkflowStatus.COMPLETED
+    assert all(t.status == TaskStatus.COMPLETED for t in stored.tasks.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("external_status", "final_status"),
+    [(WorkflowStatus.PAUSED, WorkflowStatus.COMPLETED), (WorkflowStatus.CANCELLED, WorkflowStatus.CANCELLED)],
+)
+async def test_status_change_after_last_checkpoint(orchestrator, state_manager, external_status, final_status):
+    """Test the final write survives a status change made after the last checkpoint."""
+    update_tasks = state_manager.update_tasks
+
+    async def update_tasks_then_change_status(state, task_ids):
+        result = await update_tasks(state, task_ids)
+        if all(t.status == TaskStatus.COMPLETED for t in state.tasks.values()):
+            changed = await state_manager.get_workflow(state.workflow_id)
+            changed.status = external_status
+            await state_manager.update_workflow(changed)
+        return result
+
+    state_manager.update_tasks = update_tasks_then_change_status
+    orchestrator.register_executor("test_agent", _echo)
+    workflow_id = await orchestrator.create_workflow(_chain(2))
+
+    final_state = await orchestrator.execute_workflow(workflow_id)
+
+    assert final_state.status == final_status
+    assert (await state_manager.get_workflow(workflow_id)).status == final_status
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_workflow(orchestrator, state_manager):
+    """Test cancelling a workflow that is still running returns promptly."""
+    started = asyncio.Event()
+
+    async def task(ctx: TaskExecutionContext) -> dict[str, Any]:
+        started.set()
+        await asyncio.Event().wait()
+        return {"output": ctx.task_def.task_id}
+
+    orchestrator.register_executor("test_agent", task)
+    workflow_id = await orchestrator.create_workflow(_chain(2))
+    await orchestrator.execute_workflow(workflow_id, background=True)
+    await started.wait()
+
+    cancelled = await asyncio.wait_for(orchestrator.cancel_workflow(workflow_id), timeout=3)
+
+    assert cancelled.status == WorkflowStatus.CANCELLED
+    assert (await state_manager.get_workflow(workflow_id)).status == WorkflowStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_cancel_retries_on_concurrent_task_write(orchestrator, state_manager):
+    """Test cancel re-reads and retries when a task write bumps the version."""
+    orchestrator.register_executor("test_agent", _echo)
+    workflow_id = await orchestrator.create_workflow(_chain(2))
+    get_workflow = state_manager.get_workflow
+    reads = 0
+
+    async def get_workflow_then_task_write(wid):
+        nonlocal reads
+        reads += 1
+        state = await get_workflow(wid)
+        if reads == 1:
+            # Another process reports a task after our read
+            await state_manager.update_tasks(await get_workflow(wid), [])
+        return state
+
+    state_manager.get_workflow = get_workflow_then_task_write
+    cancelled = await orchestrator.cancel_workflow(workflow_id)
+
+    assert reads == 2
+    assert cancelled.status == WorkflowStatus.CANCELLED
+    assert (await get_workflow(workflow_id)).status == WorkflowStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_task_updates_proceed_during_checkpoint_write(state_manager):
+    """Test a slow checkpoint write does not block task updates or leak them into its snapshot."""
+    orchestrator = WorkflowOrchestrator(state_manager, checkpoint_interval=60.0)  # type: ignore[arg-type]
+    workflow_id = await orchestrator.create_workflow(_chain(2))
+    state = await state_manager.get_workflow(workflow_id)
+    run = _WorkflowRun(state, {})
+    orchestrator._runs[workflow_id] = run
+
+    writing = asyncio.Event()
+    release = asyncio.Event()
+    written: list[dict[str, TaskStatus]] = []
+    update_tasks = state_manager.update_tasks
+
+    async def slow_update_tasks(snapshot, task_ids):
+        writing.set()
+        await release.wait()
+        written.append({task_id: snapshot.tasks[task_id].status for task_id in snapshot.tasks})
+        return await update_tasks(snapshot, task_ids)
+
+    state_manager.update_tasks = slow_update_tasks
+    await orchestrator._update_task(run, "task_0", status=TaskStatus.RUNNING)
+    checkpoint = asyncio.create_task(orchestrator._checkpoint(run))
+    await writing.wait()
+
+    # Neither update waits for the write in flight
+    await asyncio.wait_for(orchestrator._update_task(run, "task_0", status=TaskStatus.COMPLETED), timeout=1)
+    await asyncio.wait_for(orchestrator._update_task(run, "task_1", status=TaskStatus.RUNNING), timeout=1)
+    assert run.dirty == {"task_0", "task_1"}
+
+    release.set()
+    await checkpoint
+    assert written == [{"task_0": TaskStatus.RUNNING, "task_1": TaskStatus.PENDING}]
+
+    await orchestrator._checkpoint(run)
+    stored = await state_manager.get_workflow(workflow_id)
+    assert stored.version == run.state.version
+    assert stored.tasks["task_0"].status == TaskStatus.COMPLETED
+    assert stored.tasks["task_1"].status == TaskStatus.RUNNING
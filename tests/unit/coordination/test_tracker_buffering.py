@@ -0,0 +1,127 @@
+"""Unit tests for CoordinationTracker write-behind buffering without PostgreSQL."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from coordination.tracker import CoordinationEvent, CoordinationTracker, EventType, TrackerError
+
+
+def _event(i: int) -> CoordinationEvent:
+    return CoordinationEvent(
+        event_type=EventType.EXECUTION_START,
+        workflow_id="wf-spill",
+        task_id=f"task-{i}",
+        agent_id="agent",
+        metadata={"i": i},
+    )
+
+
+def _spilling_tracker(tmp_path: Path) -> CoordinationTracker:
+    return CoordinationTracker(
+        pool=MagicMock(),
+        config={
+            "buffered": True,
+            "batch_size": 2,
+            "max_buffered_events": 2,
+            "flush_interval": 60,
+            "backpressure": "spill",
+            "spill_path": str(tmp_path / "spill.jsonl"),
+        },
+    )
+
+
+class TestSpillDrain:
+    """Tests for writing spilled events back to the database."""
+
+    @pytest.mark.asyncio
+    async def test_spill_during_slow_copy_is_kept(self, tmp_path: Path) -> None:
+        """Test events spilled while the spill file drains are not lost."""
+        tracker = _spilling_tracker(tmp_path)
+        written: list[int] = []
+        copying = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_copy(events: list[CoordinationEvent]) -> None:
+            copying.set()
+            await release.wait()
+            written.extend(event.metadata["i"] for event in events)
+
+        tracker._copy_events = slow_copy  # type: ignore[method-assign]
+        for i in range(3):
+            tracker._spill(_event(i))
+
+        drain = asyncio.create_task(tracker.flush())
+        await copying.wait()
+        for i in range(3, 6):
+            tracker._spill(_event(i))
+        release.set()
+
+        assert await drain == 6
+        assert written == [0, 1, 2, 3, 4, 5]
+        assert list(tmp_path.iterdir()) == []
+        assert tracker.get_buffer_stats()["flushed"] == 6
+
+    @pytest.mark.asyncio
+    async def test_failed_drain_keeps_unwritten_tail(self, tmp_path: Path) -> None:
+        """Test a failed batch leaves its events for the next flush, ahead of new spills."""
+        tracker = _spilling_tracker(tmp_path)
+        written: list[int] = []
+        fail = True
+
+        async def flaky_copy(events: list[CoordinationEvent]) -> None:
+            if fail and events[0].metadata["i"] == 2:
+                raise OSError("connection reset")
+            written.extend(event.metadata["i"] for event in events)
+
+        tracker._copy_events = flaky_copy  # type: ignore[method-assign]
+        for i in range(5):
+            tracker._spill(_event(i))
+
+        with pytest.raises(TrackerError, match="spilled"):
+            await tracker.flush()
+        assert written == [0, 1]
+
+        tracker._spill(_event(5))
+        fail = False
+        assert await tracker.flush() == 4
+        assert written == [0, 1, 2, 3, 4, 5]
+        assert list(tmp_path.iterdir()) == []
+        assert tracker.get_buffer_stats()["flush_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_spill_lines_are_skipped(self, tmp_path: Path) -> None:
+        """Test a truncated or invalid spill line does not block the events around it."""
+        tracker = _spilling_tracker(tmp_path)
+        written: list[int] = []
+
+        async def copy(events: list[CoordinationEvent]) -> None:
+            written.extend(event.metadata["i"] for event in events)
+
+        tracker._copy_events = copy  # type: ignore[method-assign]
+        tracker._spill(_event(0))
+        with (tmp_path / "spill.jsonl").open("a", encoding="utf-8") as f:
+            f.write('[1, 2]\n{"event_type": "execution_start"}\n')
+        tracker._spill(_event(1))
+        with (tmp_path / "spill.jsonl").open("ab") as f:
+            f.write(b'{"event_type": "execution_st\xc3')
+
+        assert await tracker.flush() == 2
+        assert written == [0, 1]
+        assert list(tmp_path.iterdir()) == []
+        assert tracker.get_buffer_stats()["malformed"] == 3
+
+
+class TestBufferConfig:
+    """Tests for write-behind buffer configuration."""
+
+    def test_invalid_backpressure(self) -> None:
+        """Test unknown backpressure policies are rejected."""
+        with pytest.raises(ValueError, match="backpressure"):
+            CoordinationTracker(config={"buffered": True, "backpressure": "ignore"})
+
+    def test_invalid_batch_size(self) -> None:
+        """Test batches must fit in the buffer."""
+        with pytest.raises(ValueError, match="batch_size"):
+            CoordinationTracker(config={"buffered": True, "batch_size": 20, "max_buffered_events": 10})
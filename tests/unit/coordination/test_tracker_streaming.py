@@ -0,0 +1,58 @@
+"""Unit tests for streaming a workflow's events from the in-memory store."""
+
+import pytest
+from coordination.tracker import CoordinationEvent, CoordinationTracker, EventType
+
+
+class TestStreamWorkflowEvents:
+    """Tests for stream_workflow_events ordering and resumption."""
+
+    @pytest.fixture
+    async def tracker(self) -> CoordinationTracker:
+        """Create a tracker holding events that share timestamps."""
+        tracker = CoordinationTracker()
+        for i, second in enumerate([0, 1, 1, 1, 2]):
+            await tracker.track_event(
+                CoordinationEvent(
+                    event_id=f"00000000-0000-0000-0000-{4 - i:012d}",
+                    event_type=EventType.EXECUTION_START,
+                    workflow_id="wf-stream",
+                    task_id=f"task-{i}",
+                    timestamp=f"2026-10-16T09:00:0{second}Z",
+                    metadata={"i": i},
+                )
+            )
+        return tracker
+
+    @pytest.mark.asyncio
+    async def test_ordered_by_timestamp_then_id(self, tracker: CoordinationTracker) -> None:
+        """Test events sharing a timestamp are ordered by event id."""
+        events = [e async for e in tracker.stream_workflow_events("wf-stream")]
+
+        assert [e.metadata["i"] for e in events] == [0, 3, 2, 1, 4]
+
+    @pytest.mark.asyncio
+    async def test_since_timestamp_is_exclusive(self, tracker: CoordinationTracker) -> None:
+        """Test a bare timestamp skips every event at that timestamp."""
+        events = [e async for e in tracker.stream_workflow_events("wf-stream", since="2026-10-16T09:00:01Z")]
+
+        assert [e.metadata["i"] for e in events] == [4]
+
+    @pytest.mark.asyncio
+    async def test_resume_between_events_sharing_a_timestamp(self, tracker: CoordinationTracker) -> None:
+        """Test resuming from (timestamp, event_id) yields the rest of that timestamp."""
+        first_two = []
+        async for event in tracker.stream_workflow_events("wf-stream", raw=True):
+            first_two.append(event)
+            if len(first_two) == 2:
+                break
+        last = first_two[-1]
+
+        resumed = [
+            e
+            async for e in tracker.stream_workflow_events(
+                "wf-stream", since=last["timestamp"], raw=True, after_event_id=last["event_id"]
+            )
+        ]
+
+        assert [e["metadata"]["i"] for e in first_two + resumed] == [0, 3, 2, 1, 4]
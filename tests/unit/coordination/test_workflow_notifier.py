@@ -0,0 +1,90 @@
+"""Unit tests for in-process workflow change notifications."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from coordination.notifications import WorkflowNotifier
+from coordination.tracker import CoordinationTracker, TrackerError, track_handoff
+
+
+class TestWorkflowNotifier:
+    """Tests for WorkflowNotifier without a LISTEN connection."""
+
+    @pytest.mark.asyncio
+    async def test_in_process_fan_out(self) -> None:
+        """Test subscribers only receive their workflow's notifications."""
+        notifier = WorkflowNotifier()
+        async with notifier.subscribe("wf-a") as first, notifier.subscribe("wf-a") as second:
+            async with notifier.subscribe("wf-b") as other:
+                await notifier.publish("wf-a", "state", status="running", error=None)
+
+                expected = {"workflow_id": "wf-a", "kind": "state", "status": "running"}
+                assert await first.get(timeout=1) == expected
+                assert await second.get(timeout=1) == expected
+                assert await other.get(timeout=0.05) is None
+            assert notifier.get_stats()["subscriptions"] == 2
+
+        assert notifier.get_stats() == {"published": 1, "delivered": 2, "malformed": 0, "subscriptions": 0}
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self) -> None:
+        """Test a full subscription queue drops its oldest notifications."""
+        notifier = WorkflowNotifier()
+        subscription = notifier.subscribe("wf-slow", max_queue=2)
+        await subscription.start()
+        for i in range(5):
+            await notifier.publish("wf-slow", "event", event_id=str(i))
+
+        assert subscription.dropped == 3
+        await notifier.close()
+        assert [change["event_id"] async for change in subscription] == ["3", "4"]
+        assert subscription.closed
+
+    @pytest.mark.asyncio
+    async def test_tracker_publishes_events(self) -> None:
+        """Test the in-memory tracker publishes compact event notifications."""
+        tracker = CoordinationTracker(notifier=WorkflowNotifier())
+        async with tracker.subscribe("wf-live") as subscription:
+            await track_handoff(tracker, "wf-live", "agent-a", "planner", "agent-b", "coder")
+            change = await subscription.get(timeout=1)
+
+        assert change["kind"] == "event"
+        assert change["event_type"] == "handoff"
+        assert "metadata" not in change
+
+        with pytest.raises(TrackerError, match="WorkflowNotifier"):
+            CoordinationTracker().subscribe("wf-live")
+
+    @pytest.mark.asyncio
+    async def test_non_object_payloads_are_malformed(self) -> None:
+        """Test JSON payloads that are not notification objects are counted, not raised."""
+        notifier = WorkflowNotifier()
+        async with notifier.subscribe("wf-a") as subscription:
+            for payload in ("[1, 2]", '"wf-a"', "null", '{"workflow_id": ["wf-a"]}', "{not json"):
+                notifier._on_notification(MagicMock(), 1, notifier.channel, payload)
+            notifier._on_notification(MagicMock(), 1, notifier.channel, '{"workflow_id": "wf-a", "kind": "state"}')
+
+            assert await subscription.get(timeout=1) == {"workflow_id": "wf-a", "kind": "state"}
+
+        assert notifier.get_stats()["malformed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_lost_listener_is_released_to_the_pool(self) -> None:
+        """Test a terminated LISTEN connection goes back to the pool and a new one is used."""
+        lost, replacement = (MagicMock(add_listener=AsyncMock(), remove_listener=AsyncMock()) for _ in range(2))
+        pool = MagicMock(acquire=AsyncMock(side_effect=[lost, replacement]), release=AsyncMock())
+        notifier = WorkflowNotifier(pool=pool)
+
+        subscription = notifier.subscribe("wf-a")
+        await subscription.start()
+        notifier._on_listener_lost(lost)
+        await asyncio.sleep(0)
+
+        pool.release.assert_awaited_once_with(lost)
+        assert subscription.closed
+        assert notifier.get_stats()["subscriptions"] == 0
+
+        async with notifier.subscribe("wf-a"):
+            assert notifier._listener is replacement
+        pool.release.assert_awaited_with(replacement)
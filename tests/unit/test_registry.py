@@ -1,10 +1,10 @@
 """Unit tests for agent registry client."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from mycelium.registry.client import REDIS_AVAILABLE, AgentInfo, RegistryClient
+from mycelium.registry.client import REDIS_AVAILABLE, AgentInfo, AsyncRegistryClient, RegistryClient
 
 
 class TestAgentInfo:
@@ -78,6 +78,18 @@ class TestRegistryClient:
         client = RegistryClient(redis_url="redis://custom:6379")
         assert client.redis_url == "redis://custom:6379"
 
+    @pytest.mark.skipif(not REDIS_AVAILABLE, reason="Redis not available")
+    def test_connect_without_verification_skips_ping(self) -> None:
+        """Test verify_connection=False connects without a PING round trip."""
+        client = RegistryClient(verify_connection=False)
+        mock_redis = MagicMock()
+        mock_redis.smembers.return_value = set()
+
+        with patch("mycelium.registry.client.redis.from_url", return_value=mock_redis):
+            assert client.list_agents() == []
+
+        mock_redis.ping.assert_not_called()
+
     def test_register_agent(self) -> None:
         """Test agent registration creates correct AgentInfo."""
         client = RegistryClient()
@@ -184,7 +196,7 @@ class TestRegistryClient:
         mock_redis = MagicMock()
         mock_redis.ping.return_value = True
         mock_redis.smembers.return_value = {"agent1", "agent2"}
-        mock_redis.hgetall.side_effect = [
+        mock_redis.pipeline.return_value.execute.return_value = [
             {"name": "agent1", "category": "backend", "status": "healthy"},
             {"name": "agent2", "category": "frontend", "status": "healthy"},
         ]
@@ -197,6 +209,10 @@ class TestRegistryClient:
         assert agents[0].name == "agent1"
         assert agents[0].category == "backend"
 
+        # All hashes fetched in one pipelined round trip
+        mock_redis.hgetall.assert_not_called()
+        mock_redis.pipeline.return_value.execute.assert_called_once()
+
     def test_unregister_agent(self) -> None:
         """Test agent unregistration calls Redis delete."""
         client = RegistryClient()
@@ -214,6 +230,111 @@ class TestRegistryClient:
         mock_redis.srem.assert_called_once_with("mycelium:agent_names", "test-agent")
 
 
+def make_async_redis(members: set[str], pipeline_results: list[object]) -> MagicMock:
+    """Build a redis.asyncio client mock with a pipeline returning the given results."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=pipeline_results)
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+
+    mock_redis = MagicMock()
+    mock_redis.smembers = AsyncMock(return_value=members)
+    mock_redis.hgetall = AsyncMock()
+    mock_redis.ping = AsyncMock(return_value=True)
+    mock_redis.aclose = AsyncMock()
+    mock_redis.pipeline.return_value = pipe
+    return mock_redis
+
+
+class TestAsyncRegistryClient:
+    """Test AsyncRegistryClient."""
+
+    async def test_list_agents_single_pipelined_round_trip(self) -> None:
+        """Test listing fetches all agent hashes through one pipeline."""
+        mock_redis = make_async_redis(
+            {"agent1", "agent2", "stale"},
+            [
+                {"name": "agent1", "category": "backend", "status": "healthy", "pid": "42", "port": ""},
+                {"name": "agent2", "category": "frontend", "status": "starting"},
+                {},
+            ],
+        )
+        client = AsyncRegistryClient()
+        client._redis_client = mock_redis
+
+        agents = await client.list_agents(category="backend")
+
+        assert [a.name for a in agents] == ["agent1"]
+        assert agents[0].pid == 42
+        assert agents[0].port is None
+        assert mock_redis.pipeline.return_value.hgetall.call_count == 3
+        mock_redis.pipeline.return_value.execute.assert_awaited_once()
+        mock_redis.hgetall.assert_not_awaited()
+
+    async def test_list_agents_empty(self) -> None:
+        """Test listing agents when none exist skips the pipeline."""
+        mock_redis = make_async_redis(set(), [])
+        client = AsyncRegistryClient()
+        client._redis_client = mock_redis
+
+        assert await client.list_agents() == []
+        mock_redis.pipeline.assert_not_called()
+
+    async def test_get_stats_fetches_only_status(self) -> None:
+        """Test statistics read the status field instead of listing agents."""
+        mock_redis = make_async_redis({"agent1", "agent2", "agent3"}, ["healthy", "starting", None])
+        client = AsyncRegistryClient()
+        client._redis_client = mock_redis
+
+        stats = await client.get_stats()
+
+        assert stats == {"agent_count": 2, "active_count": 1}
+        assert mock_redis.pipeline.return_value.hget.call_count == 3
+        mock_redis.pipeline.return_value.hgetall.assert_not_called()
+
+    async def test_register_and_unregister_use_transactions(self) -> None:
+        """Test registration writes the hash and name set atomically."""
+        mock_redis = make_async_redis(set(), [])
+        client = AsyncRegistryClient()
+        client._redis_client = mock_redis
+
+        agent = await client.register_agent(name="test-agent", category="backend", pid=1234)
+        await client.unregister_agent("test-agent")
+
+        assert agent.status == "starting"
+        pipe = mock_redis.pipeline.return_value
+        pipe.sadd.assert_called_once_with("mycelium:agent_names", "test-agent")
+        pipe.delete.assert_called_once_with("mycelium:agents:test-agent")
+        pipe.srem.assert_called_once_with("mycelium:agent_names", "test-agent")
+        assert mock_redis.pipeline.call_args.kwargs == {"transaction": True}
+
+    async def test_get_agent_not_found(self) -> None:
+        """Test getting non-existent agent returns None."""
+        mock_redis = make_async_redis(set(), [])
+        mock_redis.hgetall.return_value = {}
+        client = AsyncRegistryClient()
+        client._redis_client = mock_redis
+
+        assert await client.get_agent("nonexistent") is None
+
+    async def test_health_check_unreachable(self) -> None:
+        """Test health check returns False when Redis is unreachable."""
+        client = AsyncRegistryClient(redis_url="redis://127.0.0.1:1")
+
+        assert await client.health_check() is False
+
+    async def test_close_releases_pool(self) -> None:
+        """Test close shuts down the connection pool."""
+        mock_redis = make_async_redis(set(), [])
+        client = AsyncRegistryClient()
+        client._redis_client = mock_redis
+
+        await client.close()
+
+        mock_redis.aclose.assert_awaited_once_with(close_connection_pool=True)
+        assert client._redis_client is None
+
+
 class TestRegistryClientIntegration:
     """Integration tests that require actual Redis - skipped if unavailable."""
 
@@ -0,0 +1,87 @@
+"""Unit tests for set-based bulk loading in the agent registry."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+# Add plugins directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "plugins" / "mycelium-core"))
+
+from registry import AgentRegistry, RegistryCache  # noqa: E402
+
+
+def make_agent(agent_id: str, **overrides):
+    agent = {
+        "agent_id": agent_id,
+        "agent_type": agent_id,
+        "name": agent_id,
+        "display_name": agent_id,
+        "category": "Core Development",
+        "description": f"{agent_id} description",
+        "file_path": f"/agents/{agent_id}.md",
+    }
+    agent.update(overrides)
+    return agent
+
+
+def make_registry(merge_rows, cache=None):
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.copy_records_to_table = AsyncMock()
+    conn.fetch = AsyncMock(return_value=merge_rows)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock()
+    transaction.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction.return_value = transaction
+
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = acquire_ctx
+
+    return AgentRegistry(pool=pool, cache=cache), conn
+
+
+class TestBulkUpsert:
+    async def test_counts_inserted_updated_unchanged(self):
+        registry, conn = make_registry([{"inserted": True}, {"inserted": False}])
+        agents = [make_agent("a"), make_agent("b"), make_agent("c")]
+
+        counts = await registry.bulk_upsert_agents(agents)
+
+        assert counts == {"inserted": 1, "updated": 1, "unchanged": 1}
+        conn.copy_records_to_table.assert_awaited_once()
+        assert len(conn.copy_records_to_table.await_args.kwargs["records"]) == 3
+        assert "DO UPDATE" in conn.fetch.await_args.args[0]
+
+    async def test_duplicate_agent_ids_count_once(self):
+        registry, _ = make_registry([{"inserted": True}])
+
+        counts = await registry.bulk_upsert_agents([make_agent("a"), make_agent("a", description="newer")])
+
+        assert counts == {"inserted": 1, "updated": 0, "unchanged": 0}
+
+    async def test_empty_input_skips_database(self):
+        registry, conn = make_registry([])
+
+        assert await registry.bulk_upsert_agents([]) == {"inserted": 0, "updated": 0, "unchanged": 0}
+        conn.copy_records_to_table.assert_not_awaited()
+
+    async def test_unchanged_reload_keeps_cache(self):
+        cache = RegistryCache()
+        registry, _ = make_registry([], cache=cache)
+
+        await registry.bulk_upsert_agents([make_agent("a")])
+
+        assert cache.get_stats()["invalidations"] == 0
+
+
+class TestBulkInsert:
+    async def test_skips_existing_agents(self):
+        registry, conn = make_registry([{"inserted": True}])
+
+        inserted = await registry.bulk_insert_agents([make_agent("a"), make_agent("b")])
+
+        assert inserted == 1
+        assert "DO NOTHING" in conn.fetch.await_args.args[0]
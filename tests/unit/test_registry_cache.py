@@ -0,0 +1,211 @@
+"""Unit tests for the agent registry read cache."""
+
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add plugins directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "plugins" / "mycelium-core"))
+
+from registry import AgentNotFoundError, AgentRegistry, RegistryCache  # noqa: E402
+
+AGENT_ROW = {
+    "agent_id": "01-core-backend-developer",
+    "agent_type": "backend-developer",
+    "name": "backend-developer",
+    "category": "Core Development",
+}
+
+
+def make_pool(conn: MagicMock) -> MagicMock:
+    """Build a pool mock whose acquire() yields the given connection."""
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+
+    pool = MagicMock()
+    pool.acquire.return_value = acquire_ctx
+    return pool
+
+
+def make_conn(row: dict[str, Any] | None = AGENT_ROW) -> MagicMock:
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value=row)
+    conn.fetch = AsyncMock(return_value=[row] if row else [])
+    conn.fetchval = AsyncMock(return_value="uuid")
+    conn.execute = AsyncMock()
+    return conn
+
+
+class TestRegistryCache:
+    def test_hit_and_miss_counters(self):
+        cache = RegistryCache(ttl_seconds=60)
+
+        assert cache.get("missing") is None
+        cache.put("key", {"a": 1})
+        assert cache.get("key") == {"a": 1}
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_returns_copies(self):
+        cache = RegistryCache()
+        cache.put("key", [{"a": 1}])
+
+        cache.get("key")[0]["a"] = 2
+
+        assert cache.get("key") == [{"a": 1}]
+
+    def test_nested_values_are_copied(self):
+        cache = RegistryCache()
+        agent = {"keywords": ["api"], "metadata": {"tags": ["backend"]}}
+        cache.put("key", agent)
+
+        agent["keywords"].append("filled")
+        cached = cache.get("key")
+        cached["keywords"].append("read")
+        cached["metadata"]["tags"].clear()
+
+        assert cache.get("key") == {"keywords": ["api"], "metadata": {"tags": ["backend"]}}
+
+    def test_put_from_before_invalidation_is_dropped(self):
+        cache = RegistryCache()
+        generation = cache.generation
+
+        cache.invalidate()
+        cache.put("key", {"a": "pre-write"}, generation)
+
+        assert cache.get("key") is None
+        assert cache.get_stats()["stale_puts"] == 1
+
+        cache.put("key", {"a": "post-write"}, cache.generation)
+        assert cache.get("key") == {"a": "post-write"}
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("registry.cache.time.monotonic", lambda: now[0])
+        cache = RegistryCache(ttl_seconds=5)
+        cache.put("key", {"a": 1})
+
+        now[0] += 6
+
+        assert cache.get("key") is None
+        assert cache.get_stats()["expirations"] == 1
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        cache = RegistryCache(max_entries=2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")
+        cache.put("c", {})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {}
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_invalidate(self):
+        cache = RegistryCache()
+        cache.put("a", {})
+
+        cache.invalidate()
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["invalidations"] == 1
+
+    @pytest.mark.parametrize("kwargs", [{"ttl_seconds": 0}, {"max_entries": 0}])
+    def test_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            RegistryCache(**kwargs)
+
+
+class TestAgentRegistryCaching:
+    async def test_reads_are_served_from_cache(self):
+        conn = make_conn()
+        registry = AgentRegistry(pool=make_pool(conn), cache=RegistryCache())
+
+        first = await registry.get_agent_by_id("01-core-backend-developer")
+        second = await registry.get_agent_by_id("01-core-backend-developer")
+
+        assert first == second == AGENT_ROW
+        assert conn.fetchrow.await_count == 1
+
+    async def test_list_and_categories_cached(self):
+        conn = make_conn()
+        conn.fetch = AsyncMock(side_effect=[[AGENT_ROW], [{"category": "Core Development"}]])
+        registry = AgentRegistry(pool=make_pool(conn), cache=RegistryCache())
+
+        assert await registry.list_agents(limit=5) == [AGENT_ROW]
+        assert await registry.list_agents(limit=5) == [AGENT_ROW]
+        assert await registry.get_categories() == ["Core Development"]
+        assert await registry.get_categories() == ["Core Development"]
+
+        assert conn.fetch.await_count == 2
+
+    async def test_not_found_is_not_cached(self):
+        conn = make_conn(row=None)
+        registry = AgentRegistry(pool=make_pool(conn), cache=RegistryCache())
+
+        for _ in range(2):
+            with pytest.raises(AgentNotFoundError):
+                await registry.get_agent_by_type("missing")
+
+        assert conn.fetchrow.await_count == 2
+
+    async def test_writes_invalidate_cache(self):
+        conn = make_conn()
+        cache = RegistryCache()
+        registry = AgentRegistry(pool=make_pool(conn), cache=cache)
+
+        await registry.get_agent_by_type("backend-developer")
+        await registry.update_agent("01-core-backend-developer", description="updated")
+        await registry.get_agent_by_type("backend-developer")
+
+        assert conn.fetchrow.await_count == 2
+        assert cache.get_stats()["invalidations"] == 1
+
+    async def test_read_racing_a_write_is_not_cached(self):
+        cache = RegistryCache()
+
+        async def fetchrow_then_write(*_args: Any) -> dict[str, Any]:
+            # Another request writes while this read is in flight
+            cache.invalidate()
+            return AGENT_ROW
+
+        conn = make_conn()
+        conn.fetchrow = AsyncMock(side_effect=fetchrow_then_write)
+        registry = AgentRegistry(pool=make_pool(conn), cache=cache)
+
+        assert await registry.get_agent_by_id("01-core-backend-developer") == AGENT_ROW
+        assert cache.get_stats()["size"] == 0
+
+    async def test_writes_publish_notification(self):
+        conn = make_conn()
+        registry = AgentRegistry(pool=make_pool(conn), cache=RegistryCache(), notify_channel="registry_changes")
+
+        await registry.delete_agent("01-core-backend-developer")
+
+        conn.execute.assert_awaited_once_with("SELECT pg_notify($1, $2)", "registry_changes", "delete_agent")
+
+    async def test_notification_from_other_process_invalidates(self):
+        cache = RegistryCache()
+        registry = AgentRegistry(pool=make_pool(make_conn()), cache=cache, notify_channel="registry_changes")
+        cache.put(("agent_id", "x"), {})
+
+        registry._on_invalidation_notify(None, 1234, "registry_changes", "update_agent")
+
+        assert cache.get_stats()["size"] == 0
+
+    async def test_without_cache_every_read_hits_database(self):
+        conn = make_conn()
+        registry = AgentRegistry(pool=make_pool(conn))
+
+        await registry.get_agent_by_id("01-core-backend-developer")
+        await registry.get_agent_by_id("01-core-backend-developer")
+
+        assert conn.fetchrow.await_count == 2
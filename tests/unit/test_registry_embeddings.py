@@ -0,0 +1,145 @@
+"""Unit tests for the agent registry embedding pipeline."""
+
+import math
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add plugins directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "plugins" / "mycelium-core"))
+
+from registry import HashingEncoder, create_encoder, embed_agents  # noqa: E402
+from registry.embeddings import agent_embedding_text, embedding_content_hash  # noqa: E402
+
+
+def cosine(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b, strict=True))
+
+
+def make_agent(agent_id: str, description: str, **overrides: Any) -> dict[str, Any]:
+    agent = {
+        "id": agent_id,
+        "agent_type": agent_id,
+        "name": agent_id,
+        "display_name": agent_id.replace("-", " ").title(),
+        "category": "Core Development",
+        "description": description,
+        "capabilities": [],
+        "keywords": [],
+        "has_embedding": False,
+        "embedding_hash": None,
+    }
+    agent.update(overrides)
+    return agent
+
+
+class TestHashingEncoder:
+    def test_dimension_and_normalization(self):
+        vector = HashingEncoder().encode(["backend api development"])[0]
+
+        assert len(vector) == 384
+        assert math.isclose(math.sqrt(sum(v * v for v in vector)), 1.0)
+
+    def test_deterministic(self):
+        encoder = HashingEncoder()
+
+        assert encoder.encode(["kubernetes operator"]) == HashingEncoder().encode(["kubernetes operator"])
+
+    def test_empty_text_is_zero_vector(self):
+        assert HashingEncoder(dimension=8).encode([""]) == [[0.0] * 8]
+
+    def test_related_text_is_more_similar(self):
+        encoder = HashingEncoder()
+        query, backend, frontend = encoder.encode(
+            [
+                "python backend api",
+                "Senior backend engineer building python REST APIs and microservices",
+                "React frontend specialist for responsive user interfaces",
+            ]
+        )
+
+        assert cosine(query, backend) > cosine(query, frontend)
+
+    def test_morphological_variants_overlap(self):
+        encoder = HashingEncoder()
+        a, b, c = encoder.encode(["development", "developer", "kubernetes"])
+
+        assert cosine(a, b) > cosine(a, c)
+
+
+class TestEncoderFactory:
+    def test_default_is_hashing(self, monkeypatch):
+        monkeypatch.delenv("DISCOVERY_ENCODER", raising=False)
+
+        assert isinstance(create_encoder(), HashingEncoder)
+
+    def test_unknown_encoder(self):
+        with pytest.raises(ValueError, match="Unknown encoder"):
+            create_encoder("word2vec")
+
+
+class TestContentHash:
+    def test_hash_changes_with_content_and_encoder(self):
+        encoder = HashingEncoder()
+        other = MagicMock()
+        other.name = "other-encoder"
+        text = agent_embedding_text(make_agent("backend-developer", "Builds APIs"))
+
+        assert embedding_content_hash(text, encoder) == embedding_content_hash(text, encoder)
+        assert embedding_content_hash(text, encoder) != embedding_content_hash(text + "!", encoder)
+        assert embedding_content_hash(text, encoder) != embedding_content_hash(text, other)
+
+
+class TestEmbedAgents:
+    async def test_embeds_only_changed_agents(self):
+        encoder = HashingEncoder()
+        unchanged = make_agent("backend-developer", "Builds APIs", has_embedding=True)
+        unchanged["embedding_hash"] = embedding_content_hash(agent_embedding_text(unchanged), encoder)
+        changed = make_agent("frontend-developer", "Builds UIs", has_embedding=True, embedding_hash="stale")
+        missing = make_agent("devops-engineer", "Runs pipelines")
+
+        registry = MagicMock()
+        registry.get_embedding_state = AsyncMock(return_value=[unchanged, changed, missing])
+        registry.store_embeddings = AsyncMock()
+
+        result = await embed_agents(registry, encoder, batch_size=1)
+
+        assert result == {"embedded": 2, "skipped": 1}
+        assert registry.store_embeddings.await_count == 2
+        stored_ids = [call.args[0][0][0] for call in registry.store_embeddings.await_args_list]
+        assert stored_ids == ["frontend-developer", "devops-engineer"]
+
+    async def test_force_reembeds_everything(self):
+        encoder = HashingEncoder()
+        agent = make_agent("backend-developer", "Builds APIs", has_embedding=True)
+        agent["embedding_hash"] = embedding_content_hash(agent_embedding_text(agent), encoder)
+
+        registry = MagicMock()
+        registry.get_embedding_state = AsyncMock(return_value=[agent])
+        registry.store_embeddings = AsyncMock()
+
+        result = await embed_agents(registry, encoder, force=True)
+
+        assert result == {"embedded": 1, "skipped": 0}
+
+    async def test_encodes_off_the_event_loop_thread(self):
+        encoder = HashingEncoder()
+        encode_threads = []
+        original_encode = encoder.encode
+
+        def encode(texts):
+            encode_threads.append(threading.get_ident())
+            return original_encode(texts)
+
+        encoder.encode = encode
+        registry = MagicMock()
+        registry.get_embedding_state = AsyncMock(return_value=[make_agent("backend-developer", "Builds APIs")])
+        registry.store_embeddings = AsyncMock()
+
+        await embed_agents(registry, encoder)
+
+        assert encode_threads and threading.get_ident() not in encode_threads
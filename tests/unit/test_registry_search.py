@@ -0,0 +1,113 @@
+"""Unit tests for ranked full-text search in the agent registry."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+# Add plugins directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "plugins" / "mycelium-core"))
+
+from registry import AgentRegistry  # noqa: E402
+from registry.registry import _escape_like  # noqa: E402
+
+
+def make_registry(rows):
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=rows)
+
+    acquire_ctx = MagicMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+    pool = MagicMock()
+    pool.acquire.return_value = acquire_ctx
+    return AgentRegistry(pool=pool), conn
+
+
+class TestEscapeLike:
+    def test_wildcards_are_escaped(self):
+        assert _escape_like("100%_done\\") == "100\\%\\_done\\\\"
+
+    def test_plain_text_unchanged(self):
+        assert _escape_like("backend-developer") == "backend-developer"
+
+
+class TestSearchAgents:
+    async def test_uses_tsquery_and_escaped_pattern(self):
+        registry, conn = make_registry([{"name": "backend-developer", "confidence": 0.5}])
+
+        results = await registry.search_agents("50%_off", limit=5)
+
+        sql, query, pattern, offset, limit = conn.fetch.await_args.args
+        assert "websearch_to_tsquery" in sql
+        assert "search_vector @@" in sql
+        assert query == "50%_off"
+        assert pattern == "%50\\%\\_off%"
+        assert offset == 0
+        assert limit == 5
+        assert results == [{"name": "backend-developer", "confidence": 0.5}]
+
+
+class TestHybridSearchBatch:
+    async def test_single_statement_grouped_by_query(self):
+        rows = [
+            {"ord": 1, "is_vector": False, "score": 0.8, "agent_id": "backend-developer"},
+            {"ord": 1, "is_vector": True, "score": 0.4, "agent_id": "api-designer"},
+            {"ord": 3, "is_vector": True, "score": 0.2, "agent_id": "security-auditor"},
+        ]
+        registry, conn = make_registry(rows)
+
+        results = await registry.hybrid_search_batch(
+            ["backend", "no_match%", "security"], [[0.1, 0.2], [0.0, 0.0], [0.3, 0.4]], limit=4
+        )
+
+        assert conn.fetch.await_count == 1
+        _, queries, patterns, embeddings, limit = conn.fetch.await_args.args
+        assert queries == ["backend", "no_match%", "security"]
+        assert patterns[1] == "%no\\_match\\%%"
+        assert embeddings[0] == "[0.1,0.2]"
+        assert limit == 4
+        assert results == [
+            ([{"agent_id": "backend-developer", "confidence": 0.8}], [({"agent_id": "api-designer"}, 0.4)]),
+            ([], []),
+            ([], [({"agent_id": "security-auditor"}, 0.2)]),
+        ]
+
+    async def test_empty_batch_skips_database(self):
+        registry, conn = make_registry([])
+
+        assert await registry.hybrid_search_batch([], []) == []
+        conn.fetch.assert_not_awaited()
+
+
+class TestPagination:
+    async def test_list_agents_keyset_cursor(self):
+        registry, conn = make_registry([])
+        cursor_id = UUID("12345678-1234-5678-1234-567812345678")
+
+        await registry.list_agents(category="Security", limit=20, after=("security-auditor", cursor_id))
+
+        sql, *params = conn.fetch.await_args.args
+        assert "(name, id) > ($2, $3)" in sql
+        assert "OFFSET" not in sql
+        assert params == ["Security", "security-auditor", cursor_id, 20]
+
+    async def test_list_agents_offset_without_cursor(self):
+        registry, conn = make_registry([])
+
+        await registry.list_agents(limit=20, offset=40)
+
+        sql, *params = conn.fetch.await_args.args
+        assert "WHERE" not in sql
+        assert "ORDER BY name, id" in sql
+        assert params == [40, 20]
+
+    async def test_search_agents_filters_category_in_sql(self):
+        registry, conn = make_registry([])
+
+        await registry.search_agents("python", limit=5, category="Development")
+
+        sql, *params = conn.fetch.await_args.args
+        assert "AND category = $3" in sql
+        assert "COUNT(*) OVER ()" in sql
+        assert params == ["python", "%python%", "Development", 0, 5]